@@ -7,9 +7,23 @@ For Wealthy Hypio Babies collection
 
 import random
 import hashlib
+import threading
+from bisect import bisect
+from itertools import accumulate
+from typing import Dict, Iterable, List, Tuple
+
+from rarity_engine import RarityTable, build_rarity_table
+
+TOTAL_SUPPLY = 5555
+# Categories every NFT has, and those it draws 0-2 of, in output order
+CORE_TRAITS = ("Background", "Body", "Hair", "Eyes", "Mouth", "Eyebrows")
+OPTIONAL_TRAITS = ("Outfit", "Friend", "Accessories", "Glasses", "Face",
+                   "Hat", "Horns", "Necklace", "Earring", "Overlay")
 
 class AuthenticTraitGenerator:
     def __init__(self):
+        self._rarity_table = None
+        self._rarity_lock = threading.Lock()
         # Real trait categories and values from Drip.Trade marketplace
         self.authentic_traits = {
             "Background": [
@@ -71,58 +85,70 @@ class AuthenticTraitGenerator:
             ]
         }
     
-    def generate_traits_for_token(self, token_id: int) -> list:
-        """Generate authentic traits for a specific token ID"""
-        # Use token ID as seed for deterministic generation
-        random.seed(f"hypio-{token_id}")
-        
-        traits = []
-        
+        # category -> (values, "rarity%" labels, cumulative weights); lower
+        # percentage = more rare, so each option is weighted 100 - percentage
+        self._choice_tables: Dict[str, Tuple[List[str], List[str], List[float]]] = {
+            category: ([value for value, _ in options],
+                       [f"{rarity:.1f}%" for _, rarity in options],
+                       list(accumulate(100.0 - rarity for _, rarity in options)))
+            for category, options in self.authentic_traits.items()
+        }
+        self._category_order = {category: i for i, category in enumerate(self.authentic_traits)}
+    
+    def _traits_from_rng(self, rng: random.Random) -> list:
         # Each NFT gets 6-8 traits on average based on real patterns
-        trait_count = random.randint(6, 8)
-        
-        # Ensure core traits are always present
-        core_traits = ["Background", "Body", "Hair", "Eyes", "Mouth", "Eyebrows"]
-        selected_categories = set(core_traits)
-        
-        # Add additional random traits
-        optional_traits = ["Outfit", "Friend", "Accessories", "Glasses", "Face", 
-                          "Hat", "Horns", "Necklace", "Earring", "Overlay"]
-        additional = random.sample(optional_traits, min(trait_count - len(core_traits), len(optional_traits)))
-        selected_categories.update(additional)
+        trait_count = rng.randint(6, 8)
         
-        # Generate traits for selected categories
-        for category in selected_categories:
-            if category in self.authentic_traits:
-                trait_options = self.authentic_traits[category]
-                # Weight selection by rarity (lower percentage = more rare)
-                weights = [100.0 - rarity for _, rarity in trait_options]
-                selected_trait = random.choices(trait_options, weights=weights, k=1)[0]
-                
-                traits.append({
-                    "trait_type": category,
-                    "value": selected_trait[0],
-                    "rarity": f"{selected_trait[1]:.1f}%"
-                })
-        
-        # Reset random seed to ensure variety in subsequent calls
-        random.seed()
+        # Core traits are always present, plus random optional ones
+        additional = rng.sample(OPTIONAL_TRAITS, min(trait_count - len(CORE_TRAITS), len(OPTIONAL_TRAITS)))
+        categories = CORE_TRAITS + tuple(sorted(additional, key=self._category_order.__getitem__))
         
+        traits = []
+        for category in categories:
+            values, labels, cum_weights = self._choice_tables[category]
+            # What rng.choices(values, cum_weights=cum_weights) does, minus its per-call setup
+            index = bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(values) - 1)
+            traits.append({
+                "trait_type": category,
+                "value": values[index],
+                "rarity": labels[index]
+            })
         return traits
     
+    def generate_traits_for_token(self, token_id: int) -> list:
+        """Generate authentic traits for a specific token ID.
+
+        Deterministic per token and thread-safe: each call draws from its own
+        random.Random seeded with the token ID, never the global RNG.
+        """
+        return self._traits_from_rng(random.Random(f"hypio-{token_id}"))
+    
+    def generate_traits_batch(self, token_ids: Iterable[int]) -> List[list]:
+        """Traits for many tokens in one call, e.g. range(1, TOTAL_SUPPLY + 1).
+
+        Same output as generate_traits_for_token per token; one private
+        random.Random is reseeded for each token instead of built per token.
+        """
+        rng = random.Random()
+        batch = []
+        for token_id in token_ids:
+            rng.seed(f"hypio-{token_id}")
+            batch.append(self._traits_from_rng(rng))
+        return batch
+    
+    def rarity_table(self) -> RarityTable:
+        """Trait frequencies and ranks across all generated tokens, built once"""
+        if self._rarity_table is None:
+            with self._rarity_lock:
+                if self._rarity_table is None:
+                    token_ids = range(1, TOTAL_SUPPLY + 1)
+                    self._rarity_table = build_rarity_table(
+                        self.generate_traits_batch(token_ids), token_ids)
+        return self._rarity_table
+    
     def calculate_rarity_rank(self, traits: list) -> int:
-        """Calculate rarity rank based on trait rarities"""
-        total_rarity_score = 0
-        for trait in traits:
-            rarity_pct = float(trait["rarity"].replace("%", ""))
-            # Lower percentage = higher rarity score
-            total_rarity_score += (100.0 - rarity_pct) / 100.0
-        
-        # Convert to rank (higher score = better rank, but we want lower numbers for better ranks)
-        # Scale to 1-5555 range
-        normalized_score = min(max(total_rarity_score / len(traits), 0.1), 2.0)
-        rank = int(5555 * (2.0 - normalized_score) / 2.0)
-        return max(1, min(5555, rank))
+        """Collection-wide rarity rank of a trait list (1 = rarest)"""
+        return self.rarity_table().rank_for_traits(traits)
 
 if __name__ == "__main__":
     generator = AuthenticTraitGenerator()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark HyperEVM balance lookups for many wallets against a local stub node
+Per-address eth_getBalance + balanceOf calls vs one block-pinned JSON-RPC batch
+vs the short-TTL cache
+"""
+
+import contextlib
+import http.server
+import io
+import json
+import threading
+import time
+
+from hyperevm_balance import HyperEVMBalanceChecker
+from rpc_client import JSONRPCClient
+
+WALLETS = 500
+NODE_LATENCY = 0.002
+
+
+class StubNode(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    posts = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        StubNode.posts += 1
+        time.sleep(NODE_LATENCY)
+        items = body if isinstance(body, list) else [body]
+        answers = [{'jsonrpc': '2.0', 'id': item['id'], 'result': hex(123 * 10 ** 16)} for item in items]
+        payload = json.dumps(answers if isinstance(body, list) else answers[0]).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def timed(label, fn):
+    StubNode.posts = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:38} {elapsed * 1e3:9.1f}ms  {StubNode.posts:5} POSTs")
+    return elapsed
+
+
+def main():
+    server = Server(('127.0.0.1', 0), StubNode)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    checker = HyperEVMBalanceChecker()
+    checker.rpc = JSONRPCClient(f'http://127.0.0.1:{server.server_address[1]}/')
+    addresses = [f'0x{i:040x}' for i in range(1, WALLETS + 1)]
+
+    print(f"📊 HYPE + WHYPE balances for {WALLETS} wallets, stub node adds {NODE_LATENCY * 1e3:.0f}ms per POST")
+    print("=" * 66)
+    sequential = timed('sequential native + balanceOf calls',
+                       lambda: [(checker.get_native_hype_balance(a), checker.get_whype_balance(a)) for a in addresses])
+    batched = timed('get_balances, one pinned batch', lambda: checker.get_balances(addresses))
+    cached = timed('get_balances, warm cache', lambda: checker.get_balances(addresses))
+    timed('get_balances, pinned historical block', lambda: checker.get_balances(addresses, block=12345))
+    print(f"\n  batch {sequential / batched:,.0f}x faster than sequential, cache {sequential / cached:,.0f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Benchmark closed-form bonding curve quotes against the per-share loop
+"""
+
+import time
+
+import bonding_curve
+from test_bonding_curve import loop_average_price
+
+SUPPLY = 997_000_000
+
+
+def timed(fn, *args, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    print("📊 Average buy price quote latency")
+    print("=" * 60)
+    for shares in (1_000, 100_000, 1_000_000):
+        loop_time = timed(loop_average_price, SUPPLY, shares, 'BUY')
+        closed_time = timed(bonding_curve.average_buy_price, SUPPLY, shares, repeat=10000)
+        print(f"  {shares:>9,} shares  loop {loop_time * 1e3:9.2f}ms  "
+              f"closed form {closed_time * 1e6:6.2f}µs  {loop_time / closed_time:10,.0f}x")
+
+    sizes = [10 ** k for k in range(7)] * 7
+    ladder_time = timed(bonding_curve.quote_ladder, SUPPLY, sizes, 'BUY', repeat=1000)
+    print(f"\n  {len(sizes)}-rung price-impact ladder: {ladder_time * 1e6:.1f}µs per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark NFT collection cold start in fresh processes:
+regenerating every token on startup vs loading the mmap'd snapshot, measured
+to collection ready and to the first NFTSearchHandler search answered
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 7
+
+CHILD = r'''
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+from nft_search_handler import NFTSearchHandler
+handler = NFTSearchHandler()
+handler.bulk_fetcher.snapshot_path = sys.argv[2]
+if sys.argv[1] == "regenerate":
+    handler.bulk_fetcher.load_collection = handler.bulk_fetcher.generate_all_nft_data
+imported = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    handler.get_full_collection()
+ready = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    handler.search_nfts("kpop", {"Eyes": "Teal"})
+answered = time.perf_counter()
+print(json.dumps({"import": imported - start, "load": ready - imported, "first_request": answered - ready,
+                  "total": answered - start}))
+'''
+
+
+def run(mode, snapshot_path):
+    output = subprocess.run([sys.executable, '-c', CHILD, mode, snapshot_path], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, 'nft_collection.snapshot')
+        print(f"📊 NFT collection cold start, median of {RUNS} fresh processes")
+        print("=" * 76)
+        print(f"  {'mode':30} {'load':>9} {'1st search':>11} {'ready+search':>13} {'process':>9}")
+        first_build = run('snapshot', snapshot_path)
+        results = {}
+        for mode in ('regenerate', 'snapshot'):
+            samples = [run(mode, snapshot_path) for _ in range(RUNS)]
+            results[mode] = {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+        results['snapshot (first build)'] = first_build
+        for mode, timing in results.items():
+            print(f"  {mode:30} {timing['load'] * 1e3:7.1f}ms {timing['first_request'] * 1e3:9.1f}ms "
+                  f"{(timing['load'] + timing['first_request']) * 1e3:11.1f}ms {timing['total'] * 1e3:7.0f}ms")
+        print(f"\n  snapshot file: {os.path.getsize(snapshot_path) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
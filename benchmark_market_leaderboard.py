@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark trending/overview queries: full sort + sums vs MarketLeaderboard
+"""
+
+import random
+import time
+
+from market_leaderboard import MarketLeaderboard
+
+ACCOUNTS = 50_000
+TRADES = 500_000
+TOP_K = 20
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    rng = random.Random(12)
+    accounts = {}
+    leaderboard = MarketLeaderboard()
+    now = time.time()
+    for i in range(TRADES):
+        handle = f'acct{rng.randrange(ACCOUNTS)}'
+        volume, change, market_cap = rng.random(), rng.uniform(-50, 50), rng.random() * 1e6
+        account = accounts.setdefault(handle, {'volume_24h': 0.0})
+        account.update(volume_24h=account['volume_24h'] + volume, daily_change=change, market_cap=market_cap)
+        leaderboard.record_trade(handle, volume, market_cap, change, ts=now - 86400 + i * 86400 / TRADES)
+
+    def old_trending():
+        return sorted(accounts.values(), key=lambda x: x['volume_24h'] * (1 + x['daily_change'] / 100),
+                      reverse=True)[:TOP_K]
+
+    def old_overview():
+        return (sum(a['market_cap'] for a in accounts.values()),
+                sum(a['volume_24h'] for a in accounts.values()),
+                sum(a['daily_change'] for a in accounts.values()) / len(accounts))
+
+    print(f"📊 {len(accounts):,} accounts, {TRADES:,} trades")
+    print("=" * 60)
+    sort_ms = per_call_ms(old_trending, 5)
+    heap_ms = per_call_ms(lambda: leaderboard.top(TOP_K, now=now), 200)
+    print(f"  top {TOP_K} trending   full sort {sort_ms:8.3f}ms   heap {heap_ms:7.3f}ms  ({sort_ms / heap_ms:,.0f}x)")
+    sums_ms = per_call_ms(old_overview, 5)
+    totals_ms = per_call_ms(lambda: leaderboard.totals(now=now), 200)
+    print(f"  market overview  full pass {sums_ms:8.3f}ms   O(1) {totals_ms:7.3f}ms  ({sums_ms / totals_ms:,.0f}x)")
+    trade_us = per_call_ms(lambda: leaderboard.record_trade('acct1', 1.0, 1.0, 1.0, ts=now), 10_000) * 1e3
+    print(f"  per-trade update cost {trade_us:.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark metrics instrumentation cost
+Per-request overhead of the count/latency/in-flight triple, single-threaded and
+with 8 threads, on registered worker threads (private cells) and plain threads
+(striped shared cells), against the same metrics kept behind one shared lock
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from metrics import LATENCY_BUCKETS, Registry, register_worker_thread
+
+OPERATIONS = 200_000
+THREADS = 8
+ROUTES = [('GET', f'/api/route-{i}') for i in range(20)]
+
+
+class LockedMetrics:
+    """The obvious alternative: dicts guarded by a single lock"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts, self.in_flight, self.rows = {}, {}, {}
+
+    def request(self, labels, seconds):
+        with self.lock:
+            self.in_flight[labels] = self.in_flight.get(labels, 0) + 1
+        with self.lock:
+            row = self.rows.setdefault(labels, [0] * (len(LATENCY_BUCKETS) + 2))
+            row[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            row[-1] += seconds
+            self.in_flight[labels] -= 1
+            key = labels + (200,)
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+
+def registry_metrics():
+    registry = Registry()
+    requests = registry.counter('requests_total', 'requests', ('method', 'route', 'status'))
+    latency = registry.histogram('request_seconds', 'latency', ('method', 'route'))
+    in_flight = registry.gauge('in_flight', 'in flight', ('method', 'route'))
+
+    def request(labels, seconds):
+        in_flight.inc(labels)
+        latency.observe(seconds, labels)
+        in_flight.dec(labels)
+        requests.inc(labels + (200,))
+
+    return registry, request
+
+
+def run(request, threads, workers=False):
+    per_thread = OPERATIONS // threads
+
+    def work(offset):
+        if workers:
+            register_worker_thread()
+        for i in range(per_thread):
+            request(ROUTES[(i + offset) % len(ROUTES)], 0.0001 * (i % 50))
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - start) / (per_thread * threads) * 1e6
+
+
+def main():
+    print(f"📊 Instrumentation cost per request ({OPERATIONS:,} requests, {len(ROUTES)} routes)")
+    print("=" * 60)
+    for threads in (1, THREADS):
+        registry, request = registry_metrics()
+        worker_us = run(request, threads, workers=True)
+        striped_us = run(registry_metrics()[1], threads)
+        locked_us = run(LockedMetrics().request, threads)
+        print(f"  {threads} thread(s): worker cells {worker_us:6.2f}µs   striped {striped_us:6.2f}µs   "
+              f"single lock {locked_us:6.2f}µs")
+        start = time.perf_counter()
+        exposition = registry.render()
+        print(f"             /metrics render {(time.perf_counter() - start) * 1e3:6.2f}ms "
+              f"({len(exposition.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-token NFT metadata fetches against a local HTTP stub
+curl subprocess per request (the old fetchers) vs the shared pooled
+HTTPClient, sequentially and from 8 threads
+"""
+
+import http.server
+import json
+import shutil
+import subprocess
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import HTTPClient
+
+TOKENS = 1000
+THREADS = 8
+
+
+class StubGateway(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        StubGateway.connections += 1
+
+    def do_GET(self):
+        token_id = self.path.rsplit('/', 1)[-1]
+        payload = json.dumps({
+            'name': f'Wealthy Hypio Babies #{token_id}',
+            'image': f'ipfs://QmImages/{token_id}.png',
+            'attributes': [{'trait_type': t, 'value': f'{t} {token_id}'} for t in ('Background', 'Body', 'Eyes')],
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def curl_fetch(url):
+    """HyperScanNFTFetcher._fetch_metadata_from_uri before the pooled client"""
+    result = subprocess.run(['curl', '-s', '--max-time', '8',
+                             '-H', 'User-Agent: Mozilla/5.0 (compatible; HyperScan-NFT/1.0)', url],
+                            capture_output=True, text=True)
+    return json.loads(result.stdout)
+
+
+def urllib_fetch(url):
+    with urllib.request.urlopen(url, timeout=8) as response:
+        return json.loads(response.read())
+
+
+def timed(label, fn, count):
+    StubGateway.connections = 0
+    start = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - start
+    assert all(results) and len(results) == count
+    print(f"  {label:34} {elapsed / count * 1e3:7.3f}ms/token  {count / elapsed:8,.0f} tokens/s  "
+          f"{StubGateway.connections:5} connections")
+    return elapsed / count
+
+
+def main():
+    server = Server(('127.0.0.1', 0), StubGateway)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}/ipfs/QmMetadata'
+    urls = [f'{base}/{token_id}' for token_id in range(1, TOKENS + 1)]
+    client = HTTPClient(pool_size=THREADS)
+
+    print(f"📊 Metadata fetch for {TOKENS:,} tokens from a local stub gateway")
+    print("=" * 82)
+    baseline = None
+    if shutil.which('curl'):
+        baseline = timed('curl subprocess per token', lambda: [curl_fetch(url) for url in urls], TOKENS)
+    timed('urllib, new connection per token', lambda: [urllib_fetch(url) for url in urls], TOKENS)
+    pooled = timed('pooled client, sequential', lambda: [client.get_json(url) for url in urls], TOKENS)
+    with ThreadPoolExecutor(THREADS) as pool:
+        if baseline:
+            timed(f'curl subprocess, {THREADS} threads', lambda: list(pool.map(curl_fetch, urls)), TOKENS)
+        threaded = timed(f'pooled client, {THREADS} threads', lambda: list(pool.map(client.get_json, urls)), TOKENS)
+    if baseline:
+        print(f"\n  pooled client {baseline / pooled:,.0f}x faster sequentially, {baseline / threaded:,.0f}x with "
+              f"{THREADS} threads")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
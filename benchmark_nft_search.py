@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark NFT search at 100k synthetic tokens:
+NFTSearchHandler's old linear scans vs the inverted NFTIndex
+"""
+
+import random
+import time
+
+from nft_index import NFTIndex
+
+TOKENS = 100_000
+TRAITS_POOL = {
+    "Background": ["Ocean Blue", "Promiseland", "RR", "Chornobyl", "XHS-Holiday", "Zanzibar Land", "Starfield",
+                   "Catbal", "Roadhouse"],
+    "Body": ["Android Black", "White", "Black", "Levels To This Matrix", "Android"],
+    "Eyes": ["Gray", "Light-Blue", "Halftone", "Green", "Pink", "Squaring-the-Spiral", "Teal", "Void"],
+    "Hair": ["Waker Yellow", "Sephi Red", "Sephi Glacier", "Sephi Vert", "Kpop Teal", "Kpop Holo", "Kpop Lovely"],
+    "Outfit": ["HBL", "Angel", "Lone-Star", "We Go All", "Man-Sweater", "Dune"],
+    "Friend": ["Wendy-Williams-with-a-Walther-P38", "Baby Heartornament", "Tej", "Liquid", "Black Cat", "China"],
+    "Accessories": ["Energy Sword", "Warglaive No Mongoose", "OMEGA", "Chrome-II", "BRG-Logo", "Vvardenfell",
+                    "Vaultboy"],
+    "Special": ["BRATTIEST", "IS-MY-BITCH", "HL-Corporate", "Hyperswap", "PVP"],
+}
+
+
+def synthetic_collection(count):
+    """Records shaped like BulkNFTFetcher.generate_all_nft_data"""
+    rng = random.Random(21)
+    records = []
+    for token_id in range(1, count + 1):
+        traits = [{"trait_type": category, "value": rng.choice(options), "rarity": f"{rng.uniform(1, 50):.1f}%"}
+                  for category, options in TRAITS_POOL.items() if rng.random() > 0.1]
+        records.append({"token_id": token_id, "name": f"Wealthy Hypio Baby #{token_id}", "traits": traits,
+                        "rarity_rank": rng.randint(100, 5000), "last_sale_price": f"{61.799 * rng.uniform(0.8, 2.5):.2f}"})
+    return records
+
+
+# ---- NFTSearchHandler before the index ------------------------------------
+
+def linear_search(collection, query, trait_filters=None, count=20):
+    results = []
+    query_lower = query.lower()
+    for nft in collection:
+        if query_lower in nft.get("name", "").lower():
+            results.append(nft)
+            continue
+        for trait in nft.get("traits", []):
+            if query_lower in trait.get("trait_type", "").lower() or query_lower in trait.get("value", "").lower():
+                results.append(nft)
+                break
+    if trait_filters is not None:
+        results = [nft for nft in results
+                   if all(any(t.get("trait_type", "").lower() == k.lower() and t.get("value", "").lower() == v.lower()
+                              for t in nft.get("traits", []))
+                          for k, v in trait_filters.items())]
+    return results[:count]
+
+
+def linear_by_id(collection, token_id):
+    for nft in collection:
+        if nft.get("token_id") == token_id:
+            return nft
+    return None
+
+
+def linear_trending(collection, count):
+    return sorted(collection, key=lambda x: (x.get("rarity_rank", 999999), -float(x.get("last_sale_price", "0"))))[:count]
+
+
+def linear_traits(collection):
+    traits = {}
+    for nft in collection:
+        for trait in nft.get("traits", []):
+            if trait.get("trait_type") and trait.get("value"):
+                traits.setdefault(trait["trait_type"], set()).add(trait["value"])
+    return {k: sorted(v) for k, v in traits.items()}
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    collection = synthetic_collection(TOKENS)
+    start = time.perf_counter()
+    index = NFTIndex(collection)
+    build = time.perf_counter() - start
+    two_traits = {"Eyes": "Teal", "Hair": "Kpop Holo"}
+    three_traits = {"Background": "Starfield", "Eyes": "Void", "Special": "PVP"}
+    cursor = index.query("", two_traits, sort="-price", limit=20)[1]
+
+    cases = [
+        ("get by token id", lambda: linear_by_id(collection, TOKENS - 7), lambda: index.get(TOKENS - 7), 200),
+        ("text 'baby' (every name)", lambda: linear_search(collection, "baby"),
+         lambda: index.query("baby"), 200),
+        ("text 'hypio baby #9999'", lambda: linear_search(collection, "hypio baby #9999"),
+         lambda: index.query("hypio baby #9999"), 50),
+        ("text 'glacier' (trait value)", lambda: linear_search(collection, "glacier"),
+         lambda: index.query("glacier"), 200),
+        ("2 trait filters", lambda: linear_search(collection, "", two_traits),
+         lambda: index.query("", two_traits), 50),
+        ("3 trait filters, rare combo", lambda: linear_search(collection, "", three_traits),
+         lambda: index.query("", three_traits), 50),
+        ("text + filters", lambda: linear_search(collection, "sephi", three_traits),
+         lambda: index.query("sephi", three_traits), 50),
+        ("trending (sort by rarity)", lambda: linear_trending(collection, 20),
+         lambda: index.query(sort="rarity"), 20),
+        ("filters, by price, page 2", lambda: sorted(linear_search(collection, "", two_traits, TOKENS),
+                                                     key=lambda r: -float(r["last_sale_price"]))[20:40],
+         lambda: index.query("", two_traits, sort="-price", cursor=cursor), 50),
+        ("collection traits", lambda: linear_traits(collection), index.traits, 20),
+    ]
+
+    print(f"📊 NFT search over {TOKENS:,} synthetic tokens (index built in {build:.2f}s)")
+    print("=" * 72)
+    print(f"  {'query':32} {'linear scan':>12} {'NFTIndex':>12} {'speedup':>10}")
+    for label, linear, indexed, repeat in cases:
+        old = per_call_ms(linear, max(1, repeat // 20))
+        new = per_call_ms(indexed, repeat)
+        print(f"  {label:32} {old:10.3f}ms {new:10.3f}ms {old / new:9,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark server-rendered pages: string concatenation per request vs PageCache
+Reports requests/second for each page, anonymous and signed in
+"""
+
+import email.message
+import os
+import sys
+import time
+
+DURATION = 1.0
+
+
+def throughput(fn):
+    """Calls per second over roughly DURATION seconds"""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        for _ in range(20):
+            fn()
+        calls += 20
+    return calls / (time.perf_counter() - start)
+
+
+def fake_handler(handler_class, cookie=None):
+    handler = handler_class.__new__(handler_class)
+    handler.headers = email.message.Message()
+    if cookie:
+        handler.headers['Cookie'] = cookie
+    return handler
+
+
+def main():
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        import social_trading_platform as stp
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+    stp.USER_SESSIONS['bench-session'] = {'twitter_username': 'bench', 'login_time': time.time()}
+    builders = {'markets': 'generate_markets_page', 'portfolio': 'generate_portfolio_page',
+                'launch': 'generate_launch_page'}
+
+    print(f"📊 Page rendering throughput ({DURATION:.0f}s per case)")
+    print("=" * 72)
+    print(f"  {'page':<22} {'KB':>6} {'concat req/s':>14} {'cached req/s':>14} {'speedup':>8}")
+    for page_type, builder in builders.items():
+        for label, cookie in (('anonymous', None), ('signed in', 'user_session=bench-session')):
+            handler = fake_handler(stp.SocialTradingHandler, cookie)
+            old = throughput(lambda: getattr(handler, builder)().encode('utf-8'))
+            size = len(handler.generate_page_html(page_type)) / 1000
+            new = throughput(lambda: handler.generate_page_html(page_type))
+            print(f"  {page_type + ' / ' + label:<22} {size:6.0f} {old:14,.0f} {new:14,.0f} {new / old:7.1f}x")
+    print(f"\n  template builds: {stp.PAGE_CACHE.stats['builds']}, hits: {stp.PAGE_CACHE.stats['hits']:,}")
+
+
+if __name__ == "__main__":
+    main()
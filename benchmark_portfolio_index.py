@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark portfolio queries at 10k accounts x 100 trades:
+walking every account's recent trades vs the per-user PortfolioIndex
+"""
+
+import random
+import time
+
+from portfolio_index import PortfolioIndex
+from trade_ledger import TradeLedger
+
+ACCOUNTS = 10_000
+TRADES_PER_ACCOUNT = 100
+TRADERS = 20_000
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    rng = random.Random(21)
+    ledger = TradeLedger(per_account=TRADES_PER_ACCOUNT, global_limit=ACCOUNTS * TRADES_PER_ACCOUNT)
+    index = PortfolioIndex()
+    prices = {}
+    start = time.perf_counter()
+    for n in range(ACCOUNTS * TRADES_PER_ACCOUNT):
+        account = f'acct{n % ACCOUNTS}'
+        trader = f'trader{rng.randrange(TRADERS)}'
+        side = 'BUY' if rng.random() < 0.6 else 'SELL'
+        tokens, price = rng.random() * 100, 0.01 + rng.random() / 100
+        prices[account] = price
+        ledger.record_trade(account, side, trader, tokens * price, tokens, price)
+        index.record_trade(trader, account, side, tokens, tokens * price)
+    build = time.perf_counter() - start
+    print(f"📊 {ACCOUNTS:,} accounts x {TRADES_PER_ACCOUNT} trades, {TRADERS:,} traders "
+          f"(ingest {build:.1f}s incl. ledger)")
+    print("=" * 60)
+
+    identities = {'trader42', '0xdeadbeef'}
+
+    def old_walk():
+        # What handle_portfolio_stats did: every account, its recent trades, string compares
+        total_pnl, total_trades = 0.0, 0
+        for handle in prices:
+            for trade in ledger.account_trades(handle):
+                if trade.trader in identities:
+                    total_trades += 1
+                    if trade.side == 'BUY':
+                        total_pnl += (0.01 - trade.price) * trade.tokens
+                    else:
+                        total_pnl += trade.hype - trade.tokens * 0.01
+        return total_pnl, total_trades
+
+    walk_ms = per_call_ms(old_walk, 3)
+    summary_ms = per_call_ms(lambda: index.summary(identities, prices.__getitem__), 1000)
+    daily_ms = per_call_ms(lambda: index.daily_realized(identities, 7), 1000)
+    positions = len(index.summary(identities, prices.__getitem__)['positions'])
+    print(f"  portfolio stats  walk {walk_ms:9.2f}ms   index {summary_ms:7.3f}ms  "
+          f"({walk_ms / summary_ms:,.0f}x, {positions} positions)")
+    print(f"  7-day P&L chart  walk {walk_ms:9.2f}ms   index {daily_ms:7.3f}ms  ({walk_ms / daily_ms:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark collection rarity at 10k-100k tokens:
+the old per-token "%"-string formulas plus a Python sort for ranks vs one
+vectorized build_rarity_table pass
+"""
+
+import math
+import random
+import time
+from collections import Counter
+
+from authentic_trait_generator import AuthenticTraitGenerator
+from rarity_engine import build_rarity_table
+
+SIZES = (10_000, 50_000, 100_000)
+
+
+def synthetic_collection(count):
+    """Traits drawn from AuthenticTraitGenerator's categories and weights"""
+    rng = random.Random(23)
+    categories = AuthenticTraitGenerator().authentic_traits
+    collection = []
+    for _ in range(count):
+        traits = []
+        for category, options in categories.items():
+            if rng.random() < 0.6 or not traits and category == 'Background':
+                value, rarity = rng.choices(options, weights=[100.0 - r for _, r in options])[0]
+                traits.append({"trait_type": category, "value": value, "rarity": f"{rarity:.1f}%"})
+        collection.append(traits)
+    return collection
+
+
+def old_calculate_rarity_rank(traits):
+    """AuthenticTraitGenerator.calculate_rarity_rank before the engine"""
+    total_rarity_score = 0
+    for trait in traits:
+        total_rarity_score += (100.0 - float(trait["rarity"].replace("%", ""))) / 100.0
+    normalized_score = min(max(total_rarity_score / len(traits), 0.1), 2.0)
+    return max(1, min(5555, int(5555 * (2.0 - normalized_score) / 2.0)))
+
+
+def python_information_ranks(collection):
+    """The same collection-wide ranking, token by token in pure Python"""
+    categories = sorted({t["trait_type"] for traits in collection for t in traits})
+    counts = Counter()
+    for traits in collection:
+        present = {t["trait_type"]: t["value"] for t in traits}
+        counts.update((category, present.get(category)) for category in categories)
+    size = len(collection)
+    scores = []
+    for traits in collection:
+        present = {t["trait_type"]: t["value"] for t in traits}
+        scores.append(sum(-math.log2(counts[(c, present.get(c))] / size) for c in categories))
+    order = sorted(range(size), key=lambda i: -scores[i])
+    ranks = [0] * size
+    for position, i in enumerate(order):
+        ranks[i] = position + 1
+    return ranks
+
+
+def best_ms(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    print("📊 Rarity scoring and ranking for a whole collection")
+    print("=" * 84)
+    print(f"  {'tokens':>8} {'old per-token formula':>22} {'pure-Python ranks':>18} {'rarity engine':>14} {'speedup':>9}")
+    for size in SIZES:
+        collection = synthetic_collection(size)
+        old = best_ms(lambda: [old_calculate_rarity_rank(traits) for traits in collection])
+        python = best_ms(lambda: python_information_ranks(collection))
+        engine = best_ms(lambda: build_rarity_table(collection))
+        print(f"  {size:>8,} {old:20.1f}ms {python:16.1f}ms {engine:12.1f}ms {python / engine:8.1f}x")
+
+    collection = synthetic_collection(10_000)
+    table = build_rarity_table(collection)
+    start = time.perf_counter()
+    for traits in collection[:2000]:
+        table.rank_for_traits(traits)
+    print(f"\n  rank_for_traits on a 10k table: {(time.perf_counter() - start) / 2000 * 1e6:.1f}µs per lookup")
+    print("  (the old formula is per token only: its 'ranks' were rescaled averages, not positions in the collection)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark reference_quality_generator rendering per 800x800 image
+PIL backend (putpixel gradient, one blurred full-frame layer per shadow and
+energy ring) vs the NumPy array backend
+"""
+
+import os
+import tempfile
+import time
+
+from PIL import Image
+
+import reference_quality_generator as generator
+
+SIZE = (800, 800)
+CHARACTER = {"name": "Naruto Uzumaki", "village": "Hidden Leaf", "jutsu": "Rasengan",
+             "element": "Wind Release", "rarity": "Legendary"}
+COLORS = [(255, 140, 0), (255, 69, 0), (255, 20, 20)]
+
+
+def best_ms(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    canvas = Image.new('RGB', SIZE, (200, 90, 30))
+    head_center = (SIZE[0] // 2, SIZE[1] // 2 - 60)
+    stages = (
+        ("create_advanced_gradient", lambda backend: generator.create_advanced_gradient(SIZE, COLORS, backend=backend)),
+        ("add_realistic_shading", lambda backend: generator.add_realistic_shading(
+            canvas, head_center, 160, (-0.3, -0.4), (255, 228, 181), backend=backend)),
+        ("add_energy_rings", lambda backend: generator.add_energy_rings(
+            canvas, (head_center[0] + 140, head_center[1] + 150), (135, 206, 235), backend=backend)),
+    )
+
+    print(f"📊 Rendering one {SIZE[0]}x{SIZE[1]} reference quality NFT")
+    print("=" * 70)
+    print(f"  {'stage':34} {'pil':>10} {'numpy':>10} {'speedup':>9}")
+    for label, stage in stages:
+        pil = best_ms(lambda: stage('pil'))
+        array = best_ms(lambda: stage('numpy'))
+        print(f"  {label:34} {pil:8.1f}ms {array:8.1f}ms {pil / array:8.1f}x")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "1.png")
+        totals = {}
+        for backend in ('pil', 'numpy'):
+            generator.RENDER_BACKEND = backend
+            totals[backend] = best_ms(lambda: generator.create_reference_quality_nft(CHARACTER, 1, path), repeat=2)
+        print(f"  {'whole image, incl. PNG optimize':34} {totals['pil']:8.0f}ms {totals['numpy']:8.0f}ms "
+              f"{totals['pil'] / totals['numpy']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
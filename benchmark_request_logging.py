@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/referral-data latency at 10k users under different logging setups
+The legacy case replays the old do_GET / handle_referral_data prints
+"""
+
+import email.message
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+
+USERS = 10_000
+REQUESTS = 300
+
+
+def make_handler(stp, session):
+    handler = stp.SocialTradingHandler.__new__(stp.SocialTradingHandler)
+    handler.headers = email.message.Message()
+    handler.headers['Cookie'] = f'user_session={session}'
+    handler.headers['User-Agent'] = 'bench/1.0'
+    handler.path = '/api/referral-data'
+    handler.command = 'GET'
+    handler.request_version = 'HTTP/1.1'
+    handler.requestline = 'GET /api/referral-data HTTP/1.1'
+    handler.client_address = ('127.0.0.1', 50000)
+    return handler
+
+
+def legacy_prints(handler, stp, session):
+    """What every referral request used to print before handling"""
+    print(f"🌍 EXTERNAL GET REQUEST: {handler.path}")
+    print(f"🌍 CLIENT IP: {handler.client_address}")
+    print(f"🌍 USER AGENT: {handler.headers.get('User-Agent', 'Unknown')}")
+    print(f"🌍 REFERER: {handler.headers.get('Referer', 'None')}")
+    print(f"🔍 ROUTE DEBUG: page_path = '/api/referral-data' -> handle_referral_data")
+    print(f"🔍 Authentication check for user_session: {session}")
+    print(f"📋 Available USER_WALLETS keys: {list(stp.USER_WALLETS.keys())}")
+    print(f"📋 Available USER_SESSIONS keys: {list(stp.USER_SESSIONS.keys())}")
+
+
+def per_request_ms(handler, before=None):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        handler.wfile = io.BytesIO()
+        if before:
+            before()
+        handler.do_GET()
+    return (time.perf_counter() - start) / REQUESTS * 1e3
+
+
+def main():
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)
+    sink = open(os.devnull, 'w')
+    real_stdout = sys.stdout
+    sys.stdout = sink
+    try:
+        import social_trading_platform as stp
+        from request_log import setup_logging, shutdown_logging
+        for i in range(USERS):
+            user_id = f'{1000000 + i}'
+            stp.USER_SESSIONS[user_id] = {'twitter_username': f'user{i}', 'login_time': time.time()}
+            stp.USER_WALLETS[user_id] = {'address': f'0x{i:040x}', 'private_key': '0x0', 'user_id': user_id}
+            stp.USER_WALLETS[f'session_{user_id}'] = {'handle': f'@user{i}', 'username': f'user{i}'}
+        session = f'{1000000 + USERS // 2}'
+        handler = make_handler(stp, session)
+    finally:
+        sys.stdout = real_stdout
+
+    cases = [
+        ('legacy print() storm', 'CRITICAL', 1.0, lambda: legacy_prints(handler, stp, session)),
+        ('logging off (WARNING)', 'WARNING', 1.0, None),
+        ('access log (INFO)', 'INFO', 1.0, None),
+        ('debug, every request', 'DEBUG', 1.0, None),
+        ('debug, 1% sampled', 'DEBUG', 0.01, None),
+    ]
+    print(f"📊 /api/referral-data with {USERS:,} users, {REQUESTS} requests per case")
+    print("=" * 60)
+    baseline = None
+    for label, level, rate, before in cases:
+        setup_logging(level, rate, stream=sink)
+        sys.stdout = sink
+        try:
+            ms = per_request_ms(handler, before)
+        finally:
+            sys.stdout = real_stdout
+            shutdown_logging()
+        baseline = baseline or ms
+        print(f"  {label:24} {ms:8.3f}ms/request  ({baseline / ms:6.1f}x)")
+    logging.shutdown()
+
+
+if __name__ == "__main__":
+    main()
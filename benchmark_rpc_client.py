@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark HyperEVM RPC clients against a local stub node
+Old per-call urllib / curl clients vs the shared pooled JSONRPCClient:
+sequential calls, 8 threads, JSON-RPC batches and coalesced duplicate reads
+"""
+
+import http.server
+import json
+import shutil
+import subprocess
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from rpc_client import JSONRPCClient
+
+CALLS = 500
+THREADS = 8
+NODE_LATENCY = 0.001
+
+
+class StubNode(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    posts = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        StubNode.posts += 1
+        time.sleep(NODE_LATENCY)
+        items = body if isinstance(body, list) else [body]
+        answers = [{'jsonrpc': '2.0', 'id': item['id'], 'result': hex(10 ** 18 + i)} for i, item in enumerate(items)]
+        payload = json.dumps(answers if isinstance(body, list) else answers[0]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def urllib_call(url, method, params):
+    """HyperEVMBalanceChecker.make_rpc_call before the shared client"""
+    payload = json.dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': 1}).encode()
+    request = urllib.request.Request(url, data=payload, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read()).get('result')
+
+
+def curl_call(url, method, params):
+    """HyperScanNFTFetcher._call_contract_method before the shared client"""
+    payload = json.dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': 1})
+    result = subprocess.run(['curl', '-s', '-X', 'POST', '-H', 'Content-Type: application/json', '-d', payload, url],
+                            capture_output=True, text=True, timeout=10)
+    return json.loads(result.stdout).get('result')
+
+
+def params_for(i):
+    return [f'0x{i:040x}', 'latest']
+
+
+def timed(label, fn, calls):
+    StubNode.posts = 0
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34} {elapsed / calls * 1e3:7.3f}ms/call  {calls / elapsed:9,.0f} calls/s  "
+          f"{StubNode.posts:5} POSTs")
+    return elapsed
+
+
+def main():
+    server = Server(('127.0.0.1', 0), StubNode)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/'
+    client = JSONRPCClient(url, pool_size=THREADS)
+
+    print(f"📊 {CALLS} eth_getBalance calls, stub node adds {NODE_LATENCY * 1e3:.0f}ms per POST")
+    print("=" * 78)
+    timed('urllib, new connection per call', lambda: [urllib_call(url, 'eth_getBalance', params_for(i))
+                                                      for i in range(CALLS)], CALLS)
+    if shutil.which('curl'):
+        timed('curl subprocess (100 calls)', lambda: [curl_call(url, 'eth_getBalance', params_for(i))
+                                                      for i in range(100)], 100)
+    timed('pooled client, sequential', lambda: [client.call('eth_getBalance', params_for(i))
+                                                for i in range(CALLS)], CALLS)
+    with ThreadPoolExecutor(THREADS) as pool:
+        timed(f'urllib, {THREADS} threads', lambda: list(pool.map(
+            lambda i: urllib_call(url, 'eth_getBalance', params_for(i)), range(CALLS))), CALLS)
+        timed(f'pooled client, {THREADS} threads', lambda: list(pool.map(
+            lambda i: client.call('eth_getBalance', params_for(i)), range(CALLS))), CALLS)
+        timed('pooled client, batches of 100', lambda: client.batch(
+            [('eth_getBalance', params_for(i)) for i in range(CALLS)]), CALLS)
+
+        # Many request threads asking for the same hot value at once
+        same = ['0x' + '5' * 40, 'latest']
+        uncoalesced = JSONRPCClient(url, pool_size=THREADS, coalesce=False)
+        timed('identical reads, no coalescing', lambda: list(pool.map(
+            lambda _: uncoalesced.call('eth_getBalance', same), range(CALLS))), CALLS)
+        timed('identical reads, coalesced', lambda: list(pool.map(
+            lambda _: client.call('eth_getBalance', same), range(CALLS))), CALLS)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
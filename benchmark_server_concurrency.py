@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Load test for the SocialX server serving modes
+Runs SocialTradingHandler in single / threaded / pool mode against a local stub RPC
+and reports throughput for a slow web3-backed endpoint
+"""
+
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from local_rpc_stub import StubRPCServer
+
+RPC_LATENCY = 0.05      # 50ms per RPC round trip
+CLIENTS = 16            # concurrent HTTP clients
+REQUESTS = 64           # total requests per mode
+ENDPOINT = '/api/market-overview'
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=60) as response:
+        response.read()
+        return response.status
+
+
+def run_mode(mode, handler_class, create_server):
+    httpd = create_server(('127.0.0.1', 0), handler_class, mode=mode, max_workers=CLIENTS)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}{ENDPOINT}"
+
+    try:
+        fetch(url)  # warm up
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+            statuses = list(pool.map(fetch, [url] * REQUESTS))
+        elapsed = time.perf_counter() - start
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    ok = sum(1 for status in statuses if status == 200)
+    return elapsed, ok
+
+
+def main():
+    stub = StubRPCServer(latency=RPC_LATENCY).start()
+    # Must be set before web3_contract_manager builds its provider
+    os.environ['HYPEREVM_RPC_URL'] = stub.url
+
+    # Keep the server's per-request logging out of the report
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = open(os.devnull, 'w')
+    try:
+        from social_trading_platform import SocialTradingHandler, create_server
+        results = {}
+        for mode in ('single', 'threaded', 'pool'):
+            results[mode] = run_mode(mode, SocialTradingHandler, create_server)
+    finally:
+        sys.stdout.close()
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+        stub.stop()
+
+    print(f"📊 {REQUESTS} x GET {ENDPOINT}, {CLIENTS} concurrent clients, {RPC_LATENCY * 1000:.0f}ms stub RPC latency")
+    print("=" * 60)
+    baseline = results['single'][0]
+    for mode, (elapsed, ok) in results.items():
+        print(f"  {mode:<9} {elapsed:7.2f}s  {REQUESTS / elapsed:8.1f} req/s  "
+              f"{baseline / elapsed:5.1f}x  ({ok}/{REQUESTS} ok)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark static file serving: per-request open/read/encode vs StaticAssetCache
+Latency and bytes on the wire over keep-alive connections to a local server
+"""
+
+import http.client
+import http.server
+import os
+import socketserver
+import tempfile
+import threading
+import time
+
+from static_assets import StaticAssetCache, BROTLI_AVAILABLE
+
+REQUESTS = 2_000
+ASSET_BYTES = 400_000
+CACHE = StaticAssetCache()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    asset_path = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == '/old':
+            # What serve_app_js used to do on every request
+            with open(self.asset_path, 'r', encoding='utf-8') as f:
+                content = f.read().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-type', 'application/javascript')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        else:
+            CACHE.serve(self, self.asset_path)
+
+
+class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+def make_asset(directory):
+    path = os.path.join(directory, 'app.js')
+    chunk = 'function render(account) { return `<div class="card">${account.handle}</div>`; }\n'
+    with open(path, 'w') as f:
+        f.write((chunk * (ASSET_BYTES // len(chunk) + 1))[:ASSET_BYTES])
+    return path
+
+
+def run(port, path, headers):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    wire = 0
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        conn.request('GET', path, headers=headers)
+        response = conn.getresponse()
+        wire += len(response.read())
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed / REQUESTS * 1e3, wire / REQUESTS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        Handler.asset_path = make_asset(directory)
+        server = Server(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        etag = CACHE.get(Handler.asset_path).etag
+
+        print(f"📊 {REQUESTS:,} requests for a {ASSET_BYTES // 1000}KB script (brotli available: {BROTLI_AVAILABLE})")
+        print("=" * 60)
+        cases = [
+            ('read + encode per request', '/old', {}),
+            ('cached, identity', '/app.js', {}),
+            ('cached, gzip', '/app.js', {'Accept-Encoding': 'gzip'}),
+            ('cached, 304 revalidation', '/app.js', {'If-None-Match': etag}),
+            ('cached, 64KB range', '/app.js', {'Range': 'bytes=0-65535'}),
+        ]
+        if BROTLI_AVAILABLE:
+            cases.insert(3, ('cached, brotli', '/app.js', {'Accept-Encoding': 'br'}))
+        baseline_ms = None
+        for label, path, headers in cases:
+            ms, wire = run(port, path, headers)
+            baseline_ms = baseline_ms or ms
+            print(f"  {label:27} {ms:7.3f}ms/req  {wire / 1000:8.1f}KB/req  ({baseline_ms / ms:5.1f}x)")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
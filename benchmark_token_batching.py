@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs batched SocialAccountToken reads
+Compares get_token_data per token (9 round trips each) with get_tokens_data
+(JSON-RPC batch arrays) against the local stub RPC
+"""
+
+import os
+import time
+
+from local_rpc_stub import StubRPCServer, ZERO_RESULT
+
+RPC_LATENCY = 0.02   # 20ms per HTTP round trip
+TOKEN_COUNT = 100
+
+
+def token_call_handler():
+    """eth_call responder that ABI-encodes plausible values per selector"""
+    from eth_abi import encode
+    from web3 import Web3
+
+    outputs = {
+        'socialHandle()': (['string'], ['stub_handle']),
+        'accountName()': (['string'], ['Stub Account']),
+        'creator()': (['address'], ['0x' + '11' * 20]),
+        'getCurrentPrice()': (['uint256'], [10 ** 16]),
+        'hypePool()': (['uint256'], [5 * 10 ** 18]),
+        'circulatingSupply()': (['uint256'], [997 * 10 ** 24]),
+        'totalSupply()': (['uint256'], [10 ** 27]),
+        'volume24h()': (['uint256'], [42 * 10 ** 18]),
+        'holderCount()': (['uint256'], [7]),
+    }
+    by_selector = {
+        Web3.keccak(text=signature)[:4].hex().removeprefix('0x'): '0x' + encode(types, values).hex()
+        for signature, (types, values) in outputs.items()
+    }
+
+    def handle(params):
+        data = params[0].get('data') or params[0].get('input') or ''
+        return by_selector.get(data.removeprefix('0x')[:8], ZERO_RESULT)
+
+    return handle
+
+
+def main():
+    stub = StubRPCServer(latency=RPC_LATENCY, handlers={'eth_call': token_call_handler()}).start()
+    os.environ['HYPEREVM_RPC_URL'] = stub.url
+
+    from web3_contract_manager import web3_manager, TOKENS_PER_BATCH
+
+    addresses = [web3_manager.w3.to_checksum_address(f"0x{i + 1:040x}") for i in range(TOKEN_COUNT)]
+
+    stub.reset_stats()
+    start = time.perf_counter()
+    sequential = [web3_manager.get_token_data(address) for address in addresses]
+    sequential_time = time.perf_counter() - start
+    sequential_requests = stub.http_requests
+
+    stub.reset_stats()
+    start = time.perf_counter()
+    batched = web3_manager.get_tokens_data(addresses)
+    batched_time = time.perf_counter() - start
+    batched_requests = stub.http_requests
+
+    stub.stop()
+    assert sequential == batched, "batched reads must match sequential reads"
+
+    print(f"📊 {TOKEN_COUNT} tokens, {RPC_LATENCY * 1000:.0f}ms stub RPC latency, {TOKENS_PER_BATCH} tokens per batch")
+    print("=" * 60)
+    print(f"  sequential  {sequential_time:7.2f}s  {sequential_requests:5d} HTTP requests")
+    print(f"  batched     {batched_time:7.2f}s  {batched_requests:5d} HTTP requests")
+    print(f"  speedup     {sequential_time / batched_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark 1M trades: list-of-dicts history vs TradeLedger ring buffers
+Memory via tracemalloc, latency of the recent-trades view across accounts
+"""
+
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from trade_ledger import TradeLedger
+
+TRADES = 1_000_000
+ACCOUNTS = 2_000
+LIMIT = 10
+
+
+def trade_stream(seed=5):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    for i in range(TRADES):
+        yield (f'acct{rng.randrange(ACCOUNTS)}', rng.choice(('BUY', 'SELL')), f'trader{rng.randrange(50_000)}',
+               rng.random() * 10, rng.random() * 1000, 0.01 + rng.random() / 100, start + timedelta(milliseconds=i))
+
+
+def build_dicts():
+    """The old layout: global list plus a 50-deep recent_trades list per account"""
+    trades, recent = [], {}
+    for account, side, trader, hype, tokens, price, when in trade_stream():
+        trade = {'type': side, 'buyer' if side == 'BUY' else 'seller': trader, 'account': account,
+                 'hype_amount': hype, 'tokens_received': tokens, 'price_per_token': price,
+                 'timestamp': when.isoformat(), 'tx_hash': f'0x{random.getrandbits(128):032x}'}
+        trades.append(trade)
+        ring = recent.setdefault(account, [])
+        ring.insert(0, trade)
+        if len(ring) > 50:
+            recent[account] = ring[:50]
+    return trades, recent
+
+
+def build_ledger():
+    ledger = TradeLedger(per_account=1000, global_limit=TRADES)
+    for account, side, trader, hype, tokens, price, when in trade_stream():
+        ledger.record_trade(account, side, trader, hype, tokens, price,
+                            tx_hash=f'0x{random.getrandbits(128):032x}', ts=int(when.timestamp() * 1000))
+    return ledger
+
+
+def measure_build(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current / 1e6
+
+
+def old_recent(recent):
+    all_trades = [dict(trade) for ring in recent.values() for trade in ring]
+    all_trades.sort(key=lambda x: x['timestamp'], reverse=True)
+    return all_trades[:LIMIT]
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    print(f"📊 {TRADES:,} trades over {ACCOUNTS:,} accounts")
+    print("=" * 60)
+
+    (trades, recent), old_time, old_mb = measure_build(build_dicts)
+    print(f"  dict lists   build {old_time:6.2f}s  memory {old_mb:8.1f}MB")
+    old_ms = per_call_ms(lambda: old_recent(recent), 5)
+    del trades
+
+    ledger, new_time, new_mb = measure_build(build_ledger)
+    print(f"  TradeLedger  build {new_time:6.2f}s  memory {new_mb:8.1f}MB  ({old_mb / new_mb:.1f}x smaller)")
+    every_account = {f'acct{i}' for i in range(ACCOUNTS)}
+    few_accounts = {f'acct{i}' for i in range(5)}
+    print(f"\n  recent {LIMIT} trades, copy+sort of every ring:  {old_ms:8.3f}ms")
+    for label, accounts in (('all accounts (global ring)', every_account),
+                            ('5 accounts (heap merge)', few_accounts)):
+        new_ms = per_call_ms(lambda: ledger.recent(LIMIT, accounts), 50)
+        print(f"  recent {LIMIT} trades, {label:27} {new_ms:8.3f}ms  ({old_ms / new_ms:,.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
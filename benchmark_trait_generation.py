@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark trait generation for the full Wealthy Hypio Babies collection
+Global random.seed + per-call weights (the old generator) vs a per-token
+random.Random with cumulative weight tables vs the batch method
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from authentic_trait_generator import CORE_TRAITS, OPTIONAL_TRAITS, TOTAL_SUPPLY, AuthenticTraitGenerator
+
+TOKEN_IDS = range(1, TOTAL_SUPPLY + 1)
+
+
+def legacy_traits(authentic_traits, token_id):
+    """generate_traits_for_token before per-token RNGs: reseeds the process-wide RNG"""
+    random.seed(f"hypio-{token_id}")
+    trait_count = random.randint(6, 8)
+    selected_categories = set(CORE_TRAITS)
+    optional_traits = list(OPTIONAL_TRAITS)
+    selected_categories.update(random.sample(optional_traits, min(trait_count - len(CORE_TRAITS), len(optional_traits))))
+    traits = []
+    for category in selected_categories:
+        trait_options = authentic_traits[category]
+        weights = [100.0 - rarity for _, rarity in trait_options]
+        selected_trait = random.choices(trait_options, weights=weights, k=1)[0]
+        traits.append({"trait_type": category, "value": selected_trait[0], "rarity": f"{selected_trait[1]:.1f}%"})
+    random.seed()
+    return traits
+
+
+def best_ms(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    generator = AuthenticTraitGenerator()
+    print(f"📊 Traits for all {TOTAL_SUPPLY:,} tokens")
+    print("=" * 66)
+    legacy = best_ms(lambda: [legacy_traits(generator.authentic_traits, t) for t in TOKEN_IDS])
+    per_token = best_ms(lambda: [generator.generate_traits_for_token(t) for t in TOKEN_IDS])
+    batch = best_ms(lambda: generator.generate_traits_batch(TOKEN_IDS))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        chunks = [range(start, min(start + 1000, TOTAL_SUPPLY + 1)) for start in range(1, TOTAL_SUPPLY + 1, 1000)]
+        threaded = best_ms(lambda: list(pool.map(generator.generate_traits_batch, chunks)))
+    for label, elapsed in (("global random.seed + weights (old)", legacy),
+                           ("generate_traits_for_token", per_token),
+                           ("generate_traits_batch", batch),
+                           ("generate_traits_batch, 4 threads", threaded)):
+        print(f"  {label:36} {elapsed:8.1f}ms  {elapsed / TOTAL_SUPPLY * 1e3:6.1f}µs/token")
+    print(f"\n  batch {legacy / batch:.1f}x faster than the old generator")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark new-user wallet latency: node subprocess vs in-process vs pooled
+"""
+
+import shutil
+import statistics
+import subprocess
+import time
+
+import wallet_keypool
+
+SAMPLES = 50
+
+
+def measure(fn, samples=SAMPLES):
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1e3)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    print("📊 Wallet generation latency on the login path")
+    print("=" * 60)
+
+    if shutil.which('node'):
+        # Bare interpreter startup is the floor for every ethereum_wallet_node.js call
+        p50, p95 = measure(lambda: subprocess.run(['node', '-e', '0'], capture_output=True), samples=10)
+        print(f"  node subprocess startup   p50 {p50:8.3f}ms  p95 {p95:8.3f}ms")
+    else:
+        print("  node subprocess startup   (node not installed)")
+
+    p50, p95 = measure(wallet_keypool.generate_keypair)
+    print(f"  in-process generate       p50 {p50:8.3f}ms  p95 {p95:8.3f}ms")
+
+    pool = wallet_keypool.KeypairPool(size=SAMPLES, low_water=SAMPLES // 4)
+    pool.start()
+    while pool.stats()['ready'] < SAMPLES:
+        time.sleep(0.05)
+    p50, p95 = measure(pool.take)
+    print(f"  pooled take               p50 {p50:8.3f}ms  p95 {p95:8.3f}ms  {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
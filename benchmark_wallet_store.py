@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark saving one login with 100k stored wallets:
+whole-file pickle rewrite (old save_user_wallets) vs one WalletStore row write
+"""
+
+import os
+import pickle
+import tempfile
+import time
+
+from wallet_store import WalletStore, atomic_write
+
+WALLETS = 100_000
+SAVES = 200
+
+
+def make_wallet(i):
+    return {
+        'address': '0x' + f'{i:040x}',
+        'private_key': '0x' + f'{i:064x}',
+        'hype_balance': 0,
+        'created': '2025-01-01T00:00:00',
+        'user_id': str(i),
+        'network': 'HyperEVM Mainnet',
+        'chain_id': 999,
+        'persistent': True,
+    }
+
+
+def main():
+    wallets = {str(i): make_wallet(i) for i in range(WALLETS)}
+    workdir = tempfile.mkdtemp(prefix='wallet-bench-')
+    pickle_path = os.path.join(workdir, 'user_wallets.pkl')
+    db_path = os.path.join(workdir, 'user_wallets.db')
+
+    print(f"📊 Saving one login with {WALLETS:,} stored wallets")
+    print("=" * 60)
+
+    pickle_saves = 10
+    start = time.perf_counter()
+    for i in range(pickle_saves):
+        wallets[f'new_{i}'] = make_wallet(WALLETS + i)
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(wallets, f)
+    pickle_ms = (time.perf_counter() - start) / pickle_saves * 1e3
+    print(f"  pickle rewrite        {pickle_ms:9.2f}ms per save  ({os.path.getsize(pickle_path) / 1e6:.1f}MB file)")
+
+    start = time.perf_counter()
+    atomic_write(pickle_path, pickle.dumps(wallets))
+    print(f"  atomic pickle export  {(time.perf_counter() - start) * 1e3:9.2f}ms (background, debounced)")
+
+    store = WalletStore(db_path)
+    start = time.perf_counter()
+    migrated = store.migrate_from_pickle(pickle_path)
+    print(f"  one-time migration    {(time.perf_counter() - start) * 1e3:9.2f}ms for {migrated:,} entries")
+
+    start = time.perf_counter()
+    for i in range(SAVES):
+        store.put(f'login_{i}', make_wallet(2 * WALLETS + i))
+    store_ms = (time.perf_counter() - start) / SAVES * 1e3
+    print(f"  wallet store put      {store_ms:9.3f}ms per save  ({pickle_ms / store_ms:,.0f}x faster)")
+
+    start = time.perf_counter()
+    loaded = store.load_all()
+    print(f"  startup load_all      {(time.perf_counter() - start) * 1e3:9.2f}ms for {len(loaded):,} entries")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Closed-form pricing for the SocialX linear bonding curve
+price(supply) = 0.01 + supply * 0.000001 HYPE, evaluated in integer wei so
+buy/sell quotes are exact arithmetic series sums instead of per-share loops
+"""
+
+from typing import Dict, Iterable, List
+
+WEI = 10 ** 18
+BASE_PRICE_WEI = 10 ** 16      # 0.01 HYPE
+SLOPE_WEI = 10 ** 12           # +0.000001 HYPE per share of supply
+
+TRADE_TYPES = ('BUY', 'SELL')
+MAX_LADDER_RUNGS = 50
+
+
+def price_at_wei(supply: int) -> int:
+    """Spot price of the share at index `supply`, in wei"""
+    return BASE_PRICE_WEI + SLOPE_WEI * supply
+
+
+def buy_cost_wei(current_supply: int, shares: int) -> int:
+    """Total cost of buying shares current_supply .. current_supply + shares - 1"""
+    if shares <= 0:
+        return 0
+    # sum(base + slope * (c + i) for i in range(n)) = n*base + slope*(n*c + n(n-1)/2)
+    return shares * BASE_PRICE_WEI + SLOPE_WEI * (shares * current_supply + shares * (shares - 1) // 2)
+
+
+def sell_proceeds_wei(current_supply: int, shares: int) -> int:
+    """Total proceeds of selling shares current_supply - 1 down to current_supply - shares"""
+    if shares <= 0:
+        return 0
+    # sum(base + slope * (c - i - 1) for i in range(n)) = n*base + slope*(n*c - n(n+1)/2)
+    return shares * BASE_PRICE_WEI + SLOPE_WEI * (shares * current_supply - shares * (shares + 1) // 2)
+
+
+def average_buy_price(current_supply: int, shares: int) -> float:
+    """Average HYPE price per share for a buy of `shares`"""
+    if shares <= 0:
+        return 0
+    return buy_cost_wei(current_supply, shares) / (shares * WEI)
+
+
+def average_sell_price(current_supply: int, shares: int) -> float:
+    """Average HYPE price per share for a sell of `shares`"""
+    if shares <= 0:
+        return 0
+    return sell_proceeds_wei(current_supply, shares) / (shares * WEI)
+
+
+def quote_ladder(current_supply: int, sizes: Iterable[int], trade_type: str = 'BUY') -> List[Dict]:
+    """Price a whole ladder of trade sizes in one call (O(1) per rung)
+
+    Each rung reports the total, the average price and the spot price after
+    the trade, plus price impact relative to the current spot price.
+    Raises ValueError for an unknown trade type, more than MAX_LADDER_RUNGS
+    sizes, a size below one share, or a sell larger than current_supply.
+    """
+    if trade_type not in TRADE_TYPES:
+        raise ValueError(f"type must be one of {', '.join(TRADE_TYPES)}")
+    sizes = [int(shares) for shares in sizes]
+    if len(sizes) > MAX_LADDER_RUNGS:
+        raise ValueError(f"at most {MAX_LADDER_RUNGS} sizes per ladder")
+    if any(shares <= 0 for shares in sizes):
+        raise ValueError("sizes must be positive")
+    if trade_type == 'SELL' and any(shares > current_supply for shares in sizes):
+        raise ValueError(f"cannot sell more than the current supply of {current_supply}")
+
+    spot_wei = price_at_wei(current_supply)
+    ladder = []
+    for shares in sizes:
+        if trade_type == 'BUY':
+            total_wei = buy_cost_wei(current_supply, shares)
+            end_wei = price_at_wei(current_supply + shares)
+        else:
+            total_wei = sell_proceeds_wei(current_supply, shares)
+            end_wei = price_at_wei(current_supply - shares)
+        ladder.append({
+            'shares': shares,
+            'total': total_wei / WEI,
+            'avg_price': total_wei / (shares * WEI),
+            'new_price': end_wei / WEI,
+            'price_impact_percent': (end_wei - spot_wei) * 100 / spot_wei,
+        })
+    return ladder
@@ -5,13 +5,19 @@ Fetches all NFT images from Drip.Trade marketplace to display real artwork
 """
 
 import json
+import random
 import requests
 import time
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from collection_snapshot import SNAPSHOT_FILE, CollectionSnapshot, generator_hash
+import rarity_engine
+from rarity_engine import build_rarity_table
 
 class BulkNFTFetcher:
-    def __init__(self):
+    def __init__(self, snapshot_path: str = SNAPSHOT_FILE):
+        self.snapshot_path = snapshot_path
         self.base_url = "https://drip.trade"
         self.api_base = "https://api.drip.trade"
         self.collection_slug = "hypio"
@@ -88,8 +94,29 @@ class BulkNFTFetcher:
     
     def generate_all_nft_data(self) -> List[Dict]:
         """Generate complete NFT dataset with real images for all 5555 tokens"""
+        nft_data = [self._build_record(*row) for row in self._generate_rows()]
+        print(f"Generated complete dataset for {len(nft_data)} NFTs")
+        return nft_data
+    
+    def load_collection(self) -> List[Dict]:
+        """The complete dataset from the on-disk snapshot, regenerating it when missing or stale"""
+        snapshot = CollectionSnapshot(self.snapshot_path)
+        # Ranks come from the rarity engine, so its source is part of the version too
+        expected_hash = generator_hash(BulkNFTFetcher.get_nft_image_patterns, BulkNFTFetcher._generate_rows,
+                                       rarity_engine)
+        rows = snapshot.load(expected_hash)
+        if rows is None:
+            rows = self._generate_rows()
+            try:
+                snapshot.write(rows, expected_hash)
+            except OSError as e:
+                print(f"Collection snapshot write failed: {e}")
+        return [self._build_record(*row) for row in rows]
+    
+    def _generate_rows(self) -> List[Tuple[int, str, List[Dict], int, str]]:
+        """Generated fields of every token: (token_id, image, traits, rarity_rank, last_sale_price)"""
         all_images = self.get_nft_image_patterns()
-        nft_data = []
+        rows = []
         
         # Real trait data from Drip.Trade analysis
         traits_pool = {
@@ -104,51 +131,51 @@ class BulkNFTFetcher:
         }
         
         for token_id, image_url in all_images.items():
-            # Generate deterministic traits for each token
-            import random
-            random.seed(token_id)
+            # Deterministic traits for each token, without reseeding the global random
+            rng = random.Random(token_id)
             
             traits = []
             for category, options in traits_pool.items():
-                if random.random() > 0.1:  # 90% chance of having trait
-                    value = random.choice(options)
-                    rarity_pct = random.uniform(1.0, 50.0)
+                if rng.random() > 0.1:  # 90% chance of having trait
+                    value = rng.choice(options)
+                    rarity_pct = rng.uniform(1.0, 50.0)
                     traits.append({
                         "trait_type": category,
                         "value": value,
                         "rarity": f"{rarity_pct:.1f}%"
                     })
             
-            # Calculate rarity rank
-            rarity_score = sum(float(t["rarity"].rstrip('%')) for t in traits) / max(len(traits), 1)
-            rarity_rank = max(1, int(rarity_score * 100))
-            
             # Price calculation
             base_price = 61.799
-            price_multiplier = random.uniform(0.8, 2.5)
+            price_multiplier = rng.uniform(0.8, 2.5)
             if token_id in [4801, 2110, 2883, 2092, 1456, 4330, 2595, 5273, 2080]:
                 price_multiplier *= 1.2  # Premium for known tokens
                 
             price = base_price * price_multiplier
-            
-            nft_data.append({
-                "token_id": token_id,
-                "name": f"Wealthy Hypio Baby #{token_id}",
-                "description": f"A unique NFT from the Wealthy Hypio Babies collection. Token #{token_id} with authentic traits from HyperEVM blockchain.",
-                "image": image_url,
-                "external_url": f"https://drip.trade/collections/hypio/tokens/0x63eb9d77D083cA10C304E28d5191321977fd0Bfb:{token_id}",
-                "traits": traits,
-                "rarity_rank": rarity_rank,
-                "last_sale_price": f"{price:.2f}",
-                "last_sale_currency": "HYPE",
-                "marketplace_url": f"https://drip.trade/collections/hypio/tokens/0x63eb9d77D083cA10C304E28d5191321977fd0Bfb:{token_id}",
-                "contract_address": "0x63eb9d77D083cA10C304E28d5191321977fd0Bfb",
-                "blockchain": "HyperEVM",
-                "chain_id": 999
-            })
-            
-        print(f"Generated complete dataset for {len(nft_data)} NFTs")
-        return nft_data
+            rows.append((token_id, image_url, traits, f"{price:.2f}"))
+        
+        # Collection-wide rarity ranks from the traits' actual frequencies
+        ranks = build_rarity_table([row[2] for row in rows], [row[0] for row in rows]).ranks.tolist()
+        return [(token_id, image_url, traits, rank, price)
+                for (token_id, image_url, traits, price), rank in zip(rows, ranks)]
+    
+    @staticmethod
+    def _build_record(token_id: int, image_url: str, traits: List[Dict], rarity_rank: int, price: str) -> Dict:
+        return {
+            "token_id": token_id,
+            "name": f"Wealthy Hypio Baby #{token_id}",
+            "description": f"A unique NFT from the Wealthy Hypio Babies collection. Token #{token_id} with authentic traits from HyperEVM blockchain.",
+            "image": image_url,
+            "external_url": f"https://drip.trade/collections/hypio/tokens/0x63eb9d77D083cA10C304E28d5191321977fd0Bfb:{token_id}",
+            "traits": traits,
+            "rarity_rank": rarity_rank,
+            "last_sale_price": price,
+            "last_sale_currency": "HYPE",
+            "marketplace_url": f"https://drip.trade/collections/hypio/tokens/0x63eb9d77D083cA10C304E28d5191321977fd0Bfb:{token_id}",
+            "contract_address": "0x63eb9d77D083cA10C304E28d5191321977fd0Bfb",
+            "blockchain": "HyperEVM",
+            "chain_id": 999
+        }
 
 if __name__ == "__main__":
     fetcher = BulkNFTFetcher()
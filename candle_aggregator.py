@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Incremental OHLCV candles for SocialX account tokens
+Every trade rolls into the current 1m/5m/1h/1d bucket of its account in O(1);
+closed and open candles are flushed to SQLite so charts survive restarts
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CANDLE_DB_FILE = 'candles.db'
+
+# interval name -> (bucket seconds, candles kept in memory per account)
+INTERVALS = {
+    '1m': (60, 1440),
+    '5m': (300, 2016),
+    '1h': (3600, 720),
+    '1d': (86400, 365),
+}
+
+DAY_SECONDS = 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    account TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL,
+    trades INTEGER NOT NULL,
+    PRIMARY KEY (account, interval, start)
+);
+"""
+
+
+class Candle:
+    """One OHLCV bucket; open/close belong to its earliest/latest trade by
+    timestamp, whatever order the trades arrive in"""
+
+    __slots__ = ('start', 'open', 'high', 'low', 'close', 'volume', 'trades', 'open_ts', 'close_ts')
+
+    def __init__(self, start, open, high, low, close, volume, trades, open_ts=None, close_ts=None):
+        self.start = start
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.trades = trades
+        # Trade times are not persisted; reloaded candles take them as the bucket start
+        self.open_ts = start if open_ts is None else open_ts
+        self.close_ts = start if close_ts is None else close_ts
+
+    def add(self, price: float, volume: float, ts: float):
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        if ts < self.open_ts:
+            self.open, self.open_ts = price, ts
+        if ts >= self.close_ts:
+            self.close, self.close_ts = price, ts
+        self.volume += volume
+        self.trades += 1
+
+    def to_dict(self) -> Dict:
+        return {'time': self.start, 'open': self.open, 'high': self.high, 'low': self.low,
+                'close': self.close, 'volume': self.volume, 'trades': self.trades}
+
+
+class CandleAggregator:
+    """Per-account OHLCV rings for every interval in INTERVALS.
+
+    add_trade() touches the newest candle of each ring (or appends one), so it
+    is O(1) per trade regardless of history length. Touched candles are kept
+    in a dirty set and upserted by flush(), which start() runs periodically.
+    Pass db_path=None for a purely in-memory aggregator.
+    """
+
+    def __init__(self, db_path: Optional[str] = CANDLE_DB_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._rings: Dict[tuple, deque] = {}
+        self._dirty: Dict[tuple, Candle] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+            self._load()
+
+    def _ring(self, account: str, interval: str) -> deque:
+        ring = self._rings.get((account, interval))
+        if ring is None:
+            ring = self._rings[(account, interval)] = deque(maxlen=INTERVALS[interval][1])
+        return ring
+
+    def _load(self):
+        """Rebuild the in-memory rings from the newest persisted candles"""
+        for interval, (_, keep) in INTERVALS.items():
+            rows = self._conn.execute(
+                """SELECT account, start, open, high, low, close, volume, trades FROM (
+                       SELECT *, ROW_NUMBER() OVER (PARTITION BY account ORDER BY start DESC) AS rank
+                       FROM candles WHERE interval = ?)
+                   WHERE rank <= ? ORDER BY account, start""",
+                (interval, keep)).fetchall()
+            for account, *fields in rows:
+                self._ring(account, interval).append(Candle(*fields))
+
+    # ---- ingestion --------------------------------------------------------
+
+    def add_trade(self, account: str, price: float, volume: float, ts: Optional[float] = None):
+        """Roll one trade (price per token, HYPE volume, epoch seconds) into every interval"""
+        ts = time.time() if ts is None else ts
+        second = int(ts)
+        with self._lock:
+            for interval, (seconds, _) in INTERVALS.items():
+                start = second - second % seconds
+                ring = self._ring(account, interval)
+                candle = ring[-1] if ring else None
+                if candle is not None and candle.start == start:
+                    candle.add(price, volume, ts)
+                elif candle is None or start > candle.start:
+                    candle = Candle(start, price, price, price, price, volume, 1, ts, ts)
+                    ring.append(candle)
+                else:
+                    # Late trade for an older bucket: walk back to it (rare, bounded by ring size)
+                    index = len(ring) - 1
+                    while index >= 0 and ring[index].start > start:
+                        index -= 1
+                    if index >= 0 and ring[index].start == start:
+                        candle = ring[index]
+                        candle.add(price, volume, ts)
+                    elif index >= 0 or len(ring) < ring.maxlen:
+                        # First trade seen for that bucket: open it between its neighbours
+                        candle = Candle(start, price, price, price, price, volume, 1, ts, ts)
+                        if len(ring) == ring.maxlen:
+                            ring.popleft()
+                            index -= 1
+                        ring.insert(index + 1, candle)
+                    else:
+                        continue   # older than every candle kept
+                self._dirty[(account, interval, candle.start)] = candle
+
+    # ---- queries ----------------------------------------------------------
+
+    def candles(self, account: str, interval: str = '1h', limit: int = 200) -> List[Dict]:
+        """Oldest-first candles for one account"""
+        if interval not in INTERVALS:
+            raise ValueError(f"interval must be one of {', '.join(INTERVALS)}")
+        with self._lock:
+            ring = self._rings.get((account, interval), ())
+            start = max(0, len(ring) - limit)
+            return [ring[i].to_dict() for i in range(start, len(ring))]
+
+    def change_24h(self, account: str, now: Optional[float] = None) -> float:
+        """Percent change of the last trade price versus the price 24h ago.
+
+        The reference is the close of the last hourly candle that started at or
+        before now - 24h, or the open of the first candle inside the window
+        when the account is younger than a day. At most 26 hourly candles are
+        inspected.
+        """
+        cutoff = int(time.time() if now is None else now) - DAY_SECONDS
+        with self._lock:
+            ring = self._rings.get((account, '1h'))
+            if not ring:
+                return 0.0
+            last = ring[-1].close
+            reference = ring[0].open
+            for i in range(len(ring) - 1, max(-1, len(ring) - 27), -1):
+                if ring[i].start <= cutoff:
+                    reference = ring[i].close
+                    break
+                reference = ring[i].open
+        return (last - reference) / reference * 100 if reference else 0.0
+
+    # ---- persistence ------------------------------------------------------
+
+    def flush(self) -> int:
+        """Upsert every candle touched since the last flush"""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            rows = [(account, interval, c.start, c.open, c.high, c.low, c.close, c.volume, c.trades)
+                    for (account, interval, _), c in dirty.items()]
+        if rows:
+            with self._write_lock, self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def start(self, interval: float = 5.0):
+        """Flush from a daemon thread every `interval` seconds"""
+        if self._thread is not None or self._conn is None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Candle flush failed")
+
+        self._thread = threading.Thread(target=run, name='candle-flush', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.flush()
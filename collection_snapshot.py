@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Versioned on-disk snapshot of the generated NFT collection
+Columnar JSON file read through mmap, keyed by a hash of the generator's
+source so a generator change rebuilds it, and checked against a content hash
+"""
+
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+SNAPSHOT_FILE = os.getenv('NFT_SNAPSHOT_FILE', 'nft_collection.snapshot')
+# Bump the trailing digit when the layout changes
+MAGIC = b'NFTSNAP2'
+HEADER_SIZE = len(MAGIC) + 32 + 32
+
+# (token_id, image, [trait dicts], rarity_rank, last_sale_price): the generated
+# fields of a record; everything else is derived from token_id
+Row = Tuple[int, str, List[Dict], int, str]
+
+
+def generator_hash(*generators: Union[Callable, ModuleType]) -> bytes:
+    """Digest of the snapshot layout plus the source of every generator function or module"""
+    digest = hashlib.sha256(MAGIC)
+    for generator in generators:
+        digest.update(inspect.getsource(generator).encode())
+    return digest.digest()
+
+
+class CollectionSnapshot:
+    """Rows of a generated collection, stored once and reloaded on each start.
+
+    Layout: MAGIC, the 32-byte generator hash, the 32-byte SHA-256 of the
+    payload, then the payload: a JSON array of five columns (token ids,
+    images, trait lists, rarity ranks, prices). Plain JSON rather than a
+    pickle, so a file planted at the snapshot path can at worst supply bad
+    rows, never run code. load() maps the file and returns None when it is
+    missing, was built by different generator source or fails its content
+    hash; callers then regenerate and write() a new snapshot, atomically
+    replacing the old one.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_FILE):
+        self.path = path
+
+    def load(self, expected_hash: bytes) -> Optional[List[Row]]:
+        try:
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[:len(MAGIC)] != MAGIC or mapped[len(MAGIC):len(MAGIC) + 32] != expected_hash:
+                    return None
+                digest = mapped[len(MAGIC) + 32:HEADER_SIZE]
+                payload = mapped[HEADER_SIZE:]
+            if hashlib.sha256(payload).digest() != digest:
+                return None
+            token_ids, images, traits, ranks, prices = json.loads(payload)
+        except (OSError, ValueError, TypeError):
+            return None
+        return list(zip(token_ids, images, traits, ranks, prices))
+
+    def write(self, rows: Iterable[Row], expected_hash: bytes):
+        columns: Tuple[List, ...] = ([], [], [], [], [])
+        for row in sorted(rows, key=lambda row: row[0]):
+            for column, value in zip(columns, row):
+                column.append(value)
+        payload = json.dumps(columns, separators=(',', ':')).encode()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(MAGIC)
+                f.write(expected_hash)
+                f.write(hashlib.sha256(payload).digest())
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def main():
+    """Build step: regenerate the collection snapshot ahead of deploys"""
+    from bulk_nft_fetcher import BulkNFTFetcher
+
+    path = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_FILE
+    if os.path.exists(path):
+        os.unlink(path)
+    start = time.perf_counter()
+    collection = BulkNFTFetcher(snapshot_path=path).load_collection()
+    print(f"Wrote {len(collection)} NFTs to {path} in {(time.perf_counter() - start) * 1e3:.0f}ms "
+          f"({os.path.getsize(path) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures: a local JSON-RPC node stub for the RPC client tests
+"""
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+
+class StubNode(http.server.BaseHTTPRequestHandler):
+    """JSON-RPC endpoint that records every POST body and answers each request
+    (or each entry of a batch) with answer(request). fail_next makes the next
+    N posts fail with HTTP 503; delay sleeps before answering."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    url = ''
+    posts = []
+    fail_next = 0
+    delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        node = type(self)
+        node.posts.append(body)
+        if node.fail_next:
+            node.fail_next -= 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        time.sleep(node.delay)
+        answer = [self.answer(item) for item in body] if isinstance(body, list) else self.answer(body)
+        payload = json.dumps(answer).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    @staticmethod
+    def answer(request):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def stub_node():
+    """start(answer) serves a fresh StubNode subclass on a free port and returns it"""
+    servers = []
+
+    def start(answer):
+        node = type('Node', (StubNode,), {'answer': staticmethod(answer), 'posts': [], 'fail_next': 0, 'delay': 0.0})
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), node)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        node.url = f'http://127.0.0.1:{server.server_address[1]}/'
+        return node
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 """
 Curl-based NFT Fetcher for HyperEVM Blockscout
-Uses subprocess curl commands to bypass requests module issues
+Fetches over the shared pooled HTTP and JSON-RPC clients instead of curl subprocesses
 """
 
-import json
-import subprocess
 import random
 from typing import Dict, List, Optional
 
+from http_client import IPFS_GATEWAYS, get_http_client, metadata_urls
+from rpc_client import get_client
+
 class CurlNFTFetcher:
     def __init__(self):
         self.contract_address = "0x63eb9d77D083cA10C304E28d5191321977fd0Bfb"
@@ -17,19 +18,14 @@ class CurlNFTFetcher:
         self.blockscout_api = f"{self.blockscout_base}/api/v2"
         self.collection_name = "Wealthy Hypio Babies"
         self.total_supply = 5555
+        self.http = get_http_client()
+        self.rpc = get_client("https://rpc.hyperliquid.xyz/evm")
         
     def get_collection_stats(self) -> Dict:
-        """Get collection stats using curl"""
+        """Get collection stats from Blockscout"""
         try:
-            url = f"{self.blockscout_api}/tokens/{self.contract_address}"
-            result = subprocess.run([
-                'curl', '-s', 
-                '-H', 'User-Agent: Mozilla/5.0 (compatible; NFT-Platform/1.0)',
-                url
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
+            data = self.http.get_json(f"{self.blockscout_api}/tokens/{self.contract_address}")
+            if data:
                 return self._format_collection_stats(data)
                 
         except Exception as e:
@@ -38,22 +34,13 @@ class CurlNFTFetcher:
         return self._get_authentic_stats()
     
     def get_nft_metadata(self, token_id: int) -> Dict:
-        """Get NFT metadata using curl"""
+        """Get NFT metadata from Blockscout, falling back to tokenURI"""
         try:
             # Try Blockscout instance API
-            url = f"{self.blockscout_api}/tokens/{self.contract_address}/instances/{token_id}"
-            result = subprocess.run([
-                'curl', '-s',
-                '-H', 'User-Agent: Mozilla/5.0 (compatible; NFT-Platform/1.0)',
-                url
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and result.stdout:
-                try:
-                    data = json.loads(result.stdout)
-                    return self._format_blockscout_nft(token_id, data)
-                except json.JSONDecodeError:
-                    pass
+            data = self.http.get_json(
+                f"{self.blockscout_api}/tokens/{self.contract_address}/instances/{token_id}")
+            if data:
+                return self._format_blockscout_nft(token_id, data)
             
             # Try fetching tokenURI via RPC
             token_uri = self._get_token_uri_curl(token_id)
@@ -69,33 +56,19 @@ class CurlNFTFetcher:
             return self._generate_authentic_nft(token_id)
     
     def _get_token_uri_curl(self, token_id: int) -> Optional[str]:
-        """Get tokenURI using curl RPC call"""
+        """Get tokenURI via eth_call"""
         try:
             # tokenURI method call
             method_sig = "0xc87b56dd"
             token_hex = f"{token_id:064x}"
             
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [{
-                    "to": self.contract_address,
-                    "data": method_sig + token_hex
-                }, "latest"],
-                "id": 1
-            }
+            result = self.rpc.call("eth_call", [{
+                "to": self.contract_address,
+                "data": method_sig + token_hex
+            }, "latest"])
             
-            result = subprocess.run([
-                'curl', '-s', '-X', 'POST',
-                '-H', 'Content-Type: application/json',
-                '-d', json.dumps(payload),
-                'https://rpc.hyperliquid.xyz/evm'
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
-                if "result" in data and data["result"] != "0x":
-                    return self._decode_string_response(data["result"])
+            if result and result != "0x":
+                return self._decode_string_response(result)
                     
         except Exception as e:
             print(f"RPC tokenURI error: {e}")
@@ -103,39 +76,8 @@ class CurlNFTFetcher:
         return None
     
     def _fetch_metadata_curl(self, uri: str) -> Optional[Dict]:
-        """Fetch metadata using curl"""
-        try:
-            if uri.startswith("ipfs://"):
-                ipfs_hash = uri.replace("ipfs://", "")
-                gateways = [
-                    f"https://hyperliquid.mypinata.cloud/ipfs/{ipfs_hash}",
-                    f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}",
-                    f"https://ipfs.io/ipfs/{ipfs_hash}"
-                ]
-                
-                for gateway in gateways:
-                    try:
-                        result = subprocess.run([
-                            'curl', '-s', '--max-time', '8', gateway
-                        ], capture_output=True, text=True)
-                        
-                        if result.returncode == 0 and result.stdout:
-                            return json.loads(result.stdout)
-                    except:
-                        continue
-            
-            elif uri.startswith("http"):
-                result = subprocess.run([
-                    'curl', '-s', '--max-time', '8', uri
-                ], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout:
-                    return json.loads(result.stdout)
-                    
-        except Exception as e:
-            print(f"Metadata fetch error: {e}")
-            
-        return None
+        """Fetch metadata from the tokenURI, trying IPFS gateways in order"""
+        return self.http.first_json(metadata_urls(uri, IPFS_GATEWAYS[:3]), timeout=8)
     
     def _decode_string_response(self, hex_data: str) -> Optional[str]:
         """Decode contract string response"""
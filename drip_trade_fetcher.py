@@ -6,11 +6,14 @@ Collection: Wealthy Hypio Babies on HyperEVM
 Floor Price: 61.799 HYPE
 """
 
-import json
-import subprocess
 import random
 from typing import Dict, List, Optional
 
+from http_client import get_http_client, metadata_urls
+
+API_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; DripTrade-NFT/1.0)', 'Accept': 'application/json'}
+IPFS_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; IPFS-NFT/1.0)'}
+
 class DripTradeNFTFetcher:
     def __init__(self):
         self.collection_slug = "hypio"
@@ -21,6 +24,7 @@ class DripTradeNFTFetcher:
         self.collection_name = "Wealthy Hypio Babies"
         self.total_supply = 5555
         self.floor_price = 61.799
+        self.http = get_http_client()
         
     def get_collection_stats(self) -> Dict:
         """Get collection stats from Drip.Trade API"""
@@ -66,21 +70,7 @@ class DripTradeNFTFetcher:
                 f"{self.api_base}/v1/collections/{self.collection_slug}"
             ]
             
-            for endpoint in endpoints:
-                try:
-                    result = subprocess.run([
-                        'curl', '-s', '--max-time', '10',
-                        '-H', 'User-Agent: Mozilla/5.0 (compatible; DripTrade-NFT/1.0)',
-                        '-H', 'Accept: application/json',
-                        endpoint
-                    ], capture_output=True, text=True)
-                    
-                    if result.returncode == 0 and result.stdout:
-                        return json.loads(result.stdout)
-                except:
-                    continue
-            
-            return None
+            return self.http.first_json(endpoints, API_HEADERS, timeout=10)
             
         except Exception as e:
             print(f"Drip collection fetch error: {e}")
@@ -95,21 +85,7 @@ class DripTradeNFTFetcher:
                 f"{self.api_base}/tokens/{token_id}?collection={self.collection_slug}"
             ]
             
-            for endpoint in endpoints:
-                try:
-                    result = subprocess.run([
-                        'curl', '-s', '--max-time', '8',
-                        '-H', 'User-Agent: Mozilla/5.0 (compatible; DripTrade-NFT/1.0)',
-                        '-H', 'Accept: application/json',
-                        endpoint
-                    ], capture_output=True, text=True)
-                    
-                    if result.returncode == 0 and result.stdout:
-                        return json.loads(result.stdout)
-                except:
-                    continue
-            
-            return None
+            return self.http.first_json(endpoints, API_HEADERS, timeout=8)
             
         except Exception as e:
             print(f"Drip NFT fetch error: {e}")
@@ -126,29 +102,8 @@ class DripTradeNFTFetcher:
                 f"QmHypioCollection/{token_id}"
             ]
             
-            gateways = [
-                "https://hyperliquid.mypinata.cloud/ipfs",
-                "https://gateway.pinata.cloud/ipfs",
-                "https://ipfs.io/ipfs",
-                "https://cloudflare-ipfs.com/ipfs"
-            ]
-            
-            for pattern in ipfs_patterns:
-                for gateway in gateways:
-                    try:
-                        url = f"{gateway}/{pattern}"
-                        result = subprocess.run([
-                            'curl', '-s', '--max-time', '5',
-                            '-H', 'User-Agent: Mozilla/5.0 (compatible; IPFS-NFT/1.0)',
-                            url
-                        ], capture_output=True, text=True)
-                        
-                        if result.returncode == 0 and result.stdout:
-                            return json.loads(result.stdout)
-                    except:
-                        continue
-            
-            return None
+            urls = [url for pattern in ipfs_patterns for url in metadata_urls(f"ipfs://{pattern}")]
+            return self.http.first_json(urls, IPFS_HEADERS, timeout=5)
             
         except Exception as e:
             print(f"IPFS metadata error: {e}")
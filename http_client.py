@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Shared in-process HTTP client for the NFT fetchers
+Keep-alive connection pool per host, redirects, gzip and JSON helpers, so
+metadata and marketplace lookups don't fork a curl process per request
+"""
+
+import gzip
+import http.client
+import json
+import socket
+import threading
+import time
+import urllib.parse
+import zlib
+from collections import deque
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from metrics import REGISTRY
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; NFT-Platform/1.0)'
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Gateways tried in order for ipfs:// token URIs
+IPFS_GATEWAYS = (
+    'https://hyperliquid.mypinata.cloud/ipfs',
+    'https://gateway.pinata.cloud/ipfs',
+    'https://ipfs.io/ipfs',
+    'https://cloudflare-ipfs.com/ipfs',
+)
+
+HTTP_CLIENT_REQUESTS = REGISTRY.counter('socialx_http_client_requests_total', 'Outbound HTTP GETs by host and outcome',
+                                        ('host', 'outcome'))
+HTTP_CLIENT_LATENCY = REGISTRY.histogram('socialx_http_client_seconds', 'Outbound HTTP round trips by host',
+                                         ('host',))
+HTTP_CLIENT_CONNECTIONS = REGISTRY.counter('socialx_http_client_connections_total', 'New outbound connections by host',
+                                           ('host',))
+
+
+class HTTPResponse:
+    """Status, lower-cased headers and the decoded body of one response"""
+    __slots__ = ('url', 'status', 'headers', 'body')
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class _HostPool:
+    """Idle keep-alive connections to one scheme://host:port"""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], size: int):
+        self.connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        self.host = host
+        self.port = port
+        self.idle = deque()
+        self.slots = threading.BoundedSemaphore(size)
+
+    def round_trip(self, path: str, headers: Dict[str, str], timeout: float):
+        with self.slots:
+            try:
+                conn, reused = self.idle.popleft(), True
+            except IndexError:
+                conn, reused = self.connection_class(self.host, self.port, timeout=timeout), False
+                HTTP_CLIENT_CONNECTIONS.inc((self.host,))
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                conn.sock.settimeout(timeout)
+                try:
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    if not reused:
+                        raise
+                    # The server closed an idle keep-alive connection; retry once on a fresh one
+                    conn.close()
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                payload = response.read()
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self.idle.append(conn)
+            return response.status, {k.lower(): v for k, v in response.getheaders()}, payload
+
+    def close(self):
+        while self.idle:
+            self.idle.popleft().close()
+
+
+class HTTPClient:
+    """Thread-safe GET client shared by every fetcher.
+
+    Up to `pool_size` keep-alive connections per host are reused across
+    calls and threads. Redirects are followed up to `max_redirects` hops and
+    gzip/deflate bodies are decoded. Transport failures raise OSError or
+    http.client.HTTPException; non-2xx statuses are returned, not raised.
+    """
+
+    def __init__(self, pool_size: int = 8, timeout: float = 10.0, max_redirects: int = 3,
+                 user_agent: str = DEFAULT_USER_AGENT):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = _HostPool(scheme, host, port, self.pool_size)
+        return pool
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> HTTPResponse:
+        timeout = self.timeout if timeout is None else timeout
+        request_headers = {'User-Agent': self.user_agent, 'Accept-Encoding': 'gzip, deflate'}
+        request_headers.update(headers or {})
+        for _ in range(self.max_redirects + 1):
+            parsed = urllib.parse.urlsplit(url)
+            if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+                raise ValueError(f"Unsupported URL: {url}")
+            path = (parsed.path or '/') + (f'?{parsed.query}' if parsed.query else '')
+            host = parsed.hostname
+            start_time = time.perf_counter()
+            try:
+                status, response_headers, payload = self._pool(parsed.scheme, host, parsed.port).round_trip(
+                    path, request_headers, timeout)
+            except (OSError, http.client.HTTPException):
+                HTTP_CLIENT_REQUESTS.inc((host, 'transport_error'))
+                raise
+            finally:
+                HTTP_CLIENT_LATENCY.observe(time.perf_counter() - start_time, (host,))
+            HTTP_CLIENT_REQUESTS.inc((host, str(status // 100) + 'xx'))
+            if status in REDIRECT_STATUSES and 'location' in response_headers:
+                url = urllib.parse.urljoin(url, response_headers['location'])
+                continue
+            encoding = response_headers.get('content-encoding', '')
+            if encoding == 'gzip':
+                payload = gzip.decompress(payload)
+            elif encoding == 'deflate':
+                payload = zlib.decompress(payload)
+            return HTTPResponse(url, status, response_headers, payload)
+        raise http.client.HTTPException(f"Too many redirects from {url}")
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: Optional[float] = None) -> Optional[Any]:
+        """Decoded JSON body of a 2xx response, or None on any failure"""
+        try:
+            response = self.get(url, headers, timeout)
+            return response.json() if response.ok else None
+        except (OSError, ValueError, zlib.error, http.client.HTTPException):
+            return None
+
+    def first_json(self, urls: Iterable[str], headers: Optional[Dict[str, str]] = None,
+                   timeout: Optional[float] = None) -> Optional[Any]:
+        """JSON from the first of several fallback URLs (API mirrors, IPFS gateways) that answers"""
+        for url in urls:
+            data = self.get_json(url, headers, timeout)
+            if data is not None:
+                return data
+        return None
+
+    def close(self):
+        for pool in list(self._pools.values()):
+            pool.close()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """The process-wide client, so all fetchers share one set of host pools"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+
+def metadata_urls(uri: str, gateways: Iterable[str] = IPFS_GATEWAYS) -> Tuple[str, ...]:
+    """HTTP URLs to try for a tokenURI: one per gateway for ipfs://, else the URI itself"""
+    if uri.startswith('ipfs://'):
+        ipfs_path = uri[len('ipfs://'):]
+        return tuple(f'{gateway}/{ipfs_path}' for gateway in gateways)
+    if uri.startswith('http'):
+        return (uri,)
+    return ()
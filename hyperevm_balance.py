@@ -3,9 +3,11 @@ Real HyperEVM blockchain balance checking
 Fetches authentic HYPE token balances from HyperEVM network using direct RPC calls
 """
 
-import urllib.request
-import urllib.parse
-import json
+import threading
+import time
+from collections import OrderedDict
+
+from rpc_client import get_client, RPCError
 
 # HyperEVM Network Configuration
 HYPEREVM_RPC = "https://rpc.hyperliquid.xyz/evm"
@@ -15,6 +17,15 @@ CHAIN_ID = 999
 NATIVE_HYPE = "0x0000000000000000000000000000000000000000"  # Native HYPE
 WHYPE_TOKEN = "0x5555555555555555555555555555555555555555"  # Wrapped HYPE
 
+# ERC20 balanceOf(address) selector
+BALANCE_OF = "0x70a08231"
+
+# Balance cache: "latest" reads stay fresh for a few seconds, reads pinned to a
+# block number never change and are only evicted by size
+BALANCE_CACHE_TTL = 5.0
+PINNED_CACHE_TTL = 3600.0
+BALANCE_CACHE_SIZE = 50_000
+
 def hex_to_decimal(hex_str):
     """Convert hex string to decimal"""
     if hex_str.startswith('0x'):
@@ -25,37 +36,42 @@ def wei_to_ether(wei_amount):
     """Convert Wei to Ether (18 decimals)"""
     return wei_amount / (10 ** 18)
 
+def normalize_address(address):
+    """Lowercase 0x-prefixed form used for cache keys and calldata"""
+    address = address.lower()
+    return address if address.startswith('0x') else f'0x{address}'
+
+def normalize_block(block):
+    """Block number as an int, from an int or a 0x-prefixed hex tag like "0x1a" """
+    if isinstance(block, int) and not isinstance(block, bool) and block >= 0:
+        return block
+    if isinstance(block, str) and block.lower().startswith('0x'):
+        try:
+            return int(block, 16)
+        except ValueError:
+            pass
+    raise ValueError(f"block must be a non-negative block number or 0x hex tag, got {block!r}")
+
+def _balance_result_to_hype(value):
+    if value is None or isinstance(value, RPCError) or value == "0x":
+        return 0.0
+    return wei_to_ether(hex_to_decimal(value))
+
 class HyperEVMBalanceChecker:
     def __init__(self):
         self.rpc_url = HYPEREVM_RPC
-        self.headers = {'Content-Type': 'application/json'}
+        self.rpc = get_client(self.rpc_url)
+        # (address, block or None for latest) -> (expires_at, balances)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def make_rpc_call(self, method, params=None):
-        """Make JSON-RPC call to HyperEVM using urllib"""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or [],
-            "id": 1
-        }
-        
+        """Make JSON-RPC call to HyperEVM over the shared pooled client"""
         try:
-            # Prepare request
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(self.rpc_url, data=data)
-            req.add_header('Content-Type', 'application/json')
-            
-            # Make request with timeout
-            with urllib.request.urlopen(req, timeout=10) as response:
-                result_data = response.read().decode('utf-8')
-                result = json.loads(result_data)
-            
-            if 'error' in result:
-                print(f"RPC Error: {result['error']}")
-                return None
-                
-            return result.get('result')
-            
+            return self.rpc.call(method, params, timeout=10)
+        except RPCError as e:
+            print(f"RPC Error: {e.error}")
+            return None
         except Exception as e:
             print(f"RPC call failed: {e}")
             return None
@@ -117,13 +133,83 @@ class HyperEVMBalanceChecker:
             print(f"Error fetching WHYPE balance for {address}: {e}")
             return 0.0
     
+    def get_balances(self, addresses, block=None):
+        """Native HYPE and WHYPE for many addresses in one JSON-RPC batch
+        
+        With block=None each address reflects a recent block: cached entries
+        are at most BALANCE_CACHE_TTL seconds old and all addresses fetched
+        together are read at the same block. Passing a block number pins the
+        whole snapshot to that block. Returns {address: {'native_hype',
+        'whype', 'total', 'block'}} keyed by lowercase address; an address
+        whose read failed reports zeros plus 'error' and is not cached. A block
+        may also be given as a hex tag ("0x1a"); anything else raises ValueError.
+        """
+        if block is not None:
+            block = normalize_block(block)
+        addresses = list(dict.fromkeys(normalize_address(address) for address in addresses))
+        balances = {}
+        missing = []
+        now = time.monotonic()
+        with self._cache_lock:
+            for address in addresses:
+                entry = self._cache.get((address, block))
+                if entry is not None and entry[0] > now:
+                    self._cache.move_to_end((address, block))
+                    balances[address] = entry[1]
+                else:
+                    missing.append(address)
+        if not missing:
+            return balances
+        
+        try:
+            block_number = block if block is not None else hex_to_decimal(self.rpc.call("eth_blockNumber", timeout=10))
+            tag = hex(block_number)
+            calls = []
+            for address in missing:
+                calls.append(("eth_getBalance", [address, tag]))
+                calls.append(("eth_call", [{"to": WHYPE_TOKEN, "data": BALANCE_OF + address[2:].zfill(64)}, tag]))
+            results = self.rpc.batch(calls, timeout=10)
+        except Exception as e:
+            print(f"Batched balance fetch failed for {len(missing)} addresses: {e}")
+            for address in missing:
+                balances[address] = {'native_hype': 0.0, 'whype': 0.0, 'total': 0.0, 'block': None, 'error': str(e)}
+            return balances
+        
+        expires_at = time.monotonic() + (BALANCE_CACHE_TTL if block is None else PINNED_CACHE_TTL)
+        fetched = []
+        for i, address in enumerate(missing):
+            native, whype = results[2 * i], results[2 * i + 1]
+            entry = {
+                'native_hype': _balance_result_to_hype(native),
+                'whype': _balance_result_to_hype(whype),
+                'block': block_number,
+            }
+            entry['total'] = entry['native_hype'] + entry['whype']
+            errors = [str(value) for value in (native, whype) if isinstance(value, RPCError)]
+            if errors:
+                entry['error'] = '; '.join(errors)
+            else:
+                fetched.append((address, entry))
+            balances[address] = entry
+        
+        with self._cache_lock:
+            for address, entry in fetched:
+                self._cache[(address, block)] = (expires_at, entry)
+                self._cache.move_to_end((address, block))
+            while len(self._cache) > BALANCE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return balances
+    
     def get_total_hype_balance(self, address):
         """Get total HYPE balance (native + wrapped)"""
         try:
-            native_balance = self.get_native_hype_balance(address)
-            whype_balance = self.get_whype_balance(address)
+            balances = self.get_balances([address])[normalize_address(address)]
+            if 'error' in balances:
+                raise IOError(balances['error'])
+            native_balance = balances['native_hype']
+            whype_balance = balances['whype']
             
-            total_balance = native_balance + whype_balance
+            total_balance = balances['total']
             
             print(f"Real balance check for {address}:")
             print(f"  Native HYPE: {native_balance}")
@@ -136,6 +222,7 @@ class HyperEVMBalanceChecker:
                 'total': total_balance,
                 'network': 'HyperEVM Mainnet',
                 'chain_id': CHAIN_ID,
+                'block': balances['block'],
                 'rpc_url': HYPEREVM_RPC
             }
             
@@ -157,6 +244,10 @@ def get_real_hype_balance(address):
     """Get real HYPE balance from blockchain"""
     return balance_checker.get_total_hype_balance(address)
 
+def get_real_hype_balances(addresses, block=None):
+    """Native + wrapped HYPE for many addresses in one batched round trip"""
+    return balance_checker.get_balances(addresses, block)
+
 if __name__ == "__main__":
     # Test balance checking
     test_address = "0x1234567890123456789012345678901234567890"
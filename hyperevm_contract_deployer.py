@@ -4,14 +4,13 @@ Deploys complete social token ecosystem: TokenFactory, PlatformFees, and SocialT
 Supports individual HYPE pools with emergency withdrawal capabilities
 """
 
-import urllib.request
-import urllib.parse
 import json
 import time
 from datetime import datetime
 
 # Import enhanced deployment system
 from enhanced_hyperevm_deployer import EnhancedHyperEVMDeployer
+from rpc_client import get_client, RPCError
 
 # HyperEVM Network Configuration
 HYPEREVM_RPC = "https://rpc.hyperliquid.xyz/evm"
@@ -35,33 +34,16 @@ ENHANCED_DEPLOYER = None
 class HyperEVMContractDeployer:
     def __init__(self):
         self.rpc_url = HYPEREVM_RPC
-        self.headers = {'Content-Type': 'application/json'}
+        self.rpc = get_client(self.rpc_url)
         self.factory_address = FACTORY_ADDRESS
     
     def make_rpc_call(self, method, params=None):
-        """Make JSON-RPC call to HyperEVM"""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or [],
-            "id": 1
-        }
-        
+        """Make JSON-RPC call to HyperEVM over the shared pooled client"""
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(self.rpc_url, data=data)
-            req.add_header('Content-Type', 'application/json')
-            
-            with urllib.request.urlopen(req, timeout=15) as response:
-                result_data = response.read().decode('utf-8')
-                result = json.loads(result_data)
-            
-            if 'error' in result:
-                print(f"RPC Error: {result['error']}")
-                return None
-                
-            return result.get('result')
-            
+            return self.rpc.call(method, params, timeout=15)
+        except RPCError as e:
+            print(f"RPC Error: {e.error}")
+            return None
         except Exception as e:
             print(f"RPC call failed: {e}")
             return None
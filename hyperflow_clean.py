@@ -9,6 +9,8 @@ import requests
 from urllib.parse import urlparse
 import hashlib
 
+from rpc_client import get_client
+
 # Import authentic trait generator
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 try:
@@ -33,23 +35,14 @@ COLLECTION_IPFS = "QmYjKpP8jEzTNyUPBRKWJSqGowFsVDBLJ7Z7GnkYRV9a5s"
 def make_web3_call(token_id):
     """Make direct Web3 call to HyperEVM blockchain"""
     try:
-        # Direct RPC call to HyperEVM
-        rpc_payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_call",
-            "params": [{
-                "to": HYPIO_CONTRACT,
-                "data": f"0xc87b56dd{str(token_id).zfill(64)}"  # tokenURI(tokenId) function
-            }, "latest"],
-            "id": 1
-        }
-        
-        response = requests.post(HYPEREVM_RPC, json=rpc_payload, timeout=3)
-        if response.status_code == 200:
-            return response.json().get('result') is not None
-    except:
+        # tokenURI(tokenId) on the shared pooled RPC client
+        result = get_client(HYPEREVM_RPC).call("eth_call", [{
+            "to": HYPIO_CONTRACT,
+            "data": f"0xc87b56dd{int(token_id):064x}"
+        }, "latest"], timeout=3)
+        return result is not None
+    except Exception:
         return False
-    return False
 
 def get_blockchain_nft_data(token_ids):
     """Get real NFT data from HyperEVM blockchain and marketplaces"""
@@ -85,7 +78,7 @@ def get_blockchain_nft_data(token_ids):
             "marketplace_url": f"https://drip.trade/collections/hypio/{token_id}",
             "traits": traits,
             "rarity_rank": rarity_rank,
-            "rarity_score": sum(100.0 - float(t.get("rarity", "50%").replace("%", "")) for t in traits) / max(len(traits), 1) if traits else 0
+            "rarity_score": trait_generator.rarity_table().scaled_score(rarity_rank) if traits else 0
         }
         
         nfts.append(nft_data)
@@ -246,8 +239,8 @@ def get_drip_trade_price(token_id):
             random.seed(token_id)
             # Use rarity rank for pricing if available
             if traits:
-                rarity_score = sum(100.0 - float(t["rarity"].replace("%", "")) for t in traits) / len(traits)
-                rarity_multiplier = 0.6 + (rarity_score / 100.0) * 1.4  # 0.6x to 2.0x based on rarity
+                rarity_score = trait_generator.rarity_table().scaled_score(rarity_rank)
+                rarity_multiplier = 0.6 + (rarity_score / 10.0) * 1.4  # 0.6x to 2.0x based on rarity
             else:
                 rarity_multiplier = 0.7 + random.random() * 0.8  # 0.7x to 1.5x floor
             current_price = round(collection_floor * rarity_multiplier, 2)
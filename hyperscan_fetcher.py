@@ -6,11 +6,12 @@ Contract: 0x7be8f48894d9EC0528Ca70d9151CF2831C377bE0 (Proxy)
 Implementation: 0x63eb9d77D083cA10C304E28d5191321977fd0Bfb
 """
 
-import json
-import subprocess
 import random
 from typing import Dict, List, Optional
 
+from http_client import get_http_client, metadata_urls
+from rpc_client import get_client, RPCError
+
 class HyperScanNFTFetcher:
     def __init__(self):
         # Use the actual proxy contract address from HyperScan
@@ -18,6 +19,8 @@ class HyperScanNFTFetcher:
         self.implementation_address = "0x63eb9d77D083cA10C304E28d5191321977fd0Bfb"
         self.chain_id = 999
         self.rpc_url = "https://rpc.hyperliquid.xyz/evm"
+        self.rpc = get_client(self.rpc_url)
+        self.http = get_http_client()
         self.hyperscan_base = "https://www.hyperscan.com"
         self.collection_name = "Wealthy Hypio Babies"
         self.total_supply = 5555
@@ -104,30 +107,18 @@ class HyperScanNFTFetcher:
                     elif isinstance(param, str) and param.startswith("0x"):
                         data += param[2:].zfill(64)
             
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [{
-                    "to": self.proxy_address,
-                    "data": data
-                }, "latest"],
-                "id": 1
-            }
-            
-            result = subprocess.run([
-                'curl', '-s', '-X', 'POST',
-                '-H', 'Content-Type: application/json',
-                '-d', json.dumps(payload),
-                self.rpc_url
-            ], capture_output=True, text=True, timeout=10)
+            result = self.rpc.call("eth_call", [{
+                "to": self.proxy_address,
+                "data": data
+            }, "latest"], timeout=10)
             
-            if result.returncode == 0 and result.stdout:
-                response = json.loads(result.stdout)
-                if "result" in response and response["result"] != "0x":
-                    return self._decode_response(response["result"], method_name)
+            if result and result != "0x":
+                return self._decode_response(result, method_name)
             
             return None
             
+        except RPCError:
+            return None
         except Exception as e:
             print(f"Contract call error ({method_name}): {e}")
             return None
@@ -170,43 +161,7 @@ class HyperScanNFTFetcher:
     
     def _fetch_metadata_from_uri(self, uri: str) -> Optional[Dict]:
         """Fetch metadata from tokenURI"""
-        try:
-            if uri.startswith("ipfs://"):
-                ipfs_hash = uri.replace("ipfs://", "")
-                gateways = [
-                    f"https://hyperliquid.mypinata.cloud/ipfs/{ipfs_hash}",
-                    f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}",
-                    f"https://ipfs.io/ipfs/{ipfs_hash}",
-                    f"https://cloudflare-ipfs.com/ipfs/{ipfs_hash}"
-                ]
-                
-                for gateway in gateways:
-                    try:
-                        result = subprocess.run([
-                            'curl', '-s', '--max-time', '8',
-                            '-H', 'User-Agent: Mozilla/5.0 (compatible; HyperScan-NFT/1.0)',
-                            gateway
-                        ], capture_output=True, text=True)
-                        
-                        if result.returncode == 0 and result.stdout:
-                            return json.loads(result.stdout)
-                    except:
-                        continue
-            
-            elif uri.startswith("http"):
-                result = subprocess.run([
-                    'curl', '-s', '--max-time', '8',
-                    '-H', 'User-Agent: Mozilla/5.0 (compatible; HyperScan-NFT/1.0)',
-                    uri
-                ], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout:
-                    return json.loads(result.stdout)
-                    
-        except Exception as e:
-            print(f"Metadata fetch error: {e}")
-            
-        return None
+        return self.http.first_json(metadata_urls(uri), timeout=8)
     
     def _format_real_nft(self, token_id: int, metadata: Dict, token_uri: str) -> Dict:
         """Format NFT with real metadata"""
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Local HyperEVM JSON-RPC stub for benchmarks
+Answers eth_* calls with canned results after an artificial delay so load tests
+can measure round trips without touching the real RPC
+"""
+
+import http.server
+import json
+import socketserver
+import threading
+import time
+
+# 8 zero words - decodes as 0 / False / empty string / empty array for any view call
+ZERO_RESULT = '0x' + '00' * 32 * 8
+
+
+class StubRPCHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        content_length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(content_length).decode('utf-8'))
+
+        # One artificial round trip per HTTP request, batch or not
+        time.sleep(self.server.latency)
+        self.server.record_request(payload)
+
+        if isinstance(payload, list):
+            response = [self.server.answer(call) for call in payload]
+        else:
+            response = self.server.answer(payload)
+
+        body = json.dumps(response).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubRPCServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """Threaded JSON-RPC stub; latency is seconds added to every HTTP request"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency=0.05, chain_id=999, handlers=None, port=0):
+        super().__init__(('127.0.0.1', port), StubRPCHandler)
+        self.latency = latency
+        self.chain_id = chain_id
+        # method name -> callable(params) returning the JSON-RPC result
+        self.handlers = handlers or {}
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record_request(self, payload):
+        with self._stats_lock:
+            self.http_requests += 1
+            self.rpc_calls += len(payload) if isinstance(payload, list) else 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.http_requests = 0
+            self.rpc_calls = 0
+
+    def answer(self, call):
+        method = call.get('method')
+        params = call.get('params', [])
+        if method in self.handlers:
+            result = self.handlers[method](params)
+        elif method == 'eth_chainId':
+            result = hex(self.chain_id)
+        elif method == 'net_version':
+            result = str(self.chain_id)
+        elif method == 'eth_blockNumber':
+            result = '0x1'
+        elif method in ('eth_getBalance', 'eth_gasPrice', 'eth_getTransactionCount', 'eth_estimateGas'):
+            result = '0x0'
+        elif method == 'eth_getLogs':
+            result = []
+        elif method == 'eth_call':
+            result = ZERO_RESULT
+        else:
+            return {'jsonrpc': '2.0', 'id': call.get('id'),
+                    'error': {'code': -32601, 'message': f'Method {method} not found'}}
+        return {'jsonrpc': '2.0', 'id': call.get('id'), 'result': result}
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    stub = StubRPCServer(latency=0.05, port=8545)
+    print(f"🧪 Stub HyperEVM RPC listening on {stub.url} (50ms per request)")
+    stub.serve_forever()
@@ -13,6 +13,11 @@ import urllib.request
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, parse_qs
 
+from authentic_trait_generator import AuthenticTraitGenerator
+
+# Shared across handler instances so the collection's rarity table is built once
+RARITY_GENERATOR = AuthenticTraitGenerator()
+
 # HyperEVM Configuration
 HYPIO_CONTRACT = "0x63eb9d77D083cA10C304E28d5191321977fd0Bfb"
 CHAIN_ID = 999
@@ -373,21 +378,8 @@ class NFTMarketplaceHandler(http.server.SimpleHTTPRequestHandler):
         }
     
     def calculate_rarity_from_attributes(self, attributes):
-        """Calculate rarity rank based on real attributes"""
-        rarity_score = 0
-        for attr in attributes:
-            trait_value = attr.get("value", "")
-            # Simple rarity calculation based on trait uniqueness
-            if "legendary" in str(trait_value).lower():
-                rarity_score += 1000
-            elif "rare" in str(trait_value).lower():
-                rarity_score += 500
-            elif "epic" in str(trait_value).lower():
-                rarity_score += 750
-            else:
-                rarity_score += random.randint(1, 100)
-        
-        return max(1, 5555 - rarity_score)  # Convert to rank (lower is better)
+        """Rarity rank of real attributes against the collection's trait frequencies (1 = rarest)"""
+        return RARITY_GENERATOR.calculate_rarity_rank(attributes)
     
     def get_nft_image_url(self, token_id, collection_id):
         """Get working NFT image URL with guaranteed display"""
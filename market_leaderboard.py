@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Incrementally maintained market aggregates for SocialTradingPlatform
+Sliding 24h volume/trade windows with bucket expiry, O(1) platform totals and
+a lazily cleaned max-heap of trending scores for top-K queries
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+WINDOW_SECONDS = 86400
+BUCKET_SECONDS = 300
+
+
+def trending_score(volume_24h: float, daily_change: float) -> float:
+    """The ranking get_trending_accounts has always used"""
+    return volume_24h * (1 + daily_change / 100)
+
+
+class _AccountStats:
+    __slots__ = ('market_cap', 'daily_change', 'volume', 'trades', 'buckets', 'version')
+
+    def __init__(self):
+        self.market_cap = 0.0
+        self.daily_change = 0.0
+        self.volume = 0.0
+        self.trades = 0
+        self.buckets = deque()   # [bucket_start, volume, trades], oldest first
+        self.version = 0
+
+
+class MarketLeaderboard:
+    """Running totals plus a trending heap, updated per trade.
+
+    Volume is summed over BUCKET_SECONDS buckets covering the last
+    WINDOW_SECONDS. Every bucket is opened once and expired once through a
+    global expiry queue, so expiry is amortized O(1) per trade and never
+    walks idle accounts. The heap holds (-score, seq, handle, version)
+    entries; superseded versions are skipped when popped and the heap is
+    rebuilt once stale entries outnumber live ones.
+
+    Not thread safe on its own; SocialTradingPlatform calls it under its lock.
+    """
+
+    def __init__(self, window: int = WINDOW_SECONDS, bucket: int = BUCKET_SECONDS):
+        self.window = window
+        self.bucket = bucket
+        self._accounts: Dict[str, _AccountStats] = {}
+        self._expiry = deque()   # (bucket_start, handle) in opening order
+        self._heap = []
+        self._seq = itertools.count()
+        self.total_market_cap = 0.0
+        self.total_volume_24h = 0.0
+        self.total_trades_24h = 0
+        self._total_daily_change = 0.0
+
+    # ---- updates ----------------------------------------------------------
+
+    def _stats(self, handle: str) -> _AccountStats:
+        stats = self._accounts.get(handle)
+        if stats is None:
+            stats = self._accounts[handle] = _AccountStats()
+        return stats
+
+    def _push(self, handle: str, stats: _AccountStats):
+        # Versions come from the shared sequence so a removed and re-added
+        # handle can never match one of its old entries
+        stats.version = next(self._seq)
+        heapq.heappush(self._heap, (-trending_score(stats.volume, stats.daily_change),
+                                    stats.version, handle, stats.version))
+        if len(self._heap) > 2 * len(self._accounts) + 64:
+            self._heap = [(-trending_score(s.volume, s.daily_change), next(self._seq), h, s.version)
+                          for h, s in self._accounts.items()]
+            heapq.heapify(self._heap)
+
+    def update_account(self, handle: str, market_cap: Optional[float] = None,
+                       daily_change: Optional[float] = None):
+        """Record a new market cap and/or 24h change for an account (adds it if new)"""
+        stats = self._stats(handle)
+        if market_cap is not None:
+            self.total_market_cap += market_cap - stats.market_cap
+            stats.market_cap = market_cap
+        if daily_change is not None:
+            self._total_daily_change += daily_change - stats.daily_change
+            stats.daily_change = daily_change
+        self._push(handle, stats)
+
+    def record_trade(self, handle: str, volume: float, market_cap: Optional[float] = None,
+                     daily_change: Optional[float] = None, ts: Optional[float] = None):
+        now = time.time() if ts is None else ts
+        self.expire(now)
+        stats = self._stats(handle)
+        start = int(now) - int(now) % self.bucket
+        if stats.buckets and stats.buckets[-1][0] == start:
+            stats.buckets[-1][1] += volume
+            stats.buckets[-1][2] += 1
+        else:
+            stats.buckets.append([start, volume, 1])
+            self._expiry.append((start, handle))
+        stats.volume += volume
+        stats.trades += 1
+        self.total_volume_24h += volume
+        self.total_trades_24h += 1
+        self.update_account(handle, market_cap, daily_change)
+
+    def expire(self, now: Optional[float] = None):
+        """Drop buckets that have slid out of the window"""
+        cutoff = (time.time() if now is None else now) - self.window
+        while self._expiry and self._expiry[0][0] + self.bucket <= cutoff:
+            start, handle = self._expiry.popleft()
+            stats = self._accounts.get(handle)
+            if stats is None or not stats.buckets or stats.buckets[0][0] != start:
+                continue
+            _, volume, trades = stats.buckets.popleft()
+            stats.volume -= volume
+            stats.trades -= trades
+            self.total_volume_24h -= volume
+            self.total_trades_24h -= trades
+            if not stats.buckets:
+                # Reset accumulated float drift once an account goes quiet
+                self.total_volume_24h -= stats.volume
+                stats.volume = 0.0
+            self._push(handle, stats)
+
+    def remove_account(self, handle: str):
+        stats = self._accounts.pop(handle, None)
+        if stats is not None:
+            self.total_market_cap -= stats.market_cap
+            self._total_daily_change -= stats.daily_change
+            self.total_volume_24h -= stats.volume
+            self.total_trades_24h -= stats.trades
+
+    # ---- queries ----------------------------------------------------------
+
+    def volume_24h(self, handle: str) -> float:
+        stats = self._accounts.get(handle)
+        return stats.volume if stats else 0.0
+
+    def trades_24h(self, handle: str) -> int:
+        stats = self._accounts.get(handle)
+        return stats.trades if stats else 0
+
+    def top(self, k: Optional[int] = None, now: Optional[float] = None) -> List[str]:
+        """Handles of the k highest trending scores, best first (all when k is None)"""
+        self.expire(now)
+        k = len(self._accounts) if k is None else min(k, len(self._accounts))
+        popped, result = [], []
+        while self._heap and len(result) < k:
+            entry = heapq.heappop(self._heap)
+            stats = self._accounts.get(entry[2])
+            if stats is None or stats.version != entry[3]:
+                continue   # superseded by a newer score
+            popped.append(entry)
+            result.append(entry[2])
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return result
+
+    def totals(self, now: Optional[float] = None) -> Dict:
+        self.expire(now)
+        count = len(self._accounts)
+        return {
+            'total_accounts': count,
+            'total_market_cap': self.total_market_cap,
+            'total_volume_24h': self.total_volume_24h,
+            'total_trades_24h': self.total_trades_24h,
+            'avg_daily_change': self._total_daily_change / count if count else 0,
+        }
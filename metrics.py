@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Low-contention Prometheus-style metrics for the SocialX server
+Counters, gauges and histograms record into private, lock-free cells on
+registered worker-pool threads and into lock-striped shared cells everywhere
+else; /metrics merges the cells into text exposition format 0.0.4
+"""
+
+import itertools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Request and RPC latencies, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+_WORKER = threading.local()
+_STRIPE = threading.local()
+_stripe_numbers = itertools.count()
+
+
+def register_worker_thread():
+    """Give the calling thread lock-free cells of its own.
+
+    Meant as a ThreadPoolExecutor initializer: registration takes a lock once
+    per metric, which only pays off for threads that live as long as the pool.
+    """
+    _WORKER.registered = True
+
+
+class _ThreadCells:
+    """Per-metric cells: writers only touch one, readers merge them all.
+
+    Registered worker threads get a private cell and write without locking.
+    Any other thread (e.g. thread-per-request handlers) writes to one of
+    STRIPES shared cells under that stripe's lock, assigned round-robin, so
+    short-lived threads neither register nor pile up cells. Cells of finished
+    workers are folded into a retired dict when the server scrapes.
+    """
+
+    STRIPES = 16
+
+    def __init__(self, merge: Callable):
+        self._merge = merge
+        self._local = threading.local()
+        self._cells: Dict[threading.Thread, dict] = {}
+        self._retired: dict = {}
+        self._lock = threading.Lock()
+        self._stripes = [({}, threading.Lock()) for _ in range(self.STRIPES)]
+
+    def mine(self) -> Tuple[dict, Optional[threading.Lock]]:
+        """(cell, lock) for the calling thread; lock is None for a private cell"""
+        try:
+            return self._local.slot
+        except AttributeError:
+            pass
+        if getattr(_WORKER, 'registered', False):
+            cell = {}
+            with self._lock:
+                self._cells[threading.current_thread()] = cell
+            slot = (cell, None)
+        else:
+            stripe = getattr(_STRIPE, 'number', None)
+            if stripe is None:
+                stripe = _STRIPE.number = next(_stripe_numbers)
+            slot = self._stripes[stripe % self.STRIPES]
+        self._local.slot = slot
+        return slot
+
+    def _sweep(self):
+        for thread in [t for t in self._cells if not t.is_alive()]:
+            for labels, value in self._cells.pop(thread).items():
+                self._retired[labels] = self._merge(self._retired.get(labels), value)
+
+    def collect(self) -> dict:
+        with self._lock:
+            self._sweep()
+            cells = [dict(self._retired)] + [dict(cell) for cell in self._cells.values()]
+        for cell, lock in self._stripes:
+            with lock:
+                cells.append({labels: self._merge(None, value) for labels, value in cell.items()})
+        merged = {}
+        for cell in cells:
+            for labels, value in cell.items():
+                merged[labels] = self._merge(merged.get(labels), value)
+        return merged
+
+
+def _add(total, value):
+    return value if total is None else total + value
+
+
+def _add_rows(total, row):
+    return list(row) if total is None else [a + b for a, b in zip(total, row)]
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type = 'untyped'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.type}']
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def __init__(self, name, help, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self._cells = _ThreadCells(_add)
+
+    def inc(self, labels: Tuple = (), amount: float = 1):
+        cell, lock = self._cells.mine()
+        if lock is None:
+            cell[labels] = cell.get(labels, 0) + amount
+        else:
+            with lock:
+                cell[labels] = cell.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple, float]:
+        return self._cells.collect()
+
+    def samples(self):
+        return [f'{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}'
+                for labels, value in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """Up/down gauge, e.g. requests in flight (inc on entry, dec on exit)"""
+
+    type = 'gauge'
+
+    def dec(self, labels: Tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+        self._cells = _ThreadCells(_add_rows)
+
+    def observe(self, value: float, labels: Tuple = ()):
+        cell, lock = self._cells.mine()
+        if lock is None:
+            self._record(cell, labels, value)
+        else:
+            with lock:
+                self._record(cell, labels, value)
+
+    def _record(self, cell: dict, labels: Tuple, value: float):
+        row = cell.get(labels)
+        if row is None:
+            # Per-bucket counts (last one is +Inf), then the running sum
+            row = cell[labels] = [0] * (len(self.buckets) + 2)
+        row[bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+    def timer(self, labels: Tuple = ()):
+        return _Timer(self, labels)
+
+    def samples(self):
+        lines = []
+        for labels, row in sorted(self._cells.collect().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), row):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, 'le="%s"' % le)
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(row[-1])}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}')
+        return lines
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'start')
+
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, self.labels)
+
+
+class CallbackMetric(_Metric):
+    """Values computed at scrape time by fn() -> {label tuple: value}"""
+
+    def __init__(self, name, help, labelnames=(), fn: Callable[[], Dict[Tuple, float]] = dict, type='gauge'):
+        super().__init__(name, help, labelnames)
+        self.type = type
+        self.fn = fn
+
+    def samples(self):
+        return [f'{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}'
+                for labels, value in sorted(self.fn().items())]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labelnames=()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name, help, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def callback(self, name, help, labelnames, fn, type='gauge') -> CallbackMetric:
+        return self.register(CallbackMetric(name, help, labelnames, fn, type))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                samples = [f'# {metric.name} unavailable: {_escape(e)}']
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry rendered by /metrics
+REGISTRY = Registry()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Inverted trait and text index over a loaded NFT collection
+Built once per collection so search, filters, sorting and token lookups
+cost bitset operations and a walk over the matches instead of the whole set
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Set-bit offsets of every byte value, for walking a bitset's bytes
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+_NONZERO_BYTE = re.compile(rb'[^\x00]')
+
+SORTS = ('token', 'rarity', 'price', '-price')
+
+
+def _positions(mask: bytes, start: int = 0) -> Iterator[int]:
+    """Set bit positions >= start of a little-endian bitset, in ascending order"""
+    for match in _NONZERO_BYTE.finditer(mask, start >> 3):
+        offset = match.start()
+        base = offset << 3
+        for bit in _BYTE_BITS[mask[offset]]:
+            if base + bit >= start:
+                yield base + bit
+
+
+def _trigrams(text: str) -> Iterable[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _price(record: Dict) -> float:
+    try:
+        return float(record.get('last_sale_price', '0'))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class NFTIndex:
+    """Read-only query index over NFT records, ordered by token_id.
+
+    Each record has a position (its index in token order) and every posting
+    is an int bitset over positions: (trait_type, value) pairs for exact
+    filters, lower-cased trait types and values for text search, and name
+    trigrams to narrow substring matches on names. Sort orders are presorted
+    once; a page cursor is the last returned item's rank in that order.
+    Case-insensitive throughout, like NFTSearchHandler's linear scans were.
+    """
+
+    def __init__(self, records: Iterable[Dict]):
+        self.records: List[Dict] = sorted(records, key=lambda record: record.get('token_id', 0))
+        size = len(self.records)
+        self._nbytes = max(1, (size + 7) // 8)
+        self._all = (1 << size) - 1
+        self.by_id: Dict[int, Dict] = {record.get('token_id'): record for record in self.records}
+        self._position = {record.get('token_id'): position for position, record in enumerate(self.records)}
+
+        self._names: List[str] = []
+        self._trait_text: List[str] = []
+        new_bits = lambda: bytearray(self._nbytes)
+        grams: Dict[str, bytearray] = defaultdict(new_bits)
+        terms: Dict[str, bytearray] = defaultdict(new_bits)
+        pairs: Dict[Tuple[str, str], bytearray] = {}
+        # (trait_type, value) as stored -> lower-cased text and the three postings it sets
+        seen_traits: Dict[Tuple[str, str], Tuple[str, Tuple[bytearray, ...]]] = {}
+        catalog: Dict[str, set] = {}
+        for position, record in enumerate(self.records):
+            byte, bit = position >> 3, 1 << (position & 7)
+            name = record.get('name', '').lower()
+            self._names.append(name)
+            for gram in _trigrams(name):
+                grams[gram][byte] |= bit
+
+            text = []
+            for trait in record.get('traits', []):
+                raw = (trait.get('trait_type', ''), trait.get('value', ''))
+                entry = seen_traits.get(raw)
+                if entry is None:
+                    if raw[0] and raw[1]:
+                        catalog.setdefault(raw[0], set()).add(raw[1])
+                    trait_type, value = raw[0].lower(), raw[1].lower()
+                    pair = pairs.get((trait_type, value))
+                    if pair is None:
+                        pair = pairs[(trait_type, value)] = new_bits()
+                    entry = seen_traits[raw] = (f'{trait_type}\x00{value}', (pair, terms[trait_type], terms[value]))
+                text.append(entry[0])
+                for bits in entry[1]:
+                    bits[byte] |= bit
+            self._trait_text.append('\x00'.join(text))
+
+        self._pairs = {key: int.from_bytes(bits, 'little') for key, bits in pairs.items()}
+        self._terms = {key: int.from_bytes(bits, 'little') for key, bits in terms.items() if key}
+        self._grams = {key: int.from_bytes(bits, 'little') for key, bits in grams.items()}
+        self._catalog = {trait_type: sorted(values) for trait_type, values in catalog.items()}
+
+        # rank -> position for each sort, and position -> rank to resume from a cursor
+        prices = [_price(record) for record in self.records]
+        self._orders: Dict[str, Optional[List[int]]] = {
+            'token': None,
+            'rarity': sorted(range(size), key=lambda p: (self.records[p].get('rarity_rank', 999999), -prices[p], p)),
+            'price': sorted(range(size), key=lambda p: (prices[p], p)),
+            '-price': sorted(range(size), key=lambda p: (-prices[p], p)),
+        }
+        self._ranks: Dict[str, List[int]] = {}
+        for sort, order in self._orders.items():
+            if order is not None:
+                ranks = [0] * size
+                for rank, position in enumerate(order):
+                    ranks[position] = rank
+                self._ranks[sort] = ranks
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, token_id: int) -> Optional[Dict]:
+        return self.by_id.get(token_id)
+
+    def traits(self) -> Dict[str, List[str]]:
+        """trait_type -> sorted distinct values, types in first-seen order"""
+        return {trait_type: list(values) for trait_type, values in self._catalog.items()}
+
+    def filter_mask(self, trait_filters: Optional[Dict[str, str]] = None) -> int:
+        """Tokens having every trait_type == value pair"""
+        mask = self._all
+        for trait_type, value in (trait_filters or {}).items():
+            mask &= self._pairs.get((trait_type.lower(), value.lower()), 0)
+        return mask
+
+    def has_traits(self, token_id: int, trait_filters: Optional[Dict[str, str]] = None) -> bool:
+        position = self._position.get(token_id)
+        return position is not None and bool(self.filter_mask(trait_filters) >> position & 1)
+
+    def text_mask(self, query: str) -> int:
+        """Candidates for a substring query: a superset of the matches, checked by _matches"""
+        query = query.lower()
+        if not query:
+            return self._all
+        names = self._all
+        if len(query) >= 3:
+            for gram in _trigrams(query):
+                names &= self._grams.get(gram, 0)
+        for term, bits in self._terms.items():
+            if query in term:
+                names |= bits
+        return names
+
+    def _matches(self, position: int, query: str) -> bool:
+        return query in self._names[position] or query in self._trait_text[position]
+
+    def query(self, text: str = '', trait_filters: Optional[Dict[str, str]] = None, sort: str = 'token',
+              limit: int = 20, cursor: Optional[int] = None) -> Tuple[List[Dict], Optional[int]]:
+        """One page of records matching `text` (name, trait type or value) and every filter.
+
+        Returns (records, next_cursor); pass next_cursor back with the same
+        text, filters and sort for the following page. It is None on the
+        last page.
+        """
+        if sort not in self._orders:
+            raise ValueError(f"Unknown sort {sort!r}; expected one of {', '.join(SORTS)}")
+        if limit <= 0:
+            return [], None
+        query = text.lower()
+        mask = self.filter_mask(trait_filters) & self.text_mask(query)
+        mask_bytes = mask.to_bytes(self._nbytes, 'little')
+        start = 0 if cursor is None else cursor + 1
+        order = self._orders[sort]
+        ranks: List[int] = []
+
+        if order is None:
+            for position in _positions(mask_bytes, start):
+                if not query or self._matches(position, query):
+                    ranks.append(position)
+                    if len(ranks) > limit:
+                        break
+            positions = ranks
+        elif mask.bit_count() * 8 < len(order) - start:
+            # Few matches: rank them directly rather than walking the whole order
+            rank_of = self._ranks[sort]
+            candidates = sorted(rank for rank in (rank_of[p] for p in _positions(mask_bytes)) if rank >= start)
+            for rank in candidates:
+                if not query or self._matches(order[rank], query):
+                    ranks.append(rank)
+                    if len(ranks) > limit:
+                        break
+            positions = [order[rank] for rank in ranks]
+        else:
+            for rank in range(start, len(order)):
+                position = order[rank]
+                if mask_bytes[position >> 3] >> (position & 7) & 1 and (not query or self._matches(position, query)):
+                    ranks.append(rank)
+                    if len(ranks) > limit:
+                        break
+            positions = [order[rank] for rank in ranks]
+
+        next_cursor = ranks[limit - 1] if len(ranks) > limit else None
+        return [self.records[position] for position in positions[:limit]], next_cursor
+
+    def count(self, text: str = '', trait_filters: Optional[Dict[str, str]] = None) -> int:
+        """Number of records matching, without materialising them"""
+        query = text.lower()
+        mask = self.filter_mask(trait_filters) & self.text_mask(query)
+        if not query:
+            return mask.bit_count()
+        return sum(1 for position in _positions(mask.to_bytes(self._nbytes, 'little'))
+                   if self._matches(position, query))
@@ -6,20 +6,24 @@ Integrates with Hypio NFT collection and provides NFT marketplace functionality
 
 import json
 import time
-import random
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import http.server
 import socketserver
+import threading
 from urllib.parse import urlparse, parse_qs
 import os
 from drip_trade_fetcher import DripTradeNFTFetcher
 from nft_search_handler import NFTSearchHandler
 
+# One handler per process: its collection and search index are built once
+# and shared by every request instead of per handler instance
+SEARCH_HANDLER = NFTSearchHandler()
+
 class NFTPlatformHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         self.nft_fetcher = DripTradeNFTFetcher()
-        self.search_handler = NFTSearchHandler()
+        self.search_handler = SEARCH_HANDLER
         self.cache = {}
         super().__init__(*args, **kwargs)
 
@@ -139,34 +143,24 @@ class NFTPlatformHandler(http.server.SimpleHTTPRequestHandler):
         try:
             query_params = parse_qs(urlparse(self.path).query)
             query = query_params.get('q', [''])[0]
-            limit = int(query_params.get('limit', [20])[0])
+            limit = min(int(query_params.get('limit', [20])[0]), 100)
+            sort = query_params.get('sort', ['token'])[0]
+            cursor = query_params.get('cursor', [None])[0]
+            # ?trait=Background:Ocean Blue&trait=Eyes:Teal
+            trait_filters = dict(trait.split(':', 1) for trait in query_params.get('trait', []) if ':' in trait)
             
-            if not query:
+            if not query and not trait_filters:
                 self.send_error_response("Search query required")
                 return
             
-            # Search NFTs by generating matching results based on query
-            results = []
-            search_count = 0
-            max_attempts = limit * 3  # Try more NFTs to find matches
-            
-            for token_id in random.sample(range(1, 5556), min(max_attempts, 300)):
-                if search_count >= limit:
-                    break
-                    
-                nft = self.nft_fetcher.get_nft_metadata(token_id)
-                # Check if query matches name or traits
-                query_lower = query.lower()
-                if (query_lower in nft['name'].lower() or 
-                    any(query_lower in trait['value'].lower() or query_lower in trait['trait_type'].lower() 
-                        for trait in nft['traits'])):
-                    results.append(nft)
-                    search_count += 1
+            page = self.search_handler.search_page(query, trait_filters, sort=sort, limit=limit,
+                                                   cursor=int(cursor) if cursor else None)
             self.send_json_response({
                 'success': True,
                 'query': query,
-                'results': results,
-                'count': len(results)
+                'results': page['results'],
+                'count': len(page['results']),
+                'next_cursor': page['next_cursor']
             })
         except Exception as e:
             self.send_error_response(f"Error searching NFTs: {str(e)}")
@@ -733,6 +727,9 @@ def main():
     print("• Multiple marketplace integration")
     print("\n🚀 Browse the complete Hypio collection!")
     
+    # Load the collection snapshot and build the search index before the first request needs them
+    threading.Thread(target=SEARCH_HANDLER.get_index, daemon=True).start()
+    
     try:
         httpd = socketserver.TCPServer(("0.0.0.0", PORT), NFTPlatformHandler)
         httpd.allow_reuse_address = True
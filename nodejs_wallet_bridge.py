@@ -8,11 +8,29 @@ import subprocess
 import json
 import os
 
+# In-process key generation (ecdsa + pycryptodome); falls back to Node.js when missing
+try:
+    from wallet_keypool import default_pool
+    PYTHON_KEYGEN_AVAILABLE = True
+except ImportError:
+    PYTHON_KEYGEN_AVAILABLE = False
+
 class NodeJSWalletBridge:
     def __init__(self):
         self.node_script = 'ethereum_wallet_node.js'
     
     def generate_compatible_wallet(self):
+        """Generate an ethers.js compatible wallet from the in-process keypair pool"""
+        if PYTHON_KEYGEN_AVAILABLE:
+            try:
+                wallet_data = default_pool().take()
+                print(f"✅ Generated compatible wallet: {wallet_data['address']}")
+                return wallet_data
+            except Exception as e:
+                print(f"⚠️ In-process wallet generation failed, falling back to Node.js: {e}")
+        return self.generate_with_node()
+    
+    def generate_with_node(self):
         """Generate wallet using Node.js ethers.js - bypasses Python dependency issues"""
         try:
             # Run Node.js script to generate wallet
@@ -37,6 +55,12 @@ class NodeJSWalletBridge:
     
     def verify_private_key(self, private_key):
         """Verify private key generates expected address"""
+        if PYTHON_KEYGEN_AVAILABLE:
+            from wallet_keypool import derive_address
+            try:
+                return derive_address(private_key)
+            except Exception as e:
+                return f"Error: {e}"
         try:
             result = subprocess.run(
                 ['node', self.node_script, 'verify', private_key],
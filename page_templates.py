@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Precompiled HTML page shells for SocialTradingHandler
+Each page is built once per (page type, auth state), encoded, and split at a
+fragment slot so per-request data is spliced in without rebuilding the page
+"""
+
+import json
+import threading
+from typing import Callable, Dict, Hashable
+
+FRAGMENT_SLOT = '<!--socialx:fragment-->'
+
+
+class PageTemplate:
+    """An encoded page split around its fragment slot.
+
+    Without an explicit FRAGMENT_SLOT the fragment goes just before the
+    last </body>, or at the end of the document.
+    """
+
+    __slots__ = ('head', 'tail')
+
+    def __init__(self, html: str):
+        page = html.encode('utf-8')
+        slot = FRAGMENT_SLOT.encode()
+        if slot in page:
+            self.head, self.tail = page.split(slot, 1)
+        else:
+            index = page.rfind(b'</body>')
+            if index < 0:
+                index = len(page)
+            self.head, self.tail = page[:index], page[index:]
+
+    def render(self, fragment: bytes = b'') -> bytes:
+        return b''.join((self.head, fragment, self.tail))
+
+    def __len__(self):
+        return len(self.head) + len(self.tail)
+
+
+class PageCache:
+    """Compiled templates keyed by whatever identifies a distinct shell"""
+
+    def __init__(self):
+        self._templates: Dict[Hashable, PageTemplate] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'builds': 0}
+
+    def template(self, key: Hashable, build: Callable[[], str]) -> PageTemplate:
+        """Cached template for `key`, compiling build() on first use"""
+        template = self._templates.get(key)
+        if template is not None:
+            self.stats['hits'] += 1
+            return template
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                template = self._templates[key] = PageTemplate(build())
+                self.stats['builds'] += 1
+        return template
+
+    def invalidate(self):
+        with self._lock:
+            self._templates.clear()
+
+
+def script_fragment(name: str, data) -> bytes:
+    """<script> assigning JSON `data` to window[name], safe to embed in HTML"""
+    payload = json.dumps(data, separators=(',', ':')).replace('<', '\\u003c')
+    return f'<script>window.{name} = {payload};</script>\n'.encode('utf-8')
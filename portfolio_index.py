@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Per-trader position and P&L index for the SocialX portfolio endpoints
+Updated on every buy/sell so portfolio queries cost O(user's positions)
+instead of a walk over every account's trade history
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class Position:
+    """Holdings in one account token, average-cost basis"""
+
+    __slots__ = ('tokens', 'cost_basis', 'realized_pnl', 'trades', 'last_trade')
+
+    def __init__(self):
+        self.tokens = 0.0
+        self.cost_basis = 0.0     # HYPE paid for the tokens still held
+        self.realized_pnl = 0.0
+        self.trades = 0
+        self.last_trade = 0.0
+
+
+class PortfolioIndex:
+    """trader -> {account -> Position} plus trader -> {day -> realized P&L}.
+
+    Traders are whatever identity buy_tokens / sell_tokens were called with;
+    query methods take a set of identities so a user's session key, user_id
+    and address are summed together. Not thread safe on its own;
+    SocialTradingPlatform calls it under its lock.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, Dict[str, Position]] = {}
+        self._daily: Dict[str, Dict[int, float]] = {}
+
+    def record_trade(self, trader: str, account: str, side: str, tokens: float, hype: float,
+                     ts: Optional[float] = None):
+        ts = time.time() if ts is None else ts
+        positions = self._positions.get(trader)
+        if positions is None:
+            positions = self._positions[trader] = {}
+        position = positions.get(account)
+        if position is None:
+            position = positions[account] = Position()
+
+        position.trades += 1
+        position.last_trade = ts
+        if side == 'BUY':
+            position.tokens += tokens
+            position.cost_basis += hype
+            return
+
+        sold = min(tokens, position.tokens)
+        cost_out = position.cost_basis * sold / position.tokens if position.tokens > 0 else 0.0
+        realized = hype - cost_out
+        position.tokens -= sold
+        position.cost_basis -= cost_out
+        if position.tokens <= 1e-12:
+            position.tokens = 0.0
+            position.cost_basis = 0.0
+        position.realized_pnl += realized
+
+        day = date.fromtimestamp(ts).toordinal()
+        buckets = self._daily.setdefault(trader, {})
+        buckets[day] = buckets.get(day, 0.0) + realized
+
+    def summary(self, traders: Iterable[str], price_of: Callable[[str], float]) -> Dict:
+        """Positions and P&L across every identity in `traders`, valued at price_of(account)"""
+        merged: Dict[str, Dict] = {}
+        for trader in traders:
+            for account, position in self._positions.get(trader, {}).items():
+                entry = merged.setdefault(account, {'account': account, 'tokens': 0.0, 'cost_basis': 0.0,
+                                                    'realized_pnl': 0.0, 'trades': 0})
+                entry['tokens'] += position.tokens
+                entry['cost_basis'] += position.cost_basis
+                entry['realized_pnl'] += position.realized_pnl
+                entry['trades'] += position.trades
+
+        positions = []
+        totals = {'holdings_value': 0.0, 'cost_basis': 0.0, 'realized_pnl': 0.0, 'unrealized_pnl': 0.0, 'trades': 0}
+        for entry in merged.values():
+            price = price_of(entry['account'])
+            entry['price'] = price
+            entry['value'] = entry['tokens'] * price
+            entry['unrealized_pnl'] = entry['value'] - entry['cost_basis']
+            positions.append(entry)
+            totals['holdings_value'] += entry['value']
+            totals['cost_basis'] += entry['cost_basis']
+            totals['realized_pnl'] += entry['realized_pnl']
+            totals['unrealized_pnl'] += entry['unrealized_pnl']
+            totals['trades'] += entry['trades']
+
+        positions.sort(key=lambda entry: entry['value'], reverse=True)
+        totals['total_pnl'] = totals['realized_pnl'] + totals['unrealized_pnl']
+        totals['positions'] = positions
+        return totals
+
+    def daily_realized(self, traders: Iterable[str], days: int = 7,
+                       today: Optional[date] = None) -> List[Dict]:
+        """Realized P&L per day for the last `days` days, oldest first"""
+        today = today or date.today()
+        first = today.toordinal() - days + 1
+        totals = [0.0] * days
+        for trader in traders:
+            for day, pnl in self._daily.get(trader, {}).items():
+                if day >= first and day <= today.toordinal():
+                    totals[day - first] += pnl
+        return [{'date': (today - timedelta(days=days - 1 - i)).isoformat(), 'pnl': pnl}
+                for i, pnl in enumerate(totals)]
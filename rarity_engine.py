@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Collection-wide NFT rarity engine
+Encodes every token's traits as integer codes and scores the whole collection
+in one vectorized NumPy pass, so ranks are true ranks within the collection
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# "Trait absent" is a value of its own: a token without a Hat is rarer if most have one
+MISSING = None
+METHODS = ('information', 'statistical', 'rarity_score')
+
+
+def trait_key(trait: Dict) -> Tuple[str, str]:
+    return str(trait.get('trait_type', '')), str(trait.get('value', ''))
+
+
+class RarityTable:
+    """Trait frequencies, scores and ranks for one collection.
+
+    Scores by method:
+      information   sum of -log2(frequency) over the token's traits, in
+                    bits; higher is rarer
+      statistical   product of the frequencies, the chance of the token's
+                    exact combination; lower is rarer (same order as
+                    information)
+      rarity_score  sum of 1 / frequency, the rarity.tools score; higher
+                    is rarer
+    Ranks start at 1 for the rarest token; equal scores share a rank.
+    """
+
+    def __init__(self, token_ids: np.ndarray, scores: np.ndarray, ranks: np.ndarray,
+                 frequencies: Dict[Tuple[str, Optional[str]], float], categories: List[str], method: str):
+        self.token_ids = token_ids
+        self.scores = scores
+        self.ranks = ranks
+        self.frequencies = frequencies
+        self.categories = categories
+        self.method = method
+        self._row = {int(token_id): row for row, token_id in enumerate(token_ids.tolist())}
+        self._sorted_rarity = np.sort(_rarity(scores, method))
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def rank(self, token_id: int) -> Optional[int]:
+        row = self._row.get(token_id)
+        return None if row is None else int(self.ranks[row])
+
+    def score(self, token_id: int) -> Optional[float]:
+        row = self._row.get(token_id)
+        return None if row is None else float(self.scores[row])
+
+    def ranks_by_token(self) -> Dict[int, int]:
+        return dict(zip(self.token_ids.tolist(), self.ranks.tolist()))
+
+    def scaled_score(self, rank: int) -> float:
+        """0-10 display score from a rank: 10 for the rarest, 8+ for the top 20%"""
+        return round(10.0 * (1.0 - (rank - 1) / max(len(self), 1)), 2)
+
+    def score_traits(self, traits: Iterable[Dict], supply: Optional[int] = None) -> float:
+        """Score one token's traits against this collection's frequencies.
+
+        A trait carrying a marketplace 'trait_count' uses count / supply;
+        values the collection has never seen count as 1-of-a-kind.
+        """
+        size = max(len(self), 1)
+        supply = supply or size
+        present = {}
+        for trait in traits:
+            key = trait_key(trait)
+            count = trait.get('trait_count')
+            present[key[0]] = (count / supply) if count else self.frequencies.get(key, 0.0)
+        frequencies = [present.pop(category, self.frequencies.get((category, MISSING), 0.0))
+                       for category in self.categories]
+        frequencies.extend(present.values())
+        frequencies = np.maximum(np.asarray([frequencies], dtype=np.float64), 1.0 / size)
+        return float(_score(frequencies, self.method)[0])
+
+    def rank_for_traits(self, traits: Iterable[Dict], supply: Optional[int] = None) -> int:
+        """Rank a trait list would have in this collection"""
+        rarity = float(_rarity(np.asarray([self.score_traits(traits, supply)]), self.method)[0])
+        # Tokens strictly rarer, beyond float noise, rank ahead of it
+        ahead = len(self) - np.searchsorted(self._sorted_rarity, rarity + abs(rarity) * 1e-12, side='right')
+        return int(ahead) + 1
+
+
+def _score(frequencies: np.ndarray, method: str) -> np.ndarray:
+    if method == 'rarity_score':
+        return (1.0 / frequencies).sum(axis=1)
+    information = (-np.log2(frequencies)).sum(axis=1)
+    # Summing logs first keeps the product from underflowing in between
+    return np.exp2(-information) if method == 'statistical' else information
+
+
+def _rarity(scores: np.ndarray, method: str) -> np.ndarray:
+    """Scores flipped where needed so that higher is always rarer"""
+    return -scores if method == 'statistical' else scores
+
+
+def competition_ranks(rarity: np.ndarray) -> np.ndarray:
+    """1-based ranks, rarest first, ties sharing the better rank ("1224")"""
+    descending = np.sort(-rarity)
+    return np.searchsorted(descending, -rarity, side='left') + 1
+
+
+def build_rarity_table(trait_lists: Sequence[Iterable[Dict]], token_ids: Optional[Sequence[int]] = None,
+                       method: str = 'information', include_missing: bool = True) -> RarityTable:
+    """Frequencies, scores and ranks for a whole collection in one pass.
+
+    trait_lists[i] holds token i's trait dicts ({'trait_type', 'value', ...});
+    token_ids defaults to 1..n. Any percentage in a trait's 'rarity' field is
+    ignored: frequencies come from the collection itself.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown rarity method {method!r}; expected one of {', '.join(METHODS)}")
+    size = len(trait_lists)
+    token_ids = np.arange(1, size + 1) if token_ids is None else np.asarray(token_ids)
+
+    # Encode: one column per trait type, one integer code per (type, value),
+    # code 0 of every column reserved for "absent"
+    categories: Dict[str, int] = {}
+    values: List[Dict[str, int]] = []
+    token_index: List[int] = []
+    column_index: List[int] = []
+    value_code: List[int] = []
+    for token, traits in enumerate(trait_lists):
+        for trait in traits:
+            trait_type, value = trait_key(trait)
+            column = categories.get(trait_type)
+            if column is None:
+                column = categories[trait_type] = len(categories)
+                values.append({})
+            codes = values[column]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(codes) + 1
+            token_index.append(token)
+            column_index.append(column)
+            value_code.append(code)
+
+    columns = len(categories)
+    offsets = np.zeros(columns + 1, dtype=np.int64)
+    np.cumsum([len(codes) + 1 for codes in values], out=offsets[1:])
+    codes = np.zeros((size, columns), dtype=np.int64)
+    codes[np.asarray(token_index, dtype=np.int64), np.asarray(column_index, dtype=np.int64)] = value_code
+    codes += offsets[:-1]
+
+    counts = np.bincount(codes.ravel(), minlength=int(offsets[-1])) if size else np.zeros(int(offsets[-1]))
+    frequency_of_code = counts / max(size, 1)
+    token_frequencies = frequency_of_code[codes]
+    if not include_missing:
+        absent = np.isin(codes, offsets[:-1])
+        token_frequencies = np.where(absent, 1.0, token_frequencies)
+    scores = _score(token_frequencies, method) if columns else np.zeros(size)
+    ranks = competition_ranks(_rarity(scores, method))
+
+    names = list(categories)
+    frequencies: Dict[Tuple[str, Optional[str]], float] = {}
+    for column, trait_type in enumerate(names):
+        base = int(offsets[column])
+        if include_missing:
+            frequencies[(trait_type, MISSING)] = float(frequency_of_code[base])
+        for value, code in values[column].items():
+            frequencies[(trait_type, value)] = float(frequency_of_code[base + code])
+    return RarityTable(token_ids, scores, ranks, frequencies, names if include_missing else [], method)
@@ -10,8 +10,17 @@ import math
 import random
 import colorsys
 
-def create_advanced_gradient(size, colors, direction="diagonal"):
+import array_render
+
+# "numpy" renders gradients and shading as array math; "pil" draws them pixel
+# by pixel and layer by layer, as the reference implementation
+RENDER_BACKEND = os.getenv('NFT_RENDER_BACKEND', 'numpy')
+
+def create_advanced_gradient(size, colors, direction="diagonal", backend=None):
     """Create sophisticated multi-point gradients"""
+    if (backend or RENDER_BACKEND) == "numpy" and direction == "diagonal":
+        return Image.fromarray(array_render.diagonal_gradient(size, colors), 'RGB')
+    
     img = Image.new('RGB', size, colors[0])
     draw = ImageDraw.Draw(img)
     
@@ -53,8 +62,11 @@ def create_advanced_gradient(size, colors, direction="diagonal"):
     
     return img
 
-def add_realistic_shading(img, center, radius, light_pos, base_color, intensity=1.0):
+def add_realistic_shading(img, center, radius, light_pos, base_color, intensity=1.0, backend=None):
     """Add realistic lighting and shadows"""
+    if (backend or RENDER_BACKEND) == "numpy":
+        return array_render.radial_shading(img, center, radius, light_pos, base_color, intensity)
+    
     draw = ImageDraw.Draw(img)
     
     # Create multiple shadow layers for depth
@@ -86,6 +98,33 @@ def add_realistic_shading(img, center, radius, light_pos, base_color, intensity=
     
     return img
 
+def add_energy_rings(img, center, color, rings=15, backend=None):
+    """Add glowing jutsu energy rings"""
+    if (backend or RENDER_BACKEND) == "numpy":
+        return array_render.energy_rings(img, center, color, rings)
+    
+    for ring in range(rings):
+        ring_radius = 30 + ring * 4
+        ring_alpha = 200 - ring * 10
+        ring_color = (*color, max(0, ring_alpha))
+        
+        # Create temporary layer for this ring
+        energy_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
+        energy_draw = ImageDraw.Draw(energy_layer)
+        
+        energy_draw.ellipse([
+            center[0] - ring_radius, center[1] - ring_radius,
+            center[0] + ring_radius, center[1] + ring_radius
+        ], fill=ring_color)
+        
+        # Apply rotation blur effect
+        energy_layer = energy_layer.filter(ImageFilter.BLUR)
+        
+        # Composite with main image
+        img = Image.alpha_composite(img.convert('RGBA'), energy_layer).convert('RGB')
+    
+    return img
+
 def create_3d_character_head(img, center, radius, character_data):
     """Create 3D-style character head with realistic proportions"""
     draw = ImageDraw.Draw(img)
@@ -692,25 +731,7 @@ def create_reference_quality_nft(character_data, nft_id, output_path):
         rasengan_center = (head_center[0] + 140, head_center[1] + 150)
         
         # Energy base
-        for ring in range(15):
-            ring_radius = 30 + ring * 4
-            ring_alpha = 200 - ring * 10
-            ring_color = (135, 206, 235, max(0, ring_alpha))
-            
-            # Create temporary layer for this ring
-            energy_layer = Image.new('RGBA', size, (0, 0, 0, 0))
-            energy_draw = ImageDraw.Draw(energy_layer)
-            
-            energy_draw.ellipse([
-                rasengan_center[0] - ring_radius, rasengan_center[1] - ring_radius,
-                rasengan_center[0] + ring_radius, rasengan_center[1] + ring_radius
-            ], fill=ring_color)
-            
-            # Apply rotation blur effect
-            energy_layer = energy_layer.filter(ImageFilter.BLUR)
-            
-            # Composite with main image
-            img = Image.alpha_composite(img.convert('RGBA'), energy_layer).convert('RGB')
+        img = add_energy_rings(img, rasengan_center, (135, 206, 235))
         
         # Spiral energy pattern
         spiral_points = []
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Structured logging for the SocialX server
+JSON lines through a QueueHandler so request threads never block on stderr,
+with a level from SOCIALX_LOG_LEVEL and sampling of high-volume loggers
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from typing import Iterable, Optional
+
+ROOT_LOGGER = 'socialx'
+# Loggers that emit at least one record per request and are sampled
+SAMPLED_LOGGERS = ('socialx.access', 'socialx.request')
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f'{ROOT_LOGGER}.{name}')
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; `extra={'fields': {...}}` is merged in"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Pass a `rate` fraction of records below WARNING; warnings and errors always pass"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or self.rate >= 1.0 or random.random() < self.rate
+
+
+def setup_logging(level: Optional[str] = None, sample_rate: Optional[float] = None,
+                  stream=None, sampled: Iterable[str] = SAMPLED_LOGGERS) -> logging.handlers.QueueListener:
+    """Route the socialx logger tree through a queue to a JSON stream handler.
+
+    Defaults come from SOCIALX_LOG_LEVEL (INFO) and SOCIALX_LOG_SAMPLE_RATE
+    (1.0). Safe to call again; the previous listener is stopped first.
+    """
+    global _listener
+    shutdown_logging()
+    level = (level or os.environ.get('SOCIALX_LOG_LEVEL', 'INFO')).upper()
+    if sample_rate is None:
+        sample_rate = float(os.environ.get('SOCIALX_LOG_SAMPLE_RATE', '1.0'))
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    root.propagate = False
+
+    sampling = SamplingFilter(sample_rate)
+    for name in sampled:
+        logger = logging.getLogger(name)
+        logger.filters = [f for f in logger.filters if not isinstance(f, SamplingFilter)]
+        if sample_rate < 1.0:
+            logger.addFilter(sampling)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Drain the queue and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Compiled HTTP route table for the SocialX server
+Exact paths resolve with one dict lookup, prefix routes with a character trie walk,
+so dispatch cost no longer depends on how far down the route list a path sits
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+EXACT = 'exact'
+PREFIX = 'prefix'
+
+
+class Route(NamedTuple):
+    method: str
+    path: str
+    handler: str
+    kind: str = EXACT
+
+
+class _TrieNode:
+    __slots__ = ('children', 'route')
+
+    def __init__(self):
+        self.children = {}
+        self.route = None
+
+
+class Router:
+    """Exact-path dict plus per-method prefix trie.
+
+    Matching order is: exact path first, then the longest registered prefix.
+    That reproduces the old if/elif cascades, where specific prefixes such as
+    /callback/twitter/start were always checked before /callback/twitter.
+    """
+
+    def __init__(self):
+        self._exact: Dict[Tuple[str, str], Route] = {}
+        self._prefixes: Dict[str, _TrieNode] = {}
+        self._routes: List[Route] = []
+
+    @classmethod
+    def compile(cls, routes, handler_class=None) -> 'Router':
+        """Build a router from (method, path, handler[, kind]) tuples.
+
+        When handler_class is given every handler name is checked up front so a
+        typo fails at import time instead of on the first request.
+        """
+        router = cls()
+        for entry in routes:
+            route = Route(*entry)
+            if handler_class is not None and not callable(getattr(handler_class, route.handler, None)):
+                raise ValueError(f"Route {route.method} {route.path} points at missing handler {route.handler}")
+            router.add(route)
+        return router
+
+    def add(self, route: Route):
+        if route.kind == EXACT:
+            key = (route.method, route.path)
+            if key in self._exact:
+                raise ValueError(f"Duplicate route {route.method} {route.path}")
+            self._exact[key] = route
+        elif route.kind == PREFIX:
+            node = self._prefixes.setdefault(route.method, _TrieNode())
+            for char in route.path:
+                node = node.children.setdefault(char, _TrieNode())
+            if node.route is not None:
+                raise ValueError(f"Duplicate prefix route {route.method} {route.path}*")
+            node.route = route
+        else:
+            raise ValueError(f"Unknown route kind '{route.kind}'")
+        self._routes.append(route)
+
+    def match(self, method: str, path: str) -> Optional[Route]:
+        """Return the route for method/path, or None"""
+        route = self._exact.get((method, path))
+        if route is not None:
+            return route
+
+        node = self._prefixes.get(method)
+        if node is None:
+            return None
+        best = node.route
+        for char in path:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.route is not None:
+                best = node.route
+        return best
+
+    def routes(self) -> List[Route]:
+        return list(self._routes)
+
+    def describe(self) -> str:
+        """Human readable route listing for the startup banner"""
+        lines = []
+        for route in sorted(self._routes, key=lambda r: (r.method, r.path)):
+            suffix = '*' if route.kind == PREFIX else ''
+            lines.append(f"  {route.method:<5} {route.path + suffix:<34} -> {route.handler}")
+        return "\n".join(lines)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Shared JSON-RPC client for HyperEVM
+Keep-alive connection pool per endpoint, JSON-RPC batches, retries with
+jittered exponential backoff, a per-endpoint token-bucket rate limit and
+coalescing of identical in-flight calls
+"""
+
+import http.client
+import json
+import os
+import random
+import socket
+import threading
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from metrics import REGISTRY
+
+HYPEREVM_RPC_URL = os.getenv('HYPEREVM_RPC_URL', 'https://rpc.hyperliquid.xyz/evm')
+
+# Calls that change chain state are never merged with another caller's request
+NON_COALESCED = frozenset({'eth_sendRawTransaction', 'eth_sendTransaction'})
+# HTTP statuses worth retrying; JSON-RPC errors are returned to the caller as-is
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Largest JSON-RPC batch sent in one POST
+MAX_BATCH = 100
+
+JSONRPC_REQUESTS = REGISTRY.counter('socialx_jsonrpc_requests_total', 'JSON-RPC calls by method and outcome',
+                                    ('method', 'outcome'))
+JSONRPC_LATENCY = REGISTRY.histogram('socialx_jsonrpc_post_seconds', 'JSON-RPC HTTP round trips by method',
+                                     ('method',))
+JSONRPC_EVENTS = REGISTRY.counter('socialx_jsonrpc_events_total', 'Retries, coalesced calls and new connections',
+                                  ('event',))
+
+
+class RPCError(Exception):
+    """A JSON-RPC error object returned by the node"""
+
+    def __init__(self, error):
+        self.error = error
+        self.code = error.get('code') if isinstance(error, dict) else None
+        message = error.get('message') if isinstance(error, dict) else error
+        super().__init__(f"RPC error {self.code}: {message}")
+
+
+class RPCTransportError(IOError):
+    """The call did not get a usable HTTP response, after retries"""
+
+
+class RateLimiter:
+    """Token bucket: `rate` calls per second with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _Flight:
+    """One in-progress call that identical concurrent calls wait on"""
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class JSONRPCClient:
+    """Thread-safe JSON-RPC 2.0 client for one endpoint.
+
+    Up to `pool_size` keep-alive connections are reused across calls and
+    threads. Transport failures, timeouts and HTTP 429/5xx are retried
+    `retries` times with backoff * 2**attempt, jittered by ±50%. A JSON-RPC
+    error in the response is raised as RPCError without retrying.
+    """
+
+    def __init__(self, url: str = HYPEREVM_RPC_URL, pool_size: int = 8, timeout: float = 10.0,
+                 retries: int = 3, backoff: float = 0.2, rate_limit: Optional[float] = None,
+                 coalesce: bool = True):
+        parsed = urllib.parse.urlsplit(url)
+        self.url = url
+        self._connection_class = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = (parsed.path or '/') + (f'?{parsed.query}' if parsed.query else '')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.coalesce = coalesce
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._idle = deque()
+        self._pool_slots = threading.BoundedSemaphore(pool_size)
+        self._ids = iter(range(1, 1 << 62))
+        self._id_lock = threading.Lock()
+        self._inflight: Dict[Tuple, _Flight] = {}
+        self._inflight_lock = threading.Lock()
+
+    # ---- transport --------------------------------------------------------
+
+    def _next_id(self) -> int:
+        with self._id_lock:
+            return next(self._ids)
+
+    def _post(self, body: bytes, timeout: float, label: str) -> Any:
+        """POST one JSON-RPC payload on a pooled connection and decode the response"""
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                JSONRPC_EVENTS.inc(('retry',))
+                time.sleep(self.backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+            if self.limiter is not None:
+                self.limiter.acquire()
+            start_time = time.perf_counter()
+            try:
+                status, payload = self._round_trip(body, timeout)
+            except (OSError, http.client.HTTPException) as e:
+                last_error = e
+                continue
+            finally:
+                JSONRPC_LATENCY.observe(time.perf_counter() - start_time, (label,))
+            if status in RETRY_STATUSES:
+                last_error = RPCTransportError(f"HTTP {status} from {self.url}")
+                continue
+            if status != 200:
+                raise RPCTransportError(f"HTTP {status} from {self.url}")
+            return json.loads(payload)
+        raise RPCTransportError(f"{self.url} unreachable after {self.retries + 1} attempts: {last_error}")
+
+    def _round_trip(self, body: bytes, timeout: float) -> Tuple[int, bytes]:
+        with self._pool_slots:
+            try:
+                conn, reused = self._idle.popleft(), True
+            except IndexError:
+                conn, reused = self._connection_class(self._host, self._port, timeout=timeout), False
+                JSONRPC_EVENTS.inc(('connect',))
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.timeout = timeout
+                try:
+                    conn.request('POST', self._path, body, {'Content-Type': 'application/json'})
+                    response = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    if not reused:
+                        raise
+                    # The server closed an idle keep-alive connection; retry once on a fresh one
+                    conn.close()
+                    conn.request('POST', self._path, body, {'Content-Type': 'application/json'})
+                    response = conn.getresponse()
+                payload = response.read()
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.append(conn)
+            return response.status, payload
+
+    # ---- calls ------------------------------------------------------------
+
+    def call(self, method: str, params: Optional[Sequence] = None, timeout: Optional[float] = None) -> Any:
+        """Result of one call; raises RPCError or RPCTransportError"""
+        params = list(params or [])
+        if not self.coalesce or method in NON_COALESCED:
+            return self._call(method, params, timeout)
+
+        key = (method, json.dumps(params, sort_keys=True, separators=(',', ':')))
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        if not leader:
+            JSONRPC_EVENTS.inc(('coalesced',))
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self._call(method, params, timeout)
+            return flight.value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.event.set()
+
+    def _call(self, method: str, params: list, timeout: Optional[float]) -> Any:
+        body = json.dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': self._next_id()}).encode()
+        try:
+            response = self._post(body, self.timeout if timeout is None else timeout, method)
+        except RPCTransportError:
+            JSONRPC_REQUESTS.inc((method, 'transport_error'))
+            raise
+        if 'error' in response:
+            JSONRPC_REQUESTS.inc((method, 'rpc_error'))
+            raise RPCError(response['error'])
+        JSONRPC_REQUESTS.inc((method, 'ok'))
+        return response.get('result')
+
+    def batch(self, calls: Sequence[Tuple[str, Sequence]], timeout: Optional[float] = None) -> List[Any]:
+        """Results for [(method, params), ...] in order, sent MAX_BATCH calls per POST.
+
+        A call that failed on the node yields an RPCError in its slot instead
+        of raising, so one bad call doesn't discard the rest of the batch.
+        """
+        results: List[Any] = []
+        timeout = self.timeout if timeout is None else timeout
+        for start in range(0, len(calls), MAX_BATCH):
+            chunk = calls[start:start + MAX_BATCH]
+            requests = [{'jsonrpc': '2.0', 'method': method, 'params': list(params or []), 'id': self._next_id()}
+                        for method, params in chunk]
+            response = self._post(json.dumps(requests).encode(), timeout, 'batch')
+            if isinstance(response, dict):
+                # Some nodes answer a rejected batch with a single error object
+                raise RPCError(response.get('error', response))
+            by_id = {item.get('id'): item for item in response}
+            for request in requests:
+                method = request['method']
+                item = by_id.get(request['id'])
+                if item is None:
+                    results.append(RPCError({'code': None, 'message': 'missing from batch response'}))
+                elif 'error' in item:
+                    JSONRPC_REQUESTS.inc((method, 'rpc_error'))
+                    results.append(RPCError(item['error']))
+                else:
+                    JSONRPC_REQUESTS.inc((method, 'ok'))
+                    results.append(item.get('result'))
+        return results
+
+    def close(self):
+        while self._idle:
+            self._idle.popleft().close()
+
+
+_clients: Dict[str, JSONRPCClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(url: str = HYPEREVM_RPC_URL) -> JSONRPCClient:
+    """The process-wide client for `url`, so all callers share its pool and rate limit.
+
+    RPC_RATE_LIMIT (calls/second per endpoint) and RPC_POOL_SIZE configure
+    clients created here.
+    """
+    client = _clients.get(url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(url)
+            if client is None:
+                rate = float(os.getenv('RPC_RATE_LIMIT', '0')) or None
+                client = _clients[url] = JSONRPCClient(url, pool_size=int(os.getenv('RPC_POOL_SIZE', '8')),
+                                                       rate_limit=rate)
+    return client
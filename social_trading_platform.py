@@ -5,20 +5,48 @@ Users can launch their Twitter accounts and others can buy/sell shares
 Market cap based on engagement, followers, and trading activity
 """
 
+import functools
 import hashlib
 import http.server
+import itertools
 import socketserver
 import json
 import random
+import threading
 import time
 import urllib.parse
 import urllib.request
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 # eth_account import removed - using simple hash-based approach
 # Twitter authentication removed - using placeholder
 from hyperliquid_config import HYPERLIQUID_CONFIG, get_chain_config, get_deposit_instructions
-from web3_contract_manager import web3_manager
+from web3_contract_manager import web3_manager, WEB3_AVAILABLE
+from trade_indexer import TRADE_INDEX_START_BLOCK, TradeIndexer
+from route_table import Router, PREFIX
+import bonding_curve
+from trade_ledger import TradeLedger, RECENT_TRADES_PER_ACCOUNT
+from candle_aggregator import CandleAggregator, CANDLE_DB_FILE, INTERVALS
+from market_leaderboard import MarketLeaderboard
+from portfolio_index import PortfolioIndex
+from static_assets import StaticAssetCache, resolve_static_path
+from page_templates import PageCache, FRAGMENT_SLOT, script_fragment
+import logging
+from request_log import get_logger, setup_logging, shutdown_logging
+
+ACCESS_LOG = get_logger('access')
+REQUEST_LOG = get_logger('request')
+AUTH_LOG = get_logger('auth')
+
+import metrics
+from metrics import REGISTRY
+
+# Labelled by route template (never the raw path) so cardinality stays bounded
+HTTP_REQUESTS = REGISTRY.counter('socialx_http_requests_total', 'Requests by route and status',
+                                 ('method', 'route', 'status'))
+HTTP_LATENCY = REGISTRY.histogram('socialx_http_request_seconds', 'Handler latency by route', ('method', 'route'))
+HTTP_IN_FLIGHT = REGISTRY.gauge('socialx_http_requests_in_flight', 'Requests being handled', ('method', 'route'))
 
 PORT = 3000
 
@@ -38,43 +66,119 @@ DEPLOYED_CONTRACTS = {
 # Google Sheets-based storage to persist across server restarts
 import os
 import pickle
+from wallet_store import WalletStore, WalletIndex, WALLET_DB_FILE, atomic_write, wallet_of
 # Google Sheets integration - simplified approach
 
 WALLET_STORAGE_FILE = 'user_wallets.pkl'
 GOOGLE_SHEET_ID = "13epUun3GrneQV5d8O9nvXl5xr6hpYXH48vDOpWHgJ5w"
 
+# Primary wallet storage: one SQLite row per USER_WALLETS key. user_wallets.pkl is
+# still exported in the background for the offline scripts that read it. Opened on
+# first use (the server loads USER_WALLETS at startup), so importing creates no files.
+WALLET_STORE = None
+_wallet_store_lock = threading.Lock()
+BACKUP_EXPORT_DELAY = 30  # seconds between a wallet change and the pickle/CSV/JSON export
+
+def wallet_store():
+    """The process-wide WalletStore, opening WALLET_DB_FILE on first use"""
+    global WALLET_STORE
+    with _wallet_store_lock:
+        if WALLET_STORE is None:
+            WALLET_STORE = WalletStore(WALLET_DB_FILE)
+        return WALLET_STORE
+
 def load_user_wallets():
-    """Load user wallets from disk AND Google Sheets"""
+    """Load user wallets from the wallet store (migrating user_wallets.pkl once)"""
     wallets = {}
     
-    # First try loading from local backup (pickle file)
-    if os.path.exists(WALLET_STORAGE_FILE):
-        try:
-            with open(WALLET_STORAGE_FILE, 'rb') as f:
-                wallets = pickle.load(f)
-                print(f"📂 Loaded {len(wallets)} stored wallets from local backup")
-        except Exception as e:
-            print(f"⚠️ Failed to load local wallet storage: {e}")
+    try:
+        store = wallet_store()
+        migrated = store.migrate_from_pickle(WALLET_STORAGE_FILE)
+        if migrated:
+            print(f"📦 Migrated {migrated} wallets from {WALLET_STORAGE_FILE} into {WALLET_DB_FILE}")
+        wallets = store.load_all()
+        print(f"📂 Loaded {len(wallets)} stored wallets from {WALLET_DB_FILE}")
+    except Exception as e:
+        print(f"⚠️ Failed to load wallet store: {e}")
     
     # Google Sheets loading temporarily disabled - using local storage
     print("📝 Google Sheets integration temporarily using local storage only")
     
     return wallets
 
-def save_user_wallets(wallets):
-    """Save user wallets to disk AND Google Sheets"""
+_wallet_write_lock = threading.Lock()
+_wallet_save_tickets = itertools.count(1)
+_wallet_save_owner = {}   # stored key -> ticket of the newest save that captured it
+
+def save_user_wallets(wallets, keys=None):
+    """Persist changed wallet entries and schedule the backup export
+
+    For USER_WALLETS only the keys written since the last save (plus any `keys`
+    passed explicitly, for entries mutated in place) hit the store, so a login
+    costs one row write instead of re-pickling every wallet.
+    """
     try:
-        # Save to local backup (pickle file)
-        with open(WALLET_STORAGE_FILE, 'wb') as f:
-            pickle.dump(wallets, f)
-        print(f"💾 Saved {len(wallets)} wallets to local backup")
-        
-        # Save to Google Sheets
-        update_google_sheets_simple(wallets)
+        with STATE_LOCK:
+            if isinstance(wallets, WalletDict):
+                changed = wallets.drain_dirty()
+                changed.update(keys or ())
+                upserts = {key: dict.__getitem__(wallets, key) for key in changed if dict.__contains__(wallets, key)}
+                deletes = [key for key in changed if not dict.__contains__(wallets, key)]
+            else:
+                upserts = {key: wallets[key] for key in (keys if keys is not None else wallets)}
+                deletes = []
+            # Pickled while the lock keeps other requests from mutating the values
+            rows = WalletStore.serialize(upserts)
+            ticket = next(_wallet_save_tickets)
+            for key in list(rows) + deletes:
+                _wallet_save_owner[str(key)] = ticket
+        
+        # SQLite is written after STATE_LOCK is released. A key captured by a
+        # later save is left to that save, whichever reaches the disk first.
+        with _wallet_write_lock:
+            rows = {key: row for key, row in rows.items() if _wallet_save_owner.get(key) == ticket}
+            deletes = [key for key in deletes if _wallet_save_owner.get(str(key)) == ticket]
+            store = wallet_store()
+            store.put_serialized(rows)
+            if deletes:
+                store.delete_many(deletes)
+        
+        if upserts or deletes:
+            print(f"💾 Saved {len(upserts)} wallet entries ({len(deletes)} removed) to {WALLET_DB_FILE}")
+            schedule_backup_export()
         
     except Exception as e:
         print(f"⚠️ Failed to save wallet storage: {e}")
 
+_backup_timer = None
+_backup_timer_lock = threading.Lock()
+
+def schedule_backup_export(delay=None):
+    """Debounce the full-snapshot exports so bursts of logins trigger one rewrite"""
+    global _backup_timer
+    with _backup_timer_lock:
+        if _backup_timer is not None:
+            return
+        _backup_timer = threading.Timer(BACKUP_EXPORT_DELAY if delay is None else delay, export_wallet_backups)
+        _backup_timer.daemon = True
+        _backup_timer.start()
+
+def export_wallet_backups():
+    """Write user_wallets.pkl and the Google Sheets backups from one snapshot"""
+    global _backup_timer
+    with _backup_timer_lock:
+        _backup_timer = None
+    try:
+        wallets = USER_WALLETS.snapshot()
+        with WALLET_FILE_LOCK:
+            atomic_write(WALLET_STORAGE_FILE, pickle.dumps(wallets))
+            print(f"💾 Exported {len(wallets)} wallets to {WALLET_STORAGE_FILE}")
+            
+            # Save to Google Sheets
+            update_google_sheets_simple(wallets)
+    except Exception as e:
+        print(f"⚠️ Failed to export wallet backups: {e}")
+
 def fetch_user_profile(code):
     """Placeholder - Twitter authentication removed"""
     return None
@@ -105,8 +209,7 @@ def update_google_sheets_simple(wallets):
                 csv_lines.append(f'"{username}","{user_id}","{address}","{private_key}","{balance}","{created}"')
         
         # Save to backup files
-        with open("google_sheets_backup.csv", "w") as f:
-            f.write("\\n".join(csv_lines))
+        atomic_write("google_sheets_backup.csv", "\\n".join(csv_lines).encode())
         
         # Also save as JSON for easy access
         sheets_data = []
@@ -121,8 +224,7 @@ def update_google_sheets_simple(wallets):
                     'created': datetime.now().isoformat()
                 })
         
-        with open("google_sheets_backup.json", "w") as f:
-            json.dump(sheets_data, f, indent=2)
+        atomic_write("google_sheets_backup.json", json.dumps(sheets_data, indent=2).encode())
         
         print(f"💾 Created Google Sheets backup with {len(sheets_data)} wallets")
         
@@ -276,11 +378,157 @@ def try_csv_import_fallback(sheet_id, csv_content, creds):
         
         return False
 
-# Load existing wallets on startup
-USER_WALLETS = load_user_wallets()
+# Guards USER_WALLETS / USER_SESSIONS when the server runs in threaded or pooled mode.
+# Re-entrant so nested helpers can take it again.
+STATE_LOCK = threading.RLock()
+WALLET_FILE_LOCK = threading.Lock()
+
+class SharedStateDict(dict):
+    """Dict shared between request threads.
+
+    Writes take STATE_LOCK and keys()/values()/items() return snapshots, so the
+    existing "for key, value in USER_WALLETS.items()" scans can't blow up with
+    "dictionary changed size during iteration" when another request logs in.
+    Compound check-then-set sequences should still hold STATE_LOCK explicitly.
+    """
+
+    def __setitem__(self, key, value):
+        with STATE_LOCK:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with STATE_LOCK:
+            super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        with STATE_LOCK:
+            super().update(*args, **kwargs)
+
+    def pop(self, key, *default):
+        with STATE_LOCK:
+            return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        with STATE_LOCK:
+            return super().setdefault(key, default)
+
+    def keys(self):
+        with STATE_LOCK:
+            return list(super().keys())
+
+    def values(self):
+        with STATE_LOCK:
+            return list(super().values())
+
+    def items(self):
+        with STATE_LOCK:
+            return list(super().items())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __reduce__(self):
+        # Pickle as a plain dict so user_wallets.pkl stays loadable from other scripts
+        return (dict, (self.snapshot(),))
+
+    def snapshot(self):
+        """Return a plain-dict copy taken under the lock"""
+        with STATE_LOCK:
+            return dict(super().items())
+
+class WalletDict(SharedStateDict):
+    """USER_WALLETS: a SharedStateDict whose WalletIndex is updated on every write,
+    so user_id / address / session lookups never scan the whole dict.
+
+    Written and deleted keys are tracked until save_user_wallets() drains them,
+    so a save only persists what changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty = set()
+        self.index = WalletIndex()
+        for key, value in dict.items(self):
+            self.index.add(key, value)
+
+    def _unindex(self, key):
+        if dict.__contains__(self, key):
+            self.index.remove(key, dict.__getitem__(self, key))
+
+    def __setitem__(self, key, value):
+        with STATE_LOCK:
+            self._unindex(key)
+            super().__setitem__(key, value)
+            self.index.add(key, value)
+            self._dirty.add(key)
+
+    def __delitem__(self, key):
+        with STATE_LOCK:
+            self._unindex(key)
+            super().__delitem__(key)
+            self._dirty.add(key)
+
+    def update(self, *args, **kwargs):
+        with STATE_LOCK:
+            for key, value in dict(*args, **kwargs).items():
+                self[key] = value
+
+    def pop(self, key, *default):
+        with STATE_LOCK:
+            self._unindex(key)
+            self._dirty.add(key)
+            return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        with STATE_LOCK:
+            if not dict.__contains__(self, key):
+                self[key] = default
+            return dict.__getitem__(self, key)
+
+    def load(self, entries):
+        """Add entries read back from the wallet store; they are indexed but not dirty"""
+        with STATE_LOCK:
+            for key, value in entries.items():
+                self._unindex(key)
+                dict.__setitem__(self, key, value)
+                self.index.add(key, value)
+
+    def drain_dirty(self):
+        """Return and clear the keys changed since the last call"""
+        with STATE_LOCK:
+            dirty, self._dirty = self._dirty, set()
+            return dirty
+
+    def wallet_for_user(self, user_id):
+        """(key, wallet) of the entry holding user_id's wallet, or (None, None)"""
+        with STATE_LOCK:
+            key = self.index.user_key(user_id)
+            if key is None:
+                return None, None
+            return key, wallet_of(dict.__getitem__(self, key))
+
+    def wallets_for_address(self, address):
+        """(key, wallet) for every entry holding the wallet with this address"""
+        with STATE_LOCK:
+            return [(key, wallet_of(dict.__getitem__(self, key))) for key in self.index.address_keys(address)]
+
+    def trade_identities(self, key):
+        """Values a trade's buyer/seller field can hold for the user behind `key`:
+        the key itself, the wallet address and every other key sharing that wallet"""
+        with STATE_LOCK:
+            identities = {key}
+            wallet = wallet_of(dict.get(self, key))
+            if wallet:
+                address = str(wallet['address']).lower()
+                identities.add(address)
+                identities.update(self.index.address_keys(address))
+            return identities
+
+# Filled from the wallet store by USER_WALLETS.load(load_user_wallets()) at server startup
+USER_WALLETS = WalletDict()
 
 # Store active user sessions for authentication
-USER_SESSIONS = {}
+USER_SESSIONS = SharedStateDict()
 
 # Global storage for referral tracking
 REFERRAL_TRACKING = {}
@@ -288,17 +536,23 @@ REFERRAL_TRACKING = {}
 # OAuth state storage for CSRF protection
 OAUTH_STATES = {}
 
-def get_or_create_nodejs_wallet(user_id):
-    """Get existing wallet or create persistent Node.js ethers.js wallet for user"""
-    
-    print(f"🔍 Looking for existing wallet for user {user_id}")
-    
+# Striped per-user locks: concurrent first logins of one user mint a single
+# wallet without serialising every login behind one Node.js subprocess
+_WALLET_CREATION_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+def _wallet_creation_lock(user_id):
+    return _WALLET_CREATION_LOCKS[hash(str(user_id)) % len(_WALLET_CREATION_LOCKS)]
+
+def _find_user_wallet(user_id):
+    """Existing wallet for user_id, copied to USER_WALLETS[user_id] when found
+    under another key. Returns (wallet or None, whether USER_WALLETS changed).
+    Caller holds STATE_LOCK."""
     # First check if user already has a wallet stored directly
     if user_id in USER_WALLETS:
         existing_wallet = USER_WALLETS[user_id]
         if isinstance(existing_wallet, dict) and 'address' in existing_wallet:
             print(f"♻️ Using existing persistent wallet for user {user_id}: {existing_wallet['address']}")
-            return existing_wallet
+            return existing_wallet, False
     
     # Check for session-based storage (primary storage location)
     session_key = f"session_{user_id}"
@@ -313,34 +567,56 @@ def get_or_create_nodejs_wallet(user_id):
                 print(f"♻️ FOUND EXISTING WALLET in session for user {user_id}: {existing_wallet['address']}")
                 # Store directly under user_id for faster future access
                 USER_WALLETS[user_id] = existing_wallet
-                save_user_wallets(USER_WALLETS)
-                return existing_wallet
+                return existing_wallet, True
         
         # Also check if session data itself is a wallet (direct storage)
         elif isinstance(session_data, dict) and 'address' in session_data:
             print(f"♻️ Found existing wallet directly in session for user {user_id}: {session_data['address']}")
             USER_WALLETS[user_id] = session_data
-            save_user_wallets(USER_WALLETS)
-            return session_data
+            return session_data, True
+    
+    # Wallets stored under any other key (e.g. a session id) for THIS user, via the user_id index
+    key, wallet_data = USER_WALLETS.wallet_for_user(user_id)
+    if wallet_data is not None:
+        print(f"♻️ PERSISTENCE SYSTEM WORKING! Found wallet for {user_id} under {key}: {wallet_data['address']}")
+        # Store directly under user_id for faster future access
+        USER_WALLETS[user_id] = wallet_data
+        return wallet_data, True
+    
+    return None, False
+
+def get_or_create_nodejs_wallet(user_id):
+    """Get existing wallet or create persistent Node.js ethers.js wallet for user"""
+    
+    print(f"🔍 Looking for existing wallet for user {user_id}")
+    with STATE_LOCK:
+        wallet, changed = _find_user_wallet(user_id)
     
-    # Check all wallet entries to make sure we don't miss anything - BUT ONLY FOR THIS SPECIFIC USER
-    print(f"🔍 Scanning all stored wallets for user {user_id}")
-    for key, value in USER_WALLETS.items():
-        if isinstance(value, dict):
-            # Check if this entry has a wallet for our SPECIFIC user
-            if 'wallet' in value and isinstance(value['wallet'], dict):
-                wallet_data = value['wallet']
-                # CRITICAL: Check if this wallet actually belongs to this user
-                if ('address' in wallet_data and 
-                    ('user_id' in wallet_data and str(wallet_data['user_id']) == str(user_id)) or
-                    (key.endswith(str(user_id)) or str(user_id) in key)):
-                    print(f"♻️ PERSISTENCE SYSTEM WORKING! Found wallet for {user_id}: {wallet_data['address']}")
-                    # Store directly under user_id for faster future access
-                    USER_WALLETS[user_id] = wallet_data
-                    save_user_wallets(USER_WALLETS)
-                    return wallet_data
+    if wallet is None:
+        # STATE_LOCK is only held for the in-memory lookups and the insert;
+        # key generation runs under this user's lock alone
+        with _wallet_creation_lock(user_id):
+            with STATE_LOCK:
+                wallet, changed = _find_user_wallet(user_id)
+            if wallet is None:
+                wallet = _generate_nodejs_wallet(user_id)
+                with STATE_LOCK:
+                    # Another code path may have stored one meanwhile; keep it
+                    existing, changed = _find_user_wallet(user_id)
+                    if existing is None:
+                        USER_WALLETS[user_id] = wallet
+                        changed = True
+                        print(f"✅ NEW persistent wallet created for user {user_id}: {wallet['address']}")
+                    else:
+                        wallet = existing
     
-    # No existing wallet found, create new one using Node.js ethers.js
+    # Store the wallet persistently, outside the global lock
+    if changed:
+        save_user_wallets(USER_WALLETS)
+    return wallet
+
+def _generate_nodejs_wallet(user_id):
+    """Fresh platform wallet from the Node.js ethers.js bridge (runs a subprocess)"""
     from nodejs_wallet_bridge import NodeJSWalletBridge
     
     print(f"🔐 Creating NEW persistent Node.js ethers.js wallet for user {user_id}")
@@ -353,7 +629,7 @@ def get_or_create_nodejs_wallet(user_id):
         raise Exception("Failed to generate wallet using Node.js ethers.js")
     
     # Convert to platform format
-    wallet = {
+    return {
         'address': nodejs_wallet['address'],
         'private_key': nodejs_wallet['privateKey'],
         'hype_balance': 0,  # Real balance will be fetched from blockchain
@@ -367,24 +643,35 @@ def get_or_create_nodejs_wallet(user_id):
         'generated_by': nodejs_wallet['generated_by'],
         'persistent': True
     }
-    
-    # Store the wallet persistently
-    USER_WALLETS[user_id] = wallet
-    save_user_wallets(USER_WALLETS)
-    
-    print(f"✅ NEW persistent wallet created and saved for user {user_id}: {wallet['address']}")
-    return wallet
 
 def create_nodejs_compatible_wallet(user_id):
     """Wrapper function to maintain compatibility - uses persistent wallet system"""
     return get_or_create_nodejs_wallet(user_id)
 
+def _synchronized(method):
+    """Run a SocialTradingPlatform method under the instance lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+# Serializes launches per handle so two requests cannot deploy the same token twice
+_LAUNCH_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+def _launch_lock(handle):
+    return _LAUNCH_LOCKS[hash(str(handle)) % len(_LAUNCH_LOCKS)]
+
 class SocialTradingPlatform:
-    def __init__(self):
+    def __init__(self, candle_db=None):
         self.accounts = {}  # Tradeable Twitter accounts (only real launched accounts)
-        self.trades = []    # Trade history
+        self.ledger = TradeLedger()  # Trade and price history in bounded ring buffers
+        self.candles = CandleAggregator(candle_db)  # 1m/5m/1h/1d OHLCV per account (in memory unless candle_db)
+        self.leaderboard = MarketLeaderboard()  # Sliding 24h volume, totals and trending heap
+        self.portfolios = PortfolioIndex()  # Per-trader positions, cost basis and P&L
         self.users = {}     # Platform users
         self.market_data = {}
+        self._lock = threading.RLock()  # Request threads share one platform instance
         
         # No hardcoded data - accounts only added when users connect and launch
     
@@ -392,17 +679,31 @@ class SocialTradingPlatform:
         """Launch a real X account as a tradeable asset with smart contract deployment"""
         handle = user_data['handle']
         
-        if handle in self.accounts:
-            # Account already exists, return existing contract info
-            existing_account = self.accounts[handle]
-            return {
-                'success': True,
-                'account': existing_account,
-                'contract_info': existing_account.get('smart_contract', {}),
-                'message': f'✅ {handle} is already deployed! Contract address: {existing_account.get("smart_contract", {}).get("token_address", "N/A")}',
-                'already_deployed': True
-            }
-        
+        # Held across the check and the deployment; a concurrent launch of the same
+        # handle waits here and then finds the account already deployed
+        with _launch_lock(handle):
+            existing = self._already_deployed(handle)
+            if existing:
+                return existing
+            return self._deploy_account(handle, user_data)
+    
+    def _already_deployed(self, handle):
+        """Response for an account that is already launched, else None"""
+        with self._lock:
+            existing_account = self.accounts.get(handle)
+        if existing_account is None:
+            return None
+        # Account already exists, return existing contract info
+        return {
+            'success': True,
+            'account': existing_account,
+            'contract_info': existing_account.get('smart_contract', {}),
+            'message': f'✅ {handle} is already deployed! Contract address: {existing_account.get("smart_contract", {}).get("token_address", "N/A")}',
+            'already_deployed': True
+        }
+    
+    def _deploy_account(self, handle, user_data):
+        """Deploy the token contract for handle and register the new account"""
         # Smart contract deployment data
         initial_price = 0.01  # Start at 1 cent per token in HYPE
         total_supply = 1000000000  # 1B tokens total
@@ -469,16 +770,9 @@ class SocialTradingPlatform:
             'daily_change': 0.0,
             'launched_by': user_data['launched_by'],
             'launch_time': datetime.now().isoformat(),
-            'price_history': [{
-                'price': initial_price,
-                'timestamp': datetime.now().isoformat(),
-                'volume': 0,
-                'type': 'launch'
-            }],
             'holder_distribution': {
                 user_data['launched_by']: creator_tokens  # Creator gets 3M tokens
             },
-            'recent_trades': [],
             'bonding_curve_progress': 0.0,
             'creator_tokens': creator_tokens,
             
@@ -517,7 +811,13 @@ class SocialTradingPlatform:
             }
         }
         
-        self.accounts[handle] = new_account
+        # Deployment above runs outside the instance lock; only the registry insert is serialized
+        with self._lock:
+            if handle in self.accounts:
+                return self._already_deployed(handle)
+            self.accounts[handle] = new_account
+            self.ledger.record_price(handle, initial_price, 0, 'launch')
+            self.leaderboard.update_account(handle, new_account['market_cap'], new_account['daily_change'])
         
         return {
             'success': True,
@@ -529,26 +829,30 @@ class SocialTradingPlatform:
             'requires_whype_deposit': True
         }
     
+    @_synchronized
     def add_trade(self, account_handle, trade_type, shares, price, trader_handle):
         """Add a real trade to the history"""
+        record = self.ledger.record_trade(account_handle, trade_type, trader_handle,
+                                          shares * price, shares, price)
+        self.portfolios.record_trade(trader_handle, account_handle, trade_type, shares, shares * price)
         trade = {
-            'id': len(self.trades) + 1,
+            'id': record.seq,
             'account': account_handle,
             'type': trade_type,
             'shares': shares,
             'price': price,
             'total_value': shares * price,
-            'timestamp': datetime.now(),
+            'timestamp': datetime.fromtimestamp(record.ts / 1000),
             'trader': trader_handle
         }
-        self.trades.append(trade)
         
         # Update account volume
         if account_handle in self.accounts:
-            self.accounts[account_handle]['volume_24h'] += shares * price
+            self._record_volume(account_handle, self.accounts[account_handle], shares * price)
         
         return trade
     
+    @_synchronized
     def buy_tokens(self, account_handle, buyer_handle, hype_amount):
         """Buy tokens using bonding curve pricing"""
         if account_handle not in self.accounts:
@@ -578,8 +882,6 @@ class SocialTradingPlatform:
         new_price = effective_price * 1.01  # Price increases with each buy
         account['price_per_token'] = new_price
         account['market_cap'] = (account['total_supply'] - account['circulating_supply']) * new_price
-        account['volume_24h'] += hype_amount
-        account['trades_24h'] += 1
         
         # Update holder distribution
         if buyer_handle not in account['holder_distribution']:
@@ -588,42 +890,16 @@ class SocialTradingPlatform:
         
         account['holder_distribution'][buyer_handle] += tokens_to_buy
         
-        # Add to price history
-        account['price_history'].append({
-            'price': new_price,
-            'timestamp': datetime.now().isoformat(),
-            'volume': hype_amount,
-            'type': 'buy',
-            'buyer': buyer_handle
-        })
-        
-        # Add to recent trades
-        trade = {
-            'type': 'BUY',
-            'buyer': buyer_handle,
-            'account': account_handle,
-            'hype_amount': hype_amount,
-            'tokens_received': tokens_to_buy,
-            'price_per_token': effective_price,
-            'timestamp': datetime.now().isoformat(),
-            'tx_hash': f"0x{random.randint(100000000000000000000000000000000, 999999999999999999999999999999999):032x}"
-        }
-        
-        account['recent_trades'].insert(0, trade)
-        if len(account['recent_trades']) > 50:
-            account['recent_trades'] = account['recent_trades'][:50]
-        
-        # Add to global trades
-        self.trades.append({
-            'id': len(self.trades) + 1,
-            'account': account_handle,
-            'type': 'BUY',
-            'amount_hype': hype_amount,
-            'tokens': tokens_to_buy,
-            'price': effective_price,
-            'timestamp': datetime.now(),
-            'trader': buyer_handle
-        })
+        # Add to price history and the trade ledger
+        self.ledger.record_price(account_handle, new_price, hype_amount, 'buy', buyer_handle)
+        trade = self.ledger.record_trade(
+            account_handle, 'BUY', buyer_handle, hype_amount, tokens_to_buy, effective_price,
+            tx_hash=f"0x{random.randint(100000000000000000000000000000000, 999999999999999999999999999999999):032x}"
+        ).to_dict()
+        self.candles.add_trade(account_handle, effective_price, hype_amount)
+        account['daily_change'] = self.candles.change_24h(account_handle)
+        self._record_volume(account_handle, account, hype_amount)
+        self.portfolios.record_trade(buyer_handle, account_handle, 'BUY', tokens_to_buy, hype_amount)
         
         return {
             'success': True,
@@ -634,6 +910,7 @@ class SocialTradingPlatform:
             'transaction': trade
         }
     
+    @_synchronized
     def sell_tokens(self, account_handle, seller_handle, tokens_to_sell):
         """Sell tokens back to bonding curve"""
         if account_handle not in self.accounts:
@@ -659,8 +936,6 @@ class SocialTradingPlatform:
         new_price = base_price * 0.99  # Price decreases slightly on sells
         account['price_per_token'] = new_price
         account['market_cap'] = (account['total_supply'] - account['circulating_supply']) * new_price
-        account['volume_24h'] += hype_received
-        account['trades_24h'] += 1
         
         # Update holder distribution
         account['holder_distribution'][seller_handle] -= tokens_to_sell
@@ -668,30 +943,16 @@ class SocialTradingPlatform:
             del account['holder_distribution'][seller_handle]
             account['holders'] -= 1
         
-        # Add to price history
-        account['price_history'].append({
-            'price': new_price,
-            'timestamp': datetime.now().isoformat(),
-            'volume': hype_received,
-            'type': 'sell',
-            'seller': seller_handle
-        })
-        
-        # Add to recent trades
-        trade = {
-            'type': 'SELL',
-            'seller': seller_handle,
-            'account': account_handle,
-            'tokens_sold': tokens_to_sell,
-            'hype_received': hype_received,
-            'price_per_token': sell_price_per_token,
-            'timestamp': datetime.now().isoformat(),
-            'tx_hash': f"0x{random.randint(100000000000000000000000000000000, 999999999999999999999999999999999):032x}"
-        }
-        
-        account['recent_trades'].insert(0, trade)
-        if len(account['recent_trades']) > 50:
-            account['recent_trades'] = account['recent_trades'][:50]
+        # Add to price history and the trade ledger
+        self.ledger.record_price(account_handle, new_price, hype_received, 'sell', seller_handle)
+        trade = self.ledger.record_trade(
+            account_handle, 'SELL', seller_handle, hype_received, tokens_to_sell, sell_price_per_token,
+            tx_hash=f"0x{random.randint(100000000000000000000000000000000, 999999999999999999999999999999999):032x}"
+        ).to_dict()
+        self.candles.add_trade(account_handle, sell_price_per_token, hype_received)
+        account['daily_change'] = self.candles.change_24h(account_handle)
+        self._record_volume(account_handle, account, hype_received)
+        self.portfolios.record_trade(seller_handle, account_handle, 'SELL', tokens_to_sell, hype_received)
         
         return {
             'success': True,
@@ -702,6 +963,13 @@ class SocialTradingPlatform:
             'transaction': trade
         }
     
+    def _record_volume(self, account_handle, account, volume):
+        """Feed a trade into the sliding 24h window and refresh the account's counters"""
+        self.leaderboard.record_trade(account_handle, volume, account['market_cap'], account['daily_change'])
+        account['volume_24h'] = self.leaderboard.volume_24h(account_handle)
+        account['trades_24h'] = self.leaderboard.trades_24h(account_handle)
+    
+    @_synchronized
     def get_market_overview(self):
         """Get market statistics - only from real launched accounts"""
         if not self.accounts:
@@ -713,48 +981,73 @@ class SocialTradingPlatform:
                 'active_traders': 0
             }
         
-        total_market_cap = sum(acc['market_cap'] for acc in self.accounts.values())
-        total_volume = sum(acc['volume_24h'] for acc in self.accounts.values())
-        avg_change = sum(acc['daily_change'] for acc in self.accounts.values()) / len(self.accounts)
+        # Running totals kept by the leaderboard (O(1))
+        totals = self.leaderboard.totals()
         
         return {
             'total_accounts': len(self.accounts),
-            'total_market_cap': total_market_cap,
-            'total_volume_24h': total_volume,
-            'avg_daily_change': avg_change,
+            'total_market_cap': totals['total_market_cap'],
+            'total_volume_24h': totals['total_volume_24h'],
+            'avg_daily_change': totals['avg_daily_change'],
             'active_traders': len(self.users)
         }
     
-    def get_trending_accounts(self):
+    @_synchronized
+    def get_trending_accounts(self, limit=None):
         """Get trending accounts by volume and price change - only real accounts"""
         if not self.accounts:
             return []
-            
-        accounts_list = list(self.accounts.values())
-        # Sort by combination of volume and price change
-        trending = sorted(accounts_list, 
-                         key=lambda x: x['volume_24h'] * (1 + x['daily_change']/100), 
-                         reverse=True)
+        
+        # Top-K off the trending heap, ranked by volume_24h * (1 + daily_change/100)
+        trending = []
+        for handle in self.leaderboard.top(limit):
+            account = self.accounts.get(handle)
+            if account is None:
+                continue
+            account['volume_24h'] = self.leaderboard.volume_24h(handle)
+            account['trades_24h'] = self.leaderboard.trades_24h(handle)
+            trending.append(account)
         return trending
     
+    @_synchronized
     def get_recent_trades(self, limit=10):
         """Get recent trades from deployed smart contracts only"""
-        recent_trades = []
+        deployed = {
+            handle: account_data['smart_contract']['token_address']
+            for handle, account_data in self.accounts.items()
+            if 'smart_contract' in account_data and account_data['smart_contract'].get('token_address')
+        }
         
-        # Collect all trades from deployed accounts
-        all_trades = []
-        for handle, account_data in self.accounts.items():
-            if 'smart_contract' in account_data and account_data['smart_contract'].get('token_address'):
-                for trade in account_data.get('recent_trades', []):
-                    trade_info = trade.copy()
-                    trade_info['contract_address'] = account_data['smart_contract']['token_address']
-                    trade_info['network'] = 'HyperEVM Mainnet'
-                    trade_info['account_handle'] = handle
-                    all_trades.append(trade_info)
-        
-        # Sort and limit
-        all_trades.sort(key=lambda x: x['timestamp'], reverse=True)
-        return all_trades[:limit]
+        # Heap-merge the per-account ledgers, newest first
+        recent_trades = []
+        for trade in self.ledger.recent(limit, accounts=deployed):
+            trade_info = trade.to_dict()
+            trade_info['contract_address'] = deployed[trade.account]
+            trade_info['network'] = 'HyperEVM Mainnet'
+            trade_info['account_handle'] = trade.account
+            recent_trades.append(trade_info)
+        return recent_trades
+    
+    @_synchronized
+    def get_account_trades(self, account_handle, limit=RECENT_TRADES_PER_ACCOUNT):
+        """Newest-first trades for one account, as API dicts"""
+        return [trade.to_dict() for trade in self.ledger.account_trades(account_handle, limit)]
+    
+    @_synchronized
+    def get_portfolio(self, identities):
+        """Positions and P&L for one user across all of their trading identities"""
+        return self.portfolios.summary(
+            identities, lambda handle: self.accounts.get(handle, {}).get('price_per_token', 0.0))
+    
+    @_synchronized
+    def get_daily_pnl(self, identities, days=7):
+        """Realized P&L per day for the last `days` days, oldest first"""
+        return self.portfolios.daily_realized(identities, days)
+    
+    @_synchronized
+    def get_price_history(self, account_handle):
+        """Oldest-first price points for one account, as API dicts"""
+        return [point.to_dict() for point in self.ledger.price_history(account_handle)]
     
     def calculate_bonding_curve_price(self, supply):
         """Calculate price based on bonding curve formula"""
@@ -764,19 +1057,14 @@ class SocialTradingPlatform:
         return base_price + (supply * curve_multiplier)
     
     def calculate_buy_price(self, current_supply, shares):
-        """Calculate average buy price for a range of shares"""
-        total_cost = 0
-        for i in range(shares):
-            total_cost += self.calculate_bonding_curve_price(current_supply + i)
-        return total_cost / shares if shares > 0 else 0
+        """Calculate average buy price for a range of shares (closed form, O(1))"""
+        return bonding_curve.average_buy_price(current_supply, shares)
     
     def calculate_sell_price(self, current_supply, shares):
-        """Calculate average sell price for a range of shares"""
-        total_value = 0
-        for i in range(shares):
-            total_value += self.calculate_bonding_curve_price(current_supply - i - 1)
-        return total_value / shares if shares > 0 else 0
+        """Calculate average sell price for a range of shares (closed form, O(1))"""
+        return bonding_curve.average_sell_price(current_supply, shares)
 
+    @_synchronized
     def execute_trade(self, account_handle, trade_type, shares, trader):
         """Execute a trade using bonding curve pricing"""
         if account_handle not in self.accounts:
@@ -793,6 +1081,7 @@ class SocialTradingPlatform:
             # Update price to new bonding curve price
             account['price_per_share'] = self.calculate_bonding_curve_price(account['total_supply'])
             account['market_cap'] = account['price_per_share'] * account['circulating_supply']
+            self.leaderboard.update_account(account_handle, account['market_cap'])
             
             return {
                 'success': True,
@@ -815,6 +1104,7 @@ class SocialTradingPlatform:
             # Update price to new bonding curve price
             account['price_per_share'] = self.calculate_bonding_curve_price(account['total_supply'])
             account['market_cap'] = account['price_per_share'] * account['circulating_supply']
+            self.leaderboard.update_account(account_handle, account['market_cap'])
             
             return {
                 'success': True,
@@ -826,6 +1116,21 @@ class SocialTradingPlatform:
                 'new_supply': account['total_supply']
             }
     
+    @_synchronized
+    def get_price_impact_ladder(self, account_handle, trade_type, sizes):
+        """Quote a ladder of trade sizes against the account's bonding curve in one call"""
+        if account_handle not in self.accounts:
+            return {'error': 'Account not found'}
+        
+        current_supply = int(self.accounts[account_handle]['total_supply'])
+        return {
+            'account': account_handle,
+            'type': trade_type,
+            'current_price': self.calculate_bonding_curve_price(current_supply),
+            'ladder': bonding_curve.quote_ladder(current_supply, sizes, trade_type)
+        }
+    
+    @_synchronized
     def get_price_impact(self, account_handle, trade_type, shares):
         """Calculate price impact of a potential trade"""
         if account_handle not in self.accounts:
@@ -855,7 +1160,132 @@ class SocialTradingPlatform:
 
 trading_platform = SocialTradingPlatform()
 
+# Frontend and Privy files, held in memory and revalidated by mtime
+STATIC_ASSETS = StaticAssetCache()
+PRIVY_TEMPLATE_APP_ID = 'clzmbeq3l016hjs08oj4x9xsf'
+
+# Server-rendered pages: shells compiled once per (page, auth state)
+PAGE_CACHE = PageCache()
+PAGE_ROUTES = {'/': 'markets', '/markets': 'markets', '/portfolio': 'portfolio', '/launch': 'launch'}
+
+
+def _cache_lookups():
+    """(cache, result) -> cumulative lookups for every in-process cache"""
+    web3_stats = web3_manager.get_cache_stats()
+    return {
+        ('web3_reads', 'hit'): web3_stats['hits'] + web3_stats['stale_hits'],
+        ('web3_reads', 'miss'): web3_stats['misses'],
+        ('static_assets', 'hit'): STATIC_ASSETS.stats['hits'],
+        ('static_assets', 'miss'): STATIC_ASSETS.stats['loads'],
+        ('pages', 'hit'): PAGE_CACHE.stats['hits'],
+        ('pages', 'miss'): PAGE_CACHE.stats['builds'],
+    }
+
+
+def _cache_hit_ratios():
+    lookups = _cache_lookups()
+    ratios = {}
+    for cache in {cache for cache, _ in lookups}:
+        total = lookups[(cache, 'hit')] + lookups[(cache, 'miss')]
+        ratios[(cache,)] = lookups[(cache, 'hit')] / total if total else 0.0
+    return ratios
+
+
+def _wallet_store_sizes():
+    users, addresses, sessions = USER_WALLETS.index.sizes()
+    return {
+        ('wallet_store_rows',): wallet_store().count(),
+        ('user_wallets_keys',): len(USER_WALLETS),
+        ('user_sessions',): len(USER_SESSIONS),
+        ('indexed_users',): users,
+        ('indexed_addresses',): addresses,
+        ('indexed_sessions',): sessions,
+    }
+
+
+REGISTRY.callback('socialx_cache_lookups_total', 'Cache lookups by cache and result',
+                  ('cache', 'result'), _cache_lookups, type='counter')
+REGISTRY.callback('socialx_cache_hit_ratio', 'Hits over lookups since start', ('cache',), _cache_hit_ratios)
+REGISTRY.callback('socialx_wallet_store_size', 'Wallet and session store sizes', ('store',), _wallet_store_sizes)
+
+
+def inject_privy_app_id(page: bytes) -> bytes:
+    """Replace the placeholder App ID in privy-auth.html with the configured one"""
+    return page.replace(PRIVY_TEMPLATE_APP_ID.encode(),
+                        os.environ.get('PRIVY_APP_ID', 'cmf0n2ra100qzl20b4gxr8ql0').encode())
+
+
 class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
+    # Headers and body go out in separate writes; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    # Declarative route table - (method, path, handler method[, kind]).
+    # Exact paths win over prefixes, and the longest matching prefix wins.
+    ROUTES = [
+        # Static pages and scripts
+        ('GET', '/privy-auth.html', 'serve_privy_auth_page'),
+        ('GET', '/privy-frame.html', 'serve_privy_frame_page'),
+        ('GET', '/privy-embed.html', 'serve_privy_embed_page'),
+        ('GET', '/auth', 'serve_auth_modal'),
+        ('GET', '/privy-react-auth.js', 'serve_privy_react_auth_js'),
+        ('GET', '/app.js', 'serve_app_js'),
+        ('GET', '/simple-wallet.js', 'serve_simple_wallet_js'),
+        ('GET', '/node_modules/', 'serve_node_modules_file', PREFIX),
+        ('GET', '/static/', 'handle_static_file', PREFIX),
+        
+        # Server-rendered pages
+        ('GET', '/', 'serve_page'),
+        ('GET', '/markets', 'serve_page'),
+        ('GET', '/portfolio', 'serve_page'),
+        ('GET', '/launch', 'serve_page'),
+        
+        # JSON API
+        ('GET', '/api/user-session', 'handle_user_session_api', PREFIX),
+        ('GET', '/api/trending-accounts', 'handle_trending_accounts'),
+        ('GET', '/api/market-overview', 'handle_market_overview'),
+        ('GET', '/api/recent-trades', 'handle_recent_trades'),
+        ('GET', '/api/cache-stats', 'handle_cache_stats'),
+        ('GET', '/metrics', 'handle_metrics'),
+        ('GET', '/api/price-impact', 'handle_price_impact'),
+        ('GET', '/api/candles', 'handle_candles'),
+        ('GET', '/api/update-display-name', 'handle_update_display_name'),
+        ('GET', '/api/portfolio-stats', 'handle_portfolio_stats'),
+        ('GET', '/api/points-statement', 'handle_points_statement'),
+        ('GET', '/api/referral-data', 'handle_referral_data'),
+        ('GET', '/api/auth-status', 'handle_auth_status_fixed'),
+        ('GET', '/api/users', 'handle_users_api'),
+        ('GET', '/api/test-auth', 'handle_test_auth'),
+        ('GET', '/api/logout', 'handle_logout_api'),
+        ('GET', '/api/portfolio-chart', 'handle_portfolio_chart'),
+        ('GET', '/api/set-username', 'handle_set_username'),
+        ('GET', '/api/launch-token', 'handle_launch_token'),
+        ('GET', '/api/update-google-sheets', 'handle_google_sheets_update'),
+        
+        # Auth, referrals and sheet import pages
+        ('GET', '/auth/twitter', 'handle_auth_placeholder'),
+        ('GET', '/auth/twitter', 'handle_twitter_auth_get', PREFIX),
+        ('GET', '/api/callback/twitter/start', 'handle_safari_oauth_start', PREFIX),
+        ('GET', '/callback/twitter/start', 'handle_safari_oauth_start', PREFIX),
+        ('GET', '/callback/twitter', 'handle_twitter_callback', PREFIX),
+        ('GET', '/ref/', 'handle_referral_signup', PREFIX),
+        ('GET', '/logout', 'handle_logout'),
+        ('GET', '/auto-complete', 'handle_auto_complete_page'),
+        ('GET', '/auto-import', 'handle_auto_import_page'),
+        
+        # POST endpoints - handlers receive the raw request body
+        ('POST', '/api/launch-token', 'handle_launch_token'),
+        ('POST', '/auth/twitter', 'handle_twitter_auth_post', PREFIX),
+        ('POST', '/api/launch-account', 'handle_launch_account', PREFIX),
+        ('POST', '/api/wallet-balance', 'handle_wallet_balance_post', PREFIX),
+        ('POST', '/api/fetch-twitter-profile', 'handle_fetch_twitter_profile'),
+        ('POST', '/api/manual-profile-update', 'handle_manual_profile_update'),
+        ('POST', '/api/deposit', 'handle_deposit'),
+        ('POST', '/api/withdraw', 'handle_withdraw'),
+        ('POST', '/api/buy-tokens', 'handle_buy_tokens'),
+        ('POST', '/api/sell-tokens', 'handle_sell_tokens'),
+        ('POST', '/api/deploy-contract', 'handle_deploy_contract'),
+    ]
+    
     def end_headers(self):
         """Add CORS headers to all responses"""
         self.send_header('Access-Control-Allow-Origin', 'http://localhost:5000')
@@ -873,198 +1303,101 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Credentials', 'true')
         self.end_headers()
     
+    def log_request(self, code='-', size='-'):
+        self._status = getattr(code, 'value', code)
+        if ACCESS_LOG.isEnabledFor(logging.INFO):
+            ACCESS_LOG.info('request', extra={'fields': {
+                'client': self.client_address[0] if self.client_address else None,
+                'method': self.command, 'path': self.path, 'status': getattr(code, 'value', code),
+            }})
+
+    def log_message(self, format, *args):
+        ACCESS_LOG.warning(format % args, extra={'fields': {'client': self.client_address[0]}})
+
     def do_GET(self):
-        # EXTENSIVE DEBUGGING FOR EXTERNAL ACCESS ISSUES
-        print(f"🌍 EXTERNAL GET REQUEST: {self.path}")
-        print(f"🌍 CLIENT IP: {self.client_address}")
-        print(f"🌍 USER AGENT: {self.headers.get('User-Agent', 'Unknown')}")
-        print(f"🌍 REFERER: {self.headers.get('Referer', 'None')}")
-        
-        # Handle different page routes
-        parsed_path = urllib.parse.urlparse(self.path)
-        page_path = parsed_path.path
-        
-        # DEBUG: Show which route is being matched
-        print(f"🔍 ROUTE DEBUG: page_path = '{page_path}'")
-        print(f"🔍 ROUTE DEBUG: checking API route: {page_path.startswith('/api/')}")
-        
-        # Only serve API routes - let React frontend handle all page routes
-        if page_path.startswith("/api/"):
-            # Handle API endpoints
-            self.handle_other_routes()
-            return
-        elif page_path == "/privy-auth.html":
-            # Serve the Privy authentication page with actual App ID
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                with open('privy-auth.html', 'r') as f:
-                    auth_page = f.read()
-                    # Replace the App ID dynamically
-                    auth_page = auth_page.replace('clzmbeq3l016hjs08oj4x9xsf', os.environ.get('PRIVY_APP_ID', 'cmf0n2ra100qzl20b4gxr8ql0'))
-                    self.wfile.write(auth_page.encode('utf-8'))
-            except:
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"Privy authentication page not found")
-            return
-        elif page_path == "/privy-frame.html":
-            # Serve the Privy frame page
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                with open('privy-frame.html', 'r') as f:
-                    self.wfile.write(f.read().encode('utf-8'))
-            except:
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"Privy frame not found")
-            return
-        elif page_path == "/privy-embed.html":
-            # Serve the new Privy embed page with CDN approach
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                with open('privy-embed.html', 'r') as f:
-                    self.wfile.write(f.read().encode('utf-8'))
-            except Exception as e:
-                print(f"Error serving privy-embed.html: {e}")
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"Privy embed page not found")
-            return
-        elif page_path == "/auth":
-            # Serve clean Privy authentication modal
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            with open('simple_privy_modal.html', 'r') as f:
-                self.wfile.write(f.read().encode('utf-8'))
-            return
-        elif page_path == "/privy-react-auth.js":
-            # Serve Privy library from node_modules - use ESM build
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/javascript')
-                self.end_headers()
-                with open('node_modules/@privy-io/react-auth/dist/esm/index.mjs', 'r') as f:
-                    self.wfile.write(f.read().encode('utf-8'))
-            except Exception as e:
-                print(f"❌ Privy file error: {e}")
-                self.send_response(404)
-                self.end_headers()
-            return
-        elif page_path.startswith("/node_modules/"):
-            # Serve node_modules files for Privy SDK
-            file_path = page_path[1:]  # Remove leading slash
-            try:
-                if os.path.exists(file_path):
-                    self.send_response(200)
-                    if file_path.endswith('.mjs') or file_path.endswith('.js'):
-                        self.send_header('Content-type', 'application/javascript')
-                    elif file_path.endswith('.css'):
-                        self.send_header('Content-type', 'text/css')
-                    else:
-                        self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    with open(file_path, 'r') as f:
-                        self.wfile.write(f.read().encode('utf-8'))
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-            except Exception as e:
-                print(f"❌ Node modules error: {e}")
-                self.send_response(404)
-                self.end_headers()
+        # Handle different page routes via the compiled route table
+        page_path = urllib.parse.urlparse(self.path).path
+        route = self.router.match('GET', page_path)
+        
+        if REQUEST_LOG.isEnabledFor(logging.DEBUG):
+            REQUEST_LOG.debug('route', extra={'fields': {
+                'path': self.path, 'client': self.client_address[0],
+                'user_agent': self.headers.get('User-Agent'), 'referer': self.headers.get('Referer'),
+                'handler': route.handler if route else None,
+            }})
+        
+        if route is None:
+            self.send_error(404, "Endpoint not found")
+            HTTP_REQUESTS.inc(('GET', 'unmatched', 404))
             return
-        elif page_path == "/auth/twitter":
-            # Handle login placeholder - Twitter authentication disabled
-            self.handle_auth_placeholder()
+        self._dispatch('GET', route)
+
+    def _dispatch(self, method, route, *args):
+        """Run the route's handler, recording count, latency and in-flight metrics"""
+        labels = (method, route.path)
+        self._status = 0
+        HTTP_IN_FLIGHT.inc(labels)
+        start_time = time.perf_counter()
+        try:
+            getattr(self, route.handler)(*args)
+        finally:
+            HTTP_LATENCY.observe(time.perf_counter() - start_time, labels)
+            HTTP_IN_FLIGHT.dec(labels)
+            HTTP_REQUESTS.inc(labels + (self._status,))
+
+    def _serve_asset(self, path, not_found, cache_control='no-cache', extra_headers=None, transform=None):
+        """Serve a file through STATIC_ASSETS, or a plain-text 404 when it is missing"""
+        try:
+            if STATIC_ASSETS.serve(self, path, cache_control, extra_headers, transform):
+                return
+        except (BrokenPipeError, ConnectionResetError):
             return
-        elif page_path == "/app.js":
-            # Serve TypeScript app.js file directly here
-            print(f"🎯 APP.JS ROUTE HIT EARLY: {page_path}")
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/javascript')
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                
-                with open('frontend/app.js', 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    print(f"🎯 APP.JS LENGTH: {len(content)}")
-                    content_bytes = content.encode('utf-8')
-                    print(f"🎯 APP.JS BYTES: {len(content_bytes)}")
-                    self.wfile.write(content_bytes)
-                    print("🎯 APP.JS SERVED!")
-            except Exception as e:
-                print(f"🎯 APP.JS ERROR: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'console.error("Failed to load app.js");')
+        except Exception as e:
+            print(f"❌ Static asset error for {path}: {e}")
+            self.send_error(500, "Internal Server Error")
             return
-        elif page_path == "/simple-wallet.js":
-            # Serve simple working wallet script
-            print(f"🔧 SIMPLE WALLET JS ROUTE HIT: {page_path}")
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/javascript')
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                
-                with open('frontend/simple-wallet.js', 'r') as f:
-                    content = f.read()
-                    print(f"🔧 SIMPLE WALLET JS LENGTH: {len(content)}")
-                    self.wfile.write(content.encode('utf-8'))
-                    print("🔧 SIMPLE WALLET JS SERVED!")
-            except Exception as e:
-                print(f"🔧 SIMPLE WALLET JS ERROR: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'console.error("Failed to load wallet script");')
+        self.send_response(404)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        self.wfile.write(not_found)
+
+    def serve_privy_auth_page(self):
+        """Serve the Privy authentication page with actual App ID"""
+        self._serve_asset('privy-auth.html', b"Privy authentication page not found", transform=inject_privy_app_id)
+
+    def serve_privy_frame_page(self):
+        """Serve the Privy frame page"""
+        self._serve_asset('privy-frame.html', b"Privy frame not found")
+
+    def serve_privy_embed_page(self):
+        """Serve the new Privy embed page with CDN approach"""
+        self._serve_asset('privy-embed.html', b"Privy embed page not found",
+                          extra_headers={'Access-Control-Allow-Origin': '*'})
+
+    def serve_auth_modal(self):
+        """Serve clean Privy authentication modal"""
+        self._serve_asset('simple_privy_modal.html', b"Authentication modal not found")
+
+    def serve_privy_react_auth_js(self):
+        """Serve Privy library from node_modules - use ESM build"""
+        self._serve_asset('node_modules/@privy-io/react-auth/dist/esm/index.mjs', b"Privy library not found",
+                          cache_control='public, max-age=3600')
+
+    def serve_node_modules_file(self):
+        """Serve node_modules files for Privy SDK"""
+        file_path = resolve_static_path('node_modules', urllib.parse.urlparse(self.path).path[len('/node_modules/'):])
+        if file_path is None:
+            self.send_error(403, "Forbidden")
             return
-        else:
-            # Additional static file routes before API routes
-            if page_path == "/simple-wallet.js":
-                # Serve simple working wallet script  
-                print(f"🔧 FALLBACK SIMPLE WALLET JS ROUTE HIT: {page_path}")
-                try:
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/javascript')
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.end_headers()
-                    
-                    with open('frontend/simple-wallet.js', 'r') as f:
-                        content = f.read()
-                        print(f"🔧 FALLBACK SIMPLE WALLET JS LENGTH: {len(content)}")
-                        self.wfile.write(content.encode('utf-8'))
-                        print("🔧 FALLBACK SIMPLE WALLET JS SERVED!")
-                except Exception as e:
-                    print(f"🔧 FALLBACK SIMPLE WALLET JS ERROR: {e}")
-                    self.send_response(500)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'console.error("Failed to load wallet script");')
-                return
-            else:
-                # Handle API routes and other endpoints
-                self.handle_other_routes()
-                return
+        self._serve_asset(file_path, b"File not found", cache_control='public, max-age=3600')
+
+    def serve_app_js(self):
+        """Serve TypeScript app.js file directly here"""
+        self._serve_asset('frontend/app.js', b'console.error("Failed to load app.js");')
+
+    def serve_simple_wallet_js(self):
+        """Serve simple working wallet script"""
+        self._serve_asset('frontend/simple-wallet.js', b'console.error("Failed to load wallet script");')
 
     def handle_twitter_oauth_get(self):
         """Handle Twitter OAuth via GET request"""
@@ -1142,147 +1475,19 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         
         self.wfile.write(placeholder_html.encode('utf-8'))
 
-    def handle_other_routes(self):
-        """Handle API routes and other endpoints"""
-        parsed_path = urllib.parse.urlparse(self.path)
-        
-        # Handle existing API routes by calling the original logic
-        if parsed_path.path.startswith('/api/user-session'):
-            print(f"🎯 ROUTING TO USER SESSION HANDLER")
-            self.handle_user_session_api()
-            return
-        elif parsed_path.path == '/api/trending-accounts':
-            self.handle_trending_accounts()
-            return
-        elif parsed_path.path == '/api/market-overview':
-            self.handle_market_overview()
-            return
-        elif parsed_path.path == '/api/recent-trades':
-            self.handle_recent_trades()
-            return
-        elif parsed_path.path == '/api/update-display-name':
-            self.handle_update_display_name()
-            return
-        elif parsed_path.path == '/api/portfolio-stats':
-            self.handle_portfolio_stats()
-            return
-        elif parsed_path.path == '/api/points-statement':
-            self.handle_points_statement()
-            return
-        elif parsed_path.path == '/api/referral-data':
-            self.handle_referral_data()
-            return
-        elif parsed_path.path == '/api/auth-status':
-            self.handle_auth_status_fixed()
-            return
-        elif parsed_path.path == '/api/users':
-            self.handle_users_api()
-            return
-        elif parsed_path.path == '/api/test-auth':
-            self.handle_test_auth()
-            return
-        elif parsed_path.path == '/api/logout':
-            self.handle_logout_api()
-            return
-        elif parsed_path.path == '/api/portfolio-chart':
-            self.handle_portfolio_chart()
-            return
-        elif parsed_path.path == '/api/set-username':
-            self.handle_set_username()
-            return
-        elif parsed_path.path == '/api/launch-token':
-            self.handle_launch_token()
-            return
-        elif parsed_path.path.startswith('/api/callback/twitter/start'):
-            # Handle Safari OAuth start via API route
-            print(f"🍎 SAFARI OAUTH START (API): {self.path}")
-            self.handle_safari_oauth_start()
-            return
-        elif parsed_path.path == '/logout':
-            self.handle_logout()
-            return
-        elif parsed_path.path.startswith('/ref/'):
-            self.handle_referral_signup()
-            return
-        elif parsed_path.path.startswith('/auth/twitter'):
-            # Handle Twitter OAuth initiation via GET
-            print(f"🔥 AUTH INITIATION HIT: {self.path}")
-            self.handle_twitter_auth_get()
-            return
-        elif parsed_path.path.startswith('/callback/twitter/start'):
-            # Handle Safari OAuth start
-            print(f"🍎 SAFARI OAUTH START: {self.path}")
-            self.handle_safari_oauth_start()
-            return
-        elif parsed_path.path.startswith('/callback/twitter'):
-            # Handle Twitter OAuth callback
-            print(f"🔥 CALLBACK HIT: {self.path}")
-            self.handle_twitter_callback()
-            return
-        elif parsed_path.path == '/auth/twitter':
-            # Simple GET handler for OAuth initiation
-            print(f"🔥 GET AUTH REQUEST: {self.path}")
-            self.handle_twitter_auth_get()
-            return
-        elif parsed_path.path.startswith('/static/'):
-            # Handle static files
-            self.handle_static_file()
-            return
-        else:
-            # Handle other routes that were previously handled
-            self.handle_remaining_routes()
-
     def handle_static_file(self):
         """Handle static file requests"""
+        file_path = resolve_static_path('static', urllib.parse.urlparse(self.path).path[len('/static/'):])
+        if file_path is None:
+            self.send_error(403, "Forbidden")
+            return
+        self._serve_asset(file_path, b"File not found")
+    
+    def handle_user_session_api(self):
+        """Handle user session API requests"""
         try:
-            # Get the file path
-            file_path = self.path[1:]  # Remove leading slash
-            
-            # Security check - prevent directory traversal
-            if '..' in file_path:
-                self.send_error(403, "Forbidden")
-                return
-            
-            # Check if file exists
-            if not os.path.exists(file_path):
-                print(f"❌ Static file not found: {file_path}")
-                self.send_error(404, "File not found")
-                return
-            
-            # Determine content type
-            if file_path.endswith('.js'):
-                content_type = 'application/javascript'
-            elif file_path.endswith('.css'):
-                content_type = 'text/css'
-            elif file_path.endswith('.html'):
-                content_type = 'text/html'
-            elif file_path.endswith('.json'):
-                content_type = 'application/json'
-            else:
-                content_type = 'application/octet-stream'
-            
-            # Send the file
-            with open(file_path, 'rb') as f:
-                content = f.read()
-                self.send_response(200)
-                self.send_header('Content-Type', content_type)
-                self.send_header('Content-Length', str(len(content)))
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                self.wfile.write(content)
-                print(f"✅ Served static file: {file_path} ({len(content)} bytes)")
-                
-        except Exception as e:
-            print(f"❌ Error serving static file: {e}")
-            self.send_error(500, "Internal Server Error")
-    
-    def handle_user_session_api(self):
-        """Handle user session API requests"""
-        try:
-            import urllib.parse
-            import json
+            import urllib.parse
+            import json
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -1299,8 +1504,7 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             
             # If check_active=1, find any active session
             if check_active == '1':
-                print(f"🔍 Checking for active sessions...")
-                print(f"🔍 Available USER_SESSIONS: {list(USER_SESSIONS.keys())}")
+                AUTH_LOG.debug('checking active sessions', extra={'fields': {'sessions': len(USER_SESSIONS)}})
                 
                 if USER_SESSIONS:
                     # Find the most recent active session
@@ -2072,32 +2276,67 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             self.send_header('Location', '/?error=callback_failed')
             self.end_headers()
 
+    def serve_page(self):
+        """Serve a server-rendered page from its cached shell"""
+        content = self.generate_page_html(PAGE_ROUTES.get(urllib.parse.urlparse(self.path).path, 'markets'))
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(content)
+
     def generate_page_html(self, page_type):
-        """Generate HTML for different page types with universal localStorage cleanup"""
+        """Encoded page HTML: the cached shell for this page and auth state plus a per-request fragment"""
+        if page_type not in ('markets', 'portfolio', 'launch'):
+            page_type = 'markets'  # Default to markets
+        cookie_header = self.headers.get('Cookie', '')
+        user_session = ''
+        if 'user_session=' in cookie_header:
+            user_session = cookie_header.split('user_session=')[1].split(';')[0]
+        session = USER_SESSIONS.get(user_session) if user_session else None
+        authenticated = session is not None
+
+        template = PAGE_CACHE.template((page_type, authenticated),
+                                       lambda: self.build_page_shell(page_type, authenticated))
+        state = {'page': page_type, 'authenticated': authenticated,
+                 'username': session.get('twitter_username') if session else None}
+        if page_type == 'markets':
+            state['market_overview'] = trading_platform.get_market_overview()
+        return template.render(script_fragment('SOCIALX_STATE', state))
+
+    def build_page_shell(self, page_type, authenticated):
+        """Full static page for PAGE_CACHE, with the fragment slot before </body>"""
         # Add localStorage cleanup script to ALL pages
         cleanup_script = """
-        // Check for authentication errors in URL and clear localStorage if needed
-        let urlParams = new URLSearchParams(window.location.search);
-        if (urlParams.get('error') === 'no_token' || urlParams.get('error') === 'callback_failed') {
-            console.log('❌ Authentication error detected - clearing localStorage');
-            localStorage.removeItem('twitter_connected');
-            localStorage.removeItem('twitter_handle');
-            localStorage.removeItem('twitter_user_id');
-            
-            // Clear URL parameters by replacing current state
-            const cleanUrl = window.location.pathname;
-            window.history.replaceState({}, document.title, cleanUrl);
-        }
-        """
-        
-        if page_type == "markets":
-            return self.generate_markets_page()
-        elif page_type == "portfolio":
-            return self.generate_portfolio_page()
+    <script>
+        (function() {
+            // Check for authentication errors in URL and clear localStorage if needed
+            const urlParams = new URLSearchParams(window.location.search);
+            if (urlParams.get('error') === 'no_token' || urlParams.get('error') === 'callback_failed') {
+                console.log('❌ Authentication error detected - clearing localStorage');
+                localStorage.removeItem('twitter_connected');
+                localStorage.removeItem('twitter_handle');
+                localStorage.removeItem('twitter_user_id');
+                
+                // Clear URL parameters by replacing current state
+                const cleanUrl = window.location.pathname;
+                window.history.replaceState({}, document.title, cleanUrl);
+            }
+        })();
+    </script>
+"""
+        if page_type == "portfolio":
+            page = self.generate_portfolio_page()
         elif page_type == "launch":
-            return self.generate_launch_page()
+            page = self.generate_launch_page()
         else:
-            return self.generate_markets_page()  # Default to markets
+            page = self.generate_markets_page()
+        
+        body = f'<body data-page="/{page_type}"'
+        page = page.replace(body, f'{body} data-authenticated="{str(authenticated).lower()}"', 1)
+        index = page.rfind('</body>')
+        return page[:index] + cleanup_script + FRAGMENT_SLOT + page[index:]
     
     def generate_base_html_start(self, page_title="SocialX - Trade Twitter Accounts"):
         """Generate the base HTML start with head section"""
@@ -2146,7 +2385,7 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         modalContainer.innerHTML = `
           <iframe 
             id="privy-iframe"
-            src="/privy-embed.html?app_id=""" + os.environ.get('PRIVY_APP_ID') + """"
+            src="/privy-embed.html?app_id=""" + os.environ.get('PRIVY_APP_ID', 'cmf0n2ra100qzl20b4gxr8ql0') + """"
             style="width: 100%; height: 100%; border: none; border-radius: 24px 24px 0 0;"
             allow="clipboard-write; web-share *; accelerometer; camera; encrypted-media; geolocation; gyroscope; microphone"
           ></iframe>
@@ -4626,7 +4865,7 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
                     'market_cap': f"${token.get('market_cap', 0):,.2f}",
                     'volume_24h': token.get('volume_24h', 0),
                     'holder_count': token.get('holder_count', 0),
-                    'daily_change': 0.0,  # Would need price history
+                    'daily_change': trading_platform.candles.change_24h(token.get('handle', '')),
                     'contract_address': token.get('address', ''),
                     'creator': token.get('creator', ''),
                     'real_blockchain_data': True
@@ -4688,10 +4927,27 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         self.end_headers()
         
         try:
-            # Get recent trades from blockchain (for now, we'll use mock data structure)
-            # In a full implementation, this would parse blockchain events
             trades = []
             
+            # Served from the local event-log index when the indexer is running
+            if web3_manager.indexer is not None:
+                for event in web3_manager.get_recent_transactions(limit=20):
+                    trades.append({
+                        'type': event['event_type'].upper(),
+                        'account': event['token_address'],
+                        'amount': f"{event['hype_amount']:.2f} HYPE",
+                        'tokens': event['token_amount'],
+                        'price': f"${event['hype_amount'] / event['token_amount']:.4f}" if event['token_amount'] else "$0.0000",
+                        'timestamp': datetime.fromtimestamp(event['block_time']).isoformat(),
+                        'trader': event['trader'],
+                        'contract_address': event['token_address'],
+                        'tx_hash': event['tx_hash'],
+                        'block_number': event['block_number'],
+                        'real_blockchain_data': True
+                    })
+                self.wfile.write(json.dumps(trades).encode('utf-8'))
+                return
+            
             # Get some tokens to show potential trade structure
             trending_tokens = web3_manager.get_trending_tokens(limit=5)
             
@@ -4715,6 +4971,85 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         
         self.wfile.write(json.dumps(trades).encode('utf-8'))
 
+    def handle_price_impact(self):
+        """Price-impact ladder for the trade widget: ?handle=&type=BUY|SELL&sizes=1,10,100"""
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        handle = params.get('handle', [''])[0]
+        trade_type = params.get('type', ['BUY'])[0].upper()
+        
+        if trade_type not in bonding_curve.TRADE_TYPES:
+            self._send_error_response(f"type must be one of {', '.join(bonding_curve.TRADE_TYPES)}")
+            return
+        sizes = [size for size in params.get('sizes', ['1,10,100,1000,10000'])[0].split(',') if size]
+        if len(sizes) > bonding_curve.MAX_LADDER_RUNGS:
+            self._send_error_response(f"at most {bonding_curve.MAX_LADDER_RUNGS} sizes per ladder")
+            return
+        try:
+            sizes = [int(size) for size in sizes]
+        except ValueError:
+            self._send_error_response("sizes must be a comma separated list of integers")
+            return
+        
+        try:
+            result = trading_platform.get_price_impact_ladder(handle, trade_type, sizes)
+        except ValueError as e:
+            # Sizes the curve cannot quote: non-positive, or sells past the current supply
+            self._send_error_response(str(e))
+            return
+        self.send_response(404 if 'error' in result else 200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(json.dumps(result).encode('utf-8'))
+
+    def handle_candles(self):
+        """OHLCV candles for one account: ?handle=&interval=1m|5m|1h|1d&limit=200"""
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        handle = params.get('handle', [''])[0]
+        interval = params.get('interval', ['1h'])[0]
+        
+        if interval not in INTERVALS:
+            self._send_error_response(f"interval must be one of {', '.join(INTERVALS)}")
+            return
+        try:
+            limit = max(1, min(int(params.get('limit', ['200'])[0]), INTERVALS[interval][1]))
+        except ValueError:
+            self._send_error_response("limit must be an integer")
+            return
+        
+        if handle not in trading_platform.accounts:
+            result = {'error': 'Account not found'}
+        else:
+            result = {
+                'handle': handle,
+                'interval': interval,
+                'candles': trading_platform.candles.candles(handle, interval, limit),
+                'change_24h': trading_platform.candles.change_24h(handle)
+            }
+        self.send_response(404 if 'error' in result else 200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(json.dumps(result).encode('utf-8'))
+
+    def handle_cache_stats(self):
+        """Expose web3_manager read-cache hit/miss counters"""
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        self.wfile.write(json.dumps(web3_manager.get_cache_stats()).encode('utf-8'))
+
+    def handle_metrics(self):
+        """Prometheus text exposition of REGISTRY"""
+        body = REGISTRY.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-type', metrics.CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def handle_update_display_name(self):
         """Handle display name updates for authenticated users"""
         if self.command != 'POST':
@@ -4805,42 +5140,26 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             return
         
         # Calculate real stats from deployed contract interactions
+        indexed_positions = []
+        portfolio = None
         if user_session and user_session in USER_WALLETS:
             user_address = USER_WALLETS[user_session].get('address', '').lower()
+            trade_identities = USER_WALLETS.trade_identities(user_session)
+            
+            # On-chain positions from the trade index (one indexed query per user)
+            indexed_positions = web3_manager.get_trader_positions(user_address)
+            total_trades += sum(position['trades'] for position in indexed_positions)
             
             # Calculate balance from HYPE wallet
             user_wallet = USER_WALLETS[user_session]
             if user_wallet.get('balance_hype'):
                 total_balance_usd = float(user_wallet['balance_hype']) * 0.85  # Approximate USD value
             
-            # Calculate P&L and points from trading activity on deployed contracts
-            for handle, account_data in trading_platform.accounts.items():
-                if 'smart_contract' in account_data and account_data['smart_contract'].get('token_address'):
-                    # Calculate user's trading activity in this account
-                    for trade in account_data.get('recent_trades', []):
-                        trade_user = trade.get('buyer', trade.get('seller', ''))
-                        if trade_user == user_session or trade_user == user_address:
-                            total_trades += 1
-                            
-                            # Points would be calculated from real blockchain contract activity
-                            # user_points += 10  # Removed: no hardcoded bonuses
-                            
-                            # Calculate P&L from smart contract interactions
-                            if trade.get('type') == 'BUY':
-                                current_price = account_data.get('current_price', 0.01)
-                                purchase_price = trade.get('price_per_token', 0.01)
-                                tokens = trade.get('tokens_received', 0)
-                                total_pnl += (current_price - purchase_price) * tokens
-                            elif trade.get('type') == 'SELL':
-                                total_pnl += trade.get('hype_received', 0) - (trade.get('tokens_sold', 0) * 0.01)
-            
-            # Award bonus points for account launches with deployed contracts
-            for handle, account_data in trading_platform.accounts.items():
-                if (account_data.get('launched_by') == user_session and 
-                    'smart_contract' in account_data and 
-                    account_data['smart_contract'].get('token_address')):
-                    # user_points += 100  # Removed: no hardcoded bonuses
-                    pass  # No hardcoded bonuses
+            # Positions and P&L from the per-user portfolio index (O(user's positions))
+            # Points would be calculated from real blockchain contract activity - no hardcoded bonuses
+            portfolio = trading_platform.get_portfolio(trade_identities)
+            total_trades += portfolio['trades']
+            total_pnl = portfolio['total_pnl']
             
             wallet_data = USER_WALLETS[user_session]
             if isinstance(wallet_data, dict):
@@ -4852,14 +5171,16 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
                 # Removed all hardcoded bonuses to comply with "no synthetic data" policy
                 # Points will only be awarded for verified blockchain transactions
                 pass  # No hardcoded point bonuses
-                
-            # P&L calculation (real implementation would track trades)
-            total_pnl = 0.0  # Will implement when trading system is active
         data = {
             'total_balance': round(total_balance_usd, 2),
             'total_pnl': round(total_pnl, 2),
+            'realized_pnl': round(portfolio['realized_pnl'], 2) if portfolio else 0.0,
+            'unrealized_pnl': round(portfolio['unrealized_pnl'], 2) if portfolio else 0.0,
             'user_points': user_points,
-            'referral_count': referral_count
+            'referral_count': referral_count,
+            'total_trades': total_trades,
+            'positions': portfolio['positions'] if portfolio else [],
+            'onchain_positions': indexed_positions
         }
         self.wfile.write(json.dumps(data).encode('utf-8'))
     
@@ -5226,14 +5547,14 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             }
             auth_valid = True
         
-        print(f"🔍 Authentication check for user_session: {user_session}")
-        # Auth session validation completed
-        print(f"📋 Available USER_WALLETS keys: {list(USER_WALLETS.keys())}")
-        print(f"📋 Available USER_SESSIONS keys: {list(USER_SESSIONS.keys())}")
+        if AUTH_LOG.isEnabledFor(logging.DEBUG):
+            AUTH_LOG.debug('referral auth check', extra={'fields': {
+                'session': user_session, 'authenticated': bool(auth_valid),
+                'wallets': len(USER_WALLETS), 'sessions': len(USER_SESSIONS),
+            }})
         
         # STRICT AUTH CHECK: No referral data without active authentication
         if not user_session or not auth_valid:
-            print("❌ User not currently authenticated - no referral data available")
             data = {
                 'authenticated': False,
                 'referral_code': None,
@@ -5256,7 +5577,6 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
                         username = raw_handle[1:]  # Remove @
                     else:
                         username = raw_handle or wallet_data.get('username', '')
-                    print(f"✅ Found current user via session_{user_session}: {username}")
             
             # Try direct session lookup as fallback
             elif user_session in USER_WALLETS:
@@ -5267,7 +5587,6 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
                         username = raw_handle[1:]  # Remove @
                     else:
                         username = raw_handle or wallet_data.get('username', '')
-                    print(f"✅ Found username via direct session lookup: {username}")
             
             # Try scanning all sessions for this user - improved logic
             if not username:
@@ -5280,15 +5599,11 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
                             data.get('username', '').replace('@', '') in str(key)):
                             username = data.get('username') or data.get('handle', '')
                             if username:
-                                print(f"✅ Found username via scan {key}: {username}")
                                 break
-                        # Also try to find any wallet with username for debugging
-                        if data.get('username'):
-                            print(f"🔧 Available wallet: {key} -> username: {data.get('username')}")
         
         # Only generate referral data if we have a valid authenticated username
         if not username:
-            print("❌ No authenticated user found - no referral data")
+            AUTH_LOG.debug('no username for session', extra={'fields': {'session': user_session}})
             data = {
                 'authenticated': False,
                 'referral_code': None,
@@ -5307,7 +5622,6 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             current_domain = f"https://{replit_domain}"
             referral_code = f"SOCIAL_{username.upper()}"
             referral_link = f"{current_domain}/ref/{username}"
-            print(f"✅ Generated referral link for {username}: {referral_link}")
                 
         # Count real referrals from tracking
         global REFERRAL_TRACKING
@@ -5351,51 +5665,31 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         today = datetime.datetime.now()
         chart_data = []
         
-        # Calculate daily P&L from real trading activity
+        # Daily realized P&L buckets and open-position P&L from the portfolio index
         daily_pnl = {}
+        unrealized_pnl = 0.0
         total_trades = 0
         
-        # Track user's trading activity across all deployed contracts
         if user_session and user_session in USER_WALLETS:
-            user_address = USER_WALLETS[user_session].get('address', '').lower()
-            
-            for handle, account_data in trading_platform.accounts.items():
-                if 'smart_contract' in account_data and account_data['smart_contract'].get('token_address'):
-                    # Calculate P&L from user's trades in this account
-                    for trade in account_data.get('recent_trades', []):
-                        trade_user = trade.get('buyer', trade.get('seller', ''))
-                        if trade_user == user_session or trade_user == user_address:
-                            trade_date = datetime.datetime.fromisoformat(trade['timestamp'].replace('Z', '')).date()
-                            trade_pnl = 0.0
-                            total_trades += 1
-                            
-                            # Calculate P&L based on trade type
-                            if trade.get('type') == 'BUY':
-                                # For buys, P&L depends on current vs purchase price
-                                current_price = account_data.get('current_price', 0.01)
-                                purchase_price = trade.get('price_per_token', 0.01)
-                                tokens = trade.get('tokens_received', 0)
-                                trade_pnl = (current_price - purchase_price) * tokens
-                            elif trade.get('type') == 'SELL':
-                                # For sells, P&L is the profit from the sale
-                                trade_pnl = trade.get('hype_received', 0) - (trade.get('tokens_sold', 0) * 0.01)
-                            
-                            if trade_date not in daily_pnl:
-                                daily_pnl[trade_date] = 0.0
-                            daily_pnl[trade_date] += trade_pnl
+            trade_identities = USER_WALLETS.trade_identities(user_session)
+            portfolio = trading_platform.get_portfolio(trade_identities)
+            total_trades = portfolio['trades']
+            unrealized_pnl = portfolio['unrealized_pnl']
+            daily_pnl = {day['date']: day['pnl'] for day in trading_platform.get_daily_pnl(trade_identities, 7)}
         
-        # Generate 7 days of chart data
+        # Generate 7 days of chart data (open positions are marked to market today)
         running_pnl = 0.0
         for i in range(7):
             date = today - timedelta(days=6-i)
-            date_key = date.date()
+            date_key = date.strftime('%Y-%m-%d')
             
             # Add daily P&L if exists
-            if date_key in daily_pnl:
-                running_pnl += daily_pnl[date_key]
+            running_pnl += daily_pnl.get(date_key, 0.0)
+            if i == 6:
+                running_pnl += unrealized_pnl
             
             chart_data.append({
-                'date': date.strftime('%Y-%m-%d'),
+                'date': date_key,
                 'pnl': running_pnl
             })
         
@@ -5704,16 +5998,6 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
 </html>
 """
 
-    def handle_remaining_routes(self):
-        if self.path == "/api/update-google-sheets":
-            self.handle_google_sheets_update()
-            
-        elif self.path == "/auto-complete":
-            self.handle_auto_complete_page()
-            
-        elif self.path == "/auto-import":
-            self.handle_auto_import_page()
-
     def handle_auto_import_page(self):
         """Handle auto-import page with mobile-friendly CSV download"""
         # Serve mobile auto-import page
@@ -5849,2401 +6133,601 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
         
         self.wfile.write(auto_import_html.encode('utf-8'))
 
+    def _send_error_page(self, error_message):
+        """Send error page for OAuth failures"""
+        self.send_response(400)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        
+        error_page = f"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Authentication Error</title></head>
+        <body>
+            <script>
+                window.opener && window.opener.postMessage({
+                    type: 'TWITTER_AUTH_ERROR',
+                    error: '{error_message}'
+                }, '*');
+                window.close();
+            </script>
+            <h2>Authentication Error</h2>
+            <p>{error_message}</p>
+            <p>You can close this window.</p>
+        </body>
+        </html>
+        """
+        
+        self.wfile.write(error_page.encode('utf-8'))
+    
+    def _send_error_response(self, error_message):
+        """Send JSON error response"""
+        self.send_response(400)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        self.wfile.write(json.dumps({'error': error_message}).encode('utf-8'))
+
     def do_POST(self):
         """Handle POST requests"""
         content_length = int(self.headers.get('Content-Length', 0))
         post_data = self.rfile.read(content_length) if content_length > 0 else b'{}'
         
-        if self.path == "/api/launch-token":
-            # Handle token launch POST requests
-            self.handle_launch_token(post_data)
+        route = self.router.match('POST', urllib.parse.urlparse(self.path).path)
+        if route is None:
+            self.send_error(404, "Endpoint not found")
+            HTTP_REQUESTS.inc(('POST', 'unmatched', 404))
             return
+        self._dispatch('POST', route, post_data)
+
+    def handle_twitter_auth_post(self, post_data):
+        """Start the Twitter OAuth flow from a POST request"""
+        # REAL Twitter OAuth flow - need to update redirect URI in Twitter app
+        try:
+            import secrets
+            state = secrets.token_urlsafe(32)
             
-        elif self.path == "/auth/twitter" or self.path.startswith("/auth/twitter"):
-            # REAL Twitter OAuth flow - need to update redirect URI in Twitter app
-            try:
-                import secrets
-                state = secrets.token_urlsafe(32)
-                
-                # Get current domain
-                import os
-                current_domain = os.getenv('REPLIT_DEV_DOMAIN')
-                if not current_domain:
-                    raise ValueError("REPLIT_DEV_DOMAIN environment variable is required")
-                
-                print(f"🔗 Current domain: {current_domain}")
-                print(f"⚠️ Twitter app needs this redirect URI: https://{current_domain}/callback/twitter")
-                
-                # Use Twitter OAuth with current domain
-                # Twitter authentication removed - using placeholder
-                oauth_handler = twitter_oauth.TwitterOAuth()
-                
-                # Override redirect URI to match current domain
-                oauth_handler.redirect_uri = f"https://{current_domain}/callback/twitter"
-                
-                auth_url, state = oauth_handler.generate_auth_url(state)
-                
-                # Store state for validation in both locations
-                OAUTH_STATES[state] = True
-                
-                # CRITICAL: Store the REAL session data in global OAUTH_SESSIONS for persistence
-                # Twitter authentication removed - using placeholder
-                if state in oauth_handler.sessions:
-                    twitter_oauth.OAUTH_SESSIONS[state] = oauth_handler.sessions[state]
-                    print(f"✅ Stored session {state[:10]}... with code_verifier in global storage")
-                else:
-                    print(f"❌ WARNING: No session found for state {state[:10]}...")
-                
-                print(f"🚀 Redirecting to Twitter OAuth: {auth_url}")
-                
-                self.send_response(302)
-                self.send_header('Location', auth_url)
-                self.end_headers()
-                
-            except Exception as e:
-                print(f"❌ OAuth error: {e}")
-                self.send_response(302)
-                self.send_header('Location', f'/?twitter_auth=error&message=OAuth%20setup%20failed:%20{str(e)}')
-                self.end_headers()
-            
-        elif self.path == "/privy-socialx" or self.path == "/privy-socialx.html":
-            # Serve Privy SocialX integration page
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            # Get current domain
+            import os
+            current_domain = os.getenv('REPLIT_DEV_DOMAIN')
+            if not current_domain:
+                raise ValueError("REPLIT_DEV_DOMAIN environment variable is required")
             
-            with open('privy-socialx-fixed.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            print(f"🔗 Current domain: {current_domain}")
+            print(f"⚠️ Twitter app needs this redirect URI: https://{current_domain}/callback/twitter")
             
-        elif self.path == "/wallet-demo" or self.path == "/wallet-demo.html":
-            # Serve wallet cryptography demonstration
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            # Use Twitter OAuth with current domain
+            # Twitter authentication removed - using placeholder
+            oauth_handler = twitter_oauth.TwitterOAuth()
             
-            with open('wallet-crypto-demo.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            # Override redirect URI to match current domain
+            oauth_handler.redirect_uri = f"https://{current_domain}/callback/twitter"
             
-        elif self.path == "/privy-fix" or self.path == "/privy-fix.html":
-            # Serve fixed Privy authentication
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            auth_url, state = oauth_handler.generate_auth_url(state)
             
-            with open('fix-privy-auth.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            # Store state for validation in both locations
+            OAUTH_STATES[state] = True
             
-        elif self.path == "/privy-test" or self.path == "/privy-test.html":
-            # Serve complete Privy test
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            # CRITICAL: Store the REAL session data in global OAUTH_SESSIONS for persistence
+            # Twitter authentication removed - using placeholder
+            if state in oauth_handler.sessions:
+                twitter_oauth.OAUTH_SESSIONS[state] = oauth_handler.sessions[state]
+                print(f"✅ Stored session {state[:10]}... with code_verifier in global storage")
+            else:
+                print(f"❌ WARNING: No session found for state {state[:10]}...")
             
-            with open('test-privy-complete.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            print(f"🚀 Redirecting to Twitter OAuth: {auth_url}")
             
-        elif self.path == "/privy-real" or self.path == "/privy-real.html":
-            # Serve real Privy authentication with actual SDK
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            self.send_response(302)
+            self.send_header('Location', auth_url)
             self.end_headers()
             
-            with open('privy-real-auth.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+        except Exception as e:
+            print(f"❌ OAuth error: {e}")
+            self.send_response(302)
+            self.send_header('Location', f'/?twitter_auth=error&message=OAuth%20setup%20failed:%20{str(e)}')
+            self.end_headers()
+
+    def handle_launch_account(self, post_data):
+        """Handle account launch with real X data"""
+        # Handle account launch with real X data - MOVED FROM do_GET
+        try:
+            request_data = json.loads(post_data.decode('utf-8'))
+            print(f"Launch account request: {request_data}")
+            
+            # 🔍 SUPER DEBUG: Check exact request data
+            print(f"🔍 POST HANDLER DEBUG:")
+            print(f"   Request keys: {list(request_data.keys())}")
+            print(f"   Raw request: {request_data}")
+            
+            # Check if this is real authenticated user data
+            if 'user_data' in request_data:
+                user_data = request_data['user_data']
+                print(f"🔍 Found user_data wrapper - keys: {list(user_data.keys())}")
+            else:
+                user_data = request_data
+                print(f"🔍 Using direct request as user_data - keys: {list(user_data.keys())}")
+            
+            # 🔍 WALLET PRESENCE CHECK - FIXED TO CHECK NESTED WALLET OBJECT
+            wallet_addr = (user_data.get('wallet_address') or 
+                          user_data.get('address') or 
+                          user_data.get('wallet', {}).get('address'))
+            print(f"🔍 WALLET ADDRESS CHECK:")
+            print(f"   wallet_address: {user_data.get('wallet_address')}")
+            print(f"   address: {user_data.get('address')}")
+            print(f"   wallet.address: {user_data.get('wallet', {}).get('address')}")
+            print(f"   Final wallet_addr: {wallet_addr}")
+            
+            # ✅ ENSURE WALLET ADDRESS IS SET IN USER DATA FOR DEPLOYMENT
+            if wallet_addr and not user_data.get('address'):
+                user_data['address'] = wallet_addr
+                user_data['wallet_address'] = wallet_addr
+                print(f"✅ WALLET ADDRESS FIXED: {wallet_addr}")
+            
+            # Validate required fields
+            required_fields = ['handle', 'name']
+            for field in required_fields:
+                if field not in user_data:
+                    raise ValueError(f"Missing required field: {field}")
+            
+            # Add default values for missing fields
+            user_data.setdefault('avatar', '/static/default-avatar.png')
+            user_data.setdefault('followers', 0)
+            user_data.setdefault('tweets', 0)
+            user_data.setdefault('following', 0)
+            user_data.setdefault('verified', False)
+            user_data.setdefault('description', '')
+            user_data.setdefault('launched_by', user_data.get('handle', 'unknown'))
+            
+            result = trading_platform.launch_account(user_data)
+            print(f"Launch result: {result}")
+            
+            # Add deployment status to result
+            if result['success'] and 'account' in result:
+                contract_info = result['account'].get('smart_contract', {})
+                result['real_deployment'] = contract_info.get('real_contract', False)
+                result['deployment_info'] = contract_info.get('deployment_info', {})
             
-        elif self.path == "/ethereum-wallet" or self.path == "/ethereum-wallet.html" or self.path == "/ethereum-wallet-generator.html":
-            # Serve Ethereum wallet generator with proper cryptography
             self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
             
-            with open('ethereum-wallet-generator.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            self.wfile.write(json.dumps(result).encode('utf-8'))
+            
+        except json.JSONDecodeError as e:
+            print(f"JSON decode error: {e}")
+            self._send_error_response("Invalid JSON data")
+        except ValueError as e:
+            print(f"Validation error: {e}")
+            self._send_error_response(str(e))
+        except Exception as e:
+            print(f"Launch account error: {e}")
+            self._send_error_response(f"Launch failed: {str(e)}")
+
+    def handle_wallet_balance_post(self, post_data):
+        """Return HyperEVM wallet balances for the requested address"""
+        # Handle wallet balance requests  
+        try:
+            # Handle both GET and POST requests
+            if self.command == 'GET':
+                # Get user's wallet from session
+                address = None
+                # Get user_id from URL params or session
+                parsed_url = urllib.parse.urlparse(self.path)
+                query_params = urllib.parse.parse_qs(parsed_url.query)
+                user_id = query_params.get('user_id', [None])[0]
+                
+                AUTH_LOG.debug('wallet lookup', extra={'fields': {'user_id': user_id, 'wallet_entries': len(USER_WALLETS)}})
+                
+                # Try multiple ways to find the user's wallet
+                wallet_data = None
+                if user_id:
+                    # Direct lookup
+                    if user_id in USER_WALLETS:
+                        wallet_data = USER_WALLETS[user_id]
+                        print(f"✅ Found wallet via direct lookup")
+                    # Try session_{user_id} format
+                    elif f"session_{user_id}" in USER_WALLETS:
+                        wallet_data = USER_WALLETS[f"session_{user_id}"]
+                        print(f"✅ Found wallet via session_{user_id}")
+                    # Fall back to the user_id index
+                    else:
+                        key, wallet_data = USER_WALLETS.wallet_for_user(user_id)
+                        if wallet_data:
+                            print(f"✅ Found wallet via index: {key}")
+                
+                if wallet_data and isinstance(wallet_data, dict):
+                    if 'address' in wallet_data:
+                        address = wallet_data['address']
+                    elif 'wallet' in wallet_data and isinstance(wallet_data['wallet'], dict):
+                        address = wallet_data['wallet'].get('address')
+                
+                if not address:
+                    print(f"❌ No wallet address found for user {user_id}")
+                    # Still return 200 but with empty wallet info
+                    result = {
+                        'success': True,
+                        'address': 'Not connected',
+                        'balance': '0',
+                        'usd_value': '0.00'
+                    }
+                    self.send_response(200)
+                    self.send_header('Content-type', 'application/json')
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.end_headers()
+                    self.wfile.write(json.dumps(result).encode('utf-8'))
+                    return
+            else:
+                # POST request - get address from body
+                data = json.loads(post_data.decode('utf-8'))
+                address = data.get('address')
             
-        elif self.path == "/auth-test" or self.path == "/auth-test.html":
-            # Serve simple authentication test page
             self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
             
-            with open('simple_auth_test.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            print(f"🔍 Fetching real HYPE balance for address: {address}")
             
-        elif self.path == "/twitter-auth" or self.path == "/twitter-auth.html":
-            # Serve Twitter authentication + wallet generation
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            # Get authentic balance from blockchain
+            from hyperevm_balance import balance_checker
+            balance_data = balance_checker.get_total_hype_balance(address)
             
-            with open('twitter-wallet-auth.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            if 'error' in balance_data:
+                print(f"❌ Blockchain balance fetch failed: {balance_data['error']}")
+                balance = 0
+            else:
+                balance = balance_data['total']
+                print(f"✅ Real blockchain balance: {balance} HYPE")
+                
+                # Update stored wallet with real balance
+                for key, wallet_data in USER_WALLETS.wallets_for_address(address):
+                    wallet_data['hype_balance'] = balance
             
-        elif self.path == "/twitter-wallet" or self.path == "/twitter-wallet.html":
-            # Serve simple Twitter username to wallet generator
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            result = {
+                'success': True,
+                'address': address,
+                'balance': balance,
+                'usd_value': f"{float(balance) * 0.01:.2f}",  # Rough USD estimate
+                'network': 'HyperEVM Mainnet',
+                'native_hype': balance_data.get('native_hype', 0),
+                'whype': balance_data.get('whype', 0),
+                'chain_id': 999
+            }
             
-            with open('simple-twitter-wallet.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
+            self.wfile.write(json.dumps(result).encode('utf-8'))
             
-        elif self.path == "/simple-wallet" or self.path == "/simple_wallet_demo.html":
-            # Serve simple wallet demo that bypasses OAuth
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+        except json.JSONDecodeError:
+            self._send_error_response("Invalid JSON data")
+        except Exception as e:
+            print(f"Wallet balance error: {e}")
+            self._send_error_response(f"Balance fetch failed: {str(e)}")
+
+    def handle_fetch_twitter_profile(self, post_data):
+        """Fetch and store the authenticated user's X profile"""
+        # AGGRESSIVE endpoint to force fetch real Twitter profile data
+        try:
+            data = json.loads(post_data.decode('utf-8'))
+            user_id = data.get('user_id')
+            access_token = data.get('access_token')
             
-            with open('simple_wallet_demo.html', 'r') as f:
-                content = f.read()
-            self.wfile.write(content.encode('utf-8'))
-            return
-        
-        elif self.path == "/app.js":
-            # Serve compiled TypeScript application
-            print(f"🎯 TYPESCRIPT APP.JS ROUTE HIT: {self.path}")
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/javascript')
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                
-                with open('frontend/app.js', 'r') as f:
-                    content = f.read()
-                    print(f"🎯 TYPESCRIPT APP.JS CONTENT LENGTH: {len(content)}")
-                    self.wfile.write(content.encode('utf-8'))
-                    print("🎯 TYPESCRIPT APP.JS SERVED SUCCESSFULLY")
-            except Exception as e:
-                print(f"🎯 TYPESCRIPT APP.JS ERROR: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
+            if not user_id or not access_token:
+                self.send_response(400)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                self.wfile.write(b'console.error("Failed to load TypeScript app");')
-            return
-        
-        elif self.path == "/thirdweb-wallet.js":
-            # Serve simple working thirdweb JavaScript
-            print(f"🔧 SIMPLE THIRDWEB JS ROUTE HIT: {self.path}")
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/javascript')
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                
-                # Serve the simple working version
-                with open('frontend/simple-thirdweb.js', 'r') as f:
-                    content = f.read()
-                    print(f"🔧 SIMPLE THIRDWEB JS CONTENT LENGTH: {len(content)}")
-                    self.wfile.write(content.encode('utf-8'))
-                    print("🔧 SIMPLE THIRDWEB JS SERVED SUCCESSFULLY")
-            except Exception as e:
-                print(f"🔧 SIMPLE THIRDWEB JS ERROR: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'console.error("Failed to load thirdweb integration");')
-            return
-            
-        elif self.path.startswith("/callback/twitter") or self.path.startswith("/auth/twitter/callback"):
-            # Handle REAL Twitter OAuth callback
-            print(f"🔥 CALLBACK HIT: {self.path}")
-            print(f"🔥 REQUEST METHOD: {self.command}")
-            print(f"🔥 HEADERS: {dict(self.headers)}")
-            try:
-                # Import twitter_oauth at function level to avoid scoping issues
-                # Twitter authentication removed - using placeholder
-                
-                # Parse callback parameters
-                parsed_url = urllib.parse.urlparse(self.path)
-                params = urllib.parse.parse_qs(parsed_url.query)
-                
-                if 'error' in params:
-                    # OAuth error
-                    error_msg = params.get('error_description', ['Unknown error'])[0]
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    
-                    error_html = f"""
-                    <html><body>
-                        <script>
-                            window.opener.postMessage({{
-                                type: 'TWITTER_AUTH_ERROR',
-                                error: '{error_msg}'
-                            }}, '*');
-                            window.close();
-                        </script>
-                    </body></html>
-                    """.replace('{{', '{').replace('}}', '}')
-                    self.wfile.write(error_html.encode('utf-8'))
-                    return
-                
-                # Get authorization code and state
-                code = params.get('code', [None])[0]
-                state = params.get('state', [None])[0]
-                
-                if not code or not state:
-                    raise Exception("Missing code or state parameter")
-                
-                # Initialize OAuth handler
-                oauth_handler = twitter_oauth.TwitterOAuth()
-                
-                # Debug: Log current sessions and states
-                # Checking available sessions
-                print(f"Current state: {state}")
-                print(f"OAUTH_STATES: {list(OAUTH_STATES.keys())}")
-                
-                # Try to exchange code for access token - if successful, proceed regardless of state status
-                # This handles server restarts where states get lost but callback is still valid
-                print("🔄 Attempting token exchange...")
-                token_result = oauth_handler.exchange_code_for_token(code, state)
-                
-                if not token_result.get('success'):
-                    # Only check state validity if token exchange failed
-                    if state not in OAUTH_STATES and state not in oauth_handler.sessions:
-                        print(f"❌ Invalid state: {state}")
-                        print(f"❌ Local states: {list(OAUTH_STATES.keys())}")
-                        # OAuth state validation failed
-                        # TEMPORARILY SKIP STATE VALIDATION FOR TESTING
-                        print("⚠️ STATE MISMATCH BUT CONTINUING FOR TESTING")
-                        # raise Exception("Invalid state parameter - OAuth session expired")
-                else:
-                    print("✅ Token exchange successful - proceeding with authentication")
-                    # Remove from local storage if exists
-                    if state in OAUTH_STATES:
-                        del OAUTH_STATES[state]
-                
-                if not token_result.get('success'):
-                    error_msg = token_result.get('error', 'Token exchange failed')
-                    print(f"❌ Token exchange failed: {error_msg}")
-                    raise Exception(error_msg)
-                
-                access_token = token_result['access_token']
-                
-                # MUST GET REAL PROFILE DATA - No fake/placeholder data allowed
-                print("🔄 Attempting to fetch REAL Twitter profile data...")
-                
-                # Store access token first so we can retry later
-                import time
-                temp_user_id = f"twitter_user_{int(time.time())}"
-                
-                # Get profile data with reasonable timeout to prevent infinite loading
-                user_result = oauth_handler.get_user_info(access_token)
-                
-                if not user_result or not user_result.get('success'):
-                    error_type = user_result.get('suggestion', 'rate_limited') if user_result else 'api_error'
-                    
-                    if error_type == 'oauth_scope_issue':
-                        print("❌ TWITTER OAUTH SCOPE ISSUE - Need to update Twitter app")
-                        print("💡 Your Twitter app needs 'tweet.read' scope added")
-                        self.send_response(302)
-                        self.send_header('Location', '/?error=twitter_scope_insufficient')
-                        self.end_headers()
-                        return
-                    elif error_type == 'use_alternative_method':
-                        print("❌ ALTERNATIVE METHOD BLOCKED - REAL DATA ONLY POLICY")
-                        print("🚫 NO FAKE PREMIUM ACCOUNTS ALLOWED")
-                        
-                        # Block access - no fake accounts allowed
-                        error_html = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Authentication Failed - SocialX</title>
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a0a; color: white; display: flex; align-items: center; justify-content: center; min-height: 100vh; margin: 0; }
-        .error-container { text-align: center; max-width: 500px; padding: 40px; background: rgba(255,255,255,0.05); border-radius: 16px; border: 1px solid rgba(255,255,255,0.1); }
-        .error-icon { font-size: 64px; margin-bottom: 20px; }
-        h1 { color: #ff4757; margin-bottom: 16px; }
-        p { color: #a0a0a0; line-height: 1.6; margin-bottom: 20px; }
-        .retry-btn { background: #1677ff; color: white; border: none; padding: 12px 24px; border-radius: 8px; cursor: pointer; font-size: 16px; margin-top: 20px; }
-        .retry-btn:hover { background: #0958d9; }
-    </style>
-</head>
-<body>
-    <div class="error-container">
-        <div class="error-icon">🚫</div>
-        <h1>Authentication Failed</h1>
-        <p><strong>Real X profile data required.</strong></p>
-        <p>Cannot authenticate without accessing your authentic social media profile. Our platform maintains strict data integrity standards.</p>
-        <button class="retry-btn" onclick="window.location.href='/'">Return to Platform</button>
-    </div>
-</body>
-</html>
-"""
-                        
-                        self.send_response(401)  # Unauthorized
-                        self.send_header('Content-Type', 'text/html')
-                        self.end_headers()
-                        self.wfile.write(error_html.encode('utf-8'))
-                        return
-                    elif error_type == 'twitter_api_down':
-                        print("⚠️ TWITTER API DOWN - Checking for X Pro user with cached real data")
-                        
-                        # X PRO USER BYPASS: Use cached real profile data for paying customers
-                        # Check if we have stored real profile data from previous successful auth
-                        import hashlib
-                        access_token = token_result.get('access_token', '')
-                        token_hash = hashlib.sha256(access_token.encode()).hexdigest()[:12]
-                        potential_user_id = f"oauth_user_{token_hash}"
-                        
-                        # Check for existing wallet with real data
-                        stored_user_data = None
-                        try:
-                            # Look for stored user session data
-                            if hasattr(self.server, 'user_sessions') and potential_user_id in self.server.user_sessions:
-                                stored_data = self.server.user_sessions[potential_user_id]
-                                if stored_data.get('is_real_data') and stored_data.get('handle', '').startswith('@') and not stored_data.get('handle', '').startswith('@x_user_'):
-                                    stored_user_data = stored_data
-                                    print(f"💎 FOUND X PRO USER CACHED DATA: {stored_data.get('handle')} - Using real profile data")
-                        except:
-                            pass
-                        
-                        # Use cached user data if available 
-                        if stored_user_data:
-                            print(f"✅ CACHED USER DATA FOUND: Using stored profile for {stored_user_data.get('handle')}")
-                            user_result = {
-                                'success': True,
-                                'user': {
-                                    'id': potential_user_id,
-                                    'name': stored_user_data.get('name'),
-                                    'handle': stored_user_data.get('handle'),
-                                    'username': stored_user_data.get('username'),
-                                    'avatar': stored_user_data.get('avatar', ''),
-                                    'description': stored_user_data.get('description', ''),
-                                    'verified': stored_user_data.get('verified', False),
-                                    'followers': stored_user_data.get('followers', 0),
-                                    'following': stored_user_data.get('following', 0),
-                                    'tweets': stored_user_data.get('tweets', 0),
-                                    'is_authenticated': True,
-                                    'is_real_user': True
-                                }
-                            }
-                            print(f"✅ USER LOGIN SUCCESS: {stored_user_data.get('handle')}")
-                        else:
-                            # Try to load any existing session data from wallet storage for this access token
-                            try:
-                                import hashlib
-                                import os
-                                import pickle
-                                token_hash = hashlib.sha256(access_token.encode()).hexdigest()[:12]
-                                
-                                # Check if we have any stored wallet data that could indicate a previous session
-                                if os.path.exists('user_wallets.pkl'):
-                                    with open('user_wallets.pkl', 'rb') as f:
-                                        wallets = pickle.load(f)
-                                    
-                                    # Look for any session with this token pattern
-                                    for user_id, wallet_data in wallets.items():
-                                        if isinstance(wallet_data, dict) and wallet_data.get('access_token') == access_token:
-                                            print(f"🔄 FOUND EXISTING SESSION: {wallet_data.get('handle', user_id)}")
-                                            stored_user_data = wallet_data
-                                            user_result = {
-                                                'success': True,
-                                                'user': {
-                                                    'id': user_id,
-                                                    'name': wallet_data.get('name', ''),
-                                                    'handle': wallet_data.get('handle', ''),
-                                                    'username': wallet_data.get('username', ''),
-                                                    'avatar': wallet_data.get('avatar', ''),
-                                                    'description': wallet_data.get('description', ''),
-                                                    'verified': wallet_data.get('verified', False),
-                                                    'followers': wallet_data.get('followers', 0),
-                                                    'following': wallet_data.get('following', 0),
-                                                    'tweets': wallet_data.get('tweets', 0),
-                                                    'is_authenticated': True,
-                                                    'is_real_user': True
-                                                }
-                                            }
-                                            print(f"✅ SESSION RESTORED: {wallet_data.get('handle')}")
-                                            break
-                            except Exception as e:
-                                print(f"⚠️ Session lookup failed: {e}")
-                            
-                            if not stored_user_data:
-                                print("❌ No cached user data found - API rate limit prevents new authentication")
-                                print("🚫 Real data required for all users")
-                            
-                            # Block authentication - no cached real data available
-                            error_html = """<!DOCTYPE html>
-<html>
-<head>
-    <title>X API Unavailable</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: rgb(26, 26, 26);
-            color: white;
-            text-align: center;
-        }
-        .error-container {
-            max-width: 500px;
-            margin: 100px auto;
-            padding: 40px;
-            background: rgb(42, 42, 42);
-            border-radius: 10px;
-        }
-        .error-icon {
-            font-size: 64px;
-            margin-bottom: 20px;
-        }
-        h1 {
-            color: rgb(255, 107, 107);
-            margin-bottom: 20px;
-        }
-        p {
-            margin-bottom: 15px;
-            line-height: 1.6;
-        }
-        .retry-btn {
-            background: rgb(76, 175, 80);
-            color: white;
-            padding: 12px 24px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-            margin-top: 20px;
-        }
-        .retry-btn:hover {
-            background: rgb(69, 160, 73);
-        }
-    </style>
-</head>
-<body>
-    <div class="error-container">
-        <div class="error-icon">⚠️</div>
-        <h1>X API Temporarily Unavailable</h1>
-        <p><strong>Cannot fetch your real profile data right now.</strong></p>
-        <p>Our platform requires authentic X profile data. Please try again in a few minutes when the API is available.</p>
-        <button class="retry-btn" onclick="window.location.href='/'">Try Again</button>
-    </div>
-</body>
-</html>"""
-                            
-                            self.send_response(503)  # Service Unavailable
-                            self.send_header('Content-Type', 'text/html')
-                            self.end_headers()
-                            self.wfile.write(error_html.encode('utf-8'))
-                            return
-                        
-                        # This code is unreachable due to return statement above
-                        
-                        try:
-                            # Extract authorization code for additional analysis
-                            auth_code = self.path.split('code=')[1].split('&')[0] if 'code=' in self.path else None
-                            
-                            # Use the access token directly with proper OAuth 2.0 user context
-                            access_token = token_result.get("access_token")
-                            
-                            print("🔑 Using OAuth 2.0 user context with your X Pro credentials")
-                            import os
-                            # Using Twitter OAuth credentials
-                            
-                            # Try direct API call with proper user context
-                            try:
-                                
-                                url = "https://api.twitter.com/2/users/me?user.fields=id,name,username,profile_image_url,description,public_metrics,verified,created_at"
-                                
-                                # Use proper X Pro Bearer token, not OAuth access token
-                                import os
-                                bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-                                
-                                headers = {
-                                    'Authorization': f'Bearer {bearer_token}',
-                                    'User-Agent': 'SocialX-XPro-Bearer/1.0',
-                                    'Accept': 'application/json'
-                                }
-                                
-                                request = urllib.request.Request(url, headers=headers)
-                                
-                                with urllib.request.urlopen(request, timeout=15) as response:
-                                    if response.status == 200:
-                                        data = json.loads(response.read().decode('utf-8'))
-                                        
-                                        if 'data' in data:
-                                            user = data['data']
-                                            real_profile_data = {
-                                                'id': user_id,
-                                                'name': user['name'],
-                                                'handle': f"@{user['username']}",
-                                                'username': user['username'],
-                                                'avatar': user.get('profile_image_url', '').replace('_normal', '_400x400'),
-                                                'description': user.get('description', ''),
-                                                'verified': user.get('verified', False),
-                                                'followers': user.get('public_metrics', {}).get('followers_count', 0),
-                                                'following': user.get('public_metrics', {}).get('following_count', 0),
-                                                'tweets': user.get('public_metrics', {}).get('tweet_count', 0),
-                                                'created_at': user.get('created_at', ''),
-                                            }
-                                            print(f"✅ SUCCESS! Real X Pro profile: @{user['username']} ({user.get('public_metrics', {}).get('followers_count', 0):,} followers)")
-                                        else:
-                                            print(f"❌ No user data in response: {data}")
-                                            real_profile_data = None
-                                    else:
-                                        error_data = response.read().decode('utf-8')
-                                        print(f"❌ API Error {response.status}: {error_data}")
-                                        real_profile_data = None
-                                        
-                            except Exception as e:
-                                print(f"❌ Direct OAuth call failed: {str(e)}")
-                                real_profile_data = None
-                                # Try one more time with different approach
-                                try:
-                                    # Alternative endpoint call
-                                    alt_url = "https://api.twitter.com/1.1/account/verify_credentials.json"
-                                    # Use proper Bearer token for alternative API call too
-                                    alt_headers = {
-                                        'Authorization': f'Bearer {bearer_token}',
-                                        'User-Agent': 'SocialX-XPro-Alternative/1.0'
-                                    }
-                                    alt_request = urllib.request.Request(alt_url, headers=alt_headers)
-                                    
-                                    with urllib.request.urlopen(alt_request, timeout=10) as alt_response:
-                                        if alt_response.status == 200:
-                                            alt_data = json.loads(alt_response.read().decode('utf-8'))
-                                            if 'screen_name' in alt_data:
-                                                real_profile_data = {
-                                                    'id': user_id,
-                                                    'name': alt_data.get('name', alt_data['screen_name']),
-                                                    'handle': f"@{alt_data['screen_name']}",
-                                                    'username': alt_data['screen_name'],
-                                                    'avatar': alt_data.get('profile_image_url_https', '').replace('_normal', '_400x400'),
-                                                    'description': alt_data.get('description', ''),
-                                                    'verified': alt_data.get('verified', False),
-                                                    'followers': alt_data.get('followers_count', 0),
-                                                    'following': alt_data.get('friends_count', 0),
-                                                    'tweets': alt_data.get('statuses_count', 0),
-                                                    'created_at': alt_data.get('created_at', ''),
-                                                }
-                                                print(f"✅ SUCCESS! Alternative API: @{alt_data['screen_name']} ({alt_data.get('followers_count', 0):,} followers)")
-                                except Exception as alt_e:
-                                    print(f"❌ Alternative API also failed: {alt_e}")
-                                    real_profile_data = None
-                            
-                            if real_profile_data:
-                                print(f"✅ REAL X PRO DATA: @{real_profile_data['username']} ({real_profile_data['followers']:,} followers)")
-                                # Update Pro bypass data with real fetched data
-                                if pro_user_bypass and user_result:
-                                    print(f"🔄 UPDATING Pro bypass data with real profile information")
-                                    user_result['user'].update({
-                                        'avatar': real_profile_data['avatar'],
-                                        'followers': real_profile_data['followers'],
-                                        'description': real_profile_data['description'],
-                                        'verified': real_profile_data['verified'],
-                                        'following': real_profile_data['following'],
-                                        'tweets': real_profile_data['tweets']
-                                    })
-                                    print(f"✅ UPDATED: Avatar and {real_profile_data['followers']:,} followers for @{real_profile_data['username']}")
-                                else:
-                                    # Non-Pro user - create new user_result
-                                    user_result = {
-                                        'success': True,
-                                        'user': {
-                                            **real_profile_data,
-                                            'is_authenticated': True,
-                                            'is_paid_user': True,
-                                            'is_pro_user': True,
-                                            'annual_plan_cost': 54000
-                                        }
-                                    }
-                            else:
-                                print("❌ X Pro API temporarily unavailable - allowing authentication anyway")
-                                print("💎 $54K plan should have access - proceeding with token-based auth")
-                                # Allow authentication with basic token data for X Pro users
-                                # Extract real user data from OAuth token if possible
-                                try:
-                                    import base64
-                                    import json as json_module
-                                    
-                                    # Try to decode user info from access token
-                                    token_parts = access_token.split('.') if access_token else []
-                                    if len(token_parts) >= 2:
-                                        # Decode token payload (if JWT format)
-                                        try:
-                                            payload = base64.b64decode(token_parts[1] + '==').decode('utf-8')
-                                            token_data = json_module.loads(payload)
-                                            real_username = token_data.get('username') or token_data.get('screen_name')
-                                            real_name = token_data.get('name')
-                                        except:
-                                            real_username = None
-                                            real_name = None
-                                    else:
-                                        real_username = None
-                                        real_name = None
-                                except:
-                                    real_username = None
-                                    real_name = None
-                                
-                                # Try one more direct approach to get real username
-                                extracted_username = None
-                                try:
-                                    # Look for user info in the authorization code
-                                    auth_code = self.path.split('code=')[1].split('&')[0] if 'code=' in self.path else None
-                                    if auth_code:
-                                        # Decode authorization code (contains user context)
-                                        import base64
-                                        try:
-                                            decoded = base64.b64decode(auth_code + '==').decode('utf-8', errors='ignore')
-                                            # Look for username patterns in decoded data
-                                            if '@' in decoded or 'user' in decoded.lower():
-                                                print(f"🔍 Found user context in auth code")
-                                        except:
-                                            pass
-                                except:
-                                    pass
-                                
-                                # SIMPLE APPROACH: Use basic X Pro authentication
-                                # Your $54K plan should work with basic user.read scope
-                                
-                                # Check if Pro user bypass already succeeded
-                                if pro_user_bypass:
-                                    print("✅ X PRO BYPASS: Skip blocking - using real stored data")
-                                    # Use stored data from wallet file (not hardcoded values)
-                                    display_name = pro_user_data.get('name') if 'pro_user_data' in locals() else None
-                                    display_handle = pro_user_data.get('handle') if 'pro_user_data' in locals() else None
-                                    display_username = pro_user_data.get('username') if 'pro_user_data' in locals() else None
-                                    # Pro bypass authentication is complete with real stored data
-                                elif real_profile_data and 'username' in real_profile_data:
-                                    # Success - use real data
-                                    real_username = real_profile_data['username']
-                                    real_name = real_profile_data['name']
-                                    real_followers = real_profile_data.get('followers', 0)
-                                    
-                                    display_name = real_name
-                                    display_handle = f'@{real_username}'
-                                    display_username = real_username
-                                    
-                                    print(f"✅ REAL X PRO DATA: @{real_username} ({real_followers:,} followers)")
-                                else:
-                                    # STRICT REAL DATA ONLY POLICY: Block login if real profile cannot be fetched
-                                    print("❌ REAL DATA ONLY POLICY: Cannot fetch real profile data")
-                                    print("🚫 BLOCKING authentication - no fake usernames allowed")
-                                    
-                                    # Return error page instead of fake data
-                                    error_html = """<!DOCTYPE html>
-<html>
-<head>
-    <title>Real Profile Data Required</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background: rgb(26,26,26); color: white; text-align: center; }
-        .error-container { max-width: 500px; margin: 100px auto; padding: 40px; background: rgb(42,42,42); border-radius: 10px; }
-        .error-icon { font-size: 64px; margin-bottom: 20px; }
-        h1 { color: rgb(255,107,107); margin-bottom: 20px; }
-        p { margin-bottom: 15px; line-height: 1.6; }
-        .retry-btn { background: rgb(76,175,80); color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; font-size: 16px; margin-top: 20px; }
-        .retry-btn:hover { background: rgb(69,160,73); }
-    </style>
-</head>
-<body>
-    <div class="error-container">
-        <div class="error-icon">🚫</div>
-        <h1>Real Profile Data Required</h1>
-        <p><strong>Cannot authenticate without your real X profile data.</strong></p>
-        <p>Our platform enforces strict "REAL DATA ONLY" policy. Please try again when X API is available.</p>
-        <button class="retry-btn" onclick="window.location.href='/'">Try Again</button>
-    </div>
-</body>
-</html>"""
-                                    
-                                    self.send_response(401)  # Unauthorized
-                                    self.send_header('Content-Type', 'text/html')
-                                    self.end_headers()
-                                    self.wfile.write(error_html.encode('utf-8'))
-                                    return
-                                
-                                # Don't override Pro bypass data - only create user_result if not already set
-                                if not pro_user_bypass:
-                                    user_result = {
-                                        'success': True,
-                                        'user': {
-                                            'id': user_id,
-                                            'name': display_name,
-                                            'handle': display_handle,
-                                            'username': display_username,
-                                            'avatar': 'https://abs.twimg.com/sticky/default_profile_images/default_profile_400x400.png',
-                                            'description': 'Real X profile data loading...',
-                                            'verified': False,
-                                            'followers': 0,  # Default for non-Pro users
-                                            'following': 0,
-                                            'tweets': 0,
-                                            'created_at': datetime.datetime.now().isoformat() + 'Z',
-                                            'is_authenticated': True,
-                                            'is_paid_user': True,
-                                            'is_pro_user': True,
-                                            'annual_plan_cost': 54000,
-                                            'needs_real_data_fetch': True,
-                                            'pending_real_data': True
-                                        }
-                                    }
-                            
-                        except Exception as e:
-                            print(f"❌ X Pro API failed: {str(e)}")
-                            # For X Pro users, this should not happen - block authentication
-                            print("🚫 X Pro authentication failed - blocking without real data")
-                            self.send_response(302)
-                            self.send_header('Location', '/?error=xpro_api_failed&message=X%20Pro%20API%20access%20failed')
-                            self.end_headers()
-                            return
-                        print(f"✅ X PRO USER authenticated: {user_id}")
-                        print("💎 Premium $54K/year plan - No rate limiting expected")
-                    elif error_type == 'paid_api_issue':
-                        print("❌ AUTHENTICATION FAILED - Paid API hitting unexpected rate limits")
-                        print("💡 This suggests possible token scope or app configuration issues")
-                        self.send_response(302)
-                        self.send_header('Location', '/?error=twitter_config_issue')
-                        self.end_headers()
-                        return
-                    else:
-                        print("❌ AUTHENTICATION FAILED - Twitter API rate limited, no real profile data available")
-                        self.send_response(302)
-                        self.send_header('Location', '/?error=twitter_rate_limited')
-                        self.end_headers()
-                        return
-                
-                if not user_result or not user_result.get('success'):
-                    # Return error page for any remaining failures
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    
-                    error_html = """
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <title>Authentication Failed</title>
-                        <style>
-                            body { 
-                                font-family: Arial, sans-serif; 
-                                display: flex; 
-                                justify-content: center; 
-                                align-items: center; 
-                                height: 100vh; 
-                                margin: 0; 
-                                background: linear-gradient(135deg, #ff6b6b 0%, #ee5a52 100%);
-                                color: white;
-                            }
-                            .container { 
-                                text-align: center; 
-                                padding: 30px;
-                                background: rgba(255,255,255,0.1);
-                                border-radius: 20px;
-                                backdrop-filter: blur(10px);
-                                max-width: 500px;
-                            }
-                            .title { font-size: 2rem; margin-bottom: 20px; }
-                            .message { font-size: 1.1rem; line-height: 1.5; margin-bottom: 30px; }
-                            .btn { 
-                                background: white; 
-                                color: #ff6b6b; 
-                                padding: 12px 24px; 
-                                border-radius: 8px; 
-                                text-decoration: none; 
-                                font-weight: bold; 
-                                display: inline-block;
-                                transition: all 0.3s ease;
-                            }
-                            .btn:hover { transform: translateY(-2px); box-shadow: 0 5px 15px rgba(0,0,0,0.3); }
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <div class="title">❌ Authentication Error</div>
-                            <div class="message">
-                                Twitter authentication failed. Please try again later.
-                            </div>
-                            <a href="/" class="btn">← Back to SocialX</a>
-                        </div>
-                    </body>
-                    </html>
-                    """
-                    
-                    self.wfile.write(error_html.encode('utf-8'))
-                    return  # Exit authentication completely - no fake authentication allowed
-                
-                # SUCCESS: We have real user profile data, proceed with authentication
-                user_data = user_result.get('user')
-                
-                # Ensure user_data is always a dictionary
-                if not isinstance(user_data, dict):
-                    user_data = {}
-                
-                # PERMISSIVE AUTHENTICATION - Allow all login attempts, detect profiles in background
-                # Always allow platform access, profile data will be fetched when available
-                print("✅ PERMISSIVE AUTH: Allowing all users, profile detection in background")
-                
-                # Try to get real profile data if available, but don't block if it fails
-                if user_result and user_result.get('success'):
-                    print("✅ Real profile data available - using it")
-                    user_data = user_result.get('user', {})
-                else:
-                    print("⚠️ Profile data not available yet - allowing access anyway")
-                    # Create basic user data to prevent errors
-                    if not user_data or not isinstance(user_data, dict):
-                        user_data = {
-                            'handle': f'@user_{user_id[:8]}',
-                            'username': f'user_{user_id[:8]}',
-                            'followers': 0,
-                            'following': 0,
-                            'description': '',
-                            'profile_fetching': True
-                        }
-                
-                print(f"✅ REAL Twitter profile data received: {user_data.get('handle')} ({user_data.get('followers')} followers)")
-                
-                # Get or create persistent wallet for authenticated user
-                try:
-                    user_id = user_data.get('id', temp_user_id)
-                    
-                    # Use the persistent wallet system
-                    persistent_wallet = get_or_create_nodejs_wallet(user_id)
-                    
-                    # Convert to the format expected by this code
-                    wallet_data = {
-                        'address': persistent_wallet['address'],
-                        'private_key': persistent_wallet['private_key'],
-                        'success': True
-                    }
-                
-                    authenticated_session = {
-                        'user_id': user_data.get('id', temp_user_id),
-                        'access_token': access_token,
-                        'authenticated': True,
-                        'needs_profile_update': False,
-                        'handle': user_data['handle'],
-                        'name': user_data['name'],
-                        'avatar': user_data.get('avatar', ''),
-                        'followers': user_data.get('followers', 0),
-                        'following': user_data.get('following', 0),
-                        'tweets': user_data.get('tweets', 0),
-                        'verified': user_data.get('verified', False),
-                        'description': user_data.get('description', ''),
-                        'wallet': {
-                            'address': wallet_data['address'],
-                            'private_key': wallet_data['private_key'],
-                            'hype_balance': '0'
-                        }
-                    }
-                    
-                    # Store session with real profile data
-                    session_key = f"session_{user_data.get('id', temp_user_id)}"
-                    
-                    # ✅ ENSURE REAL PROFILE DATA IS STORED
-                    authenticated_session.update({
-                        'name': user_data.get('name'),
-                        'handle': user_data.get('handle'), 
-                        'username': user_data.get('username'),
-                        'followers': user_data.get('followers'),
-                        'following': user_data.get('following'),
-                        'tweets': user_data.get('tweets'),
-                        'verified': user_data.get('verified'),
-                        'description': user_data.get('description'),
-                        'avatar': user_data.get('avatar')
-                    })
-                    print(f"💾 STORING REAL PROFILE: {user_data.get('handle')} ({user_data.get('followers')} followers)")
-                    
-                    USER_WALLETS[session_key] = authenticated_session
-                    
-                    # Save to disk
-                    import pickle
-                    try:
-                        with open('user_wallets.pkl', 'rb') as f:
-                            wallets = pickle.load(f)
-                    except:
-                        wallets = {}
-                    
-                    wallets[session_key] = authenticated_session
-                    
-                    # ✅ ALSO STORE UNDER USER_ID FOR DIRECT ACCESS
-                    user_id_key = user_data.get('id', temp_user_id)
-                    wallets[user_id_key] = {
-                        'address': wallet_data['address'],
-                        'private_key': wallet_data['private_key'],
-                        'name': user_data.get('name'),
-                        'handle': user_data.get('handle'), 
-                        'username': user_data.get('username'),
-                        'followers': user_data.get('followers'),
-                        'following': user_data.get('following'),
-                        'tweets': user_data.get('tweets'),
-                        'verified': user_data.get('verified'),
-                        'description': user_data.get('description'),
-                        'avatar': user_data.get('avatar')
-                    }
-                    print(f"💾 DOUBLE-STORED: Session + User ID with profile data")
-                    
-                    with open('user_wallets.pkl', 'wb') as f:
-                        pickle.dump(wallets, f)
-                    
-                    print(f"✅ REAL authenticated session stored: {authenticated_session['handle']} ({authenticated_session['followers']} followers)")
-                    
-                    # Check for referral tracking
-                    cookie_header = self.headers.get('Cookie', '')
-                    if 'referral_source=' in cookie_header:
-                        referrer_username = cookie_header.split('referral_source=')[1].split(';')[0]
-                        print(f"🎯 REFERRAL DETECTED! New user {user_id} came from referrer: {referrer_username}")
-                        self.track_referral_signup(referrer_username, user_id)
-                    
-                    # Direct redirect back to main page with success
-                    self.send_response(302)
-                    self.send_header('Location', f'/?twitter_auth=success&user_id={user_id}&handle={user_data.get("handle", "user")}')
-                    # CRITICAL: Set the session cookie for authentication
-                    self.send_header('Set-Cookie', f'user_session={user_id}; Max-Age=86400; Path=/')  # 24 hours
-                    self.end_headers()
-                    return
-                    
-                except Exception as wallet_error:
-                    print(f"❌ Wallet generation failed: {wallet_error}")
-                    print(f"❌ Full error details: {type(wallet_error).__name__}: {wallet_error}")
-                    # NO FALLBACK - Fail completely without real wallet
-                    self.send_response(500)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    
-                    error_html = """
-                    <!DOCTYPE html>
-                    <html>
-                    <body>
-                        <h2>Wallet Generation Failed</h2>
-                        <p>Unable to generate crypto wallet. Please try again.</p>
-                        <a href="/">← Back to SocialX</a>
-                    </body>
-                    </html>
-                    """
-                    self.wfile.write(error_html.encode('utf-8'))
-                    return
-                
-                print(f"✅ REAL Twitter profile data received: {user_data.get('handle')} ({user_data.get('followers')} followers)")
-                
-                # Add user ID and access token to real data
-                user_data['id'] = temp_user_id
-                user_data['access_token'] = access_token
-                user_data['needs_profile_update'] = False  # Real data already loaded
-                
-                # Ensure user_data is always a dictionary
-                if not isinstance(user_data, dict):
-                    user_data = {}
-                
-                # WALLET PERSISTENCE: Get or create persistent wallet for user
-                user_id = str(user_data.get('id', ''))  # Ensure user_id is string for consistency
-                
-                # Use the persistent wallet system
-                user_wallet = get_or_create_nodejs_wallet(user_id)
-                
-                # Ensure user_data is a dictionary before assigning
-                if isinstance(user_data, dict):
-                    user_data['wallet'] = user_wallet
-                else:
-                    user_data = {'wallet': user_wallet}
-                
-                # Store user session in BOTH places for redundancy
-                USER_WALLETS[user_id] = user_wallet
-                
-                # Update user_data with real profile data if available (for Pro users)
-                if 'real_profile_data' in locals() and real_profile_data:
-                    print(f"🔄 UPDATING session data with real profile information")
-                    user_data.update({
-                        'avatar': real_profile_data['avatar'],
-                        'followers': real_profile_data['followers'],
-                        'description': real_profile_data['description'],
-                        'verified': real_profile_data['verified'],
-                        'following': real_profile_data['following'],
-                        'tweets': real_profile_data['tweets'],
-                        'real_data_updated': True
-                    })
-                    print(f"✅ SESSION UPDATED with real data: {real_profile_data['followers']} followers, avatar: {real_profile_data['avatar'][:50]}...")
-                
-                # Store user data in session for retrieval by main page
-                USER_WALLETS[f"session_{user_id}"] = user_data
-                
-                # Save to disk for persistence across server restarts
-                save_user_wallets(USER_WALLETS)
-                
-                # Check for referral tracking before redirect
-                cookie_header = self.headers.get('Cookie', '')
-                if 'referral_source=' in cookie_header:
-                    referrer_username = cookie_header.split('referral_source=')[1].split(';')[0]
-                    print(f"🎯 REFERRAL DETECTED! New user {user_id} came from referrer: {referrer_username}")
-                    self.track_referral_signup(referrer_username, user_id)
-                
-                # Redirect back to main page with success
-                self.send_response(302)
-                self.send_header('Location', f'/?twitter_auth=success&user_id={user_id}')
-                # CRITICAL: Set the session cookie for authentication
-                self.send_header('Set-Cookie', f'user_session={user_id}; Max-Age=86400; Path=/')  # 24 hours
-                self.end_headers()
-                
-            except Exception as e:
-                print(f"OAuth callback error: {e}")
-                # Redirect back to main page with error
-                self.send_response(302)
-                self.send_header('Location', f'/?twitter_auth=error&message={urllib.parse.quote(str(e))}')
-                self.end_headers()
-            return
-                
-
-        # REMOVED OLD /api/launch-account handler - now properly handled in do_POST method
-                
-        elif self.path.startswith("/api/deploy-contract"):
-            # Handle real contract deployment to HyperEVM
-            if self.command == 'POST':
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                try:
-                    request_data = json.loads(post_data.decode('utf-8'))
-                    user_id = request_data.get('user_id')
-                    account_handle = request_data.get('account_handle')
-                    
-                    print(f"🚀 Contract deployment request for {account_handle} by user {user_id}")
-                    
-                    if not user_id or not account_handle:
-                        raise ValueError("User ID and account handle required")
-                    
-                    # Check if account exists
-                    if account_handle not in trading_platform.accounts:
-                        raise ValueError("Account not found - please launch account first")
-                    
-                    account = trading_platform.accounts[account_handle]
-                    
-                    # Deploy real smart contract
-                    from hyperevm_contract_deployer import HyperEVMContractDeployer
-                    
-                    deployer = HyperEVMContractDeployer()
-                    deployment_result = deployer.deploy_token_contract(
-                        account_handle=account_handle,
-                        creator_address=request_data.get('creator_address', '0x0000000000000000000000000000000000000000'),
-                        initial_supply=account['total_supply'],
-                        creator_allocation=account['creator_tokens']
-                    )
-                    
-                    if deployment_result['success']:
-                        # Update account with real deployment info
-                        account['smart_contract'].update({
-                            'deployed': True,
-                            'real_contract': True,
-                            'token_address': deployment_result['contract_address'],
-                            'deployment_tx': deployment_result['transaction_hash'],
-                            'deployment_info': deployment_result,
-                            'deployment_time': deployment_result['deployed_at'],
-                            'deployment_cost': deployment_result.get('deployment_cost', '0.01 HYPE'),
-                            'gas_used': deployment_result.get('gas_used', 98765)
-                        })
-                        
-                        print(f"✅ Real contract deployed for {account_handle}: {deployment_result['contract_address']}")
-                        
-                        response_data = {
-                            'success': True,
-                            'message': f'Smart contract deployed successfully for @{account_handle}!',
-                            'contract_address': deployment_result['contract_address'],
-                            'transaction_hash': deployment_result['transaction_hash'],
-                            'block_explorer_url': f"https://explorer.hyperliquid.xyz/address/{deployment_result['contract_address']}",
-                            'deployment_info': deployment_result,
-                            'account_updated': account
-                        }
-                    else:
-                        response_data = {
-                            'success': False,
-                            'error': deployment_result.get('error', 'Deployment failed'),
-                            'message': 'Contract deployment failed - please try again or check your HYPE balance'
-                        }
-                    
-                    self.send_response(200 if deployment_result['success'] else 400)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                    
-                except json.JSONDecodeError as e:
-                    print(f"JSON decode error: {e}")
-                    self._send_error_response("Invalid JSON data")
-                except ValueError as e:
-                    print(f"Validation error: {e}")
-                    self._send_error_response(str(e))
-                except Exception as e:
-                    print(f"❌ Contract deployment error: {e}")
-                    self._send_error_response(f"Deployment error: {str(e)}")
-            else:
-                self._send_error_response("Method not allowed")
-            
-        elif self.path == "/api/recent-trades":
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Return real trades from deployed smart contracts only
-            trades = []
-            
-            # Collect trades from all deployed accounts
-            for handle, account_data in trading_platform.accounts.items():
-                if 'smart_contract' in account_data and account_data['smart_contract'].get('token_address'):
-                    for trade in account_data.get('recent_trades', []):
-                        # Add contract address to trade data
-                        trade_with_contract = trade.copy()
-                        trade_with_contract['contract_address'] = account_data['smart_contract']['token_address']
-                        trade_with_contract['network'] = 'HyperEVM Mainnet'
-                        trade_with_contract['account_handle'] = handle
-                        trades.append(trade_with_contract)
-            
-            # Sort by timestamp (newest first) and limit to 20
-            trades.sort(key=lambda x: x['timestamp'], reverse=True)
-            trades = trades[:20]
-            
-            self.wfile.write(json.dumps(trades).encode('utf-8'))
-            
-        elif self.path == "/api/fetch-twitter-profile":
-            # Real-time Twitter profile connection endpoint
-            if self.command == 'GET':
-                # Handle GET request for simple connection
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
-                # Start real Twitter OAuth flow with your Pro API credentials
-                import os
-                current_domain = os.getenv('REPLIT_DEV_DOMAIN')
-                if not current_domain:
-                    raise ValueError("REPLIT_DEV_DOMAIN environment variable is required")
-                
-                # Use your real Twitter OAuth implementation
-                # Twitter authentication removed - using placeholder
-                oauth_handler = twitter_oauth.TwitterOAuth()
-                
-                # Override redirect URI to match current domain
-                oauth_handler.redirect_uri = f"https://{current_domain}/callback/twitter"
-                
-                # Generate real OAuth authorization URL with your $54K/year Pro API
-                auth_url, state = oauth_handler.generate_auth_url()
-                
-                # Store OAuth state for validation
-                OAUTH_STATES[state] = True
-                
-                print(f"🔗 Real Twitter OAuth initiated with Pro API: {auth_url[:50]}...")
-                
-                response_data = {
-                    'success': True,
-                    'auth_required': True,
-                    'auth_url': auth_url,
-                    'state': state,
-                    'message': 'Real Twitter OAuth starting - using your Pro API credentials'
-                }
-                
-                self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                
-            elif self.command == 'POST':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                try:
-                    data = json.loads(post_data.decode('utf-8'))
-                    user_id = data.get('user_id')
-                    access_token = data.get('access_token')
-                    
-                    if not user_id or not access_token:
-                        self._send_error_response("Missing user_id or access_token")
-                        return
-                    
-                    print(f"🔥 FORCING profile fetch for user {user_id}")
-                    
-                    # AGGRESSIVE multi-attempt profile fetch
-                    # Twitter authentication removed - using placeholder
-                    oauth_handler = twitter_oauth.TwitterOAuth()
-                    real_user = None
-                    
-                    # Try multiple times with different strategies
-                    for attempt in range(10):
-                        print(f"🎯 Profile attempt {attempt + 1}/10")
-                        user_result = oauth_handler.get_user_info(access_token)
-                        
-                        # Ensure user_result is a dictionary
-                        if not isinstance(user_result, dict):
-                            user_result = {'success': False, 'error': 'Invalid response format'}
-                        
-                        if user_result.get('success'):
-                            real_user = user_result.get('user', {})
-                            if not isinstance(real_user, dict):
-                                real_user = {}
-                            print(f"✅ SUCCESS! Got real profile: {real_user.get('handle', 'unknown')}")
-                            break
-                        else:
-                            error_msg = user_result.get('error', 'Unknown error')
-                            print(f"❌ Attempt {attempt + 1} failed: {error_msg}")
-                            
-                            if attempt < 9:  # Don't wait on last attempt
-                                import time
-                                wait_time = min(2 + (attempt * 2), 10)  # 2, 4, 6, 8, 10 seconds max
-                                print(f"⏳ Waiting {wait_time}s before retry...")
-                                time.sleep(wait_time)
-                    
-                    if real_user and real_user.get('handle'):
-                        # Update stored user data with REAL profile
-                        if user_id in USER_WALLETS:
-                            session_key = f"session_{user_id}"
-                            if session_key in USER_WALLETS:
-                                USER_WALLETS[session_key]['handle'] = real_user.get('handle', '@unknown')
-                                USER_WALLETS[session_key]['name'] = real_user.get('name', 'Unknown User')
-                                USER_WALLETS[session_key]['avatar'] = real_user.get('avatar', '')
-                                USER_WALLETS[session_key]['followers'] = real_user.get('followers', 0)
-                                USER_WALLETS[session_key]['following'] = real_user.get('following', 0)
-                                USER_WALLETS[session_key]['tweets'] = real_user.get('tweets', 0)
-                                USER_WALLETS[session_key]['verified'] = real_user.get('verified', False)
-                                USER_WALLETS[session_key]['description'] = real_user.get('description', '')
-                                USER_WALLETS[session_key]['needs_profile_update'] = False
-                                
-                                # Save updated data
-                                import pickle
-                                with open('user_wallets.pkl', 'wb') as f:
-                                    pickle.dump(USER_WALLETS, f)
-                                
-                                print(f"✅ Profile updated: {real_user.get('handle')} ({real_user.get('followers')} followers)")
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        
-                        self.wfile.write(json.dumps({
-                            'success': True,
-                            'profile': real_user,
-                            'message': f'Real profile loaded: {real_user.get("handle")}'
-                        }).encode('utf-8'))
-                    else:
-                        # All attempts failed
-                        self.send_response(429)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        
-                        self.wfile.write(json.dumps({
-                            'success': False,
-                            'error': 'All profile fetch attempts failed',
-                            'message': 'Twitter API blocking all requests'
-                        }).encode('utf-8'))
-                        
-                except Exception as e:
-                    print(f"Profile fetch error: {e}")
-                    self._send_error_response(f"Profile fetch error: {str(e)}")
-            else:
-                self._send_error_response("Method not allowed")
-        
-        # elif self.path.startswith("/api/user-session"):
-            # DISABLED - Handle user session data requests
-            try:
-                # Parse user_id from query parameters
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(self.path)
-                params = parse_qs(parsed.query)
-                user_id = params.get('user_id', [None])[0]
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
-                if not user_id:
-                    self.wfile.write(json.dumps({
-                        'success': False,
-                        'error': 'Missing user_id parameter'
-                    }).encode('utf-8'))
-                    return
-                
-                # Look for user session data
-                session_key = f"session_{user_id}"
-                if session_key in USER_WALLETS:
-                    session_data = USER_WALLETS[session_key]
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'profile': {
-                            'handle': session_data.get('handle', '@user'),
-                            'name': session_data.get('name', 'User'),
-                            'followers': session_data.get('followers', 0),
-                            'following': session_data.get('following', 0),
-                            'tweets': session_data.get('tweets', 0),
-                            'verified': session_data.get('verified', False),
-                            'description': session_data.get('description', ''),
-                            'avatar': session_data.get('avatar', '/static/default-avatar.png')
-                        },
-                        'wallet': {
-                            'address': session_data.get('address', ''),
-                            'private_key': session_data.get('private_key', ''),
-                            'hype_balance': session_data.get('hype_balance', 0)
-                        }
-                    }).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({
-                        'success': False,
-                        'error': 'User session not found'
-                    }).encode('utf-8'))
-                    
-            except Exception as e:
-                print(f"User session fetch error: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'error': f'Session fetch error: {str(e)}'
-                }).encode('utf-8'))
-        
-        elif self.path.startswith("/api/wallet-balance"):
-            # Handle wallet balance requests  
-            if self.command == 'POST':
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                try:
-                    data = json.loads(post_data.decode('utf-8'))
-                    address = data.get('address')
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    # Get real HYPE balance from HyperEVM blockchain
-                    from hyperevm_balance import get_real_hype_balance
-                    
-                    print(f"Fetching real HYPE balance for address: {address}")
-                    
-                    # Get authentic balance from blockchain
-                    from hyperevm_balance import HyperEVMBalanceChecker
-                    checker = HyperEVMBalanceChecker()
-                    balance_data = checker.get_total_hype_balance(address)
-                    
-                    if 'error' in balance_data:
-                        print(f"Blockchain balance fetch failed: {balance_data['error']}")
-                        balance = 0
-                    else:
-                        balance = balance_data['total']
-                        print(f"Real blockchain balance: {balance} HYPE")
-                        
-                        # Update stored wallet with real balance
-                        for key, wallet_data in USER_WALLETS.items():
-                            if isinstance(wallet_data, dict):
-                                if 'address' in wallet_data and wallet_data['address'] == address:
-                                    wallet_data['hype_balance'] = balance
-                                elif 'wallet' in wallet_data and isinstance(wallet_data['wallet'], dict):
-                                    if wallet_data['wallet'].get('address') == address:
-                                        wallet_data['wallet']['hype_balance'] = balance
-                    
-                    result = {
-                        'success': True,
-                        'address': address,
-                        'balance': balance,
-                        'network': 'HyperEVM Mainnet',
-                        'native_hype': balance_data.get('native_hype', 0),
-                        'whype': balance_data.get('whype', 0),
-                        'chain_id': 999
-                    }
-                    
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                    
-                except json.JSONDecodeError:
-                    self._send_error_response("Invalid JSON data")
-            else:
-                self._send_error_response("Method not allowed")
-                
-        elif self.path.startswith("/api/wallet/"):
-            # Handle wallet-related requests
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Extract twitter handle from path
-            path_parts = self.path.split('/')
-            if len(path_parts) >= 4:
-                twitter_handle = path_parts[3]
-                # Note: Wallet data now comes from user's connected wallet, not custodial system
-                wallet_data = None  # Users manage their own wallets
-                
-                if wallet_data:
-                    # Don't expose private key in API response
-                    safe_wallet = {
-                        'address': wallet_data['address'],
-                        'hype_balance': wallet_data['hype_balance'],
-                        'created_at': wallet_data['created_at'],
-                        'hyperliquid_config': get_chain_config()
-                    }
-                    self.wfile.write(json.dumps(safe_wallet).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({'error': 'Wallet not found'}).encode('utf-8'))
-            else:
-                self.wfile.write(json.dumps({'error': 'Invalid wallet request'}).encode('utf-8'))
-                
-        elif self.path == "/api/generate-wallet":
-            # Generate wallet for Twitter username
-            if self.command == 'POST':
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                try:
-                    data = json.loads(post_data.decode('utf-8'))
-                    twitter_username = data.get('twitter_username', '')
-                    
-                    if not twitter_username:
-                        self._send_error_response("Twitter username required")
-                        return
-                    
-                    # Note: Users connect their own wallets instead of generating custodial ones
-                    wallet_data = {'error': 'Please connect your own wallet instead of using custodial generation'}
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    # Return wallet data including private key for user
-                    result = {
-                        'success': True,
-                        'twitter_username': twitter_username,
-                        'address': wallet_data['address'],
-                        'private_key': wallet_data['private_key'],
-                        'hype_balance': wallet_data['hype_balance'],
-                        'network': 'HyperEVM Mainnet (Chain ID: 999)'
-                    }
-                    
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                    
-                except json.JSONDecodeError:
-                    self._send_error_response("Invalid JSON data")
-            else:
-                self._send_error_response("Method not allowed")
-                
-        elif self.path == "/api/hyperliquid-config":
-            # Return Hyperliquid configuration for wallet integration
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            config_data = {
-                'chain_config': get_chain_config(),
-                'deposit_instructions': get_deposit_instructions(),
-                'rpc_url': HYPERLIQUID_CONFIG['mainnet']['rpc_url'],
-                'native_currency': HYPERLIQUID_CONFIG['mainnet']['native_currency']
-            }
-            
-            self.wfile.write(json.dumps(config_data).encode('utf-8'))
-            
-        elif self.path.startswith("/api/user-session"):
-            # Get user session data after OAuth completion
-            try:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
-                # Parse query parameters
-                parsed_url = urllib.parse.urlparse(self.path)
-                params = urllib.parse.parse_qs(parsed_url.query)
-                user_id = params.get('user_id', [None])[0]
-                check_active = params.get('check_active', [None])[0]
-                
-                print(f"🔍 USER_SESSION API called - user_id: {user_id}, check_active: {check_active}")
-                
-                # If check_active=1, find any active session
-                if check_active == '1':
-                    print(f"🔍 Checking for active sessions...")
-                    print(f"🔍 Available USER_SESSIONS: {list(USER_SESSIONS.keys())}")
-                    
-                    if USER_SESSIONS:
-                        # Find the most recent active session
-                        latest_session = None
-                        latest_time = 0
-                        for session_id, session_data in USER_SESSIONS.items():
-                            if session_data.get('login_time', 0) > latest_time:
-                                latest_time = session_data.get('login_time', 0)
-                                latest_session = session_id
-                        
-                        if latest_session and latest_session in USER_SESSIONS:
-                            session_data = USER_SESSIONS[latest_session]
-                            print(f"🎯 Found active session: {latest_session}")
-                            
-                            # Get wallet info for this user
-                            try:
-                                wallet_info = get_or_create_nodejs_wallet(latest_session)
-                                print(f"✅ Session active: {session_data.get('twitter_username', 'User')} | Wallet: {wallet_info['address']}")
-                            except:
-                                wallet_info = {'address': 'No wallet', 'balance': '0'}
-                            
-                            # Get profile data from stored session
-                            profile_data = session_data.get('profile_data', {})
-                            profile_image = profile_data.get('avatar', '/static/default-avatar.png')
-                            display_name = session_data.get('twitter_display_name', session_data.get('twitter_username', ''))
-                            
-                            response_data = {
-                                'success': True,
-                                'session_id': latest_session,
-                                'user': {
-                                    'twitter_username': session_data.get('twitter_username', ''),
-                                    'twitter_display_name': display_name,
-                                    'twitter_user_id': latest_session,
-                                    'profile_image_url': profile_image,
-                                    'wallet_address': wallet_info['address'],
-                                    'x_pro_user': session_data.get('x_pro_user', False),
-                                    'profile_data': profile_data
-                                }
-                            }
-                            print(f"📤 Sending response: {response_data}")
-                            self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                            return
-                    
-                    print("❌ No active sessions found")
-                    response_data = {
-                        'success': False,
-                        'error': 'No active sessions found'
-                    }
-                    print(f"📤 Sending error response: {response_data}")
-                    self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                    return
-            except Exception as e:
-                print(f"❌ Error in user-session endpoint: {e}")
-                import traceback
-                traceback.print_exc()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'error': f'Server error: {str(e)}'
-                }).encode('utf-8'))
-            
-            # Original user_id lookup - check both USER_SESSIONS and USER_WALLETS
-            if user_id:
-                # First check USER_SESSIONS (where OAuth data is stored)
-                if user_id in USER_SESSIONS:
-                    session_data = USER_SESSIONS[user_id]
-                    print(f"🎯 Found user session: {user_id}")
-                    
-                    # Get wallet info for this user
-                    try:
-                        wallet_info = get_or_create_nodejs_wallet(user_id)
-                        print(f"✅ User found: {session_data.get('twitter_username', 'User')} | Wallet: {wallet_info['address']}")
-                    except Exception as e:
-                        print(f"❌ Wallet creation failed: {e}")
-                        wallet_info = {'address': 'No wallet', 'balance': '0'}
-                    
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'session_id': user_id,
-                        'user': {
-                            'twitter_username': session_data.get('twitter_username', ''),
-                            'twitter_user_id': user_id,
-                            'wallet_address': wallet_info['address'],
-                            'x_pro_user': session_data.get('x_pro_user', False)
-                        }
-                    }).encode('utf-8'))
-                    return
-                
-                # Then check USER_WALLETS (legacy)
-                elif f"session_{user_id}" in USER_WALLETS:
-                    user_data = USER_WALLETS[f"session_{user_id}"]
-                
-                # PERMISSIVE LOGIN - Allow everyone to log in and detect their X profiles
-                # Only block truly empty/invalid sessions, allow all user attempts
-                is_invalid_session = (
-                    not user_id or 
-                    user_id == '' or 
-                    user_id == 'undefined' or
-                    user_id == 'null'
-                )
-                
-                if is_invalid_session:
-                    print(f"🚫 SESSION BLOCKED: Invalid/empty session {user_id}")
-                    self.wfile.write(json.dumps({
-                        'error': 'Invalid session - Please try logging in again',
-                        'blocked': True,
-                        'reason': 'Invalid session data'
-                    }).encode('utf-8'))
-                    return
-                
-                # For any valid user attempt, allow platform access
-                print(f"✅ PERMISSIVE LOGIN: Allowing user {user_id} - profile detection will happen in background")
-                
-                # ❌ REMOVED HARDCODED FALLBACK SYSTEM - User requested removal
-                print(f"🔍 SESSION DATA (NO FALLBACK):")
-                print(f"   Username: {user_data.get('username')}")
-                print(f"   Handle: {user_data.get('handle')}")
-                print(f"   Followers: {user_data.get('followers')}")
-                print(f"   Avatar: {user_data.get('avatar', '')[:60]}...")
-                print(f"   🔍 WALLET IN SESSION: {user_data.get('address') or user_data.get('wallet_address')}")
-                
-                # NO MORE HARDCODED DATA DETECTION OR FALLBACK - Real auth only
-                
-                # Continue with valid user session processing (real users only)
-                
-                # CRITICAL FIX: Ensure each user gets their own unique wallet
-                try:
-                    # Get or create wallet specifically for this user
-                    user_wallet = get_or_create_nodejs_wallet(user_id)
-                    
-                    # Add wallet to user data
-                    user_data['wallet'] = user_wallet
-                    user_data['wallet_address'] = user_wallet['address']
-                    
-                    print(f"✅ WALLET ASSIGNED to {user_id}: {user_wallet['address']}")
-                    
-                except Exception as wallet_error:
-                    print(f"❌ Wallet assignment failed for {user_id}: {wallet_error}")
-                    # Still return user data but without wallet
-                
-                self.wfile.write(json.dumps({'success': True, 'user': user_data}).encode('utf-8'))
-            else:
-                self.wfile.write(json.dumps({'success': False, 'error': 'Session not found'}).encode('utf-8'))
-                
-        elif self.path.startswith("/api/update-profile"):
-            # Update user profile with real Twitter data when rate limits clear
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            parsed_url = urllib.parse.urlparse(self.path)
-            params = urllib.parse.parse_qs(parsed_url.query)
-            user_id = params.get('user_id', [None])[0]
-            
-            if not user_id:
-                self.wfile.write(json.dumps({'success': False, 'error': 'User ID required'}).encode('utf-8'))
-                return
-                
-            session_key = f"session_{user_id}"
-            if session_key not in USER_WALLETS:
-                self.wfile.write(json.dumps({'success': False, 'error': 'Session not found'}).encode('utf-8'))
-                return
-                
-            session_data = USER_WALLETS[session_key]
-            if not session_data.get('rate_limited'):
-                self.wfile.write(json.dumps({'success': False, 'error': 'Profile already updated'}).encode('utf-8'))
-                return
-                
-            # Attempt to fetch real profile data now
-            try:
-                access_token = session_data.get('access_token')
-                if not access_token:
-                    raise Exception("No access token available")
-                    
-                # Use proper X Pro Bearer token
-                import os
-                bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-                
-                headers = {
-                    'Authorization': f'Bearer {bearer_token}',
-                    'Content-Type': 'application/json'
-                }
-                
-                params = {
-                    'user.fields': 'id,name,username,profile_image_url,description,public_metrics,verified'
-                }
-                
-                url = f"https://api.twitter.com/2/users/me?{urllib.parse.urlencode(params)}"
-                request = urllib.request.Request(url, headers=headers)
-                
-                with urllib.request.urlopen(request, timeout=10) as response:
-                    response_data = response.read().decode('utf-8')
-                    import json as json_module
-                    user_data = json_module.loads(response_data)
-                    
-                    if 'data' in user_data:
-                        user = user_data['data']
-                        
-                        # Update session with real profile data
-                        session_data.update({
-                            'name': user['name'],
-                            'handle': f"@{user['username']}",
-                            'username': user['username'],
-                            'avatar': user.get('profile_image_url', '').replace('_normal', '_400x400'),
-                            'description': user.get('description', ''),
-                            'verified': user.get('verified', False),
-                            'followers': user.get('public_metrics', {}).get('followers_count', 0),
-                            'following': user.get('public_metrics', {}).get('following_count', 0),
-                            'tweets': user.get('public_metrics', {}).get('tweet_count', 0),
-                            'rate_limited': False,
-                            'needs_profile_update': False
-                        })
-                        
-                        # Save updated session
-                        USER_WALLETS[session_key] = session_data
-                        save_user_wallets(USER_WALLETS)
-                        
-                        print(f"✅ Profile updated with real data: {session_data['handle']}")
-                        self.wfile.write(json.dumps({
-                            'success': True, 
-                            'message': 'Profile updated with real Twitter data',
-                            'user': session_data
-                        }).encode('utf-8'))
-                        return
-                        
-            except Exception as e:
-                error_msg = str(e)
-                if "429" in error_msg or "Too Many Requests" in error_msg:
-                    self.wfile.write(json.dumps({
-                        'success': False, 
-                        'error': 'Still rate limited - try again later',
-                        'retry_after': 300
-                    }).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({
-                        'success': False, 
-                        'error': f'Profile update failed: {error_msg}'
-                    }).encode('utf-8'))
-                return
-            
-        elif self.path.startswith("/api/account/"):
-            # Get individual account data and chart
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Extract account handle from path
-            path_parts = self.path.split('/')
-            if len(path_parts) >= 4:
-                account_handle = path_parts[3]
-                
-                if account_handle in trading_platform.accounts:
-                    account_data = trading_platform.accounts[account_handle].copy()
-                    
-                    # Add chart data
-                    chart_data = []
-                    for i, entry in enumerate(account_data['price_history']):
-                        chart_data.append({
-                            'time': entry['timestamp'],
-                            'price': entry['price'],
-                            'volume': entry.get('volume', 0),
-                            'type': entry.get('type', 'trade')
-                        })
-                    
-                    account_data['chart_data'] = chart_data
-                    self.wfile.write(json.dumps(account_data).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({'error': 'Account not found'}).encode('utf-8'))
-            else:
-                self.wfile.write(json.dumps({'error': 'Invalid account request'}).encode('utf-8'))
-        
-        else:
-            self.send_error(404, "File not found")
-    
-    def _send_error_page(self, error_message):
-        """Send error page for OAuth failures"""
-        self.send_response(400)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        
-        error_page = f"""
-        <!DOCTYPE html>
-        <html>
-        <head><title>Authentication Error</title></head>
-        <body>
-            <script>
-                window.opener && window.opener.postMessage({
-                    type: 'TWITTER_AUTH_ERROR',
-                    error: '{error_message}'
-                }, '*');
-                window.close();
-            </script>
-            <h2>Authentication Error</h2>
-            <p>{error_message}</p>
-            <p>You can close this window.</p>
-        </body>
-        </html>
-        """
-        
-        self.wfile.write(error_page.encode('utf-8'))
-    
-    def _send_error_response(self, error_message):
-        """Send JSON error response"""
-        self.send_response(400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        
-        self.wfile.write(json.dumps({'error': error_message}).encode('utf-8'))
-
-    def do_POST(self):
-        """Handle POST requests"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length) if content_length > 0 else b'{}'
-        
-        if self.path == "/api/launch-token":
-            # Handle token launch POST requests
-            self.handle_launch_token(post_data)
-            return
-            
-        elif self.path == "/auth/twitter" or self.path.startswith("/auth/twitter"):
-            # REAL Twitter OAuth flow - need to update redirect URI in Twitter app
-            try:
-                import secrets
-                state = secrets.token_urlsafe(32)
-                
-                # Get current domain
-                import os
-                current_domain = os.getenv('REPLIT_DEV_DOMAIN')
-                if not current_domain:
-                    raise ValueError("REPLIT_DEV_DOMAIN environment variable is required")
-                
-                print(f"🔗 Current domain: {current_domain}")
-                print(f"⚠️ Twitter app needs this redirect URI: https://{current_domain}/callback/twitter")
-                
-                # Use Twitter OAuth with current domain
-                # Twitter authentication removed - using placeholder
-                oauth_handler = twitter_oauth.TwitterOAuth()
-                
-                # Override redirect URI to match current domain
-                oauth_handler.redirect_uri = f"https://{current_domain}/callback/twitter"
-                
-                auth_url, state = oauth_handler.generate_auth_url(state)
-                
-                # Store state for validation in both locations
-                OAUTH_STATES[state] = True
-                
-                # CRITICAL: Store the REAL session data in global OAUTH_SESSIONS for persistence
-                # Twitter authentication removed - using placeholder
-                if state in oauth_handler.sessions:
-                    twitter_oauth.OAUTH_SESSIONS[state] = oauth_handler.sessions[state]
-                    print(f"✅ Stored session {state[:10]}... with code_verifier in global storage")
-                else:
-                    print(f"❌ WARNING: No session found for state {state[:10]}...")
-                
-                print(f"🚀 Redirecting to Twitter OAuth: {auth_url}")
-                
-                self.send_response(302)
-                self.send_header('Location', auth_url)
-                self.end_headers()
-                
-            except Exception as e:
-                print(f"❌ OAuth error: {e}")
-                self.send_response(302)
-                self.send_header('Location', f'/?twitter_auth=error&message=OAuth%20setup%20failed:%20{str(e)}')
-                self.end_headers()
-                
-        elif self.path.startswith("/api/launch-account"):
-            # Handle account launch with real X data - MOVED FROM do_GET
-            try:
-                request_data = json.loads(post_data.decode('utf-8'))
-                print(f"Launch account request: {request_data}")
-                
-                # 🔍 SUPER DEBUG: Check exact request data
-                print(f"🔍 POST HANDLER DEBUG:")
-                print(f"   Request keys: {list(request_data.keys())}")
-                print(f"   Raw request: {request_data}")
-                
-                # Check if this is real authenticated user data
-                if 'user_data' in request_data:
-                    user_data = request_data['user_data']
-                    print(f"🔍 Found user_data wrapper - keys: {list(user_data.keys())}")
-                else:
-                    user_data = request_data
-                    print(f"🔍 Using direct request as user_data - keys: {list(user_data.keys())}")
-                
-                # 🔍 WALLET PRESENCE CHECK - FIXED TO CHECK NESTED WALLET OBJECT
-                wallet_addr = (user_data.get('wallet_address') or 
-                              user_data.get('address') or 
-                              user_data.get('wallet', {}).get('address'))
-                print(f"🔍 WALLET ADDRESS CHECK:")
-                print(f"   wallet_address: {user_data.get('wallet_address')}")
-                print(f"   address: {user_data.get('address')}")
-                print(f"   wallet.address: {user_data.get('wallet', {}).get('address')}")
-                print(f"   Final wallet_addr: {wallet_addr}")
-                
-                # ✅ ENSURE WALLET ADDRESS IS SET IN USER DATA FOR DEPLOYMENT
-                if wallet_addr and not user_data.get('address'):
-                    user_data['address'] = wallet_addr
-                    user_data['wallet_address'] = wallet_addr
-                    print(f"✅ WALLET ADDRESS FIXED: {wallet_addr}")
-                
-                # Validate required fields
-                required_fields = ['handle', 'name']
-                for field in required_fields:
-                    if field not in user_data:
-                        raise ValueError(f"Missing required field: {field}")
-                
-                # Add default values for missing fields
-                user_data.setdefault('avatar', '/static/default-avatar.png')
-                user_data.setdefault('followers', 0)
-                user_data.setdefault('tweets', 0)
-                user_data.setdefault('following', 0)
-                user_data.setdefault('verified', False)
-                user_data.setdefault('description', '')
-                user_data.setdefault('launched_by', user_data.get('handle', 'unknown'))
-                
-                result = trading_platform.launch_account(user_data)
-                print(f"Launch result: {result}")
-                
-                # Add deployment status to result
-                if result['success'] and 'account' in result:
-                    contract_info = result['account'].get('smart_contract', {})
-                    result['real_deployment'] = contract_info.get('real_contract', False)
-                    result['deployment_info'] = contract_info.get('deployment_info', {})
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}")
-                self._send_error_response("Invalid JSON data")
-            except ValueError as e:
-                print(f"Validation error: {e}")
-                self._send_error_response(str(e))
-            except Exception as e:
-                print(f"Launch account error: {e}")
-                self._send_error_response(f"Launch failed: {str(e)}")
-        
-        elif self.path.startswith("/api/wallet-balance"):
-            # Handle wallet balance requests  
-            try:
-                # Handle both GET and POST requests
-                if self.command == 'GET':
-                    # Get user's wallet from session
-                    address = None
-                    # Get user_id from URL params or session
-                    parsed_url = urllib.parse.urlparse(self.path)
-                    query_params = urllib.parse.parse_qs(parsed_url.query)
-                    user_id = query_params.get('user_id', [None])[0]
-                    
-                    print(f"🔍 Looking for wallet for user_id: {user_id}")
-                    print(f"📋 Available USER_WALLETS keys: {list(USER_WALLETS.keys())}")
-                    
-                    # Try multiple ways to find the user's wallet
-                    wallet_data = None
-                    if user_id:
-                        # Direct lookup
-                        if user_id in USER_WALLETS:
-                            wallet_data = USER_WALLETS[user_id]
-                            print(f"✅ Found wallet via direct lookup")
-                        # Try session_{user_id} format
-                        elif f"session_{user_id}" in USER_WALLETS:
-                            wallet_data = USER_WALLETS[f"session_{user_id}"]
-                            print(f"✅ Found wallet via session_{user_id}")
-                        # Try scanning all wallet data for matching user_id
-                        else:
-                            for key, data in USER_WALLETS.items():
-                                if isinstance(data, dict):
-                                    if data.get('user_id') == user_id or str(key).endswith(user_id):
-                                        wallet_data = data
-                                        print(f"✅ Found wallet via scan: {key}")
-                                        break
-                    
-                    if wallet_data and isinstance(wallet_data, dict):
-                        if 'address' in wallet_data:
-                            address = wallet_data['address']
-                        elif 'wallet' in wallet_data and isinstance(wallet_data['wallet'], dict):
-                            address = wallet_data['wallet'].get('address')
-                    
-                    if not address:
-                        print(f"❌ No wallet address found for user {user_id}")
-                        # Still return 200 but with empty wallet info
-                        result = {
-                            'success': True,
-                            'address': 'Not connected',
-                            'balance': '0',
-                            'usd_value': '0.00'
-                        }
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(result).encode('utf-8'))
-                        return
-                else:
-                    # POST request - get address from body
-                    data = json.loads(post_data.decode('utf-8'))
-                    address = data.get('address')
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                
-                print(f"🔍 Fetching real HYPE balance for address: {address}")
-                
-                # Get authentic balance from blockchain
-                from hyperevm_balance import HyperEVMBalanceChecker
-                checker = HyperEVMBalanceChecker()
-                balance_data = checker.get_total_hype_balance(address)
-                
-                if 'error' in balance_data:
-                    print(f"❌ Blockchain balance fetch failed: {balance_data['error']}")
-                    balance = 0
-                else:
-                    balance = balance_data['total']
-                    print(f"✅ Real blockchain balance: {balance} HYPE")
-                    
-                    # Update stored wallet with real balance
-                    for key, wallet_data in USER_WALLETS.items():
-                        if isinstance(wallet_data, dict):
-                            if 'address' in wallet_data and wallet_data['address'] == address:
-                                wallet_data['hype_balance'] = balance
-                            elif 'wallet' in wallet_data and isinstance(wallet_data['wallet'], dict):
-                                if wallet_data['wallet'].get('address') == address:
-                                    wallet_data['wallet']['hype_balance'] = balance
-                
-                result = {
-                    'success': True,
-                    'address': address,
-                    'balance': balance,
-                    'usd_value': f"{float(balance) * 0.01:.2f}",  # Rough USD estimate
-                    'network': 'HyperEVM Mainnet',
-                    'native_hype': balance_data.get('native_hype', 0),
-                    'whype': balance_data.get('whype', 0),
-                    'chain_id': 999
-                }
-                
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError:
-                self._send_error_response("Invalid JSON data")
-            except Exception as e:
-                print(f"Wallet balance error: {e}")
-                self._send_error_response(f"Balance fetch failed: {str(e)}")
-        
-        elif self.path == "/api/fetch-twitter-profile":
-            # AGGRESSIVE endpoint to force fetch real Twitter profile data
-            try:
-                data = json.loads(post_data.decode('utf-8'))
-                user_id = data.get('user_id')
-                access_token = data.get('access_token')
-                
-                if not user_id or not access_token:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({'error': 'Missing user_id or access_token'}).encode('utf-8'))
-                    return
-                
-                print(f"🔥 FORCING profile fetch for user {user_id}")
-                
-                # AGGRESSIVE multi-attempt profile fetch
-                # Twitter authentication removed - using placeholder
-                oauth_handler = twitter_oauth.TwitterOAuth()
-                real_user = None
-                
-                # Try multiple times with different strategies
-                for attempt in range(10):
-                    print(f"🎯 Profile attempt {attempt + 1}/10")
-                    user_result = oauth_handler.get_user_info(access_token)
-                    
-                    # Ensure user_result is a dictionary
-                    if not isinstance(user_result, dict):
-                        user_result = {'success': False, 'error': 'Invalid response format'}
-                    
-                    if user_result.get('success'):
-                        real_user = user_result.get('user', {})
-                        if not isinstance(real_user, dict):
-                            real_user = {}
-                        print(f"✅ SUCCESS! Got real profile: {real_user.get('handle', 'unknown')}")
-                        break
-                    else:
-                        error_msg = user_result.get('error', 'Unknown error')
-                        print(f"❌ Attempt {attempt + 1} failed: {error_msg}")
-                        
-                        if attempt < 9:  # Don't wait on last attempt
-                            import time
-                            wait_time = min(2 + (attempt * 2), 10)  # 2, 4, 6, 8, 10 seconds max
-                            print(f"⏳ Waiting {wait_time}s before retry...")
-                            time.sleep(wait_time)
-                
-                if real_user and real_user.get('handle'):
-                    # Update stored user data with REAL profile
-                    if user_id in USER_WALLETS:
-                        session_key = f"session_{user_id}"
-                        if session_key in USER_WALLETS:
-                            USER_WALLETS[session_key]['handle'] = real_user.get('handle', '@unknown')
-                            USER_WALLETS[session_key]['name'] = real_user.get('name', 'Unknown User')
-                            USER_WALLETS[session_key]['avatar'] = real_user.get('avatar', '')
-                            USER_WALLETS[session_key]['followers'] = real_user.get('followers', 0)
-                            USER_WALLETS[session_key]['following'] = real_user.get('following', 0)
-                            USER_WALLETS[session_key]['tweets'] = real_user.get('tweets', 0)
-                            USER_WALLETS[session_key]['verified'] = real_user.get('verified', False)
-                            USER_WALLETS[session_key]['description'] = real_user.get('description', '')
-                            USER_WALLETS[session_key]['needs_profile_update'] = False
-                            
-                            # Save updated data
-                            import pickle
-                            with open('user_wallets.pkl', 'wb') as f:
-                                pickle.dump(USER_WALLETS, f)
-                            
-                            print(f"✅ Profile updated: {real_user.get('handle')} ({real_user.get('followers')} followers)")
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'profile': real_user,
-                        'message': f'Real profile loaded: {real_user.get("handle")}'
-                    }).encode('utf-8'))
-                else:
-                    # All attempts failed
-                    self.send_response(429)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    self.wfile.write(json.dumps({
-                        'success': False,
-                        'error': 'All profile fetch attempts failed',
-                        'message': 'Twitter API blocking all requests'
-                    }).encode('utf-8'))
-                    
-            except Exception as e:
-                print(f"Profile fetch error: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': f'Profile fetch error: {str(e)}'}).encode('utf-8'))
-        
-        elif self.path == "/api/manual-profile-update":
-            # Manual profile update endpoint when Twitter API is blocked
-            try:
-                data = json.loads(post_data.decode('utf-8'))
-                user_id = data.get('user_id')
+                self.wfile.write(json.dumps({'error': 'Missing user_id or access_token'}).encode('utf-8'))
+                return
+            
+            print(f"🔥 FORCING profile fetch for user {user_id}")
+            
+            # AGGRESSIVE multi-attempt profile fetch
+            # Twitter authentication removed - using placeholder
+            oauth_handler = twitter_oauth.TwitterOAuth()
+            real_user = None
+            
+            # Try multiple times with different strategies
+            for attempt in range(10):
+                print(f"🎯 Profile attempt {attempt + 1}/10")
+                user_result = oauth_handler.get_user_info(access_token)
                 
-                if not user_id:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({'error': 'Missing user_id'}).encode('utf-8'))
-                    return
+                # Ensure user_result is a dictionary
+                if not isinstance(user_result, dict):
+                    user_result = {'success': False, 'error': 'Invalid response format'}
                 
-                # Update stored user data with manually entered data
-                session_key = f"session_{user_id}"
-                if session_key in USER_WALLETS:
-                    USER_WALLETS[session_key]['handle'] = data.get('handle', '@unknown')
-                    USER_WALLETS[session_key]['name'] = data.get('name', 'Unknown User')
-                    USER_WALLETS[session_key]['avatar'] = data.get('avatar', '')
-                    USER_WALLETS[session_key]['followers'] = data.get('followers', 0)
-                    USER_WALLETS[session_key]['following'] = data.get('following', 0)
-                    USER_WALLETS[session_key]['tweets'] = data.get('tweets', 0)
-                    USER_WALLETS[session_key]['verified'] = data.get('verified', False)
-                    USER_WALLETS[session_key]['description'] = data.get('description', '')
-                    USER_WALLETS[session_key]['needs_profile_update'] = False
-                    
-                    # Save updated data
-                    import pickle
-                    with open('user_wallets.pkl', 'wb') as f:
-                        pickle.dump(USER_WALLETS, f)
-                    
-                    print(f"✅ Manual profile update: {data.get('handle')} ({data.get('followers')} followers)")
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    
-                    profile_data = {
-                        'handle': data.get('handle'),
-                        'name': data.get('name'),
-                        'avatar': data.get('avatar'),
-                        'followers': data.get('followers'),
-                        'following': data.get('following'),
-                        'tweets': data.get('tweets'),
-                        'verified': data.get('verified'),
-                        'description': data.get('description')
-                    }
-                    
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'profile': profile_data,
-                        'message': f'Profile manually updated: {data.get("handle")}'
-                    }).encode('utf-8'))
+                if user_result.get('success'):
+                    real_user = user_result.get('user', {})
+                    if not isinstance(real_user, dict):
+                        real_user = {}
+                    print(f"✅ SUCCESS! Got real profile: {real_user.get('handle', 'unknown')}")
+                    break
                 else:
-                    self.send_response(404)
-                    self.send_header('Content-type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({'error': 'User session not found'}).encode('utf-8'))
-                    
-            except Exception as e:
-                print(f"Manual profile update error: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': f'Manual update error: {str(e)}'}).encode('utf-8'))
-        
-        # REMOVED DUPLICATE /api/launch-account handler - using the one with debug code at line 5704
-                
-        elif self.path == "/api/deposit":
-            try:
-                deposit_data = json.loads(post_data.decode('utf-8'))
-                twitter_handle = deposit_data.get('twitter_handle')
-                amount = deposit_data.get('amount', 0)
-                
-                if not twitter_handle or amount <= 0:
-                    self._send_error_response("Invalid deposit data")
-                    return
-                
-                # Note: Deposits now handled by user's wallet and smart contracts
-                result = {'error': 'Deposits are handled by smart contracts, not custodial system'}
+                    error_msg = user_result.get('error', 'Unknown error')
+                    print(f"❌ Attempt {attempt + 1} failed: {error_msg}")
+                    
+                    if attempt < 9:  # Don't wait on last attempt
+                        import time
+                        wait_time = min(2 + (attempt * 2), 10)  # 2, 4, 6, 8, 10 seconds max
+                        print(f"⏳ Waiting {wait_time}s before retry...")
+                        time.sleep(wait_time)
+            
+            if real_user and real_user.get('handle'):
+                # Update stored user data with REAL profile
+                if user_id in USER_WALLETS:
+                    session_key = f"session_{user_id}"
+                    if session_key in USER_WALLETS:
+                        USER_WALLETS[session_key]['handle'] = real_user.get('handle', '@unknown')
+                        USER_WALLETS[session_key]['name'] = real_user.get('name', 'Unknown User')
+                        USER_WALLETS[session_key]['avatar'] = real_user.get('avatar', '')
+                        USER_WALLETS[session_key]['followers'] = real_user.get('followers', 0)
+                        USER_WALLETS[session_key]['following'] = real_user.get('following', 0)
+                        USER_WALLETS[session_key]['tweets'] = real_user.get('tweets', 0)
+                        USER_WALLETS[session_key]['verified'] = real_user.get('verified', False)
+                        USER_WALLETS[session_key]['description'] = real_user.get('description', '')
+                        USER_WALLETS[session_key]['needs_profile_update'] = False
+                        
+                        # Profile fields were updated in place, so name the key explicitly
+                        save_user_wallets(USER_WALLETS, keys=[session_key])
+                        
+                        print(f"✅ Profile updated: {real_user.get('handle')} ({real_user.get('followers')} followers)")
                 
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError:
-                self._send_error_response("Invalid JSON data")
-                
-        elif self.path == "/api/withdraw":
-            try:
-                withdraw_data = json.loads(post_data.decode('utf-8'))
-                twitter_handle = withdraw_data.get('twitter_handle')
-                amount = withdraw_data.get('amount', 0)
-                withdrawal_address = withdraw_data.get('withdrawal_address')
-                
-                if not twitter_handle or amount <= 0 or not withdrawal_address:
-                    self._send_error_response("Invalid withdrawal data")
-                    return
-                
-                # Note: Withdrawals now handled by user's wallet and smart contracts
-                result = {'error': 'Withdrawals are handled by smart contracts, not custodial system'}
-                
-                self.send_response(200)
+                self.wfile.write(json.dumps({
+                    'success': True,
+                    'profile': real_user,
+                    'message': f'Real profile loaded: {real_user.get("handle")}'
+                }).encode('utf-8'))
+            else:
+                # All attempts failed
+                self.send_response(429)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError:
-                self._send_error_response("Invalid JSON data")
-                
-        elif self.path == "/api/buy-tokens":
-            try:
-                buy_data = json.loads(post_data.decode('utf-8'))
-                account_handle = buy_data.get('account')
-                buyer_handle = buy_data.get('buyer')
-                hype_amount = buy_data.get('amount', 0)
-                
-                if not account_handle or not buyer_handle or hype_amount <= 0:
-                    self._send_error_response("Invalid buy data")
-                    return
-                
-                result = trading_platform.buy_tokens(account_handle, buyer_handle, hype_amount)
+                self.wfile.write(json.dumps({
+                    'success': False,
+                    'error': 'All profile fetch attempts failed',
+                    'message': 'Twitter API blocking all requests'
+                }).encode('utf-8'))
                 
-                self.send_response(200)
+        except Exception as e:
+            print(f"Profile fetch error: {e}")
+            self.send_response(500)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': f'Profile fetch error: {str(e)}'}).encode('utf-8'))
+
+    def handle_manual_profile_update(self, post_data):
+        """Apply a manually submitted X profile to the user session"""
+        # Manual profile update endpoint when Twitter API is blocked
+        try:
+            data = json.loads(post_data.decode('utf-8'))
+            user_id = data.get('user_id')
+            
+            if not user_id:
+                self.send_response(400)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
+                self.wfile.write(json.dumps({'error': 'Missing user_id'}).encode('utf-8'))
+                return
+            
+            # Update stored user data with manually entered data
+            session_key = f"session_{user_id}"
+            if session_key in USER_WALLETS:
+                USER_WALLETS[session_key]['handle'] = data.get('handle', '@unknown')
+                USER_WALLETS[session_key]['name'] = data.get('name', 'Unknown User')
+                USER_WALLETS[session_key]['avatar'] = data.get('avatar', '')
+                USER_WALLETS[session_key]['followers'] = data.get('followers', 0)
+                USER_WALLETS[session_key]['following'] = data.get('following', 0)
+                USER_WALLETS[session_key]['tweets'] = data.get('tweets', 0)
+                USER_WALLETS[session_key]['verified'] = data.get('verified', False)
+                USER_WALLETS[session_key]['description'] = data.get('description', '')
+                USER_WALLETS[session_key]['needs_profile_update'] = False
                 
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError:
-                self._send_error_response("Invalid JSON data")
-                
-        elif self.path == "/api/sell-tokens":
-            try:
-                sell_data = json.loads(post_data.decode('utf-8'))
-                account_handle = sell_data.get('account')
-                seller_handle = sell_data.get('seller')
-                tokens_amount = sell_data.get('tokens', 0)
-                
-                if not account_handle or not seller_handle or tokens_amount <= 0:
-                    self._send_error_response("Invalid sell data")
-                    return
+                # Profile fields were updated in place, so name the key explicitly
+                save_user_wallets(USER_WALLETS, keys=[session_key])
                 
-                result = trading_platform.sell_tokens(account_handle, seller_handle, tokens_amount)
+                print(f"✅ Manual profile update: {data.get('handle')} ({data.get('followers')} followers)")
                 
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except json.JSONDecodeError:
-                self._send_error_response("Invalid JSON data")
-                
-        elif self.path == "/api/deploy-contract":
-            # Real contract deployment endpoint
-            try:
-                deploy_data = json.loads(post_data.decode('utf-8'))
-                account_handle = deploy_data.get('account_handle')
-                creator_address = deploy_data.get('creator_address')
-                
-                if not account_handle or not creator_address:
-                    self._send_error_response("Missing required deployment data")
-                    return
-                
-                # Real contract deployment
-                from hyperevm_contract_deployer import HyperEVMContractDeployer
-                
-                deployer = HyperEVMContractDeployer()
-                deployment_result = deployer.deploy_token_contract(
-                    account_handle=account_handle,
-                    creator_address=creator_address,
-                    initial_supply=1000000000,  # 1B tokens
-                    creator_allocation=3000000   # 3M tokens to creator
-                )
+                profile_data = {
+                    'handle': data.get('handle'),
+                    'name': data.get('name'),
+                    'avatar': data.get('avatar'),
+                    'followers': data.get('followers'),
+                    'following': data.get('following'),
+                    'tweets': data.get('tweets'),
+                    'verified': data.get('verified'),
+                    'description': data.get('description')
+                }
                 
-                self.send_response(200)
+                self.wfile.write(json.dumps({
+                    'success': True,
+                    'profile': profile_data,
+                    'message': f'Profile manually updated: {data.get("handle")}'
+                }).encode('utf-8'))
+            else:
+                self.send_response(404)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
+                self.wfile.write(json.dumps({'error': 'User session not found'}).encode('utf-8'))
                 
-                if deployment_result['success']:
-                    response_data = {
-                        'success': True,
-                        'contract_address': deployment_result['contract_address'],
-                        'transaction_hash': deployment_result.get('transaction_hash'),
-                        'message': f'Contract deployed successfully for {account_handle}'
-                    }
-                    print(f"✅ Contract deployed: {deployment_result['contract_address']}")
-                else:
-                    response_data = {
-                        'success': False,
-                        'error': deployment_result.get('error', 'Deployment failed'),
-                        'message': 'Contract deployment failed'
-                    }
-                    print(f"❌ Deployment failed: {deployment_result.get('error')}")
-                
-                self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                
-            except Exception as e:
-                print(f"Deploy endpoint error: {e}")
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
+        except Exception as e:
+            print(f"Manual profile update error: {e}")
+            self.send_response(500)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': f'Manual update error: {str(e)}'}).encode('utf-8'))
+
+    def handle_deposit(self, post_data):
+        """Handle HYPE deposit requests"""
+        try:
+            deposit_data = json.loads(post_data.decode('utf-8'))
+            twitter_handle = deposit_data.get('twitter_handle')
+            amount = deposit_data.get('amount', 0)
+            
+            if not twitter_handle or amount <= 0:
+                self._send_error_response("Invalid deposit data")
+                return
+            
+            # Note: Deposits now handled by user's wallet and smart contracts
+            result = {'error': 'Deposits are handled by smart contracts, not custodial system'}
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            self.wfile.write(json.dumps(result).encode('utf-8'))
+            
+        except json.JSONDecodeError:
+            self._send_error_response("Invalid JSON data")
+
+    def handle_withdraw(self, post_data):
+        """Handle HYPE withdrawal requests"""
+        try:
+            withdraw_data = json.loads(post_data.decode('utf-8'))
+            twitter_handle = withdraw_data.get('twitter_handle')
+            amount = withdraw_data.get('amount', 0)
+            withdrawal_address = withdraw_data.get('withdrawal_address')
+            
+            if not twitter_handle or amount <= 0 or not withdrawal_address:
+                self._send_error_response("Invalid withdrawal data")
+                return
+            
+            # Note: Withdrawals now handled by user's wallet and smart contracts
+            result = {'error': 'Withdrawals are handled by smart contracts, not custodial system'}
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            self.wfile.write(json.dumps(result).encode('utf-8'))
+            
+        except json.JSONDecodeError:
+            self._send_error_response("Invalid JSON data")
+
+    def handle_buy_tokens(self, post_data):
+        """Handle token buy requests against the bonding curve"""
+        try:
+            buy_data = json.loads(post_data.decode('utf-8'))
+            account_handle = buy_data.get('account')
+            buyer_handle = buy_data.get('buyer')
+            hype_amount = buy_data.get('amount', 0)
+            
+            if not account_handle or not buyer_handle or hype_amount <= 0:
+                self._send_error_response("Invalid buy data")
+                return
+            
+            result = trading_platform.buy_tokens(account_handle, buyer_handle, hype_amount)
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            self.wfile.write(json.dumps(result).encode('utf-8'))
+            
+        except json.JSONDecodeError:
+            self._send_error_response("Invalid JSON data")
+
+    def handle_sell_tokens(self, post_data):
+        """Handle token sell requests against the bonding curve"""
+        try:
+            sell_data = json.loads(post_data.decode('utf-8'))
+            account_handle = sell_data.get('account')
+            seller_handle = sell_data.get('seller')
+            tokens_amount = sell_data.get('tokens', 0)
+            
+            if not account_handle or not seller_handle or tokens_amount <= 0:
+                self._send_error_response("Invalid sell data")
+                return
+            
+            result = trading_platform.sell_tokens(account_handle, seller_handle, tokens_amount)
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            self.wfile.write(json.dumps(result).encode('utf-8'))
+            
+        except json.JSONDecodeError:
+            self._send_error_response("Invalid JSON data")
+
+    def handle_deploy_contract(self, post_data):
+        """Handle smart contract deployment requests"""
+        # Real contract deployment endpoint
+        try:
+            deploy_data = json.loads(post_data.decode('utf-8'))
+            account_handle = deploy_data.get('account_handle')
+            creator_address = deploy_data.get('creator_address')
+            
+            if not account_handle or not creator_address:
+                self._send_error_response("Missing required deployment data")
+                return
+            
+            # Real contract deployment
+            from hyperevm_contract_deployer import HyperEVMContractDeployer
+            
+            deployer = HyperEVMContractDeployer()
+            deployment_result = deployer.deploy_token_contract(
+                account_handle=account_handle,
+                creator_address=creator_address,
+                initial_supply=1000000000,  # 1B tokens
+                creator_allocation=3000000   # 3M tokens to creator
+            )
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            if deployment_result['success']:
+                response_data = {
+                    'success': True,
+                    'contract_address': deployment_result['contract_address'],
+                    'transaction_hash': deployment_result.get('transaction_hash'),
+                    'message': f'Contract deployed successfully for {account_handle}'
+                }
+                print(f"✅ Contract deployed: {deployment_result['contract_address']}")
+            else:
+                response_data = {
                     'success': False,
-                    'error': str(e),
-                    'message': 'Deployment endpoint error'
-                }).encode('utf-8'))
-                
-        else:
-            self.send_error(404, "Endpoint not found")
+                    'error': deployment_result.get('error', 'Deployment failed'),
+                    'message': 'Contract deployment failed'
+                }
+                print(f"❌ Deployment failed: {deployment_result.get('error')}")
             
+            self.wfile.write(json.dumps(response_data).encode('utf-8'))
+            
+        except Exception as e:
+            print(f"Deploy endpoint error: {e}")
+            self.send_response(500)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                'success': False,
+                'error': str(e),
+                'message': 'Deployment endpoint error'
+            }).encode('utf-8'))
+
     def do_HEAD(self):
         """Handle HEAD requests - required for OAuth callback validation"""
         if self.path == "/" or self.path.startswith("/callback/twitter"):
@@ -8258,9 +6742,87 @@ class SocialTradingHandler(http.server.BaseHTTPRequestHandler):
             self.send_response(404)
             self.end_headers()
 
+# Compile once at import; Router.compile rejects routes pointing at missing handlers
+SocialTradingHandler.router = Router.compile(SocialTradingHandler.ROUTES, SocialTradingHandler)
+
+import socket
+
+# Create a custom TCPServer class with proper socket reuse
+class ReusableTCPServer(socketserver.TCPServer):
+    def __init__(self, server_address, RequestHandlerClass):
+        self.allow_reuse_address = True
+        super().__init__(server_address, RequestHandlerClass)
+        
+        # Set socket options for reuse
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        
+        # Try to set SO_REUSEPORT if available (Linux/macOS)
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            print("✅ SO_REUSEPORT enabled - should resolve port conflicts")
+        except (AttributeError, OSError):
+            print("ℹ️ SO_REUSEPORT not available, using SO_REUSEADDR only")
+
+class ThreadedSocialXServer(socketserver.ThreadingMixIn, ReusableTCPServer):
+    """Thread-per-connection server - a slow RPC only stalls its own client"""
+    daemon_threads = True
+
+class PooledSocialXServer(ReusableTCPServer):
+    """Bounded worker pool server - caps concurrent handlers at max_workers"""
+    
+    def __init__(self, server_address, RequestHandlerClass, max_workers=32):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='socialx-worker',
+                                            initializer=metrics.register_worker_thread)
+        super().__init__(server_address, RequestHandlerClass)
+    
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_worker, request, client_address)
+    
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+SERVER_MODES = {
+    'single': ReusableTCPServer,
+    'threaded': ThreadedSocialXServer,
+    'pool': PooledSocialXServer,
+}
+
+def create_server(server_address, handler_class, mode=None, max_workers=None):
+    """Build the HTTP server for the requested serving mode.
+
+    mode defaults to SOCIALX_SERVER_MODE (single | threaded | pool, default threaded);
+    max_workers defaults to SOCIALX_MAX_WORKERS and only applies to pool mode.
+    """
+    mode = mode or os.environ.get('SOCIALX_SERVER_MODE', 'threaded')
+    if mode not in SERVER_MODES:
+        raise ValueError(f"Unknown server mode '{mode}', expected one of {sorted(SERVER_MODES)}")
+    
+    print(f"🧵 Server mode: {mode}")
+    if mode == 'pool':
+        workers = max_workers or int(os.environ.get('SOCIALX_MAX_WORKERS', '32'))
+        print(f"🧵 Worker pool size: {workers}")
+        return PooledSocialXServer(server_address, handler_class, max_workers=workers)
+    return SERVER_MODES[mode](server_address, handler_class)
+
 if __name__ == "__main__":
     print("📈 SocialX - Social Trading Platform")
     print("=" * 60)
+    
+    # JSON request/auth logs on stderr via a background writer (SOCIALX_LOG_LEVEL, SOCIALX_LOG_SAMPLE_RATE)
+    setup_logging()
+    
+    # Load existing wallets (opens user_wallets.db, migrating user_wallets.pkl once)
+    USER_WALLETS.load(load_user_wallets())
     print("🚀 Features:")
     print("  - Trade Twitter Accounts as Assets")
     print("  - Market Cap Based Pricing")
@@ -8269,30 +6831,38 @@ if __name__ == "__main__":
     print("  - X (Twitter) Authentication")
     print("=" * 60)
     
+    print("🧭 Registered routes:")
+    print(SocialTradingHandler.router.describe())
+    print("=" * 60)
+    
     print("🔄 Initializing server startup process...")
     
+    # Keep the SQLite trade index caught up with on-chain buy/sell/launch events
+    if WEB3_AVAILABLE:
+        try:
+            trade_indexer = TradeIndexer(web3_manager, start_block=TRADE_INDEX_START_BLOCK)
+            web3_manager.attach_indexer(trade_indexer)
+            trade_indexer.start()
+            print(f"📚 Trade indexer running from block {trade_indexer.last_indexed_block() + 1}")
+        except Exception as e:
+            print(f"⚠️ Trade indexer unavailable: {e}")
+    
+    # Persist OHLCV candles in candles.db, flushed in the background
+    trading_platform.candles = CandleAggregator(CANDLE_DB_FILE)
+    trading_platform.candles.start()
+    
+    # Pre-generate wallet keypairs so first logins don't pay for key generation
+    from nodejs_wallet_bridge import PYTHON_KEYGEN_AVAILABLE
+    if PYTHON_KEYGEN_AVAILABLE:
+        from wallet_keypool import default_pool
+        default_pool()
+        print("🔑 Wallet keypair pool warming up in the background")
+    
     # Start server with robust port handling
-    import socket
     import subprocess
     import time
     import sys
     
-    # Create a custom TCPServer class with proper socket reuse
-    class ReusableTCPServer(socketserver.TCPServer):
-        def __init__(self, server_address, RequestHandlerClass):
-            self.allow_reuse_address = True
-            super().__init__(server_address, RequestHandlerClass)
-            
-            # Set socket options for reuse
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            # Try to set SO_REUSEPORT if available (Linux/macOS)
-            try:
-                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-                print("✅ SO_REUSEPORT enabled - should resolve port conflicts")
-            except (AttributeError, OSError):
-                print("ℹ️ SO_REUSEPORT not available, using SO_REUSEADDR only")
-
     # Simplified port handling - avoid race conditions
     print("🔍 Checking port availability...")
     
@@ -8302,7 +6872,7 @@ if __name__ == "__main__":
     
     try:
         print(f"🔧 Creating server on port {PORT}...")
-        httpd = ReusableTCPServer(("0.0.0.0", PORT), SocialTradingHandler)
+        httpd = create_server(("0.0.0.0", PORT), SocialTradingHandler)
         
         # CRITICAL: Ensure server is accessible externally
         httpd.timeout = 30  # Set server timeout
@@ -8322,7 +6892,7 @@ if __name__ == "__main__":
             # Force retry on port 3000
             print(f"🔧 Force creating server on port {PORT}...")
             
-            httpd = ReusableTCPServer(("0.0.0.0", PORT), SocialTradingHandler)
+            httpd = create_server(("0.0.0.0", PORT), SocialTradingHandler)
         else:
             raise e
     
@@ -8336,9 +6906,11 @@ if __name__ == "__main__":
         import signal
         def signal_handler(signum, frame):
             print(f"\n📡 Received signal {signum}, shutting down gracefully...")
+            trading_platform.candles.stop()
             if httpd is not None:
                 httpd.shutdown()
                 httpd.server_close()
+            shutdown_logging()
             sys.exit(0)
         
         signal.signal(signal.SIGTERM, signal_handler)
@@ -8349,9 +6921,11 @@ if __name__ == "__main__":
         
     except KeyboardInterrupt:
         print("\n🛑 Server interrupted by user")
+        trading_platform.candles.stop()
         if httpd is not None:
             httpd.shutdown()
             httpd.server_close()
+        shutdown_logging()
         sys.exit(0)
     except Exception as e:
         print(f"❌ Server startup error: {e}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+In-memory static asset server for SocialTradingHandler
+Files are read once, re-read only when their mtime/size changes, and served
+with strong ETags (304), precompressed gzip/brotli variants, single byte
+ranges (206) and sendfile() for files too large to keep in memory
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+CONTENT_TYPES = {
+    '.js': 'application/javascript',
+    '.mjs': 'application/javascript',
+    '.css': 'text/css',
+    '.html': 'text/html',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.map': 'application/json',
+}
+
+COMPRESSIBLE = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def content_type_for(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def resolve_static_path(root: str, relative: str) -> Optional[str]:
+    """`relative` joined under `root`, or None if it would escape it"""
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, relative.lstrip('/')))
+    if path != root and not path.startswith(root + os.sep):
+        return None
+    return path
+
+
+class StaticAsset:
+    __slots__ = ('path', 'content_type', 'mtime', 'size', 'etag', 'body', 'gzip', 'br', 'checked')
+
+    def __init__(self, path, content_type, mtime, size, etag, body, gzip_body, br_body):
+        self.path = path
+        self.content_type = content_type
+        self.mtime = mtime
+        self.size = size
+        self.etag = etag
+        self.body = body          # None when the file is streamed from disk
+        self.gzip = gzip_body
+        self.br = br_body
+        self.checked = time.monotonic()
+
+
+class StaticAssetCache:
+    """Loads assets on first use and serves them from memory.
+
+    mtime is re-checked at most every `check_interval` seconds per asset, so
+    edits to frontend files still show up without a restart. Files larger
+    than `max_inline_bytes` are only stat'ed and fingerprinted, then streamed
+    with socket.sendfile().
+    """
+
+    def __init__(self, max_inline_bytes: int = 4 * 1024 * 1024, compress_min_bytes: int = 512,
+                 check_interval: float = 1.0):
+        self.max_inline_bytes = max_inline_bytes
+        self.compress_min_bytes = compress_min_bytes
+        self.check_interval = check_interval
+        self._assets: Dict[tuple, StaticAsset] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'loads': 0, 'not_modified': 0, 'partial': 0, 'sendfile': 0}
+
+    def _load(self, path: str, st: os.stat_result, transform: Optional[Callable[[bytes], bytes]]) -> StaticAsset:
+        content_type = content_type_for(path)
+        if st.st_size > self.max_inline_bytes and transform is None:
+            # Fingerprint from metadata only; the body stays on disk
+            etag = '"%x-%x"' % (st.st_mtime_ns, st.st_size)
+            return StaticAsset(path, content_type, st.st_mtime_ns, st.st_size, etag, None, None, None)
+
+        with open(path, 'rb') as f:
+            body = f.read()
+        if transform is not None:
+            body = transform(body)
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:20]
+        gzip_body = br_body = None
+        if len(body) >= self.compress_min_bytes and content_type.startswith(COMPRESSIBLE):
+            gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(gzip_body) >= len(body):
+                gzip_body = None
+            if BROTLI_AVAILABLE:
+                br_body = brotli.compress(body, quality=11)
+                if len(br_body) >= len(body):
+                    br_body = None
+        return StaticAsset(path, content_type, st.st_mtime_ns, st.st_size, etag, body, gzip_body, br_body)
+
+    def get(self, path: str, transform: Optional[Callable[[bytes], bytes]] = None) -> Optional[StaticAsset]:
+        """Current asset for `path`, or None if the file does not exist"""
+        key = (path, transform)
+        asset = self._assets.get(key)
+        now = time.monotonic()
+        if asset is not None and now - asset.checked < self.check_interval:
+            self.stats['hits'] += 1
+            return asset
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._assets.pop(key, None)
+            return None
+        if asset is not None and asset.mtime == st.st_mtime_ns and asset.size == st.st_size:
+            asset.checked = now
+            self.stats['hits'] += 1
+            return asset
+        asset = self._load(path, st, transform)
+        with self._lock:
+            self._assets[key] = asset
+            self.stats['loads'] += 1
+        return asset
+
+    def serve(self, handler, path: str, cache_control: str = 'no-cache',
+              extra_headers: Optional[Dict[str, str]] = None,
+              transform: Optional[Callable[[bytes], bytes]] = None) -> bool:
+        """Write the asset as the response to `handler`; False if it doesn't exist.
+
+        Honors If-None-Match, Range (single range, identity encoding) and
+        Accept-Encoding (br, then gzip). `transform` rewrites the bytes once
+        per load, e.g. to substitute configuration into an HTML page.
+        """
+        asset = self.get(path, transform)
+        if asset is None:
+            return False
+
+        headers = {'Cache-Control': cache_control, 'Accept-Ranges': 'bytes'}
+        if asset.gzip is not None or asset.br is not None:
+            headers['Vary'] = 'Accept-Encoding'
+        headers.update(extra_headers or {})
+
+        accept = handler.headers.get('Accept-Encoding', '')
+        range_header = handler.headers.get('Range')
+        encoding, body = None, asset.body
+        if range_header is None:
+            if asset.br is not None and 'br' in accept:
+                encoding, body = 'br', asset.br
+            elif asset.gzip is not None and 'gzip' in accept:
+                encoding, body = 'gzip', asset.gzip
+        # Each encoding is a distinct representation, so it gets its own strong ETag
+        etag = asset.etag if encoding is None else asset.etag[:-1] + '-' + encoding + '"'
+
+        if_none_match = handler.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+            self.stats['not_modified'] += 1
+            handler.send_response(304)
+            handler.send_header('ETag', etag)
+            for name, value in headers.items():
+                handler.send_header(name, value)
+            handler.end_headers()
+            return True
+
+        start, end, status = 0, asset.size - 1 if body is None else len(body) - 1, 200
+        if range_header is not None:
+            parsed = self._parse_range(range_header, end + 1)
+            if parsed is None:
+                handler.send_response(416)
+                handler.send_header('Content-Range', f'bytes */{end + 1}')
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return True
+            if parsed != (start, end):
+                start, end = parsed
+                status = 206
+                self.stats['partial'] += 1
+                headers['Content-Range'] = f'bytes {start}-{end}/{(asset.size if body is None else len(body))}'
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', asset.content_type)
+        handler.send_header('Content-Length', str(end - start + 1))
+        handler.send_header('ETag', etag)
+        if encoding is not None:
+            handler.send_header('Content-Encoding', encoding)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+
+        if body is not None:
+            handler.wfile.write(body if status == 200 else memoryview(body)[start:end + 1])
+        else:
+            self.stats['sendfile'] += 1
+            handler.wfile.flush()
+            with open(asset.path, 'rb') as f:
+                handler.connection.sendfile(f, start, end - start + 1)
+        return True
+
+    @staticmethod
+    def _parse_range(header: str, length: int):
+        """(start, end) for a single satisfiable 'bytes=' range, else None"""
+        match = _RANGE_RE.match(header.strip())
+        if not match or length == 0:
+            return None
+        first, last = match.groups()
+        if first == '' and last == '':
+            return None
+        if first == '':
+            suffix = int(last)
+            if suffix == 0:
+                return None
+            return max(0, length - suffix), length - 1
+        start = int(first)
+        end = length - 1 if last == '' else min(int(last), length - 1)
+        if start > end:
+            return None
+        return start, end
+
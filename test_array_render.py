@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Image-diff tests: the NumPy rendering backend against the PIL reference drawing
+"""
+
+import random
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import reference_quality_generator as generator
+from array_render import diagonal_gradient
+
+PALETTES = [
+    [(255, 140, 0), (255, 69, 0), (255, 20, 20)],
+    [(25, 25, 112), (72, 61, 139), (123, 104, 238)],
+    [(105, 105, 105), (169, 169, 169)],
+]
+
+
+def pixels(img):
+    return np.asarray(img, dtype=np.int16)
+
+
+def block_means(array, block=16):
+    height, width = array.shape[0] // block * block, array.shape[1] // block * block
+    return array[:height, :width].reshape(height // block, block, width // block, block, 3).mean(axis=(1, 3))
+
+
+@pytest.mark.parametrize('colors', PALETTES)
+def test_gradient_matches_reference_up_to_noise(colors):
+    size = (208, 160)
+    random.seed(1)
+    reference = pixels(generator.create_advanced_gradient(size, colors, backend='pil'))
+    rendered = pixels(generator.create_advanced_gradient(size, colors, backend='numpy'))
+    assert rendered.shape == reference.shape == (160, 208, 3)
+    # Both add independent +-5 grain per pixel, which averages out over 16x16 blocks
+    assert np.abs(rendered - reference).max() <= 11
+    assert np.abs(block_means(rendered) - block_means(reference)).max() < 2.0
+
+
+def test_gradient_without_noise_is_exact_ramp():
+    colors = PALETTES[0]
+    ramp = diagonal_gradient((100, 100), colors, noise=0)
+    assert tuple(ramp[0, 0]) == colors[0]
+    assert tuple(ramp[99, 99]) == colors[2]
+    # Away from 0 and 255, so clipping doesn't hide the grain
+    colors = PALETTES[1]
+    ramp = diagonal_gradient((100, 100), colors, noise=0).astype(np.int16)
+    grain = diagonal_gradient((100, 100), colors, rng=np.random.default_rng(0)).astype(np.int16) - ramp
+    assert grain.min() >= -5 and grain.max() <= 5
+    assert (grain[..., 0] == grain[..., 2]).all()
+
+
+@pytest.mark.parametrize('background', [(128, 128, 128), (20, 40, 200), (250, 120, 10)])
+def test_shading_matches_reference(background):
+    img = Image.new('RGB', (300, 300), background)
+    args = (img, (150, 140), 80, (-0.3, -0.4), (255, 228, 181))
+    reference = pixels(generator.add_realistic_shading(*args, backend='pil'))
+    rendered = pixels(generator.add_realistic_shading(*args, backend='numpy'))
+    diff = np.abs(rendered - reference)
+    assert diff.max() <= 8
+    assert diff.mean() < 1.0
+
+
+@pytest.mark.parametrize('background', [(128, 128, 128), (250, 120, 10)])
+def test_energy_rings_match_reference(background):
+    img = Image.new('RGB', (240, 240), background)
+    reference = pixels(generator.add_energy_rings(img, (120, 120), (135, 206, 235), backend='pil'))
+    rendered = pixels(generator.add_energy_rings(img, (120, 120), (135, 206, 235), backend='numpy'))
+    diff = np.abs(rendered - reference)
+    # ImageFilter.BLUR is a hollow 5x5 kernel, approximated by a Gaussian edge
+    assert diff.max() <= 16
+    assert diff.mean() < 1.0
+    assert (diff > 3).mean() < 0.05
+
+
+def test_shading_clipped_at_image_border():
+    img = Image.new('RGB', (120, 90), (90, 90, 90))
+    args = (img, (10, 5), 60, (-0.3, -0.4), (255, 228, 181))
+    diff = np.abs(pixels(generator.add_realistic_shading(*args, backend='numpy'))
+                  - pixels(generator.add_realistic_shading(*args, backend='pil')))
+    assert diff.max() <= 8
+
+
+def test_full_nft_renders_with_numpy_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator, 'RENDER_BACKEND', 'numpy')
+    character = {"name": "Naruto Uzumaki", "village": "Hidden Leaf", "jutsu": "Rasengan",
+                 "element": "Wind Release", "rarity": "Legendary"}
+    output = tmp_path / "1.png"
+    assert generator.create_reference_quality_nft(character, 1, str(output))
+    with Image.open(output) as img:
+        assert img.size == (800, 800) and img.mode == 'RGB'
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for deterministic, thread-safe trait generation
+"""
+
+import os
+import random
+import subprocess
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from authentic_trait_generator import CORE_TRAITS, AuthenticTraitGenerator
+
+
+def test_same_traits_for_a_token_every_call_and_every_process():
+    generator = AuthenticTraitGenerator()
+    traits = generator.generate_traits_for_token(912)
+    assert traits == AuthenticTraitGenerator().generate_traits_for_token(912)
+    assert [t["trait_type"] for t in traits[:len(CORE_TRAITS)]] == list(CORE_TRAITS)
+    assert 6 <= len(traits) <= 8
+
+    # Output must not depend on the interpreter's string hash seed
+    code = "from authentic_trait_generator import AuthenticTraitGenerator as G; print(G().generate_traits_for_token(912))"
+    outputs = {subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                              env={**os.environ, 'PYTHONHASHSEED': seed}).stdout for seed in ('1', '2')}
+    assert outputs == {f"{traits}\n"}
+
+
+def test_global_random_state_is_untouched():
+    random.seed(7)
+    expected = [random.random() for _ in range(3)]
+    random.seed(7)
+    generator = AuthenticTraitGenerator()
+    generator.generate_traits_for_token(1)
+    generator.generate_traits_batch(range(1, 20))
+    assert [random.random() for _ in range(3)] == expected
+
+
+def test_batch_matches_per_token_generation():
+    generator = AuthenticTraitGenerator()
+    token_ids = [5555, 1, 42, 42, 300]
+    assert generator.generate_traits_batch(token_ids) == [generator.generate_traits_for_token(t) for t in token_ids]
+
+
+def test_concurrent_generation_is_consistent():
+    generator = AuthenticTraitGenerator()
+    expected = generator.generate_traits_batch(range(1, 401))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        singles = list(pool.map(generator.generate_traits_for_token, range(1, 401)))
+        batches = list(pool.map(lambda start: generator.generate_traits_batch(range(start, start + 100)),
+                                range(1, 401, 100)))
+    assert singles == expected
+    assert [traits for batch in batches for traits in batch] == expected
+
+
+def test_values_follow_rarity_weights():
+    generator = AuthenticTraitGenerator()
+    mouths = Counter(t["value"] for traits in generator.generate_traits_batch(range(1, 3001))
+                     for t in traits if t["trait_type"] == "Mouth")
+    # Weights are 100 - percentage: Smoker 71.43, The Classic 56.92, WTF 95.54
+    total = 71.43 + 56.92 + 95.54
+    for value, weight in (("Smoker", 71.43), ("The Classic", 56.92), ("WTF", 95.54)):
+        assert abs(mouths[value] / 3000 - weight / total) < 0.03
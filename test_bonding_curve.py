@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Property tests for the closed-form bonding curve in bonding_curve.py
+Checks the arithmetic-series formulas against the original per-share loops
+"""
+
+import random
+
+import pytest
+
+import bonding_curve
+
+
+def loop_buy_cost_wei(current_supply, shares):
+    return sum(bonding_curve.price_at_wei(current_supply + i) for i in range(shares))
+
+
+def loop_sell_proceeds_wei(current_supply, shares):
+    return sum(bonding_curve.price_at_wei(current_supply - i - 1) for i in range(shares))
+
+
+def loop_average_price(current_supply, shares, side):
+    """The float loop SocialTradingPlatform used before the closed form"""
+    base_price = 0.01
+    curve_multiplier = 0.000001
+    total = 0
+    for i in range(shares):
+        supply = current_supply + i if side == 'BUY' else current_supply - i - 1
+        total += base_price + supply * curve_multiplier
+    return total / shares if shares > 0 else 0
+
+
+def random_cases(count=300, seed=999):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randint(0, 10 ** 9), rng.choice([0, 1, 2, rng.randint(3, 2000)])
+
+
+def test_buy_cost_matches_loop_exactly():
+    for supply, shares in random_cases():
+        assert bonding_curve.buy_cost_wei(supply, shares) == loop_buy_cost_wei(supply, shares)
+
+
+def test_sell_proceeds_match_loop_exactly():
+    for supply, shares in random_cases():
+        assert bonding_curve.sell_proceeds_wei(supply, shares) == loop_sell_proceeds_wei(supply, shares)
+
+
+def test_average_prices_match_float_loop():
+    for supply, shares in random_cases(count=100):
+        for side, closed_form in (('BUY', bonding_curve.average_buy_price),
+                                  ('SELL', bonding_curve.average_sell_price)):
+            expected = loop_average_price(supply, shares, side)
+            assert abs(closed_form(supply, shares) - expected) <= 1e-9 * max(1.0, abs(expected))
+
+
+def test_buy_then_sell_round_trips():
+    # Selling back the shares just bought walks the same rungs of the curve
+    for supply, shares in random_cases():
+        assert bonding_curve.buy_cost_wei(supply, shares) == bonding_curve.sell_proceeds_wei(supply + shares, shares)
+
+
+def test_buys_are_additive():
+    for supply, shares in random_cases():
+        split = shares // 3
+        assert (bonding_curve.buy_cost_wei(supply, shares) ==
+                bonding_curve.buy_cost_wei(supply, split) + bonding_curve.buy_cost_wei(supply + split, shares - split))
+
+
+def test_quote_ladder_matches_single_quotes():
+    supply = 123456
+    sizes = [1, 10, 100, 1000, 10 ** 6]
+    ladder = bonding_curve.quote_ladder(supply, sizes, 'BUY')
+    assert [rung['shares'] for rung in ladder] == sizes
+    for rung in ladder:
+        assert rung['total'] == bonding_curve.buy_cost_wei(supply, rung['shares']) / bonding_curve.WEI
+        assert rung['avg_price'] == bonding_curve.average_buy_price(supply, rung['shares'])
+    impacts = [rung['price_impact_percent'] for rung in ladder]
+    assert impacts == sorted(impacts)
+
+
+def test_quote_ladder_sells_down_to_zero_supply():
+    ladder = bonding_curve.quote_ladder(1000, [1, 1000], 'SELL')
+    assert ladder[-1]['total'] == bonding_curve.sell_proceeds_wei(1000, 1000) / bonding_curve.WEI
+    assert ladder[-1]['new_price'] == bonding_curve.price_at_wei(0) / bonding_curve.WEI
+
+
+def test_quote_ladder_rejects_unquotable_requests():
+    cases = [
+        ('HOLD', [1], 'type must be one of BUY, SELL'),
+        ('buy', [1], 'type must be one of BUY, SELL'),
+        ('BUY', [10, 0], 'sizes must be positive'),
+        ('SELL', [-5], 'sizes must be positive'),
+        ('SELL', [10, 1001], 'cannot sell more than the current supply of 1000'),
+        ('BUY', [1] * (bonding_curve.MAX_LADDER_RUNGS + 1), 'at most 50 sizes per ladder'),
+    ]
+    for trade_type, sizes, message in cases:
+        with pytest.raises(ValueError, match=message):
+            bonding_curve.quote_ladder(1000, sizes, trade_type)
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_')]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"All {len(tests)} bonding curve property tests passed")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental OHLCV candles, checked against a brute-force bucketing
+"""
+
+import random
+import sqlite3
+import threading
+
+import pytest
+
+from candle_aggregator import INTERVALS, CandleAggregator
+
+T0 = 1_700_000_000 - 1_700_000_000 % 86400
+
+
+def brute_force(trades, seconds):
+    """bucket start -> OHLCV over every trade, open/close by timestamp"""
+    buckets = {}
+    for ts, price, volume in sorted(trades, key=lambda trade: trade[0]):
+        start = int(ts) - int(ts) % seconds
+        candle = buckets.get(start)
+        if candle is None:
+            buckets[start] = {'time': start, 'open': price, 'high': price, 'low': price,
+                              'close': price, 'volume': volume, 'trades': 1}
+        else:
+            candle['high'] = max(candle['high'], price)
+            candle['low'] = min(candle['low'], price)
+            candle['close'] = price
+            candle['volume'] += volume
+            candle['trades'] += 1
+    return [buckets[start] for start in sorted(buckets)]
+
+
+def random_trades(rng, count, span):
+    return [(T0 + rng.uniform(0, span), rng.uniform(0.001, 0.1), rng.uniform(0.1, 10)) for _ in range(count)]
+
+
+def test_in_order_trades_match_brute_force():
+    rng = random.Random(3)
+    trades = sorted(random_trades(rng, 3000, 2 * 86400), key=lambda trade: trade[0])
+    aggregator = CandleAggregator(db_path=None)
+    for ts, price, volume in trades:
+        aggregator.add_trade('alice', price, volume, ts=ts)
+
+    for interval, (seconds, keep) in INTERVALS.items():
+        got = aggregator.candles('alice', interval, limit=keep)
+        expected = brute_force(trades, seconds)[-keep:]
+        assert len(got) == len(expected)
+        for candle, want in zip(got, expected):
+            assert candle == pytest.approx(want)
+
+
+def test_out_of_order_trades_land_in_their_own_buckets():
+    rng = random.Random(5)
+    trades = random_trades(rng, 2000, 6 * 3600)
+    # Mostly in order with a few stragglers arriving up to two hours late
+    trades.sort(key=lambda trade: trade[0] + (rng.uniform(0, 7200) if rng.random() < 0.2 else 0))
+    aggregator = CandleAggregator(db_path=None)
+    for ts, price, volume in trades:
+        aggregator.add_trade('alice', price, volume, ts=ts)
+
+    for interval in ('1m', '5m', '1h'):
+        seconds = INTERVALS[interval][0]
+        got = aggregator.candles('alice', interval, limit=10_000)
+        expected = brute_force(trades, seconds)
+        assert [candle['time'] for candle in got] == [want['time'] for want in expected]
+        for candle, want in zip(got, expected):
+            assert candle == pytest.approx(want)
+
+
+def test_open_and_close_follow_trade_time_not_arrival():
+    aggregator = CandleAggregator(db_path=None)
+    aggregator.add_trade('alice', 1.0, 1, ts=T0 + 10)
+    aggregator.add_trade('alice', 2.0, 1, ts=T0 + 70)
+    aggregator.add_trade('alice', 5.0, 3, ts=T0 + 20)   # back in the first minute
+    aggregator.add_trade('alice', 0.5, 1, ts=T0 + 5)    # earlier than the first minute's open
+
+    first, second = aggregator.candles('alice', '1m')
+    assert first == {'time': T0, 'open': 0.5, 'high': 5.0, 'low': 0.5, 'close': 5.0, 'volume': 5, 'trades': 3}
+    assert second['close'] == 2.0
+    hour, = aggregator.candles('alice', '1h')
+    assert (hour['open'], hour['close'], hour['high'], hour['trades']) == (0.5, 2.0, 5.0, 4)
+
+
+def test_late_trade_into_an_empty_bucket_opens_it_in_place():
+    aggregator = CandleAggregator(db_path=None)
+    aggregator.add_trade('alice', 1.0, 1, ts=T0)
+    aggregator.add_trade('alice', 3.0, 1, ts=T0 + 600)
+    aggregator.add_trade('alice', 2.0, 1, ts=T0 + 300)
+
+    assert [(c['time'], c['open']) for c in aggregator.candles('alice', '1m')] == [
+        (T0, 1.0), (T0 + 300, 2.0), (T0 + 600, 3.0)]
+
+
+def test_candles_survive_a_restart(tmp_path):
+    db_path = str(tmp_path / 'candles.db')
+    aggregator = CandleAggregator(db_path)
+    aggregator.add_trade('alice', 1.0, 2, ts=T0 + 5)
+    aggregator.add_trade('alice', 1.5, 1, ts=T0 + 3700)
+    aggregator.add_trade('alice', 0.5, 1, ts=T0 + 30)
+    # Two buckets in each of 1m/5m/1h, one day
+    assert aggregator.flush() == 7
+    assert aggregator.flush() == 0
+
+    reopened = CandleAggregator(db_path)
+    for interval in INTERVALS:
+        assert reopened.candles('alice', interval) == aggregator.candles('alice', interval)
+
+
+def test_background_flush_failures_are_logged(tmp_path, monkeypatch, caplog):
+    aggregator = CandleAggregator(str(tmp_path / 'candles.db'))
+    failed = threading.Event()
+
+    def failing_flush():
+        failed.set()
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(aggregator, 'flush', failing_flush)
+    aggregator.start(interval=0.01)
+    assert failed.wait(5)
+    aggregator._stop.set()
+    aggregator._thread.join(5)
+
+    record = next(record for record in caplog.records if record.getMessage() == 'Candle flush failed')
+    assert record.levelname == 'ERROR' and 'database is locked' in str(record.exc_info[1])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the versioned NFT collection snapshot
+"""
+
+import contextlib
+import hashlib
+import io
+import pickle
+
+import pytest
+
+from bulk_nft_fetcher import BulkNFTFetcher
+import rarity_engine
+from collection_snapshot import HEADER_SIZE, MAGIC, CollectionSnapshot, generator_hash
+
+
+@pytest.fixture(scope="module")
+def generated():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BulkNFTFetcher().generate_all_nft_data()
+
+
+def test_load_collection_writes_then_reads_identical_records(tmp_path, generated):
+    path = tmp_path / "collection.snapshot"
+    fetcher = BulkNFTFetcher(snapshot_path=str(path))
+    assert fetcher.load_collection() == generated
+    assert path.exists()
+    written = path.stat().st_mtime_ns
+    assert fetcher.load_collection() == generated
+    assert path.stat().st_mtime_ns == written
+
+
+def test_generation_leaves_global_random_alone():
+    import random
+    random.seed(99)
+    expected = random.random()
+    random.seed(99)
+    BulkNFTFetcher()._generate_rows()
+    assert random.random() == expected
+
+
+def test_stale_or_corrupt_snapshots_are_rejected(tmp_path):
+    path = tmp_path / "collection.snapshot"
+    snapshot = CollectionSnapshot(str(path))
+    rows = [(2, "img-b", [{"trait_type": "Eyes", "value": "Teal", "rarity": "3.0%"}], 40, "70.00"),
+            (1, "img-a", [], 10, "61.80")]
+    current = generator_hash(BulkNFTFetcher._generate_rows)
+    snapshot.write(rows, current)
+    assert snapshot.load(current) == sorted(rows)
+
+    # A different generator source means a different hash
+    assert snapshot.load(generator_hash(BulkNFTFetcher.get_nft_image_patterns)) is None
+
+    data = bytearray(path.read_bytes())
+    data[HEADER_SIZE + 5] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert snapshot.load(current) is None
+    assert CollectionSnapshot(str(tmp_path / "missing")).load(current) is None
+
+
+def test_rarity_engine_source_is_part_of_the_version():
+    without_engine = generator_hash(BulkNFTFetcher.get_nft_image_patterns, BulkNFTFetcher._generate_rows)
+    with_engine = generator_hash(BulkNFTFetcher.get_nft_image_patterns, BulkNFTFetcher._generate_rows,
+                                 rarity_engine)
+    assert with_engine != without_engine
+
+
+PLANTED = []
+
+
+class Planted:
+    def __reduce__(self):
+        return (PLANTED.append, ('ran',))
+
+
+def test_planted_snapshot_cannot_run_code(tmp_path):
+    path = tmp_path / "collection.snapshot"
+    current = generator_hash(BulkNFTFetcher._generate_rows)
+    # A well-formed header and digest around a pickle payload
+    payload = pickle.dumps([[1], [Planted()], [[]], [1], ["1.00"]])
+    path.write_bytes(MAGIC + current + hashlib.sha256(payload).digest() + payload)
+
+    assert CollectionSnapshot(str(path)).load(current) is None
+    assert PLANTED == []
+
+    payload = b'{"not": "columns"}'
+    path.write_bytes(MAGIC + current + hashlib.sha256(payload).digest() + payload)
+    assert CollectionSnapshot(str(path)).load(current) is None
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared pooled HTTP client and the fetchers ported onto it
+"""
+
+import gzip
+import http.server
+import json
+import threading
+
+import pytest
+
+from drip_trade_fetcher import DripTradeNFTFetcher
+from http_client import HTTPClient, metadata_urls
+
+
+class StubAPI(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    requests = []
+    peers = set()
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, payload=b'', headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        StubAPI.requests.append((self.path, dict(self.headers)))
+        StubAPI.peers.add(self.client_address)
+        if self.path == '/moved':
+            self.reply(302, headers=[('Location', '/token/7')])
+        elif self.path == '/gzip':
+            self.reply(200, gzip.compress(b'{"packed": true}'), [('Content-Encoding', 'gzip')])
+        elif self.path == '/html':
+            self.reply(200, b'<html>gateway timeout</html>')
+        elif self.path.startswith('/token/') or self.path.startswith('/nfts/'):
+            self.reply(200, json.dumps({'name': f'Hypio #{self.path.rsplit("/", 1)[-1]}'}).encode())
+        else:
+            self.reply(404, b'{"error": "not found"}')
+
+
+@pytest.fixture
+def api():
+    StubAPI.requests, StubAPI.peers = [], set()
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+
+
+def test_get_json_reuses_one_connection(api):
+    client = HTTPClient()
+    for token_id in range(20):
+        assert client.get_json(f'{api}/token/{token_id}') == {'name': f'Hypio #{token_id}'}
+    assert len(StubAPI.peers) == 1
+    assert StubAPI.requests[0][1]['User-Agent'].startswith('Mozilla/5.0')
+
+
+def test_redirects_gzip_and_failures(api):
+    client = HTTPClient()
+    response = client.get(f'{api}/moved')
+    assert response.status == 200 and response.url.endswith('/token/7')
+    assert client.get_json(f'{api}/gzip') == {'packed': True}
+    assert client.get_json(f'{api}/missing') is None
+    assert client.get_json(f'{api}/html') is None
+    assert client.get_json('http://127.0.0.1:1/unreachable', timeout=1) is None
+
+
+def test_first_json_falls_through_to_next_url(api):
+    client = HTTPClient()
+    urls = [f'{api}/missing', f'{api}/html', f'{api}/token/3', f'{api}/token/4']
+    assert client.first_json(urls) == {'name': 'Hypio #3'}
+    assert len(StubAPI.requests) == 3
+
+
+def test_metadata_urls():
+    assert metadata_urls('ipfs://QmHash/1', ('https://a/ipfs', 'https://b/ipfs')) == (
+        'https://a/ipfs/QmHash/1', 'https://b/ipfs/QmHash/1')
+    assert metadata_urls('https://example.com/1.json') == ('https://example.com/1.json',)
+    assert metadata_urls('data:application/json,{}') == ()
+
+
+def test_drip_fetcher_uses_pooled_client(api):
+    fetcher = DripTradeNFTFetcher()
+    fetcher.http = HTTPClient()
+    fetcher.api_base = api
+    assert fetcher._fetch_nft_from_drip(42) == {'name': 'Hypio #42'}
+    path, headers = StubAPI.requests[-1]
+    assert path == f'/nfts/{fetcher.contract_address}/42' and headers['Accept'] == 'application/json'
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for batched, block-pinned HyperEVM balance reads against a stub node
+"""
+
+import pytest
+
+import hyperevm_balance
+from hyperevm_balance import HyperEVMBalanceChecker, WHYPE_TOKEN
+from rpc_client import JSONRPCClient
+
+HEAD_BLOCK = 1000
+
+
+def answer(request):
+    method, params = request['method'], request['params']
+    if method == 'eth_blockNumber':
+        result = hex(HEAD_BLOCK)
+    elif method == 'eth_getBalance':
+        # 1 HYPE per unit of the address's last byte, plus block / 1000
+        result = hex(int(params[0][-2:], 16) * 10 ** 18 + int(params[1], 16) * 10 ** 15)
+    elif params[0]['to'] == WHYPE_TOKEN and params[0]['data'].endswith('ff'):
+        return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32000, 'message': 'reverted'}}
+    else:
+        result = hex(2 * 10 ** 18)
+    return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+
+@pytest.fixture
+def node(stub_node):
+    return stub_node(answer)
+
+
+@pytest.fixture
+def checker(node):
+    checker = HyperEVMBalanceChecker()
+    checker.rpc = JSONRPCClient(node.url, retries=0)
+    return checker
+
+
+def test_batch_reads_every_address_at_one_block(checker, node):
+    addresses = [f'0x{i:040x}' for i in range(1, 51)]
+    balances = checker.get_balances(addresses)
+    assert len(node.posts) == 2  # eth_blockNumber, then one batch
+    assert len(node.posts[1]) == 100
+    assert {entry['block'] for entry in balances.values()} == {HEAD_BLOCK}
+    assert balances[addresses[2]]['native_hype'] == pytest.approx(3 + 1.0)
+    assert balances[addresses[2]]['whype'] == pytest.approx(2.0)
+    assert balances[addresses[2]]['total'] == pytest.approx(6.0)
+
+
+def test_cache_and_pinned_blocks(checker, node):
+    address = '0x' + '0' * 38 + '05'
+    checker.get_balances([address])
+    checker.get_balances([address.upper().replace('0X', '0x')])
+    assert len(node.posts) == 2
+
+    pinned = checker.get_balances([address], block=500)[address]
+    assert pinned['block'] == 500 and pinned['native_hype'] == pytest.approx(5.5)
+    assert [request['params'][1] for request in node.posts[-1]] == [hex(500), hex(500)]
+
+
+def test_failed_reads_are_reported_and_not_cached(checker, node):
+    address = '0x' + '0' * 38 + 'ff'
+    entry = checker.get_balances([address])[address]
+    assert entry['whype'] == 0.0 and 'error' in entry
+    checker.get_balances([address])
+    assert len(node.posts) == 4
+
+
+def test_cache_is_bounded(checker, monkeypatch):
+    monkeypatch.setattr(hyperevm_balance, 'BALANCE_CACHE_SIZE', 10)
+    checker.get_balances([f'0x{i:040x}' for i in range(1, 31)])
+    assert len(checker._cache) == 10
+
+
+def test_hex_block_tags_pin_like_block_numbers(checker, node):
+    address = '0x' + '0' * 38 + '05'
+    pinned = checker.get_balances([address], block='0x1F4')[address]
+    assert pinned['block'] == 500 and pinned['native_hype'] == pytest.approx(5.5)
+    assert [request['params'][1] for request in node.posts[-1]] == [hex(500), hex(500)]
+    # Same snapshot as block=500, so it comes from the cache
+    assert checker.get_balances([address], block=500)[address] == pinned
+    assert len(node.posts) == 1
+
+
+@pytest.mark.parametrize('block', ['latest', '500', '0xzz', -1, 1.5])
+def test_unusable_block_tags_raise_value_error(checker, node, block):
+    with pytest.raises(ValueError, match='block must be'):
+        checker.get_balances(['0x' + '0' * 38 + '05'], block=block)
+    assert node.posts == []
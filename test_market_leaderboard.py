@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental market leaderboard, checked against a brute-force recompute
+"""
+
+import random
+
+import pytest
+
+from market_leaderboard import MarketLeaderboard, trending_score
+
+WINDOW, BUCKET = 3600, 60
+HANDLES = [f'user{i}' for i in range(15)]
+
+
+class BruteForce:
+    """Every trade kept forever; aggregates recomputed from scratch on each query"""
+
+    def __init__(self):
+        self.trades = {}
+        self.market_cap = {}
+        self.daily_change = {}
+
+    def update(self, handle, market_cap=None, daily_change=None):
+        self.trades.setdefault(handle, [])
+        self.market_cap[handle] = market_cap if market_cap is not None else self.market_cap.get(handle, 0.0)
+        self.daily_change[handle] = daily_change if daily_change is not None else self.daily_change.get(handle, 0.0)
+
+    def trade(self, handle, volume, ts, market_cap=None, daily_change=None):
+        self.update(handle, market_cap, daily_change)
+        self.trades[handle].append((ts, volume))
+
+    def remove(self, handle):
+        for table in (self.trades, self.market_cap, self.daily_change):
+            table.pop(handle, None)
+
+    def volume(self, handle, now):
+        # A trade counts while its bucket overlaps the window
+        return sum(volume for ts, volume in self.trades[handle]
+                   if int(ts) - int(ts) % BUCKET + BUCKET > now - WINDOW)
+
+    def scores(self, now):
+        return {handle: trending_score(self.volume(handle, now), self.daily_change[handle]) for handle in self.trades}
+
+
+def test_top_k_matches_brute_force_through_updates_and_removals():
+    rng = random.Random(11)
+    board, brute = MarketLeaderboard(window=WINDOW, bucket=BUCKET), BruteForce()
+    now = 1_700_000_000.0
+
+    for step in range(3000):
+        now += rng.expovariate(1 / 20)
+        handle = rng.choice(HANDLES)
+        roll = rng.random()
+        if roll < 0.7:
+            volume, change = rng.uniform(0.1, 50), rng.uniform(-50, 200)
+            board.record_trade(handle, volume, market_cap=volume * 10, daily_change=change, ts=now)
+            brute.trade(handle, volume, now, market_cap=volume * 10, daily_change=change)
+        elif roll < 0.95:
+            change = rng.uniform(-50, 200)
+            board.update_account(handle, daily_change=change)
+            brute.update(handle, daily_change=change)
+        else:
+            board.remove_account(handle)
+            brute.remove(handle)
+
+        if step % 25 == 0:
+            k = rng.randint(1, len(HANDLES))
+            top = board.top(k, now=now)
+            scores = brute.scores(now)
+            assert len(top) == len(set(top)) == min(k, len(scores))
+            assert [scores[handle] for handle in top] == pytest.approx(sorted(scores.values(), reverse=True)[:k])
+            for handle in scores:
+                assert board.volume_24h(handle) == pytest.approx(brute.volume(handle, now), abs=1e-6)
+            totals = board.totals(now=now)
+            assert totals['total_accounts'] == len(scores)
+            assert totals['total_volume_24h'] == pytest.approx(sum(brute.volume(h, now) for h in scores), abs=1e-6)
+            assert totals['total_market_cap'] == pytest.approx(sum(brute.market_cap.values()))
+
+    # Superseded entries are compacted away rather than piling up
+    assert len(board._heap) <= 2 * len(board._accounts) + 64
+
+
+def test_superseded_scores_are_skipped():
+    board = MarketLeaderboard()
+    board.record_trade('a', 100, daily_change=0, ts=1000)
+    board.record_trade('b', 50, daily_change=0, ts=1000)
+    board.update_account('a', daily_change=-90)
+
+    assert board.top(now=1000) == ['b', 'a']
+    assert board.top(1, now=1000) == ['b']
+    # top() puts back what it popped, so asking again gives the same answer
+    assert board.top(now=1000) == ['b', 'a']
+
+
+def test_removed_and_readded_handle_does_not_revive_old_entries():
+    board = MarketLeaderboard()
+    board.record_trade('a', 1000, daily_change=0, ts=1000)
+    board.record_trade('b', 10, daily_change=0, ts=1000)
+    board.remove_account('a')
+    board.record_trade('a', 1, daily_change=0, ts=1000)
+
+    assert board.top(now=1000) == ['b', 'a']
+
+
+def test_window_expiry_drops_old_volume():
+    board = MarketLeaderboard(window=WINDOW, bucket=BUCKET)
+    board.record_trade('a', 10, ts=0)
+    board.record_trade('a', 5, ts=WINDOW)
+
+    assert board.volume_24h('a') == 15
+    board.expire(WINDOW + BUCKET)
+    assert (board.volume_24h('a'), board.trades_24h('a')) == (5, 1)
+    assert board.totals(now=2 * WINDOW + BUCKET)['total_volume_24h'] == 0
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-thread metrics registry and its text exposition
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import Registry, register_worker_thread
+
+
+def test_counter_sums_across_threads():
+    registry = Registry()
+    requests = registry.counter('requests_total', 'Requests', ('route',))
+
+    def work():
+        for _ in range(1000):
+            requests.inc(('/a',))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    requests.inc(('/b',), 2)
+    assert requests.values() == {('/a',): 8000, ('/b',): 2}
+    assert 'requests_total{route="/a"} 8000' in registry.render()
+
+
+def test_histogram_exposition_is_cumulative():
+    registry = Registry()
+    latency = registry.histogram('latency_seconds', 'Latency', ('route',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value, ('/a',))
+    lines = registry.render().splitlines()
+    assert '# TYPE latency_seconds histogram' in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 4.05' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+
+
+def test_gauge_and_callbacks():
+    registry = Registry()
+    in_flight = registry.gauge('in_flight', 'In flight')
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+    registry.callback('store_size', 'Sizes', ('store',), lambda: {('wallets',): 3, ('odd"name',): 1})
+    text = registry.render()
+    assert 'in_flight 1' in text.splitlines()
+    assert 'store_size{store="wallets"} 3' in text
+    assert 'store_size{store="odd\\"name"} 1' in text
+
+
+def test_short_lived_threads_share_striped_cells():
+    registry = Registry()
+    requests = registry.counter('requests_total', 'Requests')
+    threads = [threading.Thread(target=requests.inc) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert requests.values() == {(): 50}
+    assert len(requests._cells._cells) == 0
+
+
+def test_worker_threads_get_private_cells_folded_after_exit():
+    registry = Registry()
+    requests = registry.counter('requests_total', 'Requests', ('route',))
+    latency = registry.histogram('latency_seconds', 'Latency', buckets=(1.0,))
+
+    def work():
+        for _ in range(100):
+            requests.inc(('/a',))
+            latency.observe(0.5)
+
+    with ThreadPoolExecutor(max_workers=4, initializer=register_worker_thread) as pool:
+        for _ in range(8):
+            pool.submit(work)
+    requests.inc(('/a',))
+    assert 0 < len(requests._cells._cells) <= 4
+
+    assert requests.values() == {('/a',): 801}
+    assert len(requests._cells._cells) == 0
+    assert 'latency_seconds_count 800' in registry.render().splitlines()
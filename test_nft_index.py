@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the NFT trait/text index against a brute-force scan of the same records
+"""
+
+import random
+
+import pytest
+
+from nft_index import NFTIndex
+
+TRAITS = {
+    "Background": ["Ocean Blue", "Promiseland", "Starfield"],
+    "Eyes": ["Gray", "Light-Blue", "Teal", "Void"],
+    "Hair": ["Sephi Red", "Kpop Teal", "Waker Yellow"],
+}
+
+
+def make_records(count, seed=5):
+    rng = random.Random(seed)
+    records = []
+    for token_id in rng.sample(range(1, count * 2), count):
+        traits = [{"trait_type": t, "value": rng.choice(v), "rarity": "5.0%"}
+                  for t, v in TRAITS.items() if rng.random() > 0.1]
+        records.append({"token_id": token_id, "name": f"Wealthy Hypio Baby #{token_id}", "traits": traits,
+                        "rarity_rank": rng.randint(100, 5000), "last_sale_price": f"{rng.uniform(50, 150):.2f}"})
+    return records
+
+
+def brute_force(records, query, filters):
+    query = query.lower()
+    ordered = sorted(records, key=lambda r: r["token_id"])
+    hits = [r for r in ordered
+            if query in r["name"].lower()
+            or any(query in t["trait_type"].lower() or query in t["value"].lower() for t in r["traits"])]
+    return [r for r in hits
+            if all(any(t["trait_type"].lower() == k.lower() and t["value"].lower() == v.lower() for t in r["traits"])
+                   for k, v in filters.items())]
+
+
+@pytest.fixture(scope="module")
+def records():
+    return make_records(2000)
+
+
+@pytest.mark.parametrize("query,filters", [
+    ("", {}), ("baby #1", {}), ("teal", {}), ("ea", {}), ("7", {"eyes": "TEAL"}),
+    ("blue", {"Background": "Ocean Blue", "Hair": "Kpop Teal"}), ("nothing here", {}), ("", {"Eyes": "Pink"}),
+])
+def test_query_matches_linear_scan(records, query, filters):
+    index = NFTIndex(records)
+    expected = brute_force(records, query, filters)
+    assert index.count(query, filters) == len(expected)
+    assert index.query(query, filters, limit=len(records) + 1)[0] == expected
+
+
+@pytest.mark.parametrize("sort,key", [
+    ("rarity", lambda r: (r["rarity_rank"], -float(r["last_sale_price"]), r["token_id"])),
+    ("price", lambda r: (float(r["last_sale_price"]), r["token_id"])),
+    ("-price", lambda r: (-float(r["last_sale_price"]), r["token_id"])),
+])
+@pytest.mark.parametrize("filters", [{}, {"Eyes": "Void", "Hair": "Sephi Red"}])
+def test_sorted_pages_walk_every_match_once(records, sort, key, filters):
+    index = NFTIndex(records)
+    expected = sorted(brute_force(records, "baby", filters), key=key)
+    seen, cursor = [], None
+    while True:
+        page, cursor = index.query("baby", filters, sort=sort, limit=37, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+        assert len(page) == 37
+    assert seen == expected
+
+
+def test_lookup_traits_and_errors(records):
+    index = NFTIndex(records)
+    token_id = records[10]["token_id"]
+    assert index.get(token_id) is records[10]
+    assert index.get(-1) is None
+    assert index.has_traits(token_id, {t["trait_type"]: t["value"] for t in records[10]["traits"]})
+    assert list(index.traits()) == list(TRAITS)
+    assert index.traits()["Eyes"] == sorted(TRAITS["Eyes"])
+    assert index.query(limit=0) == ([], None)
+    with pytest.raises(ValueError):
+        index.query(sort="name")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for the precompiled page shells
+"""
+
+from page_templates import FRAGMENT_SLOT, PageCache, PageTemplate, script_fragment
+
+
+def test_fragment_goes_into_the_slot():
+    template = PageTemplate(f'<html><body><p>ü</p>{FRAGMENT_SLOT}</body></html>')
+    assert template.render(b'<i>x</i>') == '<html><body><p>ü</p><i>x</i></body></html>'.encode('utf-8')
+    assert template.render() == '<html><body><p>ü</p></body></html>'.encode('utf-8')
+
+
+def test_fragment_defaults_to_before_body_close():
+    assert PageTemplate('<body>a</body>').render(b'X') == b'<body>aX</body>'
+    assert PageTemplate('plain').render(b'X') == b'plainX'
+
+
+def test_cache_builds_once_per_key():
+    cache = PageCache()
+    builds = []
+
+    def build(key):
+        builds.append(key)
+        return f'<body>{key}</body>'
+
+    for _ in range(3):
+        for key in (('markets', False), ('markets', True)):
+            cache.template(key, lambda: build(key))
+    assert builds == [('markets', False), ('markets', True)]
+    assert cache.stats == {'hits': 4, 'builds': 2}
+
+    cache.invalidate()
+    cache.template(('markets', False), lambda: build('again'))
+    assert builds[-1] == 'again'
+
+
+def test_script_fragment_cannot_close_the_script_tag():
+    fragment = script_fragment('STATE', {'username': '</script><script>alert(1)</script>'})
+    assert fragment.count(b'</script>') == 1
+    assert fragment.startswith(b'<script>window.STATE = {')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-trader position and P&L index
+"""
+
+import random
+from datetime import date, datetime
+
+import pytest
+
+from portfolio_index import PortfolioIndex
+
+
+def ts(year, month, day, hour=12):
+    return datetime(year, month, day, hour).timestamp()
+
+
+def test_average_cost_basis_across_partial_sells():
+    index = PortfolioIndex()
+    index.record_trade('alice', 'acct', 'BUY', 100, 10.0, ts(2026, 3, 1))
+    index.record_trade('alice', 'acct', 'BUY', 100, 30.0, ts(2026, 3, 1))
+    # Average cost is 0.2 HYPE per token
+    index.record_trade('alice', 'acct', 'SELL', 50, 15.0, ts(2026, 3, 2))
+    index.record_trade('alice', 'acct', 'SELL', 50, 5.0, ts(2026, 3, 2))
+
+    summary = index.summary(['alice'], lambda account: 0.3)
+    position, = summary['positions']
+    assert position['tokens'] == pytest.approx(100)
+    assert position['cost_basis'] == pytest.approx(20.0)
+    assert position['realized_pnl'] == pytest.approx((15.0 - 10.0) + (5.0 - 10.0))
+    assert position['unrealized_pnl'] == pytest.approx(100 * 0.3 - 20.0)
+    assert position['trades'] == 4
+    assert summary['total_pnl'] == pytest.approx(summary['realized_pnl'] + summary['unrealized_pnl'])
+
+
+def test_selling_more_than_held_closes_the_position():
+    index = PortfolioIndex()
+    index.record_trade('alice', 'acct', 'BUY', 10, 4.0)
+    index.record_trade('alice', 'acct', 'SELL', 25, 6.0)
+
+    position, = index.summary(['alice'], lambda account: 1.0)['positions']
+    assert (position['tokens'], position['cost_basis']) == (0.0, 0.0)
+    assert position['realized_pnl'] == pytest.approx(2.0)
+
+
+def test_identities_are_summed_and_priced_per_account():
+    index = PortfolioIndex()
+    index.record_trade('session-1', 'a', 'BUY', 10, 5.0)
+    index.record_trade('0xabc', 'a', 'BUY', 10, 7.0)
+    index.record_trade('0xabc', 'b', 'BUY', 1, 1.0)
+    index.record_trade('someone-else', 'a', 'BUY', 1000, 1.0)
+
+    summary = index.summary(['session-1', '0xabc'], {'a': 1.0, 'b': 50.0}.get)
+    assert [(p['account'], p['tokens'], p['value']) for p in summary['positions']] == [('b', 1, 50.0), ('a', 20, 20.0)]
+    assert summary['holdings_value'] == pytest.approx(70.0)
+    assert summary['unrealized_pnl'] == pytest.approx(70.0 - 13.0)
+    assert summary['trades'] == 3
+
+
+def test_daily_buckets_hold_realized_pnl_by_sell_day():
+    index = PortfolioIndex()
+    index.record_trade('alice', 'acct', 'BUY', 100, 100.0, ts(2026, 3, 1))
+    index.record_trade('alice', 'acct', 'SELL', 10, 15.0, ts(2026, 3, 1, 23))
+    index.record_trade('alice', 'acct', 'SELL', 10, 8.0, ts(2026, 3, 3, 1))
+    index.record_trade('alice', 'acct', 'SELL', 10, 14.0, ts(2026, 3, 3, 22))
+    # Outside the window
+    index.record_trade('alice', 'acct', 'SELL', 10, 20.0, ts(2026, 2, 20))
+
+    days = index.daily_realized(['alice'], days=4, today=date(2026, 3, 4))
+    assert [day['date'] for day in days] == ['2026-03-01', '2026-03-02', '2026-03-03', '2026-03-04']
+    assert [day['pnl'] for day in days] == pytest.approx([5.0, 0.0, 2.0, 0.0])
+
+
+def test_random_trades_match_a_brute_force_replay():
+    rng = random.Random(7)
+    index = PortfolioIndex()
+    trades = []
+    for _ in range(500):
+        account = rng.choice('abc')
+        side = rng.choice(['BUY', 'BUY', 'SELL'])
+        tokens = rng.uniform(1, 100)
+        hype = rng.uniform(0.1, 20)
+        index.record_trade('alice', account, side, tokens, hype, ts(2026, 3, rng.randint(1, 7)))
+        trades.append((account, side, tokens, hype))
+
+    # Replay the whole history per account, tracking average cost directly
+    expected = {}
+    for account, side, tokens, hype in trades:
+        held, cost, realized = expected.get(account, (0.0, 0.0, 0.0))
+        if side == 'BUY':
+            held, cost = held + tokens, cost + hype
+        elif held > 0:
+            sold = min(tokens, held)
+            average = cost / held
+            realized += hype - sold * average
+            held, cost = held - sold, cost - sold * average
+        else:
+            realized += hype
+        expected[account] = (held, cost, realized)
+
+    summary = index.summary(['alice'], lambda account: 0.5)
+    for position in summary['positions']:
+        held, cost, realized = expected[position['account']]
+        assert position['tokens'] == pytest.approx(held, abs=1e-9)
+        assert position['cost_basis'] == pytest.approx(cost, abs=1e-9)
+        assert position['realized_pnl'] == pytest.approx(realized)
+    daily = index.daily_realized(['alice'], days=7, today=date(2026, 3, 7))
+    assert sum(day['pnl'] for day in daily) == pytest.approx(summary['realized_pnl'])
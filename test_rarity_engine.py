@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized rarity engine against a per-token reference calculation
+"""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from rarity_engine import build_rarity_table
+
+CATEGORIES = {"Background": ["Ocean", "Starfield", "RR"], "Eyes": ["Teal", "Void"], "Hat": ["PVP", "Crown"]}
+
+
+def make_collection(count, seed=3):
+    rng = random.Random(seed)
+    return [[{"trait_type": t, "value": rng.choice(v), "rarity": "99.0%"} for t, v in CATEGORIES.items()
+             if rng.random() > 0.25] for _ in range(count)]
+
+
+def reference_scores(collection, method):
+    """Token-by-token scores with 'absent' counted as a value of its own"""
+    counts = Counter()
+    for traits in collection:
+        present = {t["trait_type"]: t["value"] for t in traits}
+        counts.update((category, present.get(category)) for category in CATEGORIES)
+    scores = []
+    for traits in collection:
+        present = {t["trait_type"]: t["value"] for t in traits}
+        frequencies = [counts[(category, present.get(category))] / len(collection) for category in CATEGORIES]
+        if method == "rarity_score":
+            scores.append(sum(1 / f for f in frequencies))
+        elif method == "statistical":
+            scores.append(math.prod(frequencies))
+        else:
+            scores.append(sum(-math.log2(f) for f in frequencies))
+    return scores
+
+
+@pytest.mark.parametrize("method", ["information", "statistical", "rarity_score"])
+def test_scores_and_ranks_match_reference(method):
+    collection = make_collection(500)
+    table = build_rarity_table(collection, range(1001, 1501), method=method)
+    expected = reference_scores(collection, method)
+    assert table.scores.tolist() == pytest.approx(expected)
+    rarer_first = sorted(expected, reverse=method != "statistical")
+    for token_id, score in zip(range(1001, 1501), expected):
+        # Competition ranking: 1 + number of strictly rarer tokens
+        strictly_rarer = sum(1 for other in rarer_first
+                             if (other < score if method == "statistical" else other > score)
+                             and not math.isclose(other, score))
+        assert table.rank(token_id) == strictly_rarer + 1
+
+
+def test_ties_share_a_rank_and_rarest_is_first():
+    common = [{"trait_type": "Eyes", "value": "Teal"}]
+    table = build_rarity_table([common, common, common, [{"trait_type": "Eyes", "value": "Void"}]])
+    assert table.ranks.tolist() == [2, 2, 2, 1]
+    assert table.frequencies[("Eyes", "Teal")] == 0.75
+    assert table.scaled_score(1) == 10.0
+
+
+def test_rank_for_traits_matches_collection_and_uses_trait_counts():
+    collection = make_collection(300)
+    table = build_rarity_table(collection)
+    for token_id in (1, 50, 299):
+        assert table.rank_for_traits(collection[token_id - 1]) == table.rank(token_id)
+    unseen = [{"trait_type": t, "value": "Never Seen"} for t in CATEGORIES]
+    assert table.rank_for_traits(unseen) == 1
+    ubiquitous = [{"trait_type": t, "value": "Everywhere", "trait_count": 300} for t in CATEGORIES]
+    # Every trait on every token scores 0 bits, behind everything rarer than that
+    assert table.rank_for_traits(ubiquitous, supply=300) == int((table.scores > 0).sum()) + 1
+
+
+def test_missing_traits_can_be_ignored():
+    collection = [[{"trait_type": "Hat", "value": "Crown"}], [], []]
+    with_missing = build_rarity_table(collection)
+    without = build_rarity_table(collection, include_missing=False)
+    assert with_missing.scores[1] > 0 and without.scores[1] == 0
+    with pytest.raises(ValueError):
+        build_rarity_table(collection, method="vibes")
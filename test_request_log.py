@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the structured JSON logging setup
+"""
+
+import io
+import json
+
+from request_log import get_logger, setup_logging, shutdown_logging
+
+
+def capture(level, sample_rate, emit):
+    stream = io.StringIO()
+    setup_logging(level, sample_rate, stream=stream)
+    try:
+        emit()
+    finally:
+        shutdown_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_json_lines_with_fields():
+    log = get_logger('request')
+    lines = capture('DEBUG', 1.0, lambda: log.debug('route', extra={'fields': {'path': '/x', 'status': 200}}))
+    assert len(lines) == 1
+    assert lines[0]['level'] == 'debug' and lines[0]['logger'] == 'socialx.request'
+    assert lines[0]['msg'] == 'route' and lines[0]['path'] == '/x' and lines[0]['status'] == 200
+
+
+def test_level_gate():
+    log = get_logger('auth')
+    lines = capture('WARNING', 1.0, lambda: (log.info('hidden'), log.warning('shown')))
+    assert [line['msg'] for line in lines] == ['shown']
+
+
+def test_sampling_never_drops_warnings():
+    log = get_logger('access')
+
+    def emit():
+        for _ in range(200):
+            log.info('request')
+        log.warning('bad request')
+
+    lines = capture('INFO', 0.0, emit)
+    assert [line['msg'] for line in lines] == ['bad request']
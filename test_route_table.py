@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled route table: exact and prefix matching, and compile-time checks
+"""
+
+import urllib.parse
+
+import pytest
+
+from route_table import PREFIX, Router
+
+ROUTES = [
+    ('GET', '/markets', 'serve_page'),
+    ('GET', '/auth/twitter', 'handle_auth_placeholder'),
+    ('GET', '/auth/twitter', 'handle_twitter_auth_get', PREFIX),
+    ('GET', '/callback/twitter', 'handle_twitter_callback', PREFIX),
+    ('GET', '/callback/twitter/start', 'handle_safari_oauth_start', PREFIX),
+    ('GET', '/static/', 'handle_static_file', PREFIX),
+    ('POST', '/auth/twitter', 'handle_twitter_auth_post', PREFIX),
+]
+
+
+class Handler:
+    def serve_page(self): pass
+    def handle_auth_placeholder(self): pass
+    def handle_twitter_auth_get(self): pass
+    def handle_twitter_callback(self): pass
+    def handle_safari_oauth_start(self): pass
+    def handle_static_file(self): pass
+    def handle_twitter_auth_post(self, post_data): pass
+
+
+@pytest.fixture
+def router():
+    return Router.compile(ROUTES, Handler)
+
+
+def handler_for(router, method, path):
+    route = router.match(method, path)
+    return route.handler if route else None
+
+
+def test_exact_match_wins_over_a_prefix_on_the_same_path(router):
+    assert handler_for(router, 'GET', '/auth/twitter') == 'handle_auth_placeholder'
+    assert handler_for(router, 'GET', '/auth/twitter/login') == 'handle_twitter_auth_get'
+    # Routes are per method
+    assert handler_for(router, 'POST', '/auth/twitter') == 'handle_twitter_auth_post'
+
+
+def test_longest_prefix_wins_regardless_of_registration_order(router):
+    assert handler_for(router, 'GET', '/callback/twitter?code=1') == 'handle_twitter_callback'
+    assert handler_for(router, 'GET', '/callback/twitter/start') == 'handle_safari_oauth_start'
+    assert handler_for(router, 'GET', '/callback/twitter/started') == 'handle_safari_oauth_start'
+    assert handler_for(router, 'GET', '/callback/twitte') is None
+
+
+def test_exact_paths_do_not_absorb_trailing_slashes_or_queries(router):
+    assert handler_for(router, 'GET', '/markets/') is None
+    assert handler_for(router, 'GET', '/markets?tab=new') is None
+    # The server matches on the parsed path, which drops the query string
+    assert handler_for(router, 'GET', urllib.parse.urlparse('/markets?tab=new').path) == 'serve_page'
+    assert handler_for(router, 'GET', '/static/') == 'handle_static_file'
+    assert handler_for(router, 'GET', '/static') is None
+
+
+def test_unknown_paths_and_methods_match_nothing(router):
+    assert handler_for(router, 'GET', '/nope') is None
+    assert handler_for(router, 'GET', '') is None
+    assert handler_for(router, 'DELETE', '/markets') is None
+    assert handler_for(router, 'POST', '/markets') is None
+
+
+def test_duplicate_routes_are_rejected():
+    with pytest.raises(ValueError, match='Duplicate route GET /markets'):
+        Router.compile(ROUTES + [('GET', '/markets', 'serve_page')])
+    with pytest.raises(ValueError, match=r'Duplicate prefix route GET /static/\*'):
+        Router.compile(ROUTES + [('GET', '/static/', 'serve_page', PREFIX)])
+
+
+def test_compile_rejects_missing_handlers_and_unknown_kinds():
+    with pytest.raises(ValueError, match='GET /typo points at missing handler serve_pgae'):
+        Router.compile(ROUTES + [('GET', '/typo', 'serve_pgae')], Handler)
+    with pytest.raises(ValueError, match="Unknown route kind 'regex'"):
+        Router.compile([('GET', '/x', 'serve_page', 'regex')])
+
+
+def test_server_route_table_compiles_against_its_handler():
+    from social_trading_platform import SocialTradingHandler
+
+    router = Router.compile(SocialTradingHandler.ROUTES, SocialTradingHandler)
+    assert len(router.routes()) == len(SocialTradingHandler.ROUTES)
+    assert handler_for(router, 'GET', '/api/price-impact') == 'handle_price_impact'
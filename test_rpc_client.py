@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared JSON-RPC client against a local stub node
+"""
+
+import threading
+import time
+
+import pytest
+
+from rpc_client import JSONRPCClient, RateLimiter, RPCError, RPCTransportError
+
+
+def answer(request):
+    if request['method'] == 'eth_fail':
+        return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32000, 'message': 'execution reverted'}}
+    return {'jsonrpc': '2.0', 'id': request['id'], 'result': [request['method'], request['params']]}
+
+
+@pytest.fixture
+def node(stub_node):
+    return stub_node(answer)
+
+
+def test_call_and_rpc_error(node):
+    client = JSONRPCClient(node.url)
+    assert client.call('eth_getBalance', ['0xabc', 'latest']) == ['eth_getBalance', ['0xabc', 'latest']]
+    with pytest.raises(RPCError) as error:
+        client.call('eth_fail')
+    assert error.value.code == -32000
+    assert len(node.posts) == 2
+
+
+def test_batch_keeps_order_and_per_call_errors(node):
+    client = JSONRPCClient(node.url)
+    results = client.batch([('eth_a', [1]), ('eth_fail', []), ('eth_b', [2])])
+    assert results[0] == ['eth_a', [1]] and results[2] == ['eth_b', [2]]
+    assert isinstance(results[1], RPCError)
+    assert len(node.posts) == 1
+
+
+def test_retries_unavailable_then_gives_up(node):
+    client = JSONRPCClient(node.url, retries=2, backoff=0.001)
+    node.fail_next = 2
+    assert client.call('eth_blockNumber') == ['eth_blockNumber', []]
+    node.fail_next = 3
+    with pytest.raises(RPCTransportError):
+        client.call('eth_blockNumber')
+
+
+def test_identical_concurrent_calls_are_coalesced(node):
+    client = JSONRPCClient(node.url)
+    node.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.call('eth_call', [{'to': '0x1'}, 'latest'])))
+               for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 10 and len(node.posts) == 1
+
+
+def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(rate=100, burst=1)
+    start = time.perf_counter()
+    for _ in range(11):
+        limiter.acquire()
+    assert time.perf_counter() - start >= 0.09
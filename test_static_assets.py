@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory static asset server
+"""
+
+import gzip
+import http.client
+import http.server
+import os
+import threading
+
+import pytest
+
+from static_assets import StaticAssetCache, resolve_static_path
+
+BODY = b'console.log("hyperflow");\n' * 200
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / 'app.js'
+    path.write_bytes(BODY)
+    cache = StaticAssetCache(check_interval=0)
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if not cache.serve(self, str(tmp_path / self.path.lstrip('/'))):
+                self.send_error(404)
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1], path, cache
+    httpd.shutdown()
+
+
+def fetch(port, path='/app.js', **headers):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+
+def test_identity_and_etag_revalidation(server):
+    port, _, _ = server
+    response, body = fetch(port)
+    assert response.status == 200 and body == BODY
+    assert response.getheader('Content-Type') == 'application/javascript'
+
+    response, body = fetch(port, **{'If-None-Match': response.getheader('ETag')})
+    assert response.status == 304 and body == b''
+
+
+def test_gzip_variant_has_its_own_etag(server):
+    port, _, _ = server
+    plain, _ = fetch(port)
+    response, body = fetch(port, **{'Accept-Encoding': 'gzip'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert gzip.decompress(body) == BODY
+    assert response.getheader('ETag') != plain.getheader('ETag')
+
+
+def test_ranges(server):
+    port, _, _ = server
+    response, body = fetch(port, Range='bytes=10-19')
+    assert response.status == 206 and body == BODY[10:20]
+    assert response.getheader('Content-Range') == f'bytes 10-19/{len(BODY)}'
+
+    response, body = fetch(port, Range='bytes=-5')
+    assert response.status == 206 and body == BODY[-5:]
+
+    response, _ = fetch(port, Range=f'bytes={len(BODY)}-')
+    assert response.status == 416
+
+
+def test_reloads_when_file_changes(server):
+    port, path, _ = server
+    fetch(port)
+    path.write_bytes(b'changed')
+    os.utime(path, ns=(0, 10**9))
+    _, body = fetch(port)
+    assert body == b'changed'
+
+
+def test_large_files_are_sent_from_disk(tmp_path):
+    (tmp_path / 'big.bin').write_bytes(os.urandom(4096))
+    cache = StaticAssetCache(max_inline_bytes=1024)
+    asset = cache.get(str(tmp_path / 'big.bin'))
+    assert asset.body is None and asset.size == 4096
+
+
+def test_missing_file_and_traversal(server, tmp_path):
+    port, _, _ = server
+    response, _ = fetch(port, '/missing.js')
+    assert response.status == 404
+    assert resolve_static_path(str(tmp_path), '../etc/passwd') is None
+    assert resolve_static_path(str(tmp_path), 'app.js') == os.path.realpath(str(tmp_path / 'app.js'))
+
+
+def test_static_route_stays_inside_static_directory(tmp_path, monkeypatch):
+    from social_trading_platform import SocialTradingHandler
+
+    (tmp_path / 'static').mkdir()
+    (tmp_path / 'static' / 'style.css').write_bytes(b'body {}')
+    (tmp_path / 'user_wallets.db').write_bytes(b'private keys')
+    monkeypatch.chdir(tmp_path)
+
+    class Handler(SocialTradingHandler):
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        port = httpd.server_address[1]
+        response, body = fetch(port, '/static/style.css')
+        assert response.status == 200 and body == b'body {}'
+        for path in ('/static/../user_wallets.db', '/static/../static/../user_wallets.db', '/static/user_wallets.db'):
+            response, body = fetch(port, path)
+            assert response.status in (403, 404) and b'private keys' not in body
+    finally:
+        httpd.shutdown()
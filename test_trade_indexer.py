@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-log trade indexer against a stubbed web3 manager
+"""
+
+import eth_abi
+import pytest
+from web3 import Web3
+
+from trade_indexer import EVENT_SIGNATURES, TradeIndexer
+
+FACTORY = '0x' + 'fa' * 20
+TOKEN = '0x' + 'a1' * 20
+CREATOR = '0x' + 'c0' * 20
+TRADER = '0x' + 'b2' * 20
+
+
+def topic(name):
+    return Web3.keccak(text=EVENT_SIGNATURES[name])
+
+
+def tx_hash(block, log_index):
+    return block.to_bytes(16, 'big') + log_index.to_bytes(16, 'big')
+
+
+def address_topic(address):
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+class StubEth:
+    def __init__(self, chain):
+        self.chain = chain
+
+    @property
+    def block_number(self):
+        return self.chain.head
+
+    def get_logs(self, params):
+        self.chain.log_queries.append(params)
+        addresses = params['address'] if isinstance(params['address'], list) else [params['address']]
+        addresses = {address.lower() for address in addresses}
+        wanted = params['topics'][0]
+        wanted = set(wanted) if isinstance(wanted, list) else {wanted}
+        return [log for log in self.chain.logs
+                if params['fromBlock'] <= log['blockNumber'] <= params['toBlock']
+                and log['address'].lower() in addresses
+                and '0x' + log['topics'][0].hex().removeprefix('0x') in wanted]
+
+    def get_block(self, number):
+        return {'timestamp': 1_700_000_000 + number}
+
+    def get_code(self, address, block):
+        self.chain.code_queries += 1
+        if self.chain.deployed_at is None:
+            raise ValueError('missing trie node')
+        return b'\x60\x80' if block >= self.chain.deployed_at else b''
+
+
+class StubW3:
+    codec = eth_abi
+
+    def __init__(self, chain):
+        self.eth = StubEth(chain)
+
+    @staticmethod
+    def keccak(text):
+        return Web3.keccak(text=text)
+
+    @staticmethod
+    def to_checksum_address(address):
+        return Web3.to_checksum_address(address)
+
+
+class StubManager:
+    def __init__(self, head=100, deployed_at=40):
+        self.head = head
+        self.deployed_at = deployed_at
+        self.logs = []
+        self.log_queries = []
+        self.code_queries = 0
+        self.w3 = StubW3(self)
+        self.contracts = {'token_factory': FACTORY}
+
+    def get_all_token_addresses(self, offset, limit):
+        return []
+
+    def add_launch(self, block, log_index=0):
+        self.logs.append({
+            'address': Web3.to_checksum_address(FACTORY),
+            'topics': [topic('launch'), address_topic(TOKEN), address_topic(CREATOR)],
+            'data': eth_abi.encode(['string', 'string', 'uint256'], ['Alice', 'ALICE', 10**9 * 10**18]),
+            'blockNumber': block,
+            'transactionHash': tx_hash(block, log_index),
+            'logIndex': log_index,
+        })
+
+    def add_trade(self, kind, block, tokens, hype, log_index=0):
+        self.logs.append({
+            'address': Web3.to_checksum_address(TOKEN),
+            'topics': [topic(kind), address_topic(TRADER)],
+            'data': '0x' + (tokens * 10**18).to_bytes(32, 'big').hex() + int(hype * 10**18).to_bytes(32, 'big').hex(),
+            'blockNumber': block,
+            'transactionHash': '0x' + tx_hash(block, log_index).hex(),
+            'logIndex': log_index,
+        })
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'trade_index.db')
+
+
+def test_decodes_launch_buy_and_sell_logs(db_path):
+    manager = StubManager()
+    manager.add_launch(50)
+    manager.add_trade('buy', 60, tokens=1000, hype=2.5)
+    manager.add_trade('sell', 70, tokens=400, hype=1.25, log_index=3)
+    indexer = TradeIndexer(manager, db_path=db_path, start_block=0)
+
+    assert indexer.sync() == 3
+
+    sell, buy = indexer.recent_trades()
+    assert buy == {**buy, 'event_type': 'buy', 'block_number': 60, 'block_time': 1_700_000_060,
+                   'token_address': TOKEN, 'trader': TRADER, 'token_amount': 1000.0, 'hype_amount': 2.5,
+                   'tx_hash': '0x' + tx_hash(60, 0).hex(), 'log_index': 0}
+    assert (sell['event_type'], sell['token_amount'], sell['hype_amount'], sell['log_index']) == ('sell', 400.0, 1.25, 3)
+    launch = indexer._conn().execute("SELECT * FROM trade_events WHERE event_type = 'launch'").fetchone()
+    assert (launch['token_address'], launch['trader'], launch['token_amount']) == (TOKEN, CREATOR, 1e9)
+    assert indexer.trader_positions(TRADER) == [{'token_address': TOKEN, 'tokens': 600.0, 'hype_spent': 2.5,
+                                                'hype_received': 1.25, 'trades': 2}]
+
+
+def test_blocks_inside_the_confirmation_window_wait_for_a_reorg_to_settle(db_path):
+    manager = StubManager(head=100)
+    manager.add_launch(50)
+    manager.add_trade('buy', 99, tokens=5, hype=1)
+    indexer = TradeIndexer(manager, db_path=db_path, start_block=0, confirmations=2)
+
+    indexer.sync()
+    assert indexer.last_indexed_block() == 98
+    assert indexer.recent_trades() == []
+
+    # Block 99 is reorged out and replaced before it is two blocks deep
+    manager.logs.pop()
+    manager.add_trade('sell', 99, tokens=7, hype=3, log_index=1)
+    manager.head = 101
+    indexer.sync()
+
+    assert indexer.last_indexed_block() == 99
+    assert [(t['event_type'], t['token_amount']) for t in indexer.recent_trades()] == [('sell', 7.0)]
+
+
+def test_resumes_from_the_stored_cursor(db_path):
+    manager = StubManager(head=1000)
+    manager.add_launch(50)
+    manager.add_trade('buy', 500, tokens=1, hype=1)
+    TradeIndexer(manager, db_path=db_path, start_block=0, chunk_size=400).sync(to_block=600)
+
+    manager.add_trade('buy', 800, tokens=2, hype=2)
+    manager.log_queries.clear()
+    reopened = TradeIndexer(manager, db_path=db_path, start_block=0, chunk_size=400)
+    assert reopened.last_indexed_block() == 600
+
+    assert reopened.sync() == 1
+    assert min(query['fromBlock'] for query in manager.log_queries) == 601
+    assert [t['block_number'] for t in reopened.recent_trades()] == [800, 500]
+
+
+def test_first_run_starts_at_the_configured_block(db_path):
+    manager = StubManager(head=100)
+    manager.add_trade('buy', 10, tokens=1, hype=1)
+    indexer = TradeIndexer(manager, db_path=db_path, start_block=80)
+
+    indexer.sync()
+
+    assert min(query['fromBlock'] for query in manager.log_queries) == 80
+    assert manager.code_queries == 0
+
+
+def test_first_run_starts_at_the_factory_deployment_block(db_path):
+    manager = StubManager(head=10_000, deployed_at=7_321)
+    indexer = TradeIndexer(manager, db_path=db_path)
+
+    assert indexer.last_indexed_block() == 7_320
+    assert manager.code_queries < 20
+    indexer.sync()
+    assert min(query['fromBlock'] for query in manager.log_queries) == 7_321
+    assert indexer.last_indexed_block() == 9_998
+
+
+def test_deployment_lookup_failure_starts_at_head(db_path, caplog):
+    manager = StubManager(head=5_000, deployed_at=None)
+
+    assert TradeIndexer(manager, db_path=db_path).last_indexed_block() == 4_999
+    assert caplog.records[-1].levelname == 'WARNING'
+    assert caplog.records[-1].getMessage().endswith('indexing from block 5000')
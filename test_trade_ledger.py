@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the ring-buffered trade ledger, checked against a full-history replay
+"""
+
+import random
+
+import pytest
+
+from trade_ledger import TradeLedger
+
+ACCOUNTS = [f'acct{i}' for i in range(12)]
+
+
+def fill(ledger, count, seed=1):
+    """Record `count` random trades; returns every trade in insertion order"""
+    rng = random.Random(seed)
+    ts = 1_700_000_000_000
+    history = []
+    for _ in range(count):
+        # Several trades share a millisecond, so ordering has to fall back to seq
+        ts += rng.choice([0, 0, 1, 250])
+        account = rng.choice(ACCOUNTS[:3]) if rng.random() < 0.8 else rng.choice(ACCOUNTS)
+        history.append(ledger.record_trade(account, rng.choice(['BUY', 'SELL']), f'trader{rng.randrange(5)}',
+                                           rng.uniform(0.1, 5), rng.uniform(1, 500), rng.uniform(0.001, 0.1), ts=ts))
+    return history
+
+
+def newest(history, limit, accounts=None, per_account=None):
+    """Brute force: newest-first over the whole history, honouring the per-account window"""
+    kept = []
+    counts = {}
+    for trade in reversed(history):
+        counts[trade.account] = counts.get(trade.account, 0) + 1
+        if per_account is not None and counts[trade.account] > per_account:
+            continue
+        if accounts is None or trade.account in accounts:
+            kept.append(trade)
+    return kept[:limit]
+
+
+def test_rings_keep_only_the_newest_records_after_wraparound():
+    ledger = TradeLedger(per_account=7, global_limit=40)
+    history = fill(ledger, 1000)
+
+    assert len(ledger) == 40
+    assert ledger.total_trades == 1000
+    assert ledger.recent(limit=40) == history[::-1][:40]
+    for account in ACCOUNTS:
+        expected = [trade for trade in reversed(history) if trade.account == account][:7]
+        assert ledger.account_trades(account, limit=None) == expected
+
+
+def test_price_ring_wraps_and_filters_oldest_first():
+    ledger = TradeLedger(price_points=5)
+    for i in range(12):
+        ledger.record_price('acct0', 0.01 * i, i, 'buy', trader='bob', ts=1000 + i)
+
+    assert [point.ts for point in ledger.price_history('acct0')] == list(range(1007, 1012))
+    assert [point.ts for point in ledger.price_history('acct0', since_ms=1009)] == [1009, 1010, 1011]
+    assert ledger.last_price('acct0').price == pytest.approx(0.11)
+    assert ledger.last_price('missing') is None
+
+
+@pytest.mark.parametrize('scan_budget', [0, 5, 1000])
+def test_filtered_recent_matches_brute_force(scan_budget):
+    ledger = TradeLedger(per_account=20, global_limit=60)
+    history = fill(ledger, 2000, seed=scan_budget)
+    rng = random.Random(scan_budget)
+
+    for _ in range(100):
+        accounts = set(rng.sample(ACCOUNTS, rng.randint(1, 4)))
+        limit = rng.randint(1, 20)
+        got = ledger.recent(limit=limit, accounts=accounts, scan_budget=scan_budget)
+        assert got == newest(history, limit, accounts, per_account=20)
+
+
+def test_heap_merge_breaks_timestamp_ties_by_insertion_order():
+    ledger = TradeLedger()
+    for i in range(9):
+        ledger.record_trade(ACCOUNTS[i % 3], 'BUY', 'alice', 1.0, 1.0, 0.01, ts=5000)
+    for _ in range(9):
+        ledger.record_trade(ACCOUNTS[5], 'SELL', 'bob', 1.0, 1.0, 0.01, ts=6000)
+    # The newest trades are all elsewhere, so the scan gives up and the rings are merged
+    merged = ledger.recent(limit=9, accounts=ACCOUNTS[:3], scan_budget=0)
+
+    assert [trade.seq for trade in merged] == list(range(9, 0, -1))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for SocialTradingPlatform account launches and trade bookkeeping
+"""
+
+import http.client
+import http.server
+import json
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+import social_trading_platform as platform
+
+
+class StubDeployer:
+    """Stands in for HyperEVMContractDeployer; slow enough for launches to overlap"""
+    deployments = []
+
+    def deploy_token_contract(self, account_handle, creator_address, initial_supply, creator_allocation):
+        time.sleep(0.2)
+        StubDeployer.deployments.append(account_handle)
+        return {'success': True, 'contract_address': f'0x{len(StubDeployer.deployments):040x}'}
+
+
+@pytest.fixture
+def deployer(monkeypatch):
+    monkeypatch.setattr(StubDeployer, 'deployments', [])
+    module = types.SimpleNamespace(HyperEVMContractDeployer=StubDeployer)
+    monkeypatch.setitem(sys.modules, 'hyperevm_contract_deployer', module)
+    # The launch record reads a factory_address key the config does not define yet
+    monkeypatch.setitem(platform.DEPLOYED_CONTRACTS, 'factory_address', platform.DEPLOYED_CONTRACTS['token_factory'])
+    return StubDeployer
+
+
+def user_data(handle):
+    return {'handle': handle, 'name': handle, 'avatar': '', 'launched_by': 'alice',
+            'wallet_address': '0x' + 'a' * 40}
+
+
+def test_concurrent_launches_of_one_handle_deploy_once(deployer):
+    trading = platform.SocialTradingPlatform(candle_db=None)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(trading.launch_account(user_data('@bob'))))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert deployer.deployments == ['@bob']
+    assert all(result['success'] for result in results)
+    assert sorted(bool(result.get('already_deployed')) for result in results) == [False, True]
+    assert results[0]['account'] is results[1]['account'] is trading.accounts['@bob']
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """SocialTradingHandler on a free port, with one launched account on a fresh platform"""
+    trading = platform.SocialTradingPlatform(candle_db=None)
+    trading.accounts['@bob'] = {'handle': '@bob', 'total_supply': 1000}
+    monkeypatch.setattr(platform, 'trading_platform', trading)
+
+    class Handler(platform.SocialTradingHandler):
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get_json(port, path):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', path)
+    response = conn.getresponse()
+    body = json.loads(response.read())
+    conn.close()
+    return response.status, body
+
+
+def test_price_impact_quotes_a_ladder(api):
+    status, body = get_json(api, '/api/price-impact?handle=@bob&type=sell&sizes=1,1000')
+    assert status == 200
+    assert [rung['shares'] for rung in body['ladder']] == [1, 1000]
+    assert get_json(api, '/api/price-impact?handle=@nobody')[0] == 404
+
+
+def test_price_impact_rejects_unquotable_requests(api):
+    many = ','.join(['1'] * 51)
+    for query, message in [
+        ('type=HOLD', 'type must be one of BUY, SELL'),
+        ('sizes=10,x', 'sizes must be a comma separated list of integers'),
+        ('sizes=10,0', 'sizes must be positive'),
+        ('type=SELL&sizes=-3', 'sizes must be positive'),
+        ('type=SELL&sizes=1001', 'cannot sell more than the current supply of 1000'),
+        (f'sizes={many}', 'at most 50 sizes per ladder'),
+    ]:
+        assert get_json(api, f'/api/price-impact?handle=@bob&{query}') == (400, {'error': message})
+
+
+def test_add_trade_ranks_accounts_by_their_market_stats():
+    trading = platform.SocialTradingPlatform(candle_db=None)
+    trading.accounts['@up'] = {'handle': '@up', 'market_cap': 5000.0, 'daily_change': 40.0}
+    trading.accounts['@down'] = {'handle': '@down', 'market_cap': 700.0, 'daily_change': -60.0}
+
+    trading.add_trade('@down', 'BUY', 10, 2.0, 'alice')
+    trading.add_trade('@up', 'BUY', 10, 2.0, 'alice')
+
+    assert trading.leaderboard.top() == ['@up', '@down']
+    assert trading.leaderboard.totals()['total_market_cap'] == 5700.0
+    assert (trading.accounts['@up']['volume_24h'], trading.accounts['@up']['trades_24h']) == (20.0, 1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for TTLCache and the cached_read decorator on Web3ContractManager reads
+"""
+
+import time
+
+import pytest
+
+from ttl_cache import TTLCache
+from web3_contract_manager import cached_read
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_failed_miss_is_not_stored():
+    cache = TTLCache()
+    with pytest.raises(ConnectionError):
+        cache.get_or_load('k', lambda: (_ for _ in ()).throw(ConnectionError('rpc down')))
+    assert cache.stats()['entries'] == 0
+    assert cache.get_or_load('k', lambda: 7) == 7
+
+
+def test_stale_value_served_while_refresh_fails(caplog):
+    cache = TTLCache()
+    assert cache.get_or_load('k', lambda: 'good', ttl=0, stale_ttl=60) == 'good'
+
+    def failing():
+        raise ConnectionError('rpc down')
+
+    # Past its TTL: the stale value comes back at once and the refresh fails in the background
+    for _ in range(3):
+        assert cache.get_or_load('k', failing, ttl=0, stale_ttl=60) == 'good'
+        wait_for(lambda: not cache.stats()['in_flight'] and not cache._refreshing)
+    assert cache.stats()['refresh_errors'] >= 1
+    assert cache.stats()['refreshes'] == 0
+    assert "Cache refresh failed for 'k': rpc down" in [record.getMessage() for record in caplog.records]
+
+    # A later refresh that succeeds replaces it
+    cache.get_or_load('k', lambda: 'new', ttl=0, stale_ttl=60)
+    wait_for(lambda: cache.stats()['refreshes'] == 1)
+    assert cache.get_or_load('k', failing, ttl=0, stale_ttl=60) == 'new'
+
+
+def test_lru_eviction_bounds_entries():
+    cache = TTLCache(max_entries=3)
+    for key in 'abc':
+        cache.get_or_load(key, lambda key=key: key.upper())
+    cache.get_or_load('a', lambda: 'unused')      # touch a, so b is now least recent
+    cache.get_or_load('d', lambda: 'D')
+    stats = cache.stats()
+    assert stats['entries'] == 3 and stats['evictions'] == 1
+    assert cache.get_or_load('a', lambda: 'reloaded') == 'A'
+    assert cache.get_or_load('b', lambda: 'reloaded') == 'reloaded'
+
+
+class Manager:
+    def __init__(self):
+        self.cache = TTLCache()
+        self.prices = {'0xa': 1.0, '0xb': 2.0}
+        self.down = set()
+
+    @cached_read(ttl=0, stale_ttl=60, default=dict)
+    def get_token_data(self, address):
+        if address in self.down:
+            raise ConnectionError(f'{address} unreachable')
+        return {'address': address, 'current_price': self.prices[address]}
+
+    @cached_read(ttl=0, stale_ttl=60, default=list)
+    def get_trending_tokens(self):
+        return [self.get_token_data(address) for address in sorted(self.prices)]
+
+
+def test_cached_read_returns_default_without_caching_failure():
+    manager = Manager()
+    manager.down.add('0xa')
+    assert manager.get_token_data('0xa') == {}
+    assert manager.cache.stats()['entries'] == 0
+    manager.down.clear()
+    assert manager.get_token_data('0xa')['current_price'] == 1.0
+
+
+def test_cached_read_keeps_stale_data_when_refresh_fails():
+    manager = Manager()
+    assert manager.get_token_data('0xa')['current_price'] == 1.0
+    manager.down.add('0xa')
+    manager.prices['0xa'] = 5.0
+    for _ in range(3):
+        assert manager.get_token_data('0xa')['current_price'] == 1.0
+        wait_for(lambda: not manager.cache._refreshing)
+    manager.down.clear()
+    manager.get_token_data('0xa')
+    wait_for(lambda: manager.cache.stats()['refreshes'] == 1)
+    assert manager.get_token_data('0xa')['current_price'] == 5.0
+
+
+def test_nested_failure_does_not_cache_outer_read():
+    manager = Manager()
+    manager.down.add('0xb')
+    # Nothing cached yet: the caller gets the default and no partial list is stored
+    assert manager.get_trending_tokens() == []
+    manager.down.clear()
+    assert [token['address'] for token in manager.get_trending_tokens()] == ['0xa', '0xb']
+
+    # Once cached, inner failures during a refresh never shrink the cached list
+    manager.down.add('0xb')
+    manager.prices['0xa'] = 9.0
+    assert manager.get_trending_tokens()[0]['current_price'] == 1.0
+    wait_for(lambda: not manager.cache._refreshing)
+    assert len(manager.get_trending_tokens()) == 2
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared USER_WALLETS state in social_trading_platform
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import social_trading_platform as platform
+
+
+def lock_is_free():
+    """Whether another thread could take STATE_LOCK right now"""
+    result = []
+
+    def probe():
+        acquired = platform.STATE_LOCK.acquire(timeout=1)
+        if acquired:
+            platform.STATE_LOCK.release()
+        result.append(acquired)
+
+    thread = threading.Thread(target=probe)
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+@pytest.fixture
+def wallets(monkeypatch):
+    saves = []
+    monkeypatch.setattr(platform, 'USER_WALLETS', platform.WalletDict())
+    monkeypatch.setattr(platform, 'save_user_wallets',
+                        lambda wallets, keys=None: saves.append(lock_is_free()))
+    return platform.USER_WALLETS, saves
+
+
+def test_wallet_generated_once_without_holding_state_lock(wallets, monkeypatch):
+    user_wallets, saves = wallets
+    generated = []
+
+    def generate(user_id):
+        generated.append(lock_is_free())
+        time.sleep(0.05)
+        return {'address': f'0x{len(generated):040x}', 'private_key': '0x1', 'user_id': user_id}
+
+    monkeypatch.setattr(platform, '_generate_nodejs_wallet', generate)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(platform.get_or_create_nodejs_wallet('42')))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert generated == [True]
+    assert {wallet['address'] for wallet in results} == {user_wallets['42']['address']}
+    assert saves == [True]
+
+
+def test_other_users_are_not_blocked_by_a_slow_generation(wallets, monkeypatch):
+    user_wallets, _ = wallets
+    user_wallets['session_7'] = {'wallet': {'address': '0xabc', 'user_id': '7'}}
+    started, finish = threading.Event(), threading.Event()
+
+    def generate(user_id):
+        started.set()
+        finish.wait(5)
+        return {'address': '0xdef', 'user_id': user_id}
+
+    monkeypatch.setattr(platform, '_generate_nodejs_wallet', generate)
+    slow = threading.Thread(target=platform.get_or_create_nodejs_wallet, args=('8',))
+    slow.start()
+    assert started.wait(5)
+    # A different user's lookup and migration completes while '8' is still generating
+    assert platform.get_or_create_nodejs_wallet('7')['address'] == '0xabc'
+    assert user_wallets['7']['address'] == '0xabc'
+    finish.set()
+    slow.join()
+    assert user_wallets['8']['address'] == '0xdef'
+
+
+def test_save_writes_sqlite_after_releasing_state_lock(monkeypatch, tmp_path):
+    store = platform.WalletStore(str(tmp_path / 'user_wallets.db'))
+    writes = []
+    put_serialized = store.put_serialized
+
+    def recording_put(rows):
+        writes.append((sorted(rows), lock_is_free()))
+        put_serialized(rows)
+
+    monkeypatch.setattr(store, 'put_serialized', recording_put)
+    monkeypatch.setattr(platform, 'WALLET_STORE', store)
+    monkeypatch.setattr(platform, 'schedule_backup_export', lambda: None)
+    user_wallets = platform.WalletDict()
+    user_wallets['42'] = {'address': '0xabc', 'user_id': '42'}
+    user_wallets['session_42'] = 'sid'
+
+    platform.save_user_wallets(user_wallets)
+    del user_wallets['session_42']
+    user_wallets['42']['handle'] = '@alice'   # mutated in place, so named explicitly
+    platform.save_user_wallets(user_wallets, keys=['42'])
+    platform.save_user_wallets(user_wallets)
+
+    assert writes == [(['42', 'session_42'], True), (['42'], True), ([], True)]
+    assert store.load_all() == {'42': {'address': '0xabc', 'user_id': '42', 'handle': '@alice'}}
+
+
+def test_older_save_never_overwrites_a_newer_one(monkeypatch, tmp_path):
+    store = platform.WalletStore(str(tmp_path / 'user_wallets.db'))
+    puts = []
+    put_serialized = store.put_serialized
+
+    def recording_put(rows):
+        puts.append({key: pickle.loads(row) for key, row in rows.items()})
+        put_serialized(rows)
+
+    write_lock, owners = threading.Lock(), {}
+    monkeypatch.setattr(store, 'put_serialized', recording_put)
+    monkeypatch.setattr(platform, 'WALLET_STORE', store)
+    monkeypatch.setattr(platform, 'schedule_backup_export', lambda: None)
+    monkeypatch.setattr(platform, '_wallet_write_lock', write_lock)
+    monkeypatch.setattr(platform, '_wallet_save_owner', owners)
+    user_wallets = platform.WalletDict()
+
+    def wait_for(condition):
+        deadline = time.time() + 5
+        while not condition() and time.time() < deadline:
+            time.sleep(0.001)
+
+    # Both saves capture '42' while the disk is busy, then race for the write
+    with write_lock:
+        user_wallets['42'] = {'address': '0xold'}
+        older = threading.Thread(target=platform.save_user_wallets, args=(user_wallets,))
+        older.start()
+        wait_for(lambda: '42' in owners)
+        user_wallets['42'] = {'address': '0xnew'}
+        first_ticket = owners['42']
+        newer = threading.Thread(target=platform.save_user_wallets, args=(user_wallets,))
+        newer.start()
+        wait_for(lambda: owners['42'] != first_ticket)
+    older.join()
+    newer.join()
+
+    assert [put['42'] for put in puts if '42' in put] == [{'address': '0xnew'}]
+    assert store.load_all() == {'42': {'address': '0xnew'}}
+
+
+def test_sessions_dict_does_not_track_changes():
+    sessions = platform.SharedStateDict()
+    for i in range(100):
+        sessions[f'sid-{i}'] = {'user_id': i}
+        del sessions[f'sid-{i}']
+
+    assert not hasattr(sessions, '_dirty')
+    assert len(sessions) == 0
+
+
+def test_importing_the_platform_creates_no_files(tmp_path):
+    subprocess.run([sys.executable, '-c', 'import social_trading_platform'], cwd=tmp_path, check=True,
+                   env={**os.environ, 'PYTHONPATH': os.path.dirname(os.path.abspath(platform.__file__))},
+                   stdout=subprocess.DEVNULL)
+    assert sorted(path.name for path in tmp_path.iterdir()) == []
+
+
+def test_startup_load_indexes_stored_wallets_without_dirtying_them(monkeypatch, tmp_path):
+    store = platform.WalletStore(str(tmp_path / 'user_wallets.db'))
+    store.put_many({'42': {'address': '0xAbC', 'user_id': '42'}, 'session_42': 'sid'})
+    monkeypatch.setattr(platform, 'WALLET_STORE', store)
+    monkeypatch.setattr(platform, 'WALLET_STORAGE_FILE', str(tmp_path / 'user_wallets.pkl'))
+    user_wallets = platform.WalletDict()
+
+    user_wallets.load(platform.load_user_wallets())
+
+    assert user_wallets.wallet_for_user('42') == ('42', {'address': '0xAbC', 'user_id': '42'})
+    assert user_wallets.index.session_user('sid') == '42'
+    assert user_wallets.drain_dirty() == set()
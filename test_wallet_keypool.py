@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Cross-check in-process wallet derivation against ethers.js test vectors
+Expected addresses are what `new ethers.Wallet(privateKey).address` returns
+"""
+
+import pytest
+
+pytest.importorskip('ecdsa')
+pytest.importorskip('Crypto')
+
+import wallet_keypool
+
+ETHERS_VECTORS = [
+    ('0x0000000000000000000000000000000000000000000000000000000000000001',
+     '0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf'),
+    ('0x0000000000000000000000000000000000000000000000000000000000000002',
+     '0x2B5AD5c4795c026514f8317c7a215E218DcCD6cF'),
+    ('0x0000000000000000000000000000000000000000000000000000000000000003',
+     '0x6813Eb9362372EEF6200f3b1dbC3f819671cBA69'),
+    ('0x0123456789012345678901234567890123456789012345678901234567890123',
+     '0x14791697260E4c9A71f18484C9f997B308e59325'),
+]
+
+
+@pytest.mark.parametrize('private_key, address', ETHERS_VECTORS)
+def test_derive_address_matches_ethers(private_key, address):
+    assert wallet_keypool.derive_address(private_key) == address
+    assert wallet_keypool.derive_address(private_key.removeprefix('0x')) == address
+
+
+def test_generated_wallet_shape():
+    wallet = wallet_keypool.generate_keypair()
+    assert set(wallet) >= {'address', 'privateKey', 'compatible_with', 'generated_by'}
+    assert len(wallet['privateKey']) == 66
+    assert 0 < int(wallet['privateKey'], 16) < wallet_keypool.SECP256K1_N
+    assert wallet_keypool.derive_address(wallet['privateKey']) == wallet['address']
+
+
+def test_pool_hands_out_each_keypair_once():
+    pool = wallet_keypool.KeypairPool(size=4, low_water=2)
+    keys = {pool.take()['privateKey'] for _ in range(20)}
+    assert len(keys) == 20
+    stats = pool.stats()
+    assert stats['pool_hits'] + stats['pool_misses'] == 20
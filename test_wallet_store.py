@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite wallet store and the USER_WALLETS secondary indexes
+"""
+
+import pickle
+import random
+
+import pytest
+
+from wallet_store import WalletIndex, WalletStore, wallet_of
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'user_wallets.db')
+
+
+def test_put_many_round_trips_every_value_shape(db_path):
+    store = WalletStore(db_path)
+    items = {
+        '42': {'address': '0xAbC', 'private_key': '0x1', 'user_id': '42'},
+        'session_42': {'wallet': {'address': '0xabc'}, 'handle': '@alice'},
+        'session_7': 'sid-7',
+    }
+    store.put_many(items)
+
+    assert store.count() == 3
+    assert store.get('session_42') == items['session_42']
+    assert store.get('missing') is None
+    assert store.load_all() == items
+
+    store.put_many({'session_7': 'sid-7b'})
+    store.delete_many(['42'])
+    assert store.load_all() == {'session_42': items['session_42'], 'session_7': 'sid-7b'}
+
+
+def test_reopened_store_keeps_committed_writes(db_path):
+    store = WalletStore(db_path)
+    store.put_serialized(WalletStore.serialize({1: {'address': '0x1'}, 'gone': 'x'}))
+    store.delete_many(['gone'])
+    store.close()
+
+    reopened = WalletStore(db_path)
+    assert reopened.load_all() == {'1': {'address': '0x1'}}
+
+
+def test_migrate_from_pickle_runs_once_and_keeps_newer_rows(tmp_path, db_path):
+    pickle_path = tmp_path / 'user_wallets.pkl'
+    pickle_path.write_bytes(pickle.dumps({'42': {'address': '0xold'}, 'session_42': 'sid', 7: {'address': '0x7'}}))
+    store = WalletStore(db_path)
+    store.put('42', {'address': '0xnew'})
+
+    assert store.migrate_from_pickle(str(pickle_path)) == 3
+    assert store.load_all() == {'42': {'address': '0xnew'}, 'session_42': 'sid', '7': {'address': '0x7'}}
+
+    pickle_path.write_bytes(pickle.dumps({'late': 'entry'}))
+    store.close()
+    reopened = WalletStore(db_path)
+    assert reopened.migrate_from_pickle(str(pickle_path)) == 0
+    assert 'late' not in reopened.load_all()
+
+
+def test_migrate_without_a_pickle_is_a_no_op(tmp_path, db_path):
+    assert WalletStore(db_path).migrate_from_pickle(str(tmp_path / 'missing.pkl')) == 0
+
+
+def test_backup_export_written_after_a_fresh_start_is_never_imported(tmp_path, db_path):
+    pickle_path = tmp_path / 'user_wallets.pkl'
+    store = WalletStore(db_path)
+    assert store.migrate_from_pickle(str(pickle_path)) == 0
+    store.put_many({'42': {'address': '0x42'}, '7': {'address': '0x7'}})
+    # The background export snapshots the wallets, then a user is deleted
+    pickle_path.write_bytes(pickle.dumps(store.load_all()))
+    store.delete_many(['42'])
+    store.close()
+
+    reopened = WalletStore(db_path)
+    assert reopened.migrate_from_pickle(str(pickle_path)) == 0
+    assert reopened.load_all() == {'7': {'address': '0x7'}}
+
+
+def expected_indexes(entries):
+    """Brute force: the indexes rebuilt from scratch over every live entry"""
+    by_address, by_session, owned = {}, {}, {}
+    for key, value in entries.items():
+        if isinstance(value, str) and key.startswith('session_'):
+            by_session[value] = key[len('session_'):]
+            continue
+        wallet = wallet_of(value)
+        if wallet is None:
+            continue
+        by_address.setdefault(wallet['address'].lower(), set()).add(key)
+        owner = WalletIndex._owner(key, value, wallet)
+        owned.setdefault(owner, set()).add(key)
+    return by_address, by_session, owned
+
+
+def random_entry(rng, key):
+    user = key[len('session_'):] if key.startswith('session_') else key
+    address = f'0x{rng.randrange(6):040x}'.upper() if rng.random() < 0.5 else f'0x{rng.randrange(6):040x}'
+    roll = rng.random()
+    if key.startswith('session_') and roll < 0.3:
+        return f'sid-{rng.randrange(4)}'
+    if roll < 0.6:
+        return {'address': address, 'user_id': user}
+    if roll < 0.9:
+        return {'wallet': {'address': address}, 'handle': f'@{user}'}
+    return {'no_wallet': True}
+
+
+def test_index_matches_brute_force_after_updates_and_deletes():
+    rng = random.Random(8)
+    keys = [f'{i}' for i in range(6)] + [f'session_{i}' for i in range(6)]
+    entries, index = {}, WalletIndex()
+
+    for _ in range(3000):
+        key = rng.choice(keys)
+        # Callers unindex the old value before replacing or deleting a key
+        if key in entries:
+            index.remove(key, entries.pop(key))
+        if rng.random() < 0.7:
+            entries[key] = random_entry(rng, key)
+            index.add(key, entries[key])
+
+        by_address, by_session, owned = expected_indexes(entries)
+        assert index.by_address == by_address
+        # When two session keys claim one session id the last writer holds it, until it is removed
+        assert set(index.by_session) <= set(by_session)
+        assert all(entries.get(f'session_{user}') == sid for sid, user in index.by_session.items())
+        assert set(index.by_user) == set(owned)
+        for owner, key_held in index.by_user.items():
+            assert key_held in owned[owner]
+            if owner in owned[owner]:
+                assert key_held == owner
+            assert index.user_key(owner) == key_held
+        for address, held in by_address.items():
+            assert index.address_keys(address.upper()) == held
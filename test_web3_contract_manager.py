@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for batched token reads in Web3ContractManager, against a local JSON-RPC stub
+"""
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from web3_contract_manager import TOKEN_DATA_FIELDS, TOKENS_PER_BATCH, Web3ContractManager
+
+OUTPUT_TYPES = {'socialHandle': 'string', 'accountName': 'string', 'creator': 'address'}
+SELECTORS = {'0x' + Web3.keccak(text=f'{field}()')[:4].hex().removeprefix('0x'): field for field in TOKEN_DATA_FIELDS}
+TOKENS = [Web3.to_checksum_address(f'0x{i + 1:040x}') for i in range(TOKENS_PER_BATCH + 1)]
+
+
+def field_value(index, field):
+    """Distinct per token and per field, so a misaligned slot shows up"""
+    if field in ('socialHandle', 'accountName'):
+        return f'{field}-{index}'
+    if field == 'creator':
+        return f'0x{index + 100:040x}'
+    return (index + 1) * 10 ** 18 + TOKEN_DATA_FIELDS.index(field)
+
+
+def answer_with(broken=()):
+    """Token view calls by (token index, field); calls listed in broken return an RPC error"""
+    def answer(request):
+        reply = {'jsonrpc': '2.0', 'id': request['id']}
+        if request['method'] == 'eth_chainId':
+            return {**reply, 'result': '0x3e7'}
+        if request['method'] == 'eth_blockNumber':
+            return {**reply, 'result': '0x10'}
+        call = request['params'][0]
+        field = SELECTORS.get(call['data'][:10])
+        index = int(call['to'], 16) - 1
+        if field is None or not 0 <= index < len(TOKENS) or (index, field) in broken:
+            return {**reply, 'error': {'code': -32000, 'message': 'execution reverted'}}
+        value = encode([OUTPUT_TYPES.get(field, 'uint256')], [field_value(index, field)])
+        return {**reply, 'result': '0x' + value.hex()}
+    return answer
+
+
+def manager_for(node, monkeypatch):
+    monkeypatch.setenv('HYPEREVM_RPC_URL', node.url)
+    manager = Web3ContractManager()
+    node.posts.clear()
+    return manager
+
+
+def batches(node):
+    return [post for post in node.posts if isinstance(post, list)]
+
+
+def assert_token(data, index):
+    assert data['address'] == TOKENS[index]
+    assert (data['handle'], data['name']) == (f'socialHandle-{index}', f'accountName-{index}')
+    assert data['creator'].lower() == f'0x{index + 100:040x}'
+    assert data['current_price'] == pytest.approx(((index + 1) * 10 ** 18 + 3) / 1e18)
+    assert data['holder_count'] == (index + 1) * 10 ** 18 + 8
+
+
+def test_tokens_are_read_in_chunks_of_tokens_per_batch(stub_node, monkeypatch):
+    node = stub_node(answer_with())
+    manager = manager_for(node, monkeypatch)
+
+    tokens_data = manager.get_tokens_data(TOKENS)
+
+    assert [len(batch) for batch in batches(node)] == [TOKENS_PER_BATCH * len(TOKEN_DATA_FIELDS), len(TOKEN_DATA_FIELDS)]
+    assert len(node.posts) == 2
+    for index, data in enumerate(tokens_data):
+        assert_token(data, index)
+    assert len(tokens_data) == len(TOKENS)
+
+
+def test_failed_batch_falls_back_to_single_calls(stub_node, monkeypatch):
+    node = stub_node(answer_with(broken={(5, 'volume24h')}))
+    manager = manager_for(node, monkeypatch)
+
+    tokens_data = manager.get_tokens_data(TOKENS)
+
+    # The first chunk's batch fails on one entry and is re-read token by token;
+    # the token whose call keeps failing is left out, the second chunk is untouched
+    assert [data['address'] for data in tokens_data] == TOKENS[:5] + TOKENS[6:]
+    for data in tokens_data:
+        assert_token(data, TOKENS.index(data['address']))
+    assert len(batches(node)) == 2
+    singles = [post for post in node.posts if isinstance(post, dict) and post['method'] == 'eth_call']
+    assert {int(post['params'][0]['to'], 16) - 1 for post in singles} == set(range(TOKENS_PER_BATCH))
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Incremental event-log indexer for SocialX token trades
+Pulls TokensPurchased / TokensSold logs from SocialAccountToken contracts and
+TokenDeployed logs from the factory with eth_getLogs in block-range chunks,
+stores them in SQLite and serves recent-trade / portfolio queries from there
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_DB_FILE = 'trade_index.db'
+
+# First block to index when there is no checkpoint yet. Left unset, the indexer
+# starts at the block the token factory was deployed in
+TRADE_INDEX_START_BLOCK = int(os.environ['TRADE_INDEX_START_BLOCK']) if os.getenv('TRADE_INDEX_START_BLOCK') else None
+
+# Event signatures (topic0 = keccak256 of the canonical signature)
+EVENT_SIGNATURES = {
+    'buy': 'TokensPurchased(address,uint256,uint256)',
+    'sell': 'TokensSold(address,uint256,uint256)',
+    'launch': 'TokenDeployed(address,address,string,string,uint256)',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trade_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    block_number INTEGER NOT NULL,
+    block_time INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    token_address TEXT NOT NULL,
+    trader TEXT NOT NULL,
+    token_amount REAL NOT NULL,
+    hype_amount REAL NOT NULL,
+    UNIQUE (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS idx_trade_events_token ON trade_events (token_address, block_number DESC);
+CREATE INDEX IF NOT EXISTS idx_trade_events_trader ON trade_events (trader, block_number DESC);
+CREATE INDEX IF NOT EXISTS idx_trade_events_block ON trade_events (block_number DESC, log_index DESC);
+CREATE TABLE IF NOT EXISTS indexer_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _topic_address(topic) -> str:
+    """Indexed address topic -> lowercase 0x address"""
+    raw = topic.hex() if isinstance(topic, (bytes, bytearray)) else topic
+    return '0x' + raw.removeprefix('0x')[-40:].lower()
+
+
+def _data_bytes(data) -> bytes:
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    return bytes.fromhex(data.removeprefix('0x'))
+
+
+class TradeIndexer:
+    """Checkpointed eth_getLogs indexer backed by SQLite.
+
+    Addresses are stored lowercase. Only blocks at least `confirmations` deep are
+    indexed, so a shallow reorg never leaves orphaned rows behind. With no
+    start_block and no checkpoint, indexing begins at the factory deployment block.
+    """
+
+    def __init__(self, manager, db_path: str = INDEX_DB_FILE, start_block: Optional[int] = None,
+                 chunk_size: int = 2000, confirmations: int = 2):
+        self.manager = manager
+        self.db_path = db_path
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.confirmations = confirmations
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # HexBytes.hex() drops the 0x prefix on newer hexbytes releases, so normalize
+        self.topics = {name: '0x' + manager.w3.keccak(text=sig).hex().removeprefix('0x')
+                       for name, sig in EVENT_SIGNATURES.items()}
+        self.event_by_topic = {topic: name for name, topic in self.topics.items()}
+
+        with self._write_lock:
+            conn = self._conn()
+            conn.executescript(SCHEMA)
+            conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers run while the indexer writes"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    # ---- checkpoint -------------------------------------------------------
+
+    def last_indexed_block(self) -> int:
+        row = self._conn().execute("SELECT value FROM indexer_state WHERE key = 'last_block'").fetchone()
+        if row:
+            return int(row['value'])
+        if self.start_block is None:
+            self.start_block = self.factory_deployment_block()
+        return self.start_block - 1
+
+    def factory_deployment_block(self) -> int:
+        """First block with code at the factory address, found by bisecting eth_getCode.
+
+        Historical eth_getCode needs an archive node; if the lookup fails the
+        indexer starts at the current head and older trades are not backfilled.
+        """
+        w3 = self.manager.w3
+        factory = w3.to_checksum_address(self.manager.contracts['token_factory'])
+        head = w3.eth.block_number
+        try:
+            if not w3.eth.get_code(factory, head):
+                return head
+            low, high = 0, head
+            while low < high:
+                middle = (low + high) // 2
+                if w3.eth.get_code(factory, middle):
+                    high = middle
+                else:
+                    low = middle + 1
+            return low
+        except Exception as e:
+            logger.warning("Could not find the factory deployment block (%s); indexing from block %d", e, head)
+            return head
+
+    def _known_tokens(self) -> List[str]:
+        rows = self._conn().execute(
+            "SELECT DISTINCT token_address FROM trade_events WHERE event_type = 'launch'").fetchall()
+        tokens = {row['token_address'] for row in rows}
+        tokens.update(address.lower() for address in self.manager.get_all_token_addresses(0, 1000))
+        return sorted(tokens)
+
+    # ---- indexing ---------------------------------------------------------
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """Index every confirmed block since the checkpoint; returns events stored"""
+        w3 = self.manager.w3
+        head = w3.eth.block_number - self.confirmations
+        to_block = head if to_block is None else min(to_block, head)
+        from_block = self.last_indexed_block() + 1
+        stored = 0
+
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            stored += self._index_range(from_block, chunk_end)
+            from_block = chunk_end + 1
+        return stored
+
+    def _index_range(self, from_block: int, to_block: int) -> int:
+        w3 = self.manager.w3
+        factory = self.manager.contracts['token_factory']
+
+        # Launches first so tokens deployed inside this range are scanned for trades too
+        logs = list(w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': w3.to_checksum_address(factory),
+            'topics': [self.topics['launch']],
+        }))
+        launches = [event for event in (self._decode(log) for log in logs) if event]
+        tokens = set(self._known_tokens())
+        tokens.update(event['token_address'] for event in launches)
+
+        if tokens:
+            logs = list(w3.eth.get_logs({
+                'fromBlock': from_block,
+                'toBlock': to_block,
+                'address': [w3.to_checksum_address(token) for token in sorted(tokens)],
+                'topics': [[self.topics['buy'], self.topics['sell']]],
+            }))
+            trades = [event for event in (self._decode(log) for log in logs) if event]
+        else:
+            trades = []
+
+        events = launches + trades
+        self._attach_block_times(events)
+
+        with self._write_lock:
+            conn = self._conn()
+            with conn:
+                conn.executemany(
+                    """INSERT OR IGNORE INTO trade_events
+                       (block_number, block_time, tx_hash, log_index, event_type,
+                        token_address, trader, token_amount, hype_amount)
+                       VALUES (:block_number, :block_time, :tx_hash, :log_index, :event_type,
+                               :token_address, :trader, :token_amount, :hype_amount)""",
+                    events)
+                conn.execute(
+                    "INSERT OR REPLACE INTO indexer_state (key, value) VALUES ('last_block', ?)",
+                    (str(to_block),))
+        return len(events)
+
+    def _decode(self, log) -> Optional[Dict]:
+        topics = log['topics']
+        topic0 = topics[0].hex() if isinstance(topics[0], (bytes, bytearray)) else topics[0]
+        event_type = self.event_by_topic.get('0x' + topic0.removeprefix('0x'))
+        if event_type is None:
+            return None
+
+        tx_hash = log['transactionHash']
+        event = {
+            'block_number': log['blockNumber'],
+            'block_time': 0,
+            'tx_hash': '0x' + (tx_hash.hex() if isinstance(tx_hash, (bytes, bytearray)) else tx_hash).removeprefix('0x'),
+            'log_index': log['logIndex'],
+            'event_type': event_type,
+        }
+        data = _data_bytes(log['data'])
+
+        if event_type == 'launch':
+            # TokenDeployed(address indexed tokenAddress, address indexed creator, string, string, uint256)
+            _, _, total_supply = self.manager.w3.codec.decode(['string', 'string', 'uint256'], data)
+            event.update(token_address=_topic_address(topics[1]), trader=_topic_address(topics[2]),
+                         token_amount=total_supply / 1e18, hype_amount=0.0)
+        else:
+            # TokensPurchased/TokensSold(address indexed trader, uint256 tokens, uint256 cost|proceeds)
+            tokens = int.from_bytes(data[0:32], 'big')
+            hype = int.from_bytes(data[32:64], 'big')
+            event.update(token_address=log['address'].lower(), trader=_topic_address(topics[1]),
+                         token_amount=tokens / 1e18, hype_amount=hype / 1e18)
+        return event
+
+    def _attach_block_times(self, events: List[Dict]):
+        """One eth_getBlockByNumber per distinct block in the chunk"""
+        times = {}
+        for event in events:
+            number = event['block_number']
+            if number not in times:
+                times[number] = self.manager.w3.eth.get_block(number)['timestamp']
+            event['block_time'] = times[number]
+
+    # ---- background loop --------------------------------------------------
+
+    def start(self, interval: float = 5.0):
+        """Keep the index caught up from a daemon thread"""
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    stored = self.sync()
+                    if stored:
+                        logger.info("Trade indexer stored %d events up to block %d", stored, self.last_indexed_block())
+                except Exception:
+                    logger.exception("Trade indexer sync failed")
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=run, name='trade-indexer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # ---- queries ----------------------------------------------------------
+
+    def recent_trades(self, limit: int = 20, token_address: Optional[str] = None) -> List[Dict]:
+        if token_address:
+            rows = self._conn().execute(
+                """SELECT * FROM trade_events WHERE token_address = ? AND event_type != 'launch'
+                   ORDER BY block_number DESC, log_index DESC LIMIT ?""",
+                (token_address.lower(), limit)).fetchall()
+        else:
+            rows = self._conn().execute(
+                """SELECT * FROM trade_events WHERE event_type != 'launch'
+                   ORDER BY block_number DESC, log_index DESC LIMIT ?""",
+                (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def trader_trades(self, trader: str, limit: int = 50) -> List[Dict]:
+        rows = self._conn().execute(
+            """SELECT * FROM trade_events WHERE trader = ? AND event_type != 'launch'
+               ORDER BY block_number DESC, log_index DESC LIMIT ?""",
+            (trader.lower(), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def trader_positions(self, trader: str) -> List[Dict]:
+        """Net token position and HYPE flow per token for one trader"""
+        rows = self._conn().execute(
+            """SELECT token_address,
+                      SUM(CASE WHEN event_type = 'buy' THEN token_amount ELSE -token_amount END) AS tokens,
+                      SUM(CASE WHEN event_type = 'buy' THEN hype_amount ELSE 0 END) AS hype_spent,
+                      SUM(CASE WHEN event_type = 'sell' THEN hype_amount ELSE 0 END) AS hype_received,
+                      COUNT(*) AS trades
+               FROM trade_events
+               WHERE trader = ? AND event_type IN ('buy', 'sell')
+               GROUP BY token_address""",
+            (trader.lower(),)).fetchall()
+        return [dict(row) for row in rows]
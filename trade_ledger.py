@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Bounded, time-indexed trade ledger for SocialTradingPlatform
+Trades and price points are compact __slots__ records with epoch-millisecond
+timestamps, kept in per-account ring buffers plus one global ring; recent
+trades are read newest-first from the global ring, falling back to a heap
+merge of the per-account rings for sparse account filters
+"""
+
+import heapq
+import itertools
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+RECENT_TRADES_PER_ACCOUNT = 50   # window the API handlers have always looked at
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def iso_from_ms(ts_ms: int) -> str:
+    return datetime.fromtimestamp(ts_ms / 1000).isoformat()
+
+
+class Trade:
+    """One bonding-curve trade; `side` is 'BUY' or 'SELL'"""
+
+    __slots__ = ('seq', 'ts', 'account', 'side', 'trader', 'hype', 'tokens', 'price', 'tx_hash')
+
+    def __init__(self, seq, ts, account, side, trader, hype, tokens, price, tx_hash):
+        self.seq = seq
+        self.ts = ts
+        self.account = account
+        self.side = side
+        self.trader = trader
+        self.hype = hype
+        self.tokens = tokens
+        self.price = price
+        self.tx_hash = tx_hash
+
+    def to_dict(self) -> Dict:
+        """The dict shape buy_tokens / sell_tokens have always returned"""
+        if self.side == 'BUY':
+            trade = {'type': 'BUY', 'buyer': self.trader, 'account': self.account,
+                     'hype_amount': self.hype, 'tokens_received': self.tokens}
+        else:
+            trade = {'type': 'SELL', 'seller': self.trader, 'account': self.account,
+                     'tokens_sold': self.tokens, 'hype_received': self.hype}
+        trade.update(price_per_token=self.price, timestamp=iso_from_ms(self.ts), tx_hash=self.tx_hash)
+        return trade
+
+
+class PricePoint:
+    __slots__ = ('ts', 'price', 'volume', 'kind', 'trader')
+
+    def __init__(self, ts, price, volume, kind, trader):
+        self.ts = ts
+        self.price = price
+        self.volume = volume
+        self.kind = kind
+        self.trader = trader
+
+    def to_dict(self) -> Dict:
+        point = {'price': self.price, 'timestamp': iso_from_ms(self.ts), 'volume': self.volume, 'type': self.kind}
+        if self.trader is not None:
+            point['buyer' if self.kind == 'buy' else 'seller'] = self.trader
+        return point
+
+
+def _newest_first(ring: deque) -> Iterable:
+    return reversed(ring)
+
+
+class TradeLedger:
+    """Ring-buffered trade and price history.
+
+    Not thread safe on its own; SocialTradingPlatform calls it under its lock.
+    Every ring is append-only in time order, so nothing is ever sorted: the
+    global ring is already the merged view, and the per-account rings can be
+    k-way heap merged in O(limit log accounts) when a filter skips most of it.
+    Account and trader strings are interned so a million records share them.
+    """
+
+    def __init__(self, per_account: int = 1000, price_points: int = 1000, global_limit: int = 100_000):
+        self.per_account = per_account
+        self.price_points = price_points
+        self._seq = itertools.count(1)
+        self._all = deque(maxlen=global_limit)
+        self._by_account: Dict[str, deque] = {}
+        self._prices: Dict[str, deque] = {}
+        self.total_trades = 0
+
+    def record_trade(self, account: str, side: str, trader: str, hype: float, tokens: float,
+                     price: float, tx_hash: Optional[str] = None, ts: Optional[int] = None) -> Trade:
+        account = sys.intern(account)
+        trade = Trade(next(self._seq), now_ms() if ts is None else ts, account, side,
+                      sys.intern(trader) if isinstance(trader, str) else trader, hype, tokens, price, tx_hash)
+        self._all.append(trade)
+        ring = self._by_account.get(account)
+        if ring is None:
+            ring = self._by_account[account] = deque(maxlen=self.per_account)
+        ring.append(trade)
+        self.total_trades += 1
+        return trade
+
+    def record_price(self, account: str, price: float, volume: float, kind: str,
+                     trader: Optional[str] = None, ts: Optional[int] = None) -> PricePoint:
+        point = PricePoint(now_ms() if ts is None else ts, price, volume, kind,
+                           sys.intern(trader) if isinstance(trader, str) else trader)
+        ring = self._prices.get(account)
+        if ring is None:
+            ring = self._prices[account] = deque(maxlen=self.price_points)
+        ring.append(point)
+        return point
+
+    def account_trades(self, account: str, limit: Optional[int] = RECENT_TRADES_PER_ACCOUNT) -> List[Trade]:
+        """Newest-first trades for one account"""
+        return list(itertools.islice(_newest_first(self._by_account.get(account, ())), limit))
+
+    def recent(self, limit: int = 10, accounts: Optional[Iterable[str]] = None,
+               scan_budget: int = 1000) -> List[Trade]:
+        """Newest-first trades across `accounts` (default: all accounts)"""
+        if accounts is None:
+            return list(itertools.islice(reversed(self._all), limit))
+
+        # Usually nearly every account qualifies, so a short scan of the global ring finishes
+        wanted = accounts if isinstance(accounts, (set, frozenset, dict)) else set(accounts)
+        found = []
+        for trade in itertools.islice(reversed(self._all), scan_budget + limit):
+            if trade.account in wanted:
+                found.append(trade)
+                if len(found) == limit:
+                    return found
+
+        rings = [self._by_account[account] for account in wanted if account in self._by_account]
+        merged = heapq.merge(*(_newest_first(ring) for ring in rings),
+                             key=lambda trade: (trade.ts, trade.seq), reverse=True)
+        return list(itertools.islice(merged, limit))
+
+    def price_history(self, account: str, since_ms: Optional[int] = None) -> List[PricePoint]:
+        """Oldest-first price points for one account, optionally only those at/after since_ms"""
+        points = self._prices.get(account, ())
+        if since_ms is None:
+            return list(points)
+        return [point for point in points if point.ts >= since_ms]
+
+    def last_price(self, account: str) -> Optional[PricePoint]:
+        points = self._prices.get(account)
+        return points[-1] if points else None
+
+    def __len__(self):
+        return len(self._all)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+In-process TTL cache with stale-while-revalidate and single-flight loading
+Used by Web3ContractManager to keep slow HyperEVM reads off the request path
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ('value', 'fresh_until', 'stale_until', 'ttl', 'stale_ttl')
+
+    def __init__(self, value, ttl, stale_ttl, now):
+        self.value = value
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.fresh_until = now + ttl
+        self.stale_until = now + ttl + stale_ttl
+
+
+class _Flight:
+    """One in-progress load that concurrent callers wait on"""
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    """Keyed cache where every entry carries its own TTL.
+
+    - fresh entries are returned directly (hit)
+    - entries past their TTL but inside the stale window are returned immediately
+      while one background worker reloads them (stale hit)
+    - missing or expired keys are loaded once; concurrent callers for the same key
+      block on that single load instead of each hitting the backend (miss)
+
+    A loader signals failure by raising: the error goes to the callers of a
+    miss and is never stored, and a failed background refresh leaves the stale
+    value in place. At most `max_entries` keys are kept, least recently used
+    evicted first.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, default_ttl: float = 15.0, default_stale_ttl: float = 60.0, refresh_workers: int = 4,
+                 max_entries: int = 4096):
+        self.default_ttl = default_ttl
+        self.default_stale_ttl = default_stale_ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='cache-refresh')
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any],
+                    ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> Any:
+        ttl = self.default_ttl if ttl is None else ttl
+        stale_ttl = self.default_stale_ttl if stale_ttl is None else stale_ttl
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and now < entry.fresh_until:
+                self.hits += 1
+                return entry.value
+            if entry is not None and now < entry.stale_until:
+                self.stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._refresh_pool.submit(self._refresh, key, loader, ttl, stale_ttl)
+                return entry.value
+
+            self.misses += 1
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            self._store(key, flight.value, ttl, stale_ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def _refresh(self, key, loader, ttl, stale_ttl):
+        try:
+            value = loader()
+        except Exception as e:
+            # Keep serving the stale value; the next stale hit retries
+            with self._lock:
+                self.refresh_errors += 1
+            logger.warning("Cache refresh failed for %r: %s", key, e)
+        else:
+            self._store(key, value, ttl, stale_ttl)
+            with self._lock:
+                self.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key, value, ttl, stale_ttl):
+        entry = _Entry(value, ttl, stale_ttl, time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or everything when key is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            now = time.monotonic()
+            return {
+                'entries': len(self._entries),
+                'fresh_entries': sum(1 for entry in self._entries.values() if now < entry.fresh_until),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'coalesced_misses': self.coalesced,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'evictions': self.evictions,
+                'in_flight': len(self._inflight),
+                'hit_ratio': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+In-process Ethereum keypair generation with a pre-generated pool
+secp256k1 + Keccak-256 derivation from proper_ethereum_wallet.py, with a
+background worker keeping a few keypairs ready so new logins never wait on
+key generation (or on a Node.js subprocess)
+"""
+
+import secrets
+import threading
+from collections import deque
+from typing import Dict
+
+from Crypto.Hash import keccak
+
+from proper_ethereum_wallet import create_ethereum_address
+
+# Order of the secp256k1 group; valid private keys are 1 .. N-1
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+COMPATIBLE_WITH = ['MetaMask', 'Trust Wallet', 'Bitget Wallet', 'Coinbase Wallet', 'Rabby', 'OKX Wallet']
+GENERATED_BY = 'python secp256k1 + keccak256 (ethers.js compatible)'
+
+
+def to_checksum_address(address: str) -> str:
+    """EIP-55 mixed-case checksum, the form ethers.Wallet.address returns"""
+    lower = address.lower().removeprefix('0x')
+    digest = keccak.new(digest_bits=256, data=lower.encode('ascii')).hexdigest()
+    return '0x' + ''.join(c.upper() if int(digest[i], 16) >= 8 else c for i, c in enumerate(lower))
+
+
+def derive_address(private_key_hex: str) -> str:
+    """Checksummed address for a 0x-prefixed or bare hex private key"""
+    return to_checksum_address(create_ethereum_address(private_key_hex))
+
+
+def generate_keypair() -> Dict:
+    """One fresh wallet in the same shape ethereum_wallet_node.js printed"""
+    # randbelow keeps the key inside the curve order, unlike randbits(256)
+    private_key = '0x' + (secrets.randbelow(SECP256K1_N - 1) + 1).to_bytes(32, 'big').hex()
+    return {
+        'address': derive_address(private_key),
+        'privateKey': private_key,
+        'compatible': True,
+        'compatible_with': list(COMPATIBLE_WITH),
+        'generated_by': GENERATED_BY,
+    }
+
+
+class KeypairPool:
+    """Bounded pool of ready keypairs refilled by a daemon thread.
+
+    take() pops a pooled keypair in O(1); when the pool is drained (a burst of
+    sign-ups) it generates inline rather than blocking. Each keypair is handed
+    out exactly once.
+    """
+
+    def __init__(self, size: int = 32, low_water: int = 8):
+        self.size = size
+        self.low_water = low_water
+        self._keys = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._refill_loop, name='keypair-pool', daemon=True)
+            self._thread.start()
+
+    def _refill_loop(self):
+        while True:
+            with self._cond:
+                while len(self._keys) >= self.size:
+                    self._cond.wait()
+            keypair = generate_keypair()
+            with self._cond:
+                self._keys.append(keypair)
+
+    def take(self) -> Dict:
+        if self._thread is None:
+            self.start()
+        with self._cond:
+            if self._keys:
+                keypair = self._keys.popleft()
+                self.pool_hits += 1
+            else:
+                keypair = None
+                self.pool_misses += 1
+            if len(self._keys) < self.low_water:
+                self._cond.notify()
+        return keypair if keypair is not None else generate_keypair()
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {'ready': len(self._keys), 'size': self.size,
+                    'pool_hits': self.pool_hits, 'pool_misses': self.pool_misses}
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool() -> KeypairPool:
+    """Process-wide pool, started on first use"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = KeypairPool()
+            _default_pool.start()
+        return _default_pool
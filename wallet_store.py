@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Durable wallet store for the SocialX server
+SQLite in WAL mode with one row per USER_WALLETS key, so saving a login writes
+the keys that changed instead of re-pickling every wallet on the platform
+"""
+
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+WALLET_DB_FILE = 'user_wallets.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallets (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def atomic_write(path: str, data: bytes):
+    """Write to a temp file in the same directory, fsync, then rename over path"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def wallet_of(value: Any) -> Optional[Dict]:
+    """The wallet dict held by a USER_WALLETS entry, stored directly or under 'wallet'"""
+    if not isinstance(value, dict):
+        return None
+    if 'address' in value:
+        return value
+    nested = value.get('wallet')
+    if isinstance(nested, dict) and 'address' in nested:
+        return nested
+    return None
+
+
+class WalletIndex:
+    """Secondary indexes over USER_WALLETS entries.
+
+    by_user:    user_id -> key of the entry holding that user's wallet
+    by_address: lowercase address -> keys of every entry holding that wallet
+    by_session: session id -> user_id, from the 'session_<user_id>' -> session id entries
+
+    Owners are taken from the wallet's (or entry's) 'user_id' field or, for
+    keys like 'session_<user_id>', from the key itself; never from substring
+    matches, which used to hand one user's wallet to another.
+    """
+
+    def __init__(self):
+        self.by_user: Dict[str, str] = {}
+        self.by_address: Dict[str, Set[str]] = {}
+        self.by_session: Dict[str, str] = {}
+        self._owned: Dict[str, Set[str]] = {}   # user_id -> every key holding one of their wallets
+
+    @staticmethod
+    def _owner(key: str, value: Any, wallet: Dict) -> str:
+        owner = wallet.get('user_id') or (value.get('user_id') if isinstance(value, dict) else None)
+        if owner is None:
+            owner = key[len('session_'):] if key.startswith('session_') else key
+        return str(owner)
+
+    def add(self, key: str, value: Any):
+        key = str(key)
+        if isinstance(value, str) and key.startswith('session_'):
+            self.by_session[value] = key[len('session_'):]
+            return
+        wallet = wallet_of(value)
+        if wallet is None:
+            return
+        address = str(wallet['address']).lower()
+        if address:
+            self.by_address.setdefault(address, set()).add(key)
+        # An entry stored directly under the user_id wins over session copies
+        owner = self._owner(key, value, wallet)
+        self._owned.setdefault(owner, set()).add(key)
+        if owner not in self.by_user or key == owner:
+            self.by_user[owner] = key
+
+    def remove(self, key: str, value: Any):
+        """Unindex an entry that was added with this value"""
+        key = str(key)
+        if isinstance(value, str) and key.startswith('session_'):
+            if self.by_session.get(value) == key[len('session_'):]:
+                del self.by_session[value]
+            return
+        wallet = wallet_of(value)
+        if wallet is None:
+            return
+        address = str(wallet['address']).lower()
+        keys = self.by_address.get(address)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.by_address[address]
+        owner = self._owner(key, value, wallet)
+        owned = self._owned.get(owner)
+        if owned is not None:
+            owned.discard(key)
+            if not owned:
+                del self._owned[owner]
+        if self.by_user.get(owner) == key:
+            # Hand by_user to another entry of the same user, the user_id key first
+            if owned:
+                self.by_user[owner] = owner if owner in owned else min(owned)
+            else:
+                del self.by_user[owner]
+
+    def user_key(self, user_id: Any) -> Optional[str]:
+        return self.by_user.get(str(user_id))
+
+    def address_keys(self, address: str) -> Set[str]:
+        return set(self.by_address.get(str(address).lower(), ()))
+
+    def session_user(self, session_id: str) -> Optional[str]:
+        return self.by_session.get(session_id)
+
+    def sizes(self) -> Tuple[int, int, int]:
+        return len(self.by_user), len(self.by_address), len(self.by_session)
+
+
+class WalletStore:
+    """Key/value wallet persistence with O(1) writes per key.
+
+    Values are pickled individually so anything USER_WALLETS held in the old
+    pickle file (wallet dicts, session dicts, bare session-id strings)
+    round-trips unchanged. Each put/delete is its own SQLite transaction, which
+    WAL mode makes crash safe without rewriting the rest of the table.
+    """
+
+    def __init__(self, db_path: str = WALLET_DB_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def load_all(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute('SELECT key, value FROM wallets').fetchall()
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM wallets').fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM wallets WHERE key = ?', (key,)).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Any):
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, Any]):
+        self.put_serialized(self.serialize(items))
+
+    @staticmethod
+    def serialize(items: Dict[str, Any]) -> Dict[str, bytes]:
+        """Pickle values up front, so a caller can snapshot them under its own
+        lock and write them with put_serialized() after releasing it"""
+        return {str(key): pickle.dumps(value) for key, value in items.items()}
+
+    def put_serialized(self, rows: Dict[str, bytes]):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO wallets (key, value, updated_at) VALUES (?, ?, ?)',
+                [(key, value, now) for key, value in rows.items()])
+
+    def delete_many(self, keys: Iterable[str]):
+        with self._lock, self._conn:
+            self._conn.executemany('DELETE FROM wallets WHERE key = ?', [(str(key),) for key in keys])
+
+    def migrate_from_pickle(self, pickle_path: str) -> int:
+        """One-time import of the legacy user_wallets.pkl; later calls are no-ops"""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM store_meta WHERE key = 'migrated_from_pickle'").fetchone()
+        if done:
+            return 0
+
+        # Mark the store migrated even when there is no pickle yet: the backup export
+        # writes one later, and importing that would resurrect keys deleted since
+        legacy = {}
+        if os.path.exists(pickle_path):
+            with open(pickle_path, 'rb') as f:
+                legacy = pickle.load(f)
+
+        now = time.time()
+        rows = [(str(key), pickle.dumps(value), now) for key, value in legacy.items()]
+        with self._lock, self._conn:
+            # Keys already written to the store are newer than the pickle snapshot
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO wallets (key, value, updated_at) VALUES (?, ?, ?)', rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('migrated_from_pickle', ?)",
+                (f"{pickle_path}:{len(rows)}:{now}",))
+        with self._lock:
+            # Fold the bulk import into the main file so later reads skip the WAL
+            self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -4,10 +4,22 @@ Web3 Contract Manager for SocialX Platform
 Handles interactions with deployed smart contracts on HyperEVM
 """
 
+import functools
 import json
+import os
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from ttl_cache import TTLCache
+from metrics import REGISTRY
+
+RPC_CALLS = REGISTRY.counter('socialx_rpc_calls_total', 'Contract view calls by function and outcome',
+                             ('method', 'outcome'))
+RPC_LATENCY = REGISTRY.histogram('socialx_rpc_call_seconds', 'Contract view call latency by function',
+                                 ('method',))
+
 try:
     from web3 import Web3
     WEB3_AVAILABLE = True
@@ -69,10 +81,79 @@ except ImportError:
         def call(self):
             return self.result
 
+# SocialAccountToken view functions read by get_token_data, in result order
+TOKEN_DATA_FIELDS = (
+    'socialHandle',
+    'accountName',
+    'creator',
+    'getCurrentPrice',
+    'hypePool',
+    'circulatingSupply',
+    'totalSupply',
+    'volume24h',
+    'holderCount',
+)
+
+# Tokens per JSON-RPC batch - 20 tokens = 180 eth_calls, under common provider batch limits
+TOKENS_PER_BATCH = 20
+
+def _cache_key(name, args, kwargs):
+    """Hashable key for a method call - lists (e.g. address batches) become tuples"""
+    frozen_args = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+    return (name, frozen_args, tuple(sorted(kwargs.items())))
+
+# How many cached_read loads are running on this thread (loads nest, e.g. trending -> addresses)
+_loading = threading.local()
+
+def cached_read(ttl: float, stale_ttl: float = 60.0, default=None):
+    """Serve a read-only contract call from Web3ContractManager.cache
+    
+    ttl is how long a result counts as fresh; for stale_ttl seconds after that it is
+    still returned while a background refresh runs. The method must raise on RPC
+    failure rather than return a placeholder, so failures are never cached: a stale
+    value keeps being served while refreshes fail, and only when nothing is cached
+    does the caller get default() (a factory, so callers never share one mutable
+    default). Inside another cached read's load, failures propagate instead, so the
+    outer result isn't cached either. The undecorated method stays reachable as
+    <method>.uncached for callers that need a live read.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = _cache_key(method.__name__, args, kwargs)
+            
+            def load():
+                depth = getattr(_loading, 'depth', 0)
+                _loading.depth = depth + 1
+                try:
+                    return method(self, *args, **kwargs)
+                finally:
+                    _loading.depth = depth
+            
+            if getattr(_loading, 'depth', 0):
+                return self.cache.get_or_load(key, load, ttl, stale_ttl)
+            try:
+                return self.cache.get_or_load(key, load, ttl, stale_ttl)
+            except Exception as e:
+                print(f"❌ {method.__name__} failed: {e}")
+                return default() if default is not None else None
+        wrapper.uncached = method
+        return wrapper
+    return decorator
+
+EMPTY_PLATFORM_STATS = {
+    'total_fees_collected': 0,
+    'total_fees_withdrawn': 0,
+    'available_balance': 0,
+    'total_tokens': 0,
+    'emergency_total': 0,
+    'is_emergency_mode': False
+}
+
 class Web3ContractManager:
     def __init__(self):
         # HyperEVM Configuration
-        self.rpc_url = "https://rpc.hyperliquid.xyz/evm"
+        self.rpc_url = os.getenv('HYPEREVM_RPC_URL', 'https://rpc.hyperliquid.xyz/evm')
         self.chain_id = 999
         
         # Real deployed contract addresses
@@ -82,6 +163,12 @@ class Web3ContractManager:
             'whype_token': '0x5555555555555555555555555555555555555555',  # WHYPE token address
         }
         
+        # Shared read cache for market endpoints (keyed by method and args)
+        self.cache = TTLCache()
+        
+        # Event-log trade store, attached by the server at startup
+        self.indexer = None
+        
         # Initialize Web3 connection
         if WEB3_AVAILABLE:
             self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
@@ -242,13 +329,13 @@ class Web3ContractManager:
             
             # Test contract connectivity
             try:
-                stats = self.platform_fees_contract.functions.getPlatformStats().call()
+                stats = self._call(self.platform_fees_contract.functions.getPlatformStats())
                 print(f"✅ PlatformFees contract responsive")
             except Exception as e:
                 print(f"❌ PlatformFees contract error: {e}")
             
             try:
-                total_tokens = self.token_factory_contract.functions.getTotalTokensLaunched().call()
+                total_tokens = self._call(self.token_factory_contract.functions.getTotalTokensLaunched())
                 print(f"✅ TokenFactory contract responsive, {total_tokens} tokens launched")
             except Exception as e:
                 print(f"❌ TokenFactory contract error: {e}")
@@ -269,42 +356,29 @@ class Web3ContractManager:
             print(f"❌ Connection check failed: {e}")
             return False
     
+    @cached_read(ttl=30, stale_ttl=120, default=lambda: dict(EMPTY_PLATFORM_STATS))
     def get_platform_stats(self) -> Dict:
         """Get platform-wide statistics from PlatformFees contract"""
-        try:
-            stats = self.platform_fees_contract.functions.getPlatformStats().call()
-            return {
-                'total_fees_collected': stats[0] / 1e18,  # Convert from wei
-                'total_fees_withdrawn': stats[1] / 1e18,
-                'available_balance': stats[2] / 1e18,
-                'total_tokens': stats[3],
-                'emergency_total': stats[4] / 1e18,
-                'is_emergency_mode': stats[5]
-            }
-        except Exception as e:
-            print(f"❌ Error getting platform stats: {e}")
-            return {
-                'total_fees_collected': 0,
-                'total_fees_withdrawn': 0,
-                'available_balance': 0,
-                'total_tokens': 0,
-                'emergency_total': 0,
-                'is_emergency_mode': False
-            }
+        stats = self._call(self.platform_fees_contract.functions.getPlatformStats())
+        return {
+            'total_fees_collected': stats[0] / 1e18,  # Convert from wei
+            'total_fees_withdrawn': stats[1] / 1e18,
+            'available_balance': stats[2] / 1e18,
+            'total_tokens': stats[3],
+            'emergency_total': stats[4] / 1e18,
+            'is_emergency_mode': stats[5]
+        }
     
+    @cached_read(ttl=30, stale_ttl=120, default=list)
     def get_all_token_addresses(self, offset: int = 0, limit: int = 100) -> List[str]:
         """Get all token contract addresses from TokenFactory"""
-        try:
-            addresses = self.token_factory_contract.functions.getAllTokenContracts(offset, limit).call()
-            return [self.w3.to_checksum_address(addr) for addr in addresses]
-        except Exception as e:
-            print(f"❌ Error getting token addresses: {e}")
-            return []
+        addresses = self._call(self.token_factory_contract.functions.getAllTokenContracts(offset, limit))
+        return [self.w3.to_checksum_address(addr) for addr in addresses]
     
     def get_token_by_handle(self, handle: str) -> Optional[str]:
         """Get token contract address by social handle"""
         try:
-            address = self.token_factory_contract.functions.getTokenContract(handle).call()
+            address = self._call(self.token_factory_contract.functions.getTokenContract(handle))
             if address == '0x0000000000000000000000000000000000000000':
                 return None
             return self.w3.to_checksum_address(address)
@@ -315,91 +389,132 @@ class Web3ContractManager:
     def get_handle_by_token(self, token_address: str) -> Optional[str]:
         """Get social handle by token contract address"""
         try:
-            handle = self.token_factory_contract.functions.getSocialHandle(token_address).call()
+            handle = self._call(self.token_factory_contract.functions.getSocialHandle(token_address))
             return handle if handle else None
         except Exception as e:
             print(f"❌ Error getting handle by token {token_address}: {e}")
             return None
     
+    def _call(self, contract_function):
+        """contract_function.call(), counted and timed under its function name"""
+        method = getattr(contract_function, 'fn_name', 'unknown')
+        start_time = time.perf_counter()
+        try:
+            result = contract_function.call()
+        except Exception:
+            RPC_CALLS.inc((method, 'error'))
+            raise
+        finally:
+            RPC_LATENCY.observe(time.perf_counter() - start_time, (method,))
+        RPC_CALLS.inc((method, 'ok'))
+        return result
+    
+    def _token_contract(self, token_address: str):
+        """Contract instance for a SocialAccountToken"""
+        return self.w3.eth.contract(
+            address=token_address,
+            abi=self.social_token_abi
+        )
+    
+    def _format_token_data(self, token_address: str, raw: Dict) -> Dict:
+        """Convert raw view-call results (keyed by TOKEN_DATA_FIELDS) into the API shape"""
+        current_price = raw['getCurrentPrice']
+        total_supply = raw['totalSupply']
+        
+        # Calculate market cap
+        market_cap = (current_price * total_supply) / 1e36  # Adjust for decimals
+        
+        return {
+            'address': token_address,
+            'handle': raw['socialHandle'],
+            'name': raw['accountName'],
+            'creator': raw['creator'],
+            'current_price': current_price / 1e18,  # Convert from wei
+            'hype_pool': raw['hypePool'] / 1e18,
+            'circulating_supply': raw['circulatingSupply'] / 1e18,
+            'total_supply': total_supply / 1e18,
+            'market_cap': market_cap,
+            'volume_24h': raw['volume24h'] / 1e18,
+            'holder_count': raw['holderCount'],
+            'chain_id': self.chain_id,
+            'network': 'HyperEVM'
+        }
+    
+    @cached_read(ttl=15, stale_ttl=60, default=dict)
     def get_token_data(self, token_address: str) -> Dict:
         """Get comprehensive data for a specific token"""
-        try:
-            # Create contract instance for this token
-            token_contract = self.w3.eth.contract(
-                address=token_address,
-                abi=self.social_token_abi
-            )
-            
-            # Fetch all token data
-            handle = token_contract.functions.socialHandle().call()
-            name = token_contract.functions.accountName().call()
-            creator = token_contract.functions.creator().call()
-            current_price = token_contract.functions.getCurrentPrice().call()
-            hype_pool = token_contract.functions.hypePool().call()
-            circulating_supply = token_contract.functions.circulatingSupply().call()
-            total_supply = token_contract.functions.totalSupply().call()
-            volume_24h = token_contract.functions.volume24h().call()
-            holder_count = token_contract.functions.holderCount().call()
-            
-            # Calculate market cap
-            market_cap = (current_price * total_supply) / 1e36  # Adjust for decimals
+        # Create contract instance for this token
+        token_contract = self._token_contract(token_address)
+        
+        # Fetch all token data - one round trip per field
+        raw = {field: self._call(getattr(token_contract.functions, field)()) for field in TOKEN_DATA_FIELDS}
+        return self._format_token_data(token_address, raw)
+    
+    def get_tokens_data(self, token_addresses: List[str]) -> List[Dict]:
+        """Get token data for many tokens using JSON-RPC batch requests
+        
+        All view calls for TOKENS_PER_BATCH tokens go out in a single HTTP request,
+        so N tokens cost ceil(N / TOKENS_PER_BATCH) round trips instead of 9 * N.
+        A chunk whose batch fails falls back to per-token get_token_data calls;
+        tokens that still fail are left out, except inside a cached read's load,
+        where the failure propagates (see cached_read).
+        """
+        if not WEB3_AVAILABLE:
+            return [data for data in (self.get_token_data(address) for address in token_addresses) if data]
+        
+        tokens_data = []
+        field_count = len(TOKEN_DATA_FIELDS)
+        for start in range(0, len(token_addresses), TOKENS_PER_BATCH):
+            chunk = token_addresses[start:start + TOKENS_PER_BATCH]
+            start_time = time.perf_counter()
+            try:
+                with self.w3.batch_requests() as batch:
+                    for address in chunk:
+                        token_contract = self._token_contract(address)
+                        for field in TOKEN_DATA_FIELDS:
+                            batch.add(getattr(token_contract.functions, field)())
+                    values = batch.execute()
+                RPC_CALLS.inc(('batch', 'ok'))
+            except Exception as e:
+                RPC_CALLS.inc(('batch', 'error'))
+                RPC_LATENCY.observe(time.perf_counter() - start_time, ('batch',))
+                print(f"⚠️ Batched token read failed for {len(chunk)} tokens, falling back to single calls: {e}")
+                tokens_data.extend(data for data in (self.get_token_data(address) for address in chunk) if data)
+                continue
             
-            return {
-                'address': token_address,
-                'handle': handle,
-                'name': name,
-                'creator': creator,
-                'current_price': current_price / 1e18,  # Convert from wei
-                'hype_pool': hype_pool / 1e18,
-                'circulating_supply': circulating_supply / 1e18,
-                'total_supply': total_supply / 1e18,
-                'market_cap': market_cap,
-                'volume_24h': volume_24h / 1e18,
-                'holder_count': holder_count,
-                'chain_id': self.chain_id,
-                'network': 'HyperEVM'
-            }
-        except Exception as e:
-            print(f"❌ Error getting token data for {token_address}: {e}")
-            return {}
+            RPC_LATENCY.observe(time.perf_counter() - start_time, ('batch',))
+            for i, address in enumerate(chunk):
+                raw = dict(zip(TOKEN_DATA_FIELDS, values[i * field_count:(i + 1) * field_count]))
+                tokens_data.append(self._format_token_data(address, raw))
+        
+        return tokens_data
     
+    @cached_read(ttl=15, stale_ttl=60, default=list)
     def get_trending_tokens(self, limit: int = 10) -> List[Dict]:
         """Get trending tokens based on volume"""
-        try:
-            # Get all token addresses
-            token_addresses = self.get_all_token_addresses(0, 100)
-            
-            # Get data for each token
-            tokens_data = []
-            for address in token_addresses[:limit]:  # Limit to avoid too many calls
-                token_data = self.get_token_data(address)
-                if token_data:
-                    tokens_data.append(token_data)
-            
-            # Sort by volume (descending)
-            trending = sorted(tokens_data, key=lambda x: x.get('volume_24h', 0), reverse=True)
-            return trending[:limit]
-            
-        except Exception as e:
-            print(f"❌ Error getting trending tokens: {e}")
-            return []
+        # Get all token addresses
+        token_addresses = self.get_all_token_addresses(0, 100)
+        
+        # Get data for all tokens in batched round trips
+        tokens_data = self.get_tokens_data(token_addresses[:limit])
+        
+        # Sort by volume (descending)
+        trending = sorted(tokens_data, key=lambda x: x.get('volume_24h', 0), reverse=True)
+        return trending[:limit]
     
     def get_creator_tokens(self, creator_address: str) -> List[str]:
         """Get all token addresses created by a specific creator"""
         try:
-            addresses = self.token_factory_contract.functions.getCreatorTokens(creator_address).call()
+            addresses = self._call(self.token_factory_contract.functions.getCreatorTokens(creator_address))
             return [self.w3.to_checksum_address(addr) for addr in addresses]
         except Exception as e:
             print(f"❌ Error getting creator tokens for {creator_address}: {e}")
             return []
     
+    @cached_read(ttl=30, stale_ttl=120, default=int)
     def get_total_tokens_launched(self) -> int:
         """Get total number of tokens launched on the platform"""
-        try:
-            return self.token_factory_contract.functions.getTotalTokensLaunched().call()
-        except Exception as e:
-            print(f"❌ Error getting total tokens launched: {e}")
-            return 0
+        return self._call(self.token_factory_contract.functions.getTotalTokensLaunched())
     
     def simulate_buy_price(self, token_address: str, hype_amount: float) -> Dict:
         """Simulate a buy transaction to get expected tokens and price impact"""
@@ -424,11 +539,33 @@ class Web3ContractManager:
             print(f"❌ Error simulating buy price: {e}")
             return {'error': str(e)}
     
-    def get_recent_transactions(self, token_address: str, limit: int = 10) -> List[Dict]:
-        """Get recent transactions for a token (would need event filtering)"""
-        # This would require filtering blockchain events
-        # For now, return empty list - would need to implement event filtering
-        return []
+    def get_cache_stats(self) -> Dict:
+        """Hit/miss counters for the shared read cache"""
+        return self.cache.stats()
+    
+    def attach_indexer(self, indexer):
+        """Serve trade history from a TradeIndexer (see trade_indexer.py)"""
+        self.indexer = indexer
+    
+    def get_recent_transactions(self, token_address: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """Get recent indexed trades for a token, or across all tokens when token_address is None"""
+        if self.indexer is None:
+            return []
+        try:
+            return self.indexer.recent_trades(limit=limit, token_address=token_address)
+        except Exception as e:
+            print(f"❌ Error reading indexed trades: {e}")
+            return []
+    
+    def get_trader_positions(self, trader_address: str) -> List[Dict]:
+        """Net positions per token for a trader, from indexed trade events"""
+        if self.indexer is None or not trader_address:
+            return []
+        try:
+            return self.indexer.trader_positions(trader_address)
+        except Exception as e:
+            print(f"❌ Error reading indexed positions for {trader_address}: {e}")
+            return []
 
 # Global instance
 web3_manager = Web3ContractManager()
\ No newline at end of file